@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Precomputed edge geometry for the IWAC spatial network map.
+
+Edges are drawn from polylines built once at generation time instead of
+straight segments computed in the browser:
+
+1. Great circles: every edge is sampled at ``segments + 1`` points along the
+   great circle between its endpoints (spherical linear interpolation of the
+   endpoint unit vectors, all edges at once). Longitudes are unwrapped so a
+   path never jumps across the antimeridian.
+2. Bundling (optional): force-directed edge bundling (Holten & van Wijk,
+   2009) in web-mercator space, i.e. in the plane the map is drawn in.
+   Edge pairs are scored by the paper's angle, scale, position and
+   visibility compatibilities; for pairs scoring at least
+   ``compatibility``, the interior points of each edge are attracted to the
+   matching points of the other edge, while springs along the edge keep it
+   smooth. Endpoints never move. Forces are NumPy array operations over
+   all compatible pairs, with the step size halved each cycle.
+3. Simplification: Douglas-Peucker with ``tolerance`` degrees, so short or
+   straight edges fall back to two points.
+4. Quantization: coordinates are snapped to a ``scale`` degree grid and
+   delta-encoded like TopoJSON arcs.
+
+Exported per edge (``path``), with a shared header (``edgePaths``)::
+
+    "edgePaths": {"scale": 0.001, "translate": [west, south], "bundled": false},
+    "edges": [{..., "path": [x0, y0, dx1, dy1, ...]}]
+
+Point ``i`` is ``(sum(x[:i + 1]) * scale + translate[0], ...)`` in
+longitude/latitude. The client reader is src/lib/utils/edgePaths.ts.
+
+Used by:
+- generate_spatial_networks.py  (networks/spatial.json edge "path")
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import shapely
+
+from geo_proximity import unit_vectors
+from point_clusters import inverse_mercator, mercator
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+DEFAULT_SEGMENTS = 16
+# Degrees; ~1 km on the ground
+DEFAULT_TOLERANCE = 0.01
+DEFAULT_SCALE = 0.001
+
+# Force-directed bundling
+DEFAULT_COMPATIBILITY = 0.6
+DEFAULT_CYCLES = 5
+DEFAULT_ITERATIONS = 40
+# Spring stiffness along each edge (relative to its length and subdivision)
+SPRING_CONSTANT = 0.1
+# Initial step, as a fraction of the mean edge length
+INITIAL_STEP = 0.04
+# Compatible pairs handled per force chunk (bounds memory on dense networks)
+PAIR_CHUNK = 50_000
+
+
+# ============================================================================
+# Great circles
+# ============================================================================
+
+
+def great_circle_paths(
+    src_lats: Sequence[float],
+    src_lngs: Sequence[float],
+    dst_lats: Sequence[float],
+    dst_lngs: Sequence[float],
+    segments: int = DEFAULT_SEGMENTS,
+) -> np.ndarray:
+    """Points along the great circle of every edge.
+
+    Returns:
+        (edges, segments + 1, 2) array of longitude/latitude, endpoints included
+    """
+    a = unit_vectors(src_lats, src_lngs)
+    b = unit_vectors(dst_lats, dst_lngs)
+    omega = np.arccos(np.clip(np.einsum("ij,ij->i", a, b), -1.0, 1.0))[:, None]
+    t = np.linspace(0.0, 1.0, segments + 1)[None, :]
+
+    # Slerp; coincident endpoints (omega = 0) fall back to linear weights
+    sin_omega = np.sin(omega)
+    tiny = sin_omega < 1e-12
+    safe = np.where(tiny, 1.0, sin_omega)
+    wa = np.where(tiny, 1 - t, np.sin((1 - t) * omega) / safe)
+    wb = np.where(tiny, t, np.sin(t * omega) / safe)
+    points = wa[..., None] * a[:, None, :] + wb[..., None] * b[:, None, :]
+
+    lats = np.degrees(np.arctan2(points[..., 2], np.hypot(points[..., 0], points[..., 1])))
+    lngs = np.degrees(np.arctan2(points[..., 1], points[..., 0]))
+    # Keep each path continuous, starting from the source longitude
+    lngs = np.degrees(np.unwrap(np.radians(lngs), axis=1))
+    lngs += np.round((np.asarray(src_lngs, dtype=np.float64)[:, None] - lngs[:, :1]) / 360.0) * 360.0
+    return np.stack([lngs, lats], axis=-1)
+
+
+# ============================================================================
+# Force-directed edge bundling
+# ============================================================================
+
+
+def _visibility(p0, p1, q0, q1) -> np.ndarray:
+    """Visibility of edges q from edges p (row-wise arrays of endpoints)."""
+    d = p1 - p0
+    length2 = np.maximum(np.einsum("ij,ij->i", d, d), 1e-24)[:, None]
+    i0 = p0 + np.einsum("ij,ij->i", q0 - p0, d)[:, None] / length2 * d
+    i1 = p0 + np.einsum("ij,ij->i", q1 - p0, d)[:, None] / length2 * d
+    span = np.maximum(np.linalg.norm(i1 - i0, axis=1), 1e-12)
+    offset = np.linalg.norm((p0 + p1) / 2 - (i0 + i1) / 2, axis=1)
+    return np.maximum(1 - 2 * offset / span, 0.0)
+
+
+def compatible_pairs(ends: np.ndarray, threshold: float = DEFAULT_COMPATIBILITY, chunk: int = 512):
+    """Edge pairs (i < j) whose bundling compatibility reaches ``threshold``.
+
+    Args:
+        ends: (edges, 2, 2) planar source/target points
+
+    Returns:
+        (first, second, compatibility) arrays
+    """
+    p0, p1 = ends[:, 0], ends[:, 1]
+    vec = p1 - p0
+    length = np.maximum(np.linalg.norm(vec, axis=1), 1e-12)
+    mid = (p0 + p1) / 2
+    n = len(ends)
+
+    firsts, seconds, scores = [], [], []
+    for start in range(0, n, chunk):
+        rows = np.arange(start, min(start + chunk, n))
+        i, j = np.meshgrid(rows, np.arange(n), indexing="ij")
+        upper = j > i
+        i, j = i[upper], j[upper]
+        if not len(i):
+            continue
+        angle = np.abs(np.einsum("ij,ij->i", vec[i], vec[j])) / (length[i] * length[j])
+        avg = (length[i] + length[j]) / 2
+        scale = 2 / (avg / np.minimum(length[i], length[j]) + np.maximum(length[i], length[j]) / avg)
+        position = avg / (avg + np.linalg.norm(mid[i] - mid[j], axis=1))
+        score = angle * scale * position
+        # Visibility is the costliest term; only score the remaining candidates
+        keep = score >= threshold
+        i, j, score = i[keep], j[keep], score[keep]
+        score = score * np.minimum(
+            _visibility(p0[i], p1[i], p0[j], p1[j]), _visibility(p0[j], p1[j], p0[i], p1[i])
+        )
+        keep = score >= threshold
+        firsts.append(i[keep])
+        seconds.append(j[keep])
+        scores.append(score[keep])
+
+    if not firsts:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+    return np.concatenate(firsts), np.concatenate(seconds), np.concatenate(scores)
+
+
+def bundle_paths(
+    paths: np.ndarray,
+    compatibility: float = DEFAULT_COMPATIBILITY,
+    cycles: int = DEFAULT_CYCLES,
+    iterations: int = DEFAULT_ITERATIONS,
+) -> np.ndarray:
+    """Force-directed bundling of planar polylines with fixed endpoints.
+
+    Each interior point moves by ``step`` along the compatibility-weighted
+    mean direction to the matching points of its compatible edges (edges
+    running the other way are matched back to front), plus a spring term
+    pulling it towards its neighbours on the edge.
+
+    Args:
+        paths: (edges, points, 2) polylines, all with the same point count
+
+    Returns:
+        Bundled copy of ``paths``
+    """
+    paths = np.array(paths, dtype=np.float64)
+    if len(paths) < 2 or paths.shape[1] < 3:
+        return paths
+
+    first, second, score = compatible_pairs(paths[:, [0, -1]], compatibility)
+    if not len(first):
+        return paths
+    # Each pair attracts both ways
+    a = np.concatenate([first, second])
+    b = np.concatenate([second, first])
+    c = np.concatenate([score, score])[:, None, None]
+    vec = paths[:, -1] - paths[:, 0]
+    reverse = np.einsum("ij,ij->i", vec[a], vec[b]) < 0
+    total = np.maximum(np.bincount(a, weights=c[:, 0, 0], minlength=len(paths)), 1.0)[:, None, None]
+
+    segments = paths.shape[1] - 1
+    lengths = np.maximum(np.linalg.norm(vec, axis=1), 1e-12)[:, None, None]
+    step = INITIAL_STEP * float(lengths.mean())
+
+    for _ in range(cycles):
+        # Spring weight per edge, capped where the explicit update stays stable
+        smooth = np.minimum(step * SPRING_CONSTANT * segments ** 2 / lengths, 0.25)
+        for _ in range(iterations):
+            inner = paths[:, 1:-1]
+            curvature = paths[:, :-2] + paths[:, 2:] - 2 * inner
+
+            attraction = np.zeros_like(inner)
+            for start in range(0, len(a), PAIR_CHUNK):
+                chunk = slice(start, start + PAIR_CHUNK)
+                pa, pb = a[chunk], b[chunk]
+                other = paths[pb, 1:-1]
+                flip = reverse[chunk]
+                other[flip] = other[flip, ::-1]
+                delta = other - paths[pa, 1:-1]
+                dist = np.linalg.norm(delta, axis=-1, keepdims=True)
+                pull = np.divide(delta, dist, out=np.zeros_like(delta), where=dist > 1e-12)
+                np.add.at(attraction, pa, c[chunk] * pull)
+
+            paths[:, 1:-1] = inner + smooth * curvature + step * attraction / total
+        step /= 2
+        iterations = max(1, iterations * 2 // 3)
+    return paths
+
+
+# ============================================================================
+# Encoding
+# ============================================================================
+
+
+def simplify_paths(paths: Sequence[np.ndarray], tolerance: float = DEFAULT_TOLERANCE) -> List[np.ndarray]:
+    """Douglas-Peucker simplification of each polyline (endpoints are kept)."""
+    if not len(paths):
+        return []
+    lines = shapely.linestrings(np.asarray(paths))
+    simplified = shapely.simplify(lines, tolerance, preserve_topology=False)
+    coords, index = shapely.get_coordinates(simplified, return_index=True)
+    splits = np.flatnonzero(np.diff(index)) + 1
+    return np.split(coords, splits)
+
+
+def quantize_path(path: np.ndarray, translate: Sequence[float], scale: float = DEFAULT_SCALE) -> List[int]:
+    """Snap a longitude/latitude polyline to the grid and delta-encode it."""
+    grid = np.rint((np.asarray(path) - np.asarray(translate)) / scale).astype(np.int64)
+    deltas = np.concatenate([grid[:1], np.diff(grid, axis=0)])
+    # Consecutive points that collapsed onto one grid cell are dropped
+    keep = np.ones(len(deltas), dtype=bool)
+    keep[1:-1] = np.any(deltas[1:-1] != 0, axis=1)
+    if not keep[1:].all():
+        grid = grid[keep]
+        deltas = np.concatenate([grid[:1], np.diff(grid, axis=0)])
+    return deltas.ravel().tolist()
+
+
+def edge_paths(
+    src_lats: Sequence[float],
+    src_lngs: Sequence[float],
+    dst_lats: Sequence[float],
+    dst_lngs: Sequence[float],
+    *,
+    bundle: bool = False,
+    segments: int = DEFAULT_SEGMENTS,
+    tolerance: float = DEFAULT_TOLERANCE,
+    scale: float = DEFAULT_SCALE,
+    translate: Optional[Sequence[float]] = None,
+    compatibility: float = DEFAULT_COMPATIBILITY,
+) -> Dict[str, Any]:
+    """Great-circle (optionally bundled) paths of all edges, quantized.
+
+    Args:
+        translate: Grid origin as [west, south]; defaults to the minimum of the paths
+
+    Returns:
+        {"header": edgePaths header, "paths": [flat delta-encoded ints per edge]}
+    """
+    if not len(src_lats):
+        return {"header": {"scale": scale, "translate": [0.0, 0.0], "bundled": bundle}, "paths": []}
+
+    lnglat = great_circle_paths(src_lats, src_lngs, dst_lats, dst_lngs, segments)
+    if bundle:
+        m, points, _ = lnglat.shape
+        planar = mercator(lnglat[..., 0].ravel(), lnglat[..., 1].ravel()).reshape(m, points, 2)
+        bundled = bundle_paths(planar, compatibility)
+        lnglat = inverse_mercator(bundled.reshape(-1, 2)).reshape(m, points, 2)
+
+    simplified = simplify_paths(lnglat, tolerance)
+    if translate is None:
+        translate = np.floor(lnglat.reshape(-1, 2).min(axis=0) / scale) * scale
+    translate = [round(float(v), 6) for v in translate]
+    return {
+        "header": {"scale": scale, "translate": translate, "bundled": bundle},
+        "paths": [quantize_path(path, translate, scale) for path in simplified],
+    }
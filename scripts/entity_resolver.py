@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Fuzzy entity-name resolution for the IWAC generators.
+
+Exact lookups on normalized names miss near-identical spellings: accents,
+initials ("A. Diallo"), word order ("Diallo, Amadou") and small typos. The
+resolver matches such names against the index titles and alternative titles
+without comparing every name with every entity:
+
+1. Blocking: each name becomes a match key (accents and punctuation removed,
+   lowercase) and a set of character trigrams. Entity trigrams form a sparse
+   entities x trigrams matrix; trigrams shared by more than ``max_block``
+   entities (e.g. "  a", "ou ") are dropped as uninformative.
+2. Candidates: the trigram sets of all query names are multiplied against
+   that matrix in one sparse product, giving the shared-trigram count for
+   the (name, entity) pairs that share a block only. Pairs under a Dice
+   threshold are discarded.
+3. Scoring: the remaining few candidates per name are scored with a
+   token-order-insensitive string ratio that also expands initials. The best
+   candidate is accepted above ``threshold`` unless a different entity
+   scores almost as well (ambiguous names stay unmatched).
+
+Results are cached on disk per entity set and parameters, so later runs only
+score names not seen before.
+
+Used by:
+- generate_knowledge_graph.py  (KnowledgeGraphBuilder.build_fuzzy_lookup)
+- generate_references.py       (add_fuzzy_matches for author/publisher o:ids)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import unicodedata
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Set
+
+import numpy as np
+from scipy import sparse
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+DEFAULT_THRESHOLD = 0.9
+# Minimum trigram Dice coefficient for a pair to be scored
+DEFAULT_MIN_DICE = 0.4
+# Trigrams shared by more entities than this are not used for blocking
+DEFAULT_MAX_BLOCK = 300
+# Candidates scored per name (highest trigram overlap first)
+MAX_CANDIDATES = 20
+# Best match must beat the best *other* entity by this much
+AMBIGUITY_MARGIN = 0.02
+# Matches that rely on expanding an initial are scored a little lower
+INITIAL_PENALTY = 0.95
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CACHE_DIR = ROOT / ".cache" / "entity-resolver"
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+# ============================================================================
+# String helpers
+# ============================================================================
+
+def match_key(name: str) -> str:
+    """Accent-, case- and punctuation-insensitive form of a name."""
+    if not name:
+        return ""
+    text = unicodedata.normalize("NFKD", str(name))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    return " ".join(_NON_ALNUM.sub(" ", text).split())
+
+
+def trigrams(key: str) -> Set[str]:
+    """Character trigrams of a match key, padded so word edges count."""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _expand_initials(tokens: List[str], other: List[str]) -> List[str]:
+    """Replace single-letter tokens by a full token of ``other`` with that initial."""
+    pool = [t for t in other if len(t) > 1]
+    expanded = []
+    for token in tokens:
+        if len(token) == 1:
+            full = next((t for t in pool if t[0] == token), None)
+            if full is not None:
+                pool.remove(full)
+                expanded.append(full)
+                continue
+        expanded.append(token)
+    return expanded
+
+
+def name_similarity(a: str, b: str) -> float:
+    """Similarity in [0, 1] of two match keys, insensitive to word order and initials.
+
+    Examples:
+        >>> name_similarity("amadou diallo", "diallo amadou")
+        1.0
+        >>> round(name_similarity("a diallo", "amadou diallo"), 2)
+        0.95
+    """
+    ta, tb = a.split(), b.split()
+    best = SequenceMatcher(None, " ".join(sorted(ta)), " ".join(sorted(tb))).ratio()
+    if any(len(t) == 1 for t in ta) or any(len(t) == 1 for t in tb):
+        ea, eb = _expand_initials(ta, tb), _expand_initials(tb, ta)
+        ratio = SequenceMatcher(None, " ".join(sorted(ea)), " ".join(sorted(eb))).ratio()
+        best = max(best, ratio * INITIAL_PENALTY)
+    return best
+
+
+# ============================================================================
+# Resolver
+# ============================================================================
+
+class FuzzyResolver:
+    """Trigram-blocked fuzzy matcher from free-text names to entity targets.
+
+    Typical use::
+
+        resolver = FuzzyResolver({"Amadou Diallo": "per:12", ...})
+        matches = resolver.resolve_many(unmatched_names)   # name -> target or None
+        resolver.save_cache()
+    """
+
+    def __init__(
+        self,
+        names: Mapping[str, str],
+        threshold: float = DEFAULT_THRESHOLD,
+        min_dice: float = DEFAULT_MIN_DICE,
+        max_block: int = DEFAULT_MAX_BLOCK,
+        cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+    ) -> None:
+        """
+        Args:
+            names: Entity name (title or alternative title) -> target id
+            threshold: Minimum name_similarity for a match
+            min_dice: Minimum trigram Dice coefficient for a candidate
+            max_block: Trigrams shared by more entities are ignored for blocking
+            cache_dir: Directory for the per-entity-set match cache (None disables)
+        """
+        self.threshold = threshold
+        self.min_dice = min_dice
+
+        targets: Dict[str, Set[str]] = {}
+        for name, target in names.items():
+            key = match_key(name)
+            if key:
+                targets.setdefault(key, set()).add(str(target))
+        self.keys = sorted(targets)
+        # A key shared by several entities cannot identify one of them
+        self.targets = [next(iter(t)) if len(t) == 1 else None for t in (targets[k] for k in self.keys)]
+
+        self.vocab: Dict[str, int] = {}
+        rows, cols = [], []
+        self.sizes = np.zeros(len(self.keys), dtype=np.float64)
+        for i, key in enumerate(self.keys):
+            grams = trigrams(key)
+            self.sizes[i] = len(grams)
+            for gram in grams:
+                rows.append(i)
+                cols.append(self.vocab.setdefault(gram, len(self.vocab)))
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float64), (rows, cols)),
+            shape=(len(self.keys), len(self.vocab)),
+        )
+        block_sizes = np.asarray(matrix.sum(axis=0)).ravel()
+        self.entity_grams = (matrix @ sparse.diags((block_sizes <= max_block).astype(np.float64))).T.tocsr()
+        self.entity_grams.eliminate_zeros()
+
+        fingerprint = hashlib.sha1(
+            json.dumps([self.keys, self.targets, threshold, min_dice, max_block]).encode("utf-8")
+        ).hexdigest()[:16]
+        self.cache_path = cache_dir / f"{fingerprint}.json" if cache_dir else None
+        self.cache: Dict[str, Optional[str]] = {}
+        if self.cache_path and self.cache_path.exists():
+            try:
+                self.cache = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                logger.warning(f"Ignoring unreadable resolver cache {self.cache_path}")
+        self._dirty = False
+
+    def _score(self, query_keys: List[str]) -> List[Optional[str]]:
+        """Match a batch of (uncached) keys in one sparse candidate product."""
+        rows, cols = [], []
+        sizes = np.zeros(len(query_keys), dtype=np.float64)
+        for i, key in enumerate(query_keys):
+            grams = trigrams(key)
+            sizes[i] = len(grams)
+            for gram in grams:
+                col = self.vocab.get(gram)
+                if col is not None:
+                    rows.append(i)
+                    cols.append(col)
+        queries = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float64), (rows, cols)),
+            shape=(len(query_keys), len(self.vocab)),
+        )
+        shared = (queries @ self.entity_grams).tocsr()
+
+        results: List[Optional[str]] = []
+        for i, key in enumerate(query_keys):
+            start, stop = shared.indptr[i], shared.indptr[i + 1]
+            candidates, overlap = shared.indices[start:stop], shared.data[start:stop]
+            dice = 2.0 * overlap / (sizes[i] + self.sizes[candidates])
+            keep = dice >= self.min_dice
+            candidates, dice = candidates[keep], dice[keep]
+            if len(candidates) > MAX_CANDIDATES:
+                top = np.argpartition(-dice, MAX_CANDIDATES - 1)[:MAX_CANDIDATES]
+                candidates = candidates[top]
+
+            scored = sorted(
+                ((name_similarity(key, self.keys[c]), c) for c in candidates.tolist()),
+                key=lambda pair: (-pair[0], pair[1]),
+            )
+            match = None
+            if scored and scored[0][0] >= self.threshold:
+                best_score, best = scored[0]
+                target = self.targets[best]
+                rival = next(
+                    (s for s, c in scored[1:] if self.targets[c] != target), 0.0
+                )
+                if target is not None and rival < best_score - AMBIGUITY_MARGIN:
+                    match = target
+            results.append(match)
+        return results
+
+    def resolve_many(self, names: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Resolve names to targets (None when there is no confident match).
+
+        Args:
+            names: Free-text names; duplicates and names sharing a match key
+                are scored once
+
+        Returns:
+            Mapping from each input name to its target or None
+        """
+        by_key: Dict[str, List[str]] = {}
+        for name in names:
+            key = match_key(name)
+            by_key.setdefault(key, []).append(name)
+
+        pending = [key for key in by_key if key and key not in self.cache]
+        if pending:
+            for key, target in zip(pending, self._score(pending)):
+                self.cache[key] = target
+            self._dirty = True
+
+        return {
+            name: self.cache.get(key) if key else None
+            for key, group in by_key.items()
+            for name in group
+        }
+
+    def resolve(self, name: str) -> Optional[str]:
+        """Resolve a single name (prefer resolve_many for batches)."""
+        return self.resolve_many([name])[name]
+
+    def save_cache(self) -> None:
+        """Persist newly scored names for the next run."""
+        if not self.cache_path or not self._dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path.write_text(json.dumps(self.cache, ensure_ascii=False), encoding="utf-8")
+        self._dirty = False
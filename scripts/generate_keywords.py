@@ -39,6 +39,8 @@ from iwac_utils import (
     extract_year,
     normalize_country,
     save_json,
+    build_columnar_series,
+    save_columnar_json,
 )
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -58,12 +60,39 @@ def load_articles_data() -> pd.DataFrame:
         raise
 
 
+def _build_facet_series(
+    year_keyword: Dict[int, Dict[str, int]],
+    sorted_years: List[int],
+    top_n: int = 50
+) -> Dict[str, Any]:
+    """Build the columnar series block for one country/newspaper facet."""
+    facet_keywords = Counter()
+    for year_data in year_keyword.values():
+        for kw, count in year_data.items():
+            facet_keywords[kw] += count
+
+    # Block names are the facet's top keywords, in descending order
+    facet_top = [kw for kw, _ in facet_keywords.most_common(top_n)]
+
+    return {
+        "series": build_columnar_series({
+            kw: [year_keyword[year].get(kw, 0) for year in sorted_years]
+            for kw in facet_top
+        }),
+        "total_keywords": len(facet_keywords)
+    }
+
+
 def process_keywords_data(df: pd.DataFrame, field: str) -> Dict[str, Any]:
     """
     Process keywords (subject or spatial) and generate prevalence data.
 
+    Series are written in the shared columnar layout: ``years`` is the single
+    axis and every series block holds a keyword dictionary plus one row of
+    counts per keyword (see iwac_utils.build_columnar_series).
+
     Returns a structure with:
-    - global: yearly counts for all keywords globally
+    - global_series: yearly counts for the top keywords, with totals/articles
     - by_country: yearly counts faceted by country
     - by_newspaper: yearly counts faceted by newspaper
     - top_keywords: list of top keywords by total count
@@ -117,61 +146,26 @@ def process_keywords_data(df: pd.DataFrame, field: str) -> Dict[str, Any]:
     # Get top keywords (by total count)
     top_keywords = [kw for kw, _ in keyword_total.most_common(100)]
 
-    # Build global time series for top keywords
-    global_series = {}
-    for keyword in top_keywords:
-        global_series[keyword] = {
-            "years": sorted_years,
-            "counts": [global_year_keyword[year].get(keyword, 0) for year in sorted_years],
-            "total": keyword_total[keyword],
-            "articles": len(keyword_articles[keyword])
-        }
+    # Build global time series for top keywords (one row per keyword,
+    # aligned to the shared sorted_years axis)
+    global_series = build_columnar_series({
+        keyword: [global_year_keyword[year].get(keyword, 0) for year in sorted_years]
+        for keyword in top_keywords
+    })
+    global_series["totals"] = [keyword_total[kw] for kw in top_keywords]
+    global_series["articles"] = [len(keyword_articles[kw]) for kw in top_keywords]
 
     # Build country-faceted data
-    by_country = {}
-    for country in sorted(countries_set):
-        country_keywords = Counter()
-        for year_data in country_year_keyword[country].values():
-            for kw, count in year_data.items():
-                country_keywords[kw] += count
-
-        # Get top keywords for this country
-        country_top = [kw for kw, _ in country_keywords.most_common(50)]
-
-        by_country[country] = {
-            "top_keywords": country_top,
-            "series": {
-                kw: {
-                    "years": sorted_years,
-                    "counts": [country_year_keyword[country][year].get(kw, 0) for year in sorted_years]
-                }
-                for kw in country_top
-            },
-            "total_keywords": len(country_keywords)
-        }
+    by_country = {
+        country: _build_facet_series(country_year_keyword[country], sorted_years)
+        for country in sorted(countries_set)
+    }
 
     # Build newspaper-faceted data
-    by_newspaper = {}
-    for newspaper in sorted(newspapers_set):
-        newspaper_keywords = Counter()
-        for year_data in newspaper_year_keyword[newspaper].values():
-            for kw, count in year_data.items():
-                newspaper_keywords[kw] += count
-
-        # Get top keywords for this newspaper
-        newspaper_top = [kw for kw, _ in newspaper_keywords.most_common(50)]
-
-        by_newspaper[newspaper] = {
-            "top_keywords": newspaper_top,
-            "series": {
-                kw: {
-                    "years": sorted_years,
-                    "counts": [newspaper_year_keyword[newspaper][year].get(kw, 0) for year in sorted_years]
-                }
-                for kw in newspaper_top
-            },
-            "total_keywords": len(newspaper_keywords)
-        }
+    by_newspaper = {
+        newspaper: _build_facet_series(newspaper_year_keyword[newspaper], sorted_years)
+        for newspaper in sorted(newspapers_set)
+    }
 
     # All keywords with metadata
     all_keywords = [
@@ -269,11 +263,11 @@ def main():
 
         # Process subject keywords
         subjects_data = process_keywords_data(df, "subject")
-        save_json(subjects_data, output_dir / "keywords-subjects.json")
+        save_columnar_json(subjects_data, output_dir / "keywords-subjects.json")
 
         # Process spatial keywords
         spatial_data = process_keywords_data(df, "spatial")
-        save_json(spatial_data, output_dir / "keywords-spatial.json")
+        save_columnar_json(spatial_data, output_dir / "keywords-spatial.json")
 
         # Generate metadata
         metadata = generate_metadata(df, subjects_data, spatial_data)
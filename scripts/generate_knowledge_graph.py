@@ -10,6 +10,12 @@ OUTPUT:
   - static/data/knowledge-graph/graph.json       (core KG: entities + typed edges)
   - static/data/knowledge-graph/ontology.json     (schema definition)
   - static/data/knowledge-graph/stats.json        (extraction statistics)
+  - static/data/knowledge-graph/graph-{tier}.json (level-of-detail subgraphs)
+  - static/data/knowledge-graph/lod.json          (tier manifest, smallest first)
+  - static/data/knowledge-graph/ego/{bucket}.json (1-hop neighbourhood shards)
+  - static/data/knowledge-graph/ego/index.json    (bucket count + hash name)
+  - static/data/knowledge-graph/graph*.bin        (--binary: typed-array copies of
+                                                   graph.json and the tiers, graph_binary.py)
 
 EDGE TYPES:
   Explicit (from index relational fields):
@@ -23,19 +29,77 @@ EDGE TYPES:
     - mentioned_in    : entity name in article.subject
     - co_occurs_with  : two entities in same article.subject (weighted)
     - co_authored_with: two authors on same reference
+
+LEVELS OF DETAIL (--lod-tiers, default "core:500:10,mid:2000:25"):
+  Each tier keeps the top-N nodes by labelPriority and, among the edges between
+  them, those ranking in the K strongest of either endpoint. Tiers are nested
+  by node (core ⊂ mid ⊂ full) and share node ids/attributes with graph.json, so
+  the client renders the core first and swaps in larger tiers on demand.
+
+EGO SHARDS (--ego-buckets, default 512; 0 disables):
+  Node ids are hashed (32-bit FNV-1a over UTF-8) into buckets; each bucket
+  file holds the incident edges of its nodes, strongest first, plus the
+  records of those nodes and all their neighbours. index.json only records
+  the bucket count and hash name: the client (src/lib/utils/egoShards.ts)
+  hashes a selected id itself, so an entity costs one shard fetch instead of
+  the full graph.json. Shards are written on a thread pool (--workers).
+
+FUZZY NAME RESOLUTION (--no-fuzzy to skip, --fuzzy-threshold):
+  Subject and author names without an exact (normalized) match are resolved
+  in one batch by entity_resolver.FuzzyResolver: trigram blocking over index
+  titles and alternative titles, then a word-order/initials-aware ratio on
+  the few candidates per block. Ambiguous names stay unmatched; results are
+  cached in .cache/entity-resolver/ across runs.
+
+BACKBONE (optional, --backbone-alpha):
+  co_occurs_with edges are first reduced to their disparity-filter backbone
+  (graph_analytics.py) over all article co-occurrences, then thresholded by
+  --min-cooccurrence: an edge survives when it carries a significant share of
+  either endpoint's co-occurrence strength, which keeps ties between
+  low-frequency entities and drops the weak edges fanning out of hubs.
+
+ANALYTICS (--no-analytics to skip):
+  One scipy CSR adjacency (graph_analytics.py) yields weighted PageRank,
+  k-core numbers and Louvain communities, attached as node attributes
+  pagerank / coreNumber / community. --priority-by pagerank ranks
+  labelPriority by PageRank instead of strength.
+
+LAYOUT (optional, --layout):
+  Deterministic Barnes-Hut ForceAtlas2 (graph_layout.py) run after the graph
+  metrics; writes x/y on every node so the client can skip its force layout.
 """
 
 from __future__ import annotations
 
 import argparse
-import hashlib
 import logging
+import os
 import unicodedata
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from itertools import combinations
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+import numpy as np
+
+from entity_resolver import DEFAULT_THRESHOLD as DEFAULT_FUZZY_THRESHOLD, FuzzyResolver
+from graph_analytics import (
+    DEFAULT_RESOLUTION,
+    adjacency_matrix,
+    core_numbers,
+    disparity_filter,
+    louvain_communities,
+    modularity,
+    pagerank,
+)
+from graph_binary import save_graph_binary
+from graph_layout import (
+    DEFAULT_ITERATIONS as DEFAULT_LAYOUT_ITERATIONS,
+    DEFAULT_SEED as DEFAULT_LAYOUT_SEED,
+    assign_positions,
+    forceatlas2_layout,
+)
 from iwac_utils import (
     configure_logging,
     find_column,
@@ -67,6 +131,65 @@ TYPE_MAP = {
 # Reverse map for lookups
 TYPE_MAP_REV = {v: k for k, v in TYPE_MAP.items()}
 
+# Level-of-detail tiers: (name, max nodes, strongest edges kept per node)
+DEFAULT_LOD_TIERS: List[Tuple[str, int, int]] = [("core", 500, 10), ("mid", 2000, 25)]
+
+# Node attributes labelPriority can be ranked by
+PRIORITY_MEASURES = ("strength", "pagerank")
+
+# Ego-network shards: number of hash buckets
+DEFAULT_EGO_BUCKETS = 512
+
+
+def parse_lod_tiers(spec: str) -> List[Tuple[str, int, int]]:
+    """Parse a "name:nodes:edgesPerNode,..." tier spec ("" or "none" disables tiers)."""
+    tiers = []
+    if not spec or spec.strip().lower() == "none":
+        return tiers
+    for part in spec.split(","):
+        name, max_nodes, per_node = part.strip().split(":")
+        tiers.append((name, int(max_nodes), int(per_node)))
+    return sorted(tiers, key=lambda tier: tier[1])
+
+
+def strongest_edge_mask(
+    src: np.ndarray, dst: np.ndarray, strength: np.ndarray, per_node: int
+) -> np.ndarray:
+    """Mark edges ranking within the ``per_node`` strongest of either endpoint.
+
+    Args:
+        src: Edge source codes
+        dst: Edge target codes
+        strength: Edge sort key (higher is stronger); ties keep edge order
+        per_node: Edges kept per endpoint
+
+    Returns:
+        Boolean mask aligned with the edge arrays
+    """
+    n_edges = len(src)
+    ends = np.concatenate([src, dst])
+    edge_ids = np.concatenate([np.arange(n_edges)] * 2)
+    order = np.lexsort((edge_ids, -np.concatenate([strength] * 2), ends))
+    sorted_ends = ends[order]
+    rank = np.arange(len(order)) - np.searchsorted(sorted_ends, sorted_ends, side="left")
+    keep = np.zeros(n_edges, dtype=bool)
+    keep[edge_ids[order][rank < per_node]] = True
+    return keep
+
+
+EGO_HASH = "fnv1a32"
+
+
+def ego_bucket(node_id: str, buckets: int) -> int:
+    """Stable shard bucket for a node id (32-bit FNV-1a over its UTF-8 bytes).
+
+    Mirrored by ``egoBucket`` in src/lib/utils/egoShards.ts; change both together.
+    """
+    h = 0x811C9DC5
+    for byte in node_id.encode("utf-8"):
+        h = ((h ^ byte) * 0x01000193) & 0xFFFFFFFF
+    return h % buckets
+
 
 def normalize_name(name: str) -> str:
     """Normalize entity name for matching: NFC + lowercase + collapse whitespace."""
@@ -102,10 +225,32 @@ class KnowledgeGraphBuilder:
         min_cooccurrence: int = 3,
         max_article_nodes: int = 0,
         include_articles: bool = False,
+        fuzzy: bool = True,
+        fuzzy_threshold: float = DEFAULT_FUZZY_THRESHOLD,
+        backbone_alpha: Optional[float] = None,
+        analytics: bool = True,
+        priority_by: str = "strength",
+        community_resolution: float = DEFAULT_RESOLUTION,
+        layout: bool = False,
+        layout_iterations: int = DEFAULT_LAYOUT_ITERATIONS,
+        layout_seed: int = DEFAULT_LAYOUT_SEED,
     ):
+        if priority_by not in PRIORITY_MEASURES:
+            raise ValueError(f"priority_by must be one of {PRIORITY_MEASURES}, got {priority_by!r}")
+        if priority_by != "strength" and not analytics:
+            raise ValueError(f"priority_by={priority_by!r} requires analytics")
         self.min_cooccurrence = min_cooccurrence
         self.max_article_nodes = max_article_nodes
         self.include_articles = include_articles
+        self.fuzzy = fuzzy
+        self.fuzzy_threshold = fuzzy_threshold
+        self.backbone_alpha = backbone_alpha
+        self.analytics = analytics
+        self.priority_by = priority_by
+        self.community_resolution = community_resolution
+        self.layout = layout
+        self.layout_iterations = layout_iterations
+        self.layout_seed = layout_seed
 
         # Data
         self.index_df = None
@@ -120,6 +265,7 @@ class KnowledgeGraphBuilder:
         # Lookup tables
         self.name_to_id: Dict[str, str] = {}  # normalized name → node ID
         self.alt_name_to_id: Dict[str, str] = {}  # alt names → node ID
+        self.fuzzy_name_to_id: Dict[str, str] = {}  # unmatched name → fuzzy-resolved node ID
         self.id_to_name: Dict[str, str] = {}  # node ID → display name
 
         # Statistics
@@ -128,6 +274,7 @@ class KnowledgeGraphBuilder:
             "inferred_edges": Counter(),
             "match_success": 0,
             "match_failure": 0,
+            "fuzzy_matches": 0,
             "unmatched_names": Counter(),
         }
 
@@ -197,10 +344,50 @@ class KnowledgeGraphBuilder:
             self.stats["match_success"] += 1
             return node_id
 
+        # Try fuzzy matches (resolved up front by build_fuzzy_lookup)
+        node_id = self.fuzzy_name_to_id.get(norm)
+        if node_id:
+            self.stats["match_success"] += 1
+            self.stats["fuzzy_matches"] += 1
+            return node_id
+
         self.stats["match_failure"] += 1
         self.stats["unmatched_names"][name] += 1
         return None
 
+    def build_fuzzy_lookup(self) -> None:
+        """Fuzzy-resolve every subject/author name that has no exact match."""
+        names: Set[str] = set()
+        for df, columns in (
+            (self.articles_df, ["subject", "dcterms:subject"]),
+            (self.references_df, ["author", "dcterms:creator"]),
+        ):
+            col = find_column(df, columns) if df is not None else None
+            if col:
+                for value in df[col].dropna():
+                    names.update(parse_pipe_separated(value))
+
+        unmatched = {}
+        for name in names:
+            norm = normalize_name(name)
+            if norm and norm not in self.name_to_id and norm not in self.alt_name_to_id:
+                unmatched[norm] = name
+        if not unmatched:
+            return
+
+        resolver = FuzzyResolver(
+            {**self.alt_name_to_id, **self.name_to_id}, threshold=self.fuzzy_threshold
+        )
+        matches = resolver.resolve_many(unmatched.values())
+        resolver.save_cache()
+        for norm, name in unmatched.items():
+            node_id = matches.get(name)
+            if node_id:
+                self.fuzzy_name_to_id[norm] = node_id
+        logger.info(
+            f"Fuzzy lookup: resolved {len(self.fuzzy_name_to_id)} of {len(unmatched)} unmatched names"
+        )
+
     def build_entity_nodes(self) -> None:
         """Create nodes from the index subset."""
         df = self.index_df
@@ -446,9 +633,23 @@ class KnowledgeGraphBuilder:
                 key = (min(a, b), max(a, b))
                 cooccurrence[key] += 1
 
+        # Disparity backbone over all co-occurrences (before the threshold)
+        pairs = list(cooccurrence.items())
+        if self.backbone_alpha is not None and pairs:
+            index = {nid: i for i, nid in enumerate(self.nodes)}
+            src = np.array([index[a] for (a, _), _ in pairs], dtype=np.int64)
+            dst = np.array([index[b] for (_, b), _ in pairs], dtype=np.int64)
+            weight = np.array([w for _, w in pairs], dtype=np.float64)
+            keep = disparity_filter(len(index), src, dst, weight, self.backbone_alpha)
+            pairs = [pair for pair, kept in zip(pairs, keep.tolist()) if kept]
+            logger.info(
+                f"  Disparity backbone (alpha={self.backbone_alpha}): "
+                f"kept {len(pairs)} of {len(keep)} co-occurring pairs"
+            )
+
         # Add co-occurrence edges above threshold
         cooc_count = 0
-        for (a, b), weight in cooccurrence.items():
+        for (a, b), weight in pairs:
             if weight >= self.min_cooccurrence:
                 edge = {
                     "source": a,
@@ -551,14 +752,86 @@ class KnowledgeGraphBuilder:
                     edge["weightNorm"] = 1.0
 
         # Label priority (by strength, for rendering)
+        self.assign_label_priority("strength")
+
+    def assign_label_priority(self, measure: str) -> None:
+        """Rank nodes by ``measure`` (descending) into labelPriority."""
         sorted_nodes = sorted(
             self.nodes.values(),
-            key=lambda n: n.get("strength", 0),
+            key=lambda n: n.get(measure, 0),
             reverse=True,
         )
         for rank, node in enumerate(sorted_nodes):
             node["labelPriority"] = rank
 
+    def compute_graph_analytics(self) -> None:
+        """Attach PageRank, k-core number and Louvain community to every node."""
+        node_ids = list(self.nodes)
+        if not node_ids:
+            return
+        index = {nid: i for i, nid in enumerate(node_ids)}
+        src, dst, weight = [], [], []
+        for edge in self.edges:
+            s, t = index.get(edge["source"]), index.get(edge["target"])
+            if s is None or t is None:
+                continue
+            src.append(s)
+            dst.append(t)
+            weight.append(edge.get("weight", 1.0))
+
+        adj = adjacency_matrix(len(node_ids), src, dst, weight)
+        ranks = pagerank(adj)
+        cores = core_numbers(adj)
+        communities = louvain_communities(adj, resolution=self.community_resolution)
+
+        for i, node in enumerate(self.nodes.values()):
+            node["pagerank"] = round(float(ranks[i]), 8)
+            node["coreNumber"] = int(cores[i])
+            node["community"] = int(communities[i])
+
+        if self.priority_by != "strength":
+            self.assign_label_priority(self.priority_by)
+
+        sizes = np.bincount(communities)
+        summary = {
+            "communities": len(sizes),
+            "modularity": round(modularity(adj, communities, self.community_resolution), 4),
+            "largestCommunities": sizes[:20].tolist(),
+            "maxCoreNumber": int(cores.max()),
+            "labelPriorityBy": self.priority_by,
+        }
+        self.stats["analytics"] = summary
+        logger.info(
+            f"  {summary['communities']} communities (modularity {summary['modularity']}), "
+            f"max core {summary['maxCoreNumber']}"
+        )
+
+    def compute_layout(self) -> None:
+        """Compute a deterministic ForceAtlas2 layout and store x/y on each node."""
+        node_ids = list(self.nodes)
+        index = {nid: i for i, nid in enumerate(node_ids)}
+        src, dst, weight = [], [], []
+        for edge in self.edges:
+            s, t = index.get(edge["source"]), index.get(edge["target"])
+            if s is None or t is None:
+                continue
+            src.append(s)
+            dst.append(t)
+            weight.append(edge.get("weight", 1.0))
+
+        positions = forceatlas2_layout(
+            len(node_ids),
+            src,
+            dst,
+            weight,
+            iterations=self.layout_iterations,
+            seed=self.layout_seed,
+        )
+        assign_positions(list(self.nodes.values()), positions)
+        logger.info(
+            f"Laid out {len(node_ids)} nodes ({self.layout_iterations} iterations, seed {self.layout_seed})"
+        )
+
     def remove_isolated_nodes(self) -> int:
         """Remove nodes with no edges. Returns count removed."""
         connected = set()
@@ -694,6 +967,115 @@ class KnowledgeGraphBuilder:
             },
         }
 
+    def build_lod_tiers(
+        self, graph: Dict, tiers: List[Tuple[str, int, int]] = DEFAULT_LOD_TIERS
+    ) -> Dict[str, Dict]:
+        """Build nested level-of-detail subgraphs of ``graph``.
+
+        Nodes are taken in labelPriority order, so every tier is a prefix of
+        the next. Edge strength is (weightNorm, weight): explicit edges
+        (weightNorm 1.0) rank first, then the heaviest co-occurrences.
+        """
+        nodes = sorted(graph["nodes"], key=lambda n: n.get("labelPriority", 0))
+        index = {node["id"]: i for i, node in enumerate(nodes)}
+        edges = graph["edges"]
+        src = np.array([index[e["source"]] for e in edges], dtype=np.int64)
+        dst = np.array([index[e["target"]] for e in edges], dtype=np.int64)
+        weight_norm = np.array([e.get("weightNorm", 0.0) for e in edges], dtype=np.float64)
+        weight = np.array([e.get("weight", 1.0) for e in edges], dtype=np.float64)
+        # Global edge rank by (weightNorm, weight), used as the strength key
+        strength = np.empty(len(edges), dtype=np.int64)
+        strength[np.lexsort((weight, weight_norm))] = np.arange(len(edges))
+
+        result = {}
+        for name, max_nodes, per_node in tiers:
+            inside = np.flatnonzero((src < max_nodes) & (dst < max_nodes))
+            keep = inside[strongest_edge_mask(src[inside], dst[inside], strength[inside], per_node)]
+            tier_nodes = nodes[:max_nodes]
+            tier_edges = [edges[i] for i in keep.tolist()]
+            result[name] = {
+                "nodes": tier_nodes,
+                "edges": tier_edges,
+                "meta": {
+                    **graph["meta"],
+                    "totalNodes": len(tier_nodes),
+                    "totalEdges": len(tier_edges),
+                    "lod": {
+                        "tier": name,
+                        "maxNodes": max_nodes,
+                        "edgesPerNode": per_node,
+                        "fullNodes": len(nodes),
+                        "fullEdges": len(edges),
+                    },
+                },
+            }
+            logger.info(f"  LOD {name}: {len(tier_nodes)} nodes, {len(tier_edges)} edges")
+        return result
+
+    def write_ego_shards(
+        self,
+        graph: Dict,
+        out_dir: Path,
+        buckets: int = DEFAULT_EGO_BUCKETS,
+        workers: int = 1,
+    ) -> Dict:
+        """Write hashed 1-hop neighbourhood shards of ``graph`` to ``out_dir``.
+
+        Each ``{bucket}.json`` maps its ego node ids to their incident edges
+        (strongest first, same shape as graph.json) and carries the node
+        records of the egos and all their neighbours. Buckets are serialized
+        in parallel; stale shards from a previous run are removed first.
+
+        Returns:
+            The shard index (also written to ``index.json``): the bucket count
+            and hash name only, since clients recompute ``ego_bucket``
+        """
+        nodes = {node["id"]: node for node in graph["nodes"]}
+        edges = graph["edges"]
+        order = sorted(
+            range(len(edges)),
+            key=lambda i: (-edges[i].get("weightNorm", 0.0), -edges[i].get("weight", 1.0), i),
+        )
+        incident: Dict[str, List[Dict]] = defaultdict(list)
+        for i in order:
+            incident[edges[i]["source"]].append(edges[i])
+            incident[edges[i]["target"]].append(edges[i])
+
+        members: Dict[int, List[str]] = defaultdict(list)
+        for node_id in nodes:
+            members[ego_bucket(node_id, buckets)].append(node_id)
+
+        def write_shard(bucket: int) -> int:
+            egos = {ego: incident.get(ego, []) for ego in members[bucket]}
+            ids = dict.fromkeys(members[bucket])
+            for ego_edges in egos.values():
+                for edge in ego_edges:
+                    ids[edge["source"]] = None
+                    ids[edge["target"]] = None
+            shard = {
+                "bucket": bucket,
+                "egos": egos,
+                "nodes": {node_id: nodes[node_id] for node_id in ids},
+            }
+            save_json(shard, out_dir / f"{bucket}.json", minify=True, log=False)
+            return len(ids)
+
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for stale in out_dir.glob("*.json"):
+            stale.unlink()
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            sizes = list(pool.map(write_shard, sorted(members)))
+
+        index = {"generatedAt": generate_timestamp(), "buckets": buckets, "hash": EGO_HASH}
+        save_json(index, out_dir / "index.json", minify=True)
+        if sizes:
+            logger.info(
+                f"  Ego shards: {len(sizes)} files, "
+                f"{sum(sizes) / len(sizes):.0f} nodes/shard on average (max {max(sizes)})"
+            )
+        return index
+
     def build_stats(self) -> Dict:
         """Generate extraction statistics."""
         # Node type distribution
@@ -758,11 +1140,13 @@ class KnowledgeGraphBuilder:
                 "totalAttempts": total_matches,
                 "successes": self.stats["match_success"],
                 "failures": self.stats["match_failure"],
+                "fuzzyMatches": self.stats["fuzzy_matches"],
                 "matchRate": round(match_rate, 1),
                 "topUnmatched": top_unmatched,
             },
             "explicitEdgeBreakdown": dict(self.stats["explicit_edges"]),
             "inferredEdgeBreakdown": dict(self.stats["inferred_edges"]),
+            **({"analytics": self.stats["analytics"]} if "analytics" in self.stats else {}),
         }
 
     def build(self) -> Dict:
@@ -782,6 +1166,11 @@ class KnowledgeGraphBuilder:
         logger.info("\n--- Building entity nodes ---")
         self.build_entity_nodes()
 
+        # Resolve near-miss names before edge extraction
+        if self.fuzzy:
+            logger.info("\n--- Fuzzy-resolving unmatched names ---")
+            self.build_fuzzy_lookup()
+
         # Extract explicit edges
         logger.info("\n--- Extracting explicit edges (index fields) ---")
         self.extract_explicit_edges()
@@ -802,6 +1191,16 @@ class KnowledgeGraphBuilder:
         logger.info("\n--- Computing graph metrics ---")
         self.compute_graph_metrics()
 
+        # PageRank, k-core, communities
+        if self.analytics:
+            logger.info("\n--- Computing graph analytics ---")
+            self.compute_graph_analytics()
+
+        # Precompute positions
+        if self.layout:
+            logger.info("\n--- Computing ForceAtlas2 layout ---")
+            self.compute_layout()
+
         # Build outputs
         graph = {
             "nodes": list(self.nodes.values()),
@@ -812,6 +1211,7 @@ class KnowledgeGraphBuilder:
                 "totalEdges": len(self.edges),
                 "dataSource": "fmadore/islam-west-africa-collection",
                 "minCooccurrence": self.min_cooccurrence,
+                "backboneAlpha": self.backbone_alpha,
             },
         }
 
@@ -841,12 +1241,86 @@ def main():
         default=3,
         help="Minimum article co-occurrence count for inferred edges (default: 3)",
     )
+    parser.add_argument(
+        "--no-fuzzy",
+        action="store_true",
+        help="Only match subject/author names exactly (skip fuzzy resolution)",
+    )
+    parser.add_argument(
+        "--fuzzy-threshold",
+        type=float,
+        default=DEFAULT_FUZZY_THRESHOLD,
+        help=f"Minimum similarity for a fuzzy name match (default: {DEFAULT_FUZZY_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--backbone-alpha",
+        type=float,
+        default=None,
+        help="Keep only the disparity-filter backbone of co_occurs_with edges at this significance (e.g. 0.05)",
+    )
     parser.add_argument(
         "--output-dir",
         type=str,
         default=str(OUT_DIR),
         help="Output directory for JSON files",
     )
+    parser.add_argument(
+        "--lod-tiers",
+        type=str,
+        default=",".join(f"{n}:{m}:{k}" for n, m, k in DEFAULT_LOD_TIERS),
+        help='Level-of-detail tiers as "name:maxNodes:edgesPerNode,..." ("none" to disable)',
+    )
+    parser.add_argument(
+        "--binary",
+        action="store_true",
+        help="Also write typed-array binary copies (graph.bin, graph-{tier}.bin)",
+    )
+    parser.add_argument(
+        "--no-analytics",
+        action="store_true",
+        help="Skip PageRank, k-core and community detection",
+    )
+    parser.add_argument(
+        "--priority-by",
+        choices=PRIORITY_MEASURES,
+        default="strength",
+        help="Node measure ranked into labelPriority (default: strength)",
+    )
+    parser.add_argument(
+        "--community-resolution",
+        type=float,
+        default=DEFAULT_RESOLUTION,
+        help=f"Louvain modularity resolution (default: {DEFAULT_RESOLUTION})",
+    )
+    parser.add_argument(
+        "--ego-buckets",
+        type=int,
+        default=DEFAULT_EGO_BUCKETS,
+        help=f"Hash buckets for ego-network shards, 0 to disable (default: {DEFAULT_EGO_BUCKETS})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=min(8, os.cpu_count() or 1),
+        help="Parallel writers for ego-network shards",
+    )
+    parser.add_argument(
+        "--layout",
+        action="store_true",
+        help="Precompute ForceAtlas2 x/y positions for each node",
+    )
+    parser.add_argument(
+        "--layout-iterations",
+        type=int,
+        default=DEFAULT_LAYOUT_ITERATIONS,
+        help=f"ForceAtlas2 iteration budget (default: {DEFAULT_LAYOUT_ITERATIONS})",
+    )
+    parser.add_argument(
+        "--layout-seed",
+        type=int,
+        default=DEFAULT_LAYOUT_SEED,
+        help=f"Seed for the initial layout positions (default: {DEFAULT_LAYOUT_SEED})",
+    )
     args = parser.parse_args()
 
     configure_logging()
@@ -856,6 +1330,15 @@ def main():
 
     builder = KnowledgeGraphBuilder(
         min_cooccurrence=args.min_cooccurrence,
+        fuzzy=not args.no_fuzzy,
+        fuzzy_threshold=args.fuzzy_threshold,
+        backbone_alpha=args.backbone_alpha,
+        analytics=not args.no_analytics,
+        priority_by=args.priority_by,
+        community_resolution=args.community_resolution,
+        layout=args.layout,
+        layout_iterations=args.layout_iterations,
+        layout_seed=args.layout_seed,
     )
 
     # Build graph
@@ -868,9 +1351,50 @@ def main():
     # Save outputs
     logger.info("\n--- Saving outputs ---")
     save_json(graph, out_dir / "graph.json", minify=True)
+    if args.binary:
+        save_graph_binary(graph, out_dir / "graph.bin")
     save_json(ontology, out_dir / "ontology.json", minify=False)
     save_json(stats, out_dir / "stats.json", minify=False)
 
+    # Level-of-detail tiers + manifest (smallest first, full graph last)
+    tiers = parse_lod_tiers(args.lod_tiers)
+    if tiers:
+        logger.info("\n--- Building level-of-detail tiers ---")
+        manifest = []
+        for name, tier in builder.build_lod_tiers(graph, tiers).items():
+            save_json(tier, out_dir / f"graph-{name}.json", minify=True)
+            entry = {
+                "name": name,
+                "file": f"graph-{name}.json",
+                "nodes": tier["meta"]["totalNodes"],
+                "edges": tier["meta"]["totalEdges"],
+            }
+            if args.binary:
+                save_graph_binary(tier, out_dir / f"graph-{name}.bin")
+                entry["binary"] = f"graph-{name}.bin"
+            manifest.append(entry)
+        entry = {
+            "name": "full",
+            "file": "graph.json",
+            "nodes": len(graph["nodes"]),
+            "edges": len(graph["edges"]),
+        }
+        if args.binary:
+            entry["binary"] = "graph.bin"
+        manifest.append(entry)
+        save_json(
+            {"generatedAt": generate_timestamp(), "tiers": manifest},
+            out_dir / "lod.json",
+            minify=False,
+        )
+
+    # Ego-network shards + bucket metadata
+    if args.ego_buckets > 0:
+        logger.info("\n--- Writing ego-network shards ---")
+        builder.write_ego_shards(
+            graph, out_dir / "ego", buckets=args.ego_buckets, workers=args.workers
+        )
+
     # Print summary
     logger.info("\n" + "=" * 60)
     logger.info("KNOWLEDGE GRAPH SUMMARY")
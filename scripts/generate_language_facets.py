@@ -8,8 +8,8 @@ Fetches data from multiple subsets of the dataset:
 Generates JSON files for pie chart facets under static/data:
 
 1) language-global.json        -> global language distribution for pie chart
-2) language-countries.json     -> language distribution by country facets
-3) language-types.json         -> language distribution by type facets
+2) language-countries.json     -> language distribution by country facets (columnar)
+3) language-types.json         -> language distribution by type facets (columnar)
 4) language-metadata.json      -> metadata about the language facets
 
 The script processes these subsets:
@@ -30,7 +30,7 @@ from __future__ import annotations
 import re
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 from collections import defaultdict, Counter
 from datetime import datetime
 
@@ -49,6 +49,8 @@ from iwac_utils import (
     extract_year,
     find_column,
     save_json,
+    build_columnar_series,
+    save_columnar_json,
 )
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -184,6 +186,28 @@ def generate_global_distribution(all_records: List[Dict[str, Any]]) -> Dict[str,
     }
 
 
+def _facet_language_matrix(
+    facet_language_counts: Dict[str, Dict[str, int]]
+) -> Tuple[List[str], Dict[str, Any]]:
+    """Align per-facet language counts to one shared language axis.
+
+    The axis is ordered by overall frequency so the most common languages
+    come first; each facet (in sorted order) becomes one row of counts in a
+    columnar series block. Pie slices, totals and percentages are derived
+    from the rows client-side.
+    """
+    language_totals = Counter()
+    for language_counts in facet_language_counts.values():
+        language_totals.update(language_counts)
+    languages = [language for language, _ in language_totals.most_common()]
+
+    series = build_columnar_series({
+        facet: [facet_language_counts[facet].get(language, 0) for language in languages]
+        for facet in sorted(facet_language_counts.keys())
+    })
+    return languages, series
+
+
 def generate_country_facets(all_records: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Generate language distribution by country for faceted filtering."""
     country_language_counts = defaultdict(lambda: defaultdict(int))
@@ -191,29 +215,12 @@ def generate_country_facets(all_records: List[Dict[str, Any]]) -> Dict[str, Any]
     for record in all_records:
         country_language_counts[record["country"]][record["language"]] += 1
     
-    facets = {}
-    
-    for country, language_counts in country_language_counts.items():
-        total = sum(language_counts.values())
-        
-        pie_data = []
-        for language, count in sorted(language_counts.items(), key=lambda x: x[1], reverse=True):
-            percentage = (count / total * 100) if total > 0 else 0
-            pie_data.append({
-                "label": language,
-                "value": count,
-                "percentage": round(percentage, 1)
-            })
-        
-        facets[country] = {
-            "data": pie_data,
-            "total": total,
-            "languages": len(language_counts)
-        }
+    languages, series = _facet_language_matrix(country_language_counts)
     
     return {
-        "facets": facets,
-        "countries": sorted(facets.keys()),
+        "languages": languages,
+        "series": series,
+        "countries": series["names"],
         "generated_at": datetime.now().isoformat()
     }
 
@@ -225,29 +232,12 @@ def generate_type_facets(all_records: List[Dict[str, Any]]) -> Dict[str, Any]:
     for record in all_records:
         type_language_counts[record["type"]][record["language"]] += 1
     
-    facets = {}
-    
-    for doc_type, language_counts in type_language_counts.items():
-        total = sum(language_counts.values())
-        
-        pie_data = []
-        for language, count in sorted(language_counts.items(), key=lambda x: x[1], reverse=True):
-            percentage = (count / total * 100) if total > 0 else 0
-            pie_data.append({
-                "label": language,
-                "value": count,
-                "percentage": round(percentage, 1)
-            })
-        
-        facets[doc_type] = {
-            "data": pie_data,
-            "total": total,
-            "languages": len(language_counts)
-        }
+    languages, series = _facet_language_matrix(type_language_counts)
     
     return {
-        "facets": facets,
-        "types": sorted(facets.keys()),
+        "languages": languages,
+        "series": series,
+        "types": series["names"],
         "generated_at": datetime.now().isoformat()
     }
 
@@ -380,11 +370,11 @@ def main():
     
     logger.info("Generating country facets...")
     country_data = generate_country_facets(all_records)
-    save_json(country_data, output_dir / "language-countries.json")
+    save_columnar_json(country_data, output_dir / "language-countries.json")
     
     logger.info("Generating type facets...")
     type_data = generate_type_facets(all_records)
-    save_json(type_data, output_dir / "language-types.json")
+    save_columnar_json(type_data, output_dir / "language-types.json")
     
     logger.info("Generating metadata...")
     metadata = generate_metadata(all_records)
@@ -18,6 +18,13 @@ Data extraction:
 - country: multivalue field separated by |
 - pub_date: normalized to YYYY format (from yyyy-mm-dd, yyyy-mm, or yyyy)
 - o:resource_class: reference type
+- --binary also writes coauthor-network.bin (typed-array copy, graph_binary.py)
+- author/publisher -> index o:id: exact normalized match, then fuzzy match
+  (entity_resolver.FuzzyResolver; --no-fuzzy to disable)
+- per-country files are computed from one country partition of the records
+  (a single pass, whatever the number of countries)
+- records are compact slotted ReferenceRecord objects (one per reference ×
+  country × author) sharing the per-reference author/publisher/provenance lists
 """
 
 from __future__ import annotations
@@ -25,6 +32,7 @@ from __future__ import annotations
 import json
 import logging
 import re
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from collections import defaultdict, Counter
@@ -48,6 +56,14 @@ from iwac_utils import (
     save_json as _utils_save_json,
     find_column as _utils_find_column,
 )
+from entity_resolver import (
+    DEFAULT_CACHE_DIR as DEFAULT_RESOLVER_CACHE_DIR,
+    DEFAULT_THRESHOLD as DEFAULT_FUZZY_THRESHOLD,
+    FuzzyResolver,
+)
+from graph_binary import save_graph_binary
+from graph_layout import DEFAULT_ITERATIONS as DEFAULT_LAYOUT_ITERATIONS, DEFAULT_SEED as DEFAULT_LAYOUT_SEED
+from network_builder import NetworkBuilder
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -248,6 +264,55 @@ def find_entity_id(name: str, lookup: Dict[str, Dict[str, Any]], entity_types: L
     return None
 
 
+def add_fuzzy_matches(
+    lookup: Dict[str, Dict[str, Any]],
+    names: List[str],
+    threshold: float = DEFAULT_FUZZY_THRESHOLD,
+    cache_dir: Optional[Path] = DEFAULT_RESOLVER_CACHE_DIR,
+) -> int:
+    """Alias near-miss author/publisher spellings to their index entries.
+
+    Names with no exact entry in the lookup are resolved in one batch by
+    entity_resolver.FuzzyResolver against the index o:ids, so a title and its
+    alternative titles count as one candidate rather than ambiguous rivals.
+    Confident matches are added to the lookup under their normalized form
+    (pointing at the o:id's first entry), so find_entity_id picks them up
+    unchanged.
+
+    Returns:
+        Number of aliases added
+    """
+    unmatched = {}
+    for name in names:
+        if name:
+            normalized = " ".join(name.lower().split())
+            if normalized not in lookup:
+                unmatched[normalized] = name
+    if not lookup or not unmatched:
+        return 0
+
+    entries: Dict[str, Dict[str, Any]] = {}
+    for entry in lookup.values():
+        entries.setdefault(entry["o_id"], entry)
+
+    resolver = FuzzyResolver(
+        {key: entry["o_id"] for key, entry in lookup.items()},
+        threshold=threshold,
+        cache_dir=cache_dir,
+    )
+    matches = resolver.resolve_many(unmatched.values())
+    resolver.save_cache()
+
+    added = 0
+    for normalized, name in unmatched.items():
+        o_id = matches.get(name)
+        if o_id:
+            lookup[normalized] = entries[o_id]
+            added += 1
+    logger.info(f"Fuzzy-matched {added} of {len(unmatched)} unmatched author/publisher names")
+    return added
+
+
 def parse_coordinates(coord_str: str) -> Optional[Tuple[float, float]]:
     """Parse coordinates from the Coordonnées field. Delegates to iwac_utils."""
     return _utils_parse_coordinates(coord_str)
@@ -315,7 +380,7 @@ def build_coord_lookup(index_df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
 
 
 def generate_provenance_map_data(
-    records: List[Dict[str, Any]],
+    records: List[ReferenceRecord],
     coord_lookup: Dict[str, Dict[str, Any]],
     name_lookup: Optional[Dict[str, Dict[str, Any]]] = None
 ) -> Dict[str, Any]:
@@ -341,20 +406,20 @@ def generate_provenance_map_data(
     seen_pub_ids: Dict[str, Dict[str, Any]] = {}
 
     for record in records:
-        pub_id = record["pub_id"]
+        pub_id = record.pub_id
         if pub_id in seen_pub_ids:
             continue
 
         # Get provenance from record (we need to add this to process_references_data)
-        provenance_list = record.get("provenance_list", [])
+        provenance_list = record.provenance_list
         if not provenance_list:
             continue
 
         seen_pub_ids[pub_id] = {
-            "title": record.get("title", ""),
-            "type": record.get("type", "Unknown"),
-            "year": record.get("year"),
-            "authors": record.get("authors_list", [])
+            "title": record.title,
+            "type": record.type,
+            "year": record.year,
+            "authors": record.authors_list
         }
 
         for provenance in provenance_list:
@@ -366,15 +431,15 @@ def generate_provenance_map_data(
 
             if pub_id not in location_data[normalized]["pub_ids"]:
                 location_data[normalized]["pub_ids"].add(pub_id)
-                location_data[normalized]["types"][record.get("type", "Unknown")] += 1
-                if record.get("year"):
-                    location_data[normalized]["years"].append(record["year"])
+                location_data[normalized]["types"][record.type] += 1
+                if record.year:
+                    location_data[normalized]["years"].append(record.year)
                 location_data[normalized]["publications"].append({
                     "pub_id": pub_id,
-                    "title": record.get("title", ""),
-                    "type": record.get("type", "Unknown"),
-                    "year": record.get("year"),
-                    "authors": record.get("authors_list", [])[:3]  # Limit to first 3 authors
+                    "title": record.title,
+                    "type": record.type,
+                    "year": record.year,
+                    "authors": record.authors_list[:3]  # Limit to first 3 authors
                 })
 
     logger.info(f"Found {len(location_data)} unique provenance locations with coordinates")
@@ -444,7 +509,32 @@ def generate_provenance_map_data(
     return result
 
 
-def process_references_data(df: pd.DataFrame) -> List[Dict[str, Any]]:
+@dataclass(slots=True)
+class ReferenceRecord:
+    """One reference × country × author row.
+
+    The list fields are shared by all rows of the same reference.
+    """
+    pub_id: str
+    year: Optional[int]
+    country: str
+    type: str
+    author: Optional[str]
+    title: str
+    publishers_list: List[str]  # Keep full list for publisher stats
+    authors_list: List[str]  # Keep full list for co-author network
+    provenance_list: List[str]  # Keep full list for map
+
+    @property
+    def has_year(self) -> bool:
+        return self.year is not None
+
+    @property
+    def has_author(self) -> bool:
+        return self.author is not None
+
+
+def process_references_data(df: pd.DataFrame) -> List[ReferenceRecord]:
     """Process references data and extract normalized records."""
     if df.empty:
         logger.warning("Empty dataframe received")
@@ -470,15 +560,20 @@ def process_references_data(df: pd.DataFrame) -> List[Dict[str, Any]]:
 
     logger.info(f"Found columns: author={author_col}, country={country_col}, date={date_col}, type={type_col}, id={id_col}, publisher={publisher_col}, provenance={provenance_col}")
     
-    records = []
+    records: List[ReferenceRecord] = []
     skipped_no_year = 0
     skipped_no_author = 0
-    
-    for idx, row in df.iterrows():
+
+    # Iterate column values directly instead of building a Series per row
+    columns = [author_col, country_col, date_col, type_col, title_col, id_col, publisher_col, provenance_col]
+    values = [df[col].tolist() if col else [None] * len(df) for col in columns]
+
+    for idx, author_val, country_val, date_val, type_val, title_val, id_val, publisher_val, provenance_val in zip(
+        df.index, *values
+    ):
         # Get the identifier from the dataset (or fall back to index)
         pub_id = None
         if id_col:
-            id_val = row.get(id_col)
             if id_val and not (isinstance(id_val, float) and pd.isna(id_val)):
                 pub_id = str(id_val).strip()
         
@@ -489,77 +584,56 @@ def process_references_data(df: pd.DataFrame) -> List[Dict[str, Any]]:
         # Extract year (required for temporal analysis)
         year = None
         if date_col:
-            year = extract_year(row.get(date_col))
+            year = extract_year(date_val)
         
         # Extract authors (required for author analysis)
         authors = []
         if author_col:
-            authors = normalize_authors(row.get(author_col))
+            authors = normalize_authors(author_val)
         
         # Extract countries
         countries = ["Unknown"]
         if country_col:
-            countries = normalize_country(row.get(country_col))
+            countries = normalize_country(country_val)
         
         # Extract reference type
         ref_type = "Unknown"
         if type_col:
-            ref_type = normalize_reference_type(row.get(type_col))
+            ref_type = normalize_reference_type(type_val)
         
         # Extract title (optional, for display)
         title = ""
         if title_col:
-            title_val = row.get(title_col)
             if title_val and not (isinstance(title_val, float) and pd.isna(title_val)):
                 title = str(title_val).strip()
 
         # Extract publishers (can be multiple, pipe-separated)
         publishers = []
         if publisher_col:
-            publishers = normalize_publishers(row.get(publisher_col))
+            publishers = normalize_publishers(publisher_val)
 
         # Extract provenance locations (can be multiple, pipe-separated)
         provenance = []
         if provenance_col:
-            provenance = normalize_multivalue_field(row.get(provenance_col), "|")
+            provenance = normalize_multivalue_field(provenance_val, "|")
 
         # Create records with different tracking
         # For temporal analysis: need year
         if year:
             for country in countries:
                 for author in (authors if authors else [None]):
-                    records.append({
-                        "pub_id": pub_id,
-                        "year": year,
-                        "country": country,
-                        "type": ref_type,
-                        "author": author,
-                        "title": title,
-                        "publishers_list": publishers,  # Keep full list for publisher stats
-                        "authors_list": authors,  # Keep full list for co-author network
-                        "provenance_list": provenance,  # Keep full list for map
-                        "has_year": True,
-                        "has_author": author is not None
-                    })
+                    records.append(ReferenceRecord(
+                        pub_id, year, country, ref_type, author, title, publishers, authors, provenance
+                    ))
         else:
             skipped_no_year += 1
             # Still track for author-only stats if we have authors
             if authors:
                 for country in countries:
                     for author in authors:
-                        records.append({
-                            "pub_id": pub_id,
-                            "year": None,
-                            "country": country,
-                            "type": ref_type,
-                            "author": author,
-                            "title": title,
-                            "publishers_list": publishers,
-                            "authors_list": authors,  # Keep full list for co-author network
-                            "provenance_list": provenance,  # Keep full list for map
-                            "has_year": False,
-                            "has_author": True
-                        })
+                        records.append(ReferenceRecord(
+                            pub_id, None, country, ref_type, author, title, publishers, authors, provenance
+                        ))
             else:
                 skipped_no_author += 1
     
@@ -570,14 +644,14 @@ def process_references_data(df: pd.DataFrame) -> List[Dict[str, Any]]:
     return records
 
 
-def generate_by_year_data(records: List[Dict[str, Any]], country_filter: Optional[str] = None) -> Dict[str, Any]:
+def generate_by_year_data(records: List[ReferenceRecord], country_filter: Optional[str] = None) -> Dict[str, Any]:
     """Generate references by year and type data."""
     # Filter records with years
-    year_records = [r for r in records if r["has_year"]]
+    year_records = [r for r in records if r.has_year]
     
     # Apply country filter if specified
     if country_filter:
-        year_records = [r for r in year_records if r["country"] == country_filter]
+        year_records = [r for r in year_records if r.country == country_filter]
         logger.info(f"Generating by-year data for {country_filter}: {len(year_records)} records")
     else:
         logger.info(f"Generating global by-year data: {len(year_records)} records")
@@ -596,9 +670,9 @@ def generate_by_year_data(records: List[Dict[str, Any]], country_filter: Optiona
     year_type_pub_ids = defaultdict(lambda: defaultdict(set))
     
     for record in year_records:
-        year = record["year"]
-        ref_type = record["type"]
-        pub_id = record["pub_id"]
+        year = record.year
+        ref_type = record.type
+        pub_id = record.pub_id
         
         # Track unique pub_ids per year-type combination
         year_type_pub_ids[year][ref_type].add(pub_id)
@@ -643,17 +717,17 @@ def generate_by_year_data(records: List[Dict[str, Any]], country_filter: Optiona
 
 
 def generate_authors_data(
-    records: List[Dict[str, Any]],
+    records: List[ReferenceRecord],
     country_filter: Optional[str] = None,
     name_lookup: Optional[Dict[str, Dict[str, Any]]] = None
 ) -> Dict[str, Any]:
     """Generate top authors by publication count."""
     # Filter records with authors
-    author_records = [r for r in records if r["has_author"]]
+    author_records = [r for r in records if r.has_author]
 
     # Apply country filter if specified
     if country_filter:
-        author_records = [r for r in author_records if r["country"] == country_filter]
+        author_records = [r for r in author_records if r.country == country_filter]
         logger.info(f"Generating authors data for {country_filter}: {len(author_records)} records")
     else:
         logger.info(f"Generating global authors data: {len(author_records)} records")
@@ -675,10 +749,10 @@ def generate_authors_data(
     })
 
     for record in author_records:
-        author = record["author"]
-        pub_id = record["pub_id"]
-        ref_type = record["type"]
-        year = record.get("year")
+        author = record.author
+        pub_id = record.pub_id
+        ref_type = record.type
+        year = record.year
 
         # Only count each publication once per author
         if pub_id not in author_data[author]["pub_ids"]:
@@ -734,17 +808,17 @@ def generate_authors_data(
 
 
 def generate_publishers_data(
-    records: List[Dict[str, Any]],
+    records: List[ReferenceRecord],
     country_filter: Optional[str] = None,
     name_lookup: Optional[Dict[str, Dict[str, Any]]] = None
 ) -> Dict[str, Any]:
     """Generate top publishers by publication count."""
     # Filter records with publishers (we need unique pub_ids per publisher)
-    publisher_records = [r for r in records if r.get("publishers_list")]
+    publisher_records = [r for r in records if r.publishers_list]
 
     # Apply country filter if specified
     if country_filter:
-        publisher_records = [r for r in publisher_records if r["country"] == country_filter]
+        publisher_records = [r for r in publisher_records if r.country == country_filter]
         logger.info(f"Generating publishers data for {country_filter}: {len(publisher_records)} records")
     else:
         logger.info(f"Generating global publishers data: {len(publisher_records)} records")
@@ -766,10 +840,10 @@ def generate_publishers_data(
     })
 
     for record in publisher_records:
-        publishers_list = record.get("publishers_list", [])
-        pub_id = record["pub_id"]
-        ref_type = record["type"]
-        year = record.get("year")
+        publishers_list = record.publishers_list
+        pub_id = record.pub_id
+        ref_type = record.type
+        year = record.year
 
         # Process each publisher in the list
         for publisher in publishers_list:
@@ -827,8 +901,11 @@ def generate_publishers_data(
 
 
 def generate_coauthor_network(
-    records: List[Dict[str, Any]],
-    name_lookup: Optional[Dict[str, Dict[str, Any]]] = None
+    records: List[ReferenceRecord],
+    name_lookup: Optional[Dict[str, Dict[str, Any]]] = None,
+    layout: bool = False,
+    layout_iterations: int = DEFAULT_LAYOUT_ITERATIONS,
+    layout_seed: int = DEFAULT_LAYOUT_SEED,
 ) -> Dict[str, Any]:
     """Generate co-author network data.
 
@@ -836,6 +913,8 @@ def generate_coauthor_network(
     - Nodes are authors
     - Edges connect authors who co-authored publications together
     - Edge weight is the number of co-authored publications
+
+    With ``layout`` each node also gets precomputed ForceAtlas2 ``x``/``y``.
     """
     import hashlib
 
@@ -846,11 +925,11 @@ def generate_coauthor_network(
     author_pubs: Dict[str, set] = defaultdict(set)
 
     for record in records:
-        if not record.get("has_author"):
+        if not record.has_author:
             continue
 
-        pub_id = record["pub_id"]
-        authors_list = record.get("authors_list", [])
+        pub_id = record.pub_id
+        authors_list = record.authors_list
 
         if len(authors_list) < 2:
             # Need at least 2 authors for co-authorship
@@ -862,26 +941,23 @@ def generate_coauthor_network(
 
     logger.info(f"Found {len(pub_authors)} publications with 2+ authors")
 
-    # Build co-authorship edges
-    edge_weights: Dict[tuple, Dict] = {}  # (author1, author2) -> {weight, pub_ids}
+    def make_author_id(name: str) -> str:
+        """Create a stable ID for an author."""
+        hash_val = hashlib.md5(name.encode('utf-8')).hexdigest()[:8]
+        return f"author:{hash_val}"
 
+    # Register authors and publication memberships, then derive co-authorship edges
+    builder = NetworkBuilder()
+    for author, pubs in author_pubs.items():
+        builder.add_node(make_author_id(author), type="author", label=author, count=len(pubs))
     for pub_id, authors in pub_authors.items():
-        authors_list = sorted(authors)  # Sort for consistent edge keys
-
-        # Create edges between all pairs of co-authors
-        for i, author1 in enumerate(authors_list):
-            for author2 in authors_list[i+1:]:
-                edge_key = (author1, author2)
-
-                if edge_key not in edge_weights:
-                    edge_weights[edge_key] = {"weight": 0, "pub_ids": set()}
+        for author in sorted(authors):
+            builder.add_membership(str(pub_id), builder.code(make_author_id(author)))
+    builder.add_cooccurrence_edges(edge_type="coauthor")
 
-                edge_weights[edge_key]["weight"] += 1
-                edge_weights[edge_key]["pub_ids"].add(pub_id)
+    logger.info(f"Found {builder.edge_count} unique co-author pairs")
 
-    logger.info(f"Found {len(edge_weights)} unique co-author pairs")
-
-    if not edge_weights:
+    if not builder.edge_count:
         return {
             "nodes": [],
             "edges": [],
@@ -901,113 +977,91 @@ def generate_coauthor_network(
             }
         }
 
-    # Compute node metrics
-    author_degree: Dict[str, int] = defaultdict(int)
-    author_strength: Dict[str, int] = defaultdict(int)
-
-    for (author1, author2), data in edge_weights.items():
-        weight = data["weight"]
-        author_degree[author1] += 1
-        author_degree[author2] += 1
-        author_strength[author1] += weight
-        author_strength[author2] += weight
-
-    # Get all authors that have co-authorships
-    all_coauthors = set(author_degree.keys())
-
-    # Build nodes
-    def make_author_id(name: str) -> str:
-        """Create a stable ID for an author."""
-        hash_val = hashlib.md5(name.encode('utf-8')).hexdigest()[:8]
-        return f"author:{hash_val}"
-
-    # Sort authors by strength for label priority
-    sorted_authors = sorted(all_coauthors, key=lambda a: author_strength[a], reverse=True)
-    author_priority = {author: idx for idx, author in enumerate(sorted_authors)}
-
-    nodes = []
-    author_id_map = {}
-    matched_count = 0
-
-    for author in all_coauthors:
-        author_id = make_author_id(author)
-        author_id_map[author] = author_id
-
-        node_data = {
-            "id": author_id,
-            "type": "author",
-            "label": author,
-            "count": len(author_pubs.get(author, set())),
-            "degree": author_degree[author],
-            "strength": author_strength[author],
-            "labelPriority": author_priority[author]
-        }
+    # Edges by weight descending; nodes ranked by strength for label priority
+    builder.sort_edges_by_weight()
+    if layout:
+        logger.info(f"Computing co-author layout ({layout_iterations} iterations)...")
+        builder.compute_layout(iterations=layout_iterations, seed=layout_seed)
+    network = builder.serialize(
+        priority=builder.priority_rank(builder.strength()),
+        order_by_priority=True,
+        article_ids=True,
+        max_article_ids=100,  # Limit to 100 for size
+    )
+    nodes = network["nodes"]
 
-        # Look up o:id from index (filter to Personnes type for authors)
-        if name_lookup:
-            o_id = find_entity_id(author, name_lookup, ["Personnes"])
+    # Look up o:id from index (filter to Personnes type for authors)
+    if name_lookup:
+        matched_count = 0
+        for node_data in nodes:
+            o_id = find_entity_id(node_data["label"], name_lookup, ["Personnes"])
             if o_id:
                 node_data["o_id"] = o_id
                 matched_count += 1
-
-        nodes.append(node_data)
-
-    if name_lookup:
         logger.info(f"Matched {matched_count}/{len(nodes)} co-authors to index entries")
 
-    # Build edges
-    max_weight = max(data["weight"] for data in edge_weights.values())
-
-    edges = []
-    for (author1, author2), data in edge_weights.items():
-        weight = data["weight"]
-        edges.append({
-            "source": author_id_map[author1],
-            "target": author_id_map[author2],
-            "type": "coauthor",
-            "weight": weight,
-            "weightNorm": weight / max_weight if max_weight > 0 else 0,
-            "articleIds": list(data["pub_ids"])[:100]  # Limit to 100 for size
-        })
-
-    # Sort edges by weight descending
-    edges.sort(key=lambda e: e["weight"], reverse=True)
-
-    # Compute stats
-    degrees = list(author_degree.values())
-    strengths = list(author_strength.values())
+    weight = builder.weight
 
     meta = {
         "generatedAt": datetime.now().isoformat(),
         "totalNodes": len(nodes),
-        "totalEdges": len(edges),
+        "totalEdges": builder.edge_count,
         "supportedTypes": ["author"],
         "weightMinConfigured": 1,
-        "weightMinActual": min(data["weight"] for data in edge_weights.values()),
-        "weightMax": max_weight,
-        "degree": {
-            "min": min(degrees),
-            "max": max(degrees),
-            "mean": round(sum(degrees) / len(degrees), 2) if degrees else 0
-        },
-        "strength": {
-            "min": min(strengths),
-            "max": max(strengths),
-            "mean": round(sum(strengths) / len(strengths), 2) if strengths else 0
-        },
+        "weightMinActual": int(weight.min()),
+        "weightMax": int(weight.max()),
+        **builder.metric_summary(decimals=2),
         "topLabelCount": min(50, len(nodes)),
         "typePairs": [["author", "author"]],
-        "labelPriorityTop": [nodes[i]["label"] for i in range(min(50, len(nodes)))]
+        "labelPriorityTop": [node["label"] for node in nodes[:50]]
     }
 
     return {
         "nodes": nodes,
-        "edges": edges,
+        "edges": network["edges"],
         "meta": meta
     }
 
 
-def generate_treemap_data(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+def partition_by_country(records: List[ReferenceRecord]) -> Dict[str, List[ReferenceRecord]]:
+    """Group records by country in a single pass (countries in first-seen order)."""
+    partitions: Dict[str, List[ReferenceRecord]] = defaultdict(list)
+    for record in records:
+        partitions[record.country].append(record)
+    return dict(partitions)
+
+
+def country_slug(country: str) -> str:
+    """File name part for a country (e.g. "Burkina Faso" -> "burkina-faso")."""
+    return country.lower().replace(' ', '-')
+
+
+def generate_country_files(
+    partitions: Dict[str, List[ReferenceRecord]],
+    countries: List[str],
+    output_dir: Path,
+    name_lookup: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> None:
+    """Write by-year, authors and publishers files for each country.
+
+    Each country is computed from its own partition only, so the total work is
+    one pass over the records however many countries get files.
+    """
+    for country in countries:
+        country_records = partitions.get(country, [])
+        slug = country_slug(country)
+        save_json(generate_by_year_data(country_records, country), output_dir / f"by-year-{slug}.json")
+        save_json(
+            generate_authors_data(country_records, country, name_lookup=name_lookup),
+            output_dir / f"authors-{slug}.json",
+        )
+        save_json(
+            generate_publishers_data(country_records, country, name_lookup=name_lookup),
+            output_dir / f"publishers-{slug}.json",
+        )
+
+
+def generate_treemap_data(records: List[ReferenceRecord]) -> Dict[str, Any]:
     """Generate treemap data for country → reference type hierarchy.
 
     Creates a hierarchical structure:
@@ -1021,9 +1075,9 @@ def generate_treemap_data(records: List[Dict[str, Any]]) -> Dict[str, Any]:
     country_type_pub_ids: Dict[str, Dict[str, set]] = defaultdict(lambda: defaultdict(set))
 
     for record in records:
-        country = record["country"]
-        ref_type = record["type"]
-        pub_id = record["pub_id"]
+        country = record.country
+        ref_type = record.type
+        pub_id = record.pub_id
 
         country_type_pub_ids[country][ref_type].add(pub_id)
 
@@ -1069,23 +1123,23 @@ def generate_treemap_data(records: List[Dict[str, Any]]) -> Dict[str, Any]:
     return result
 
 
-def generate_metadata(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+def generate_metadata(records: List[ReferenceRecord]) -> Dict[str, Any]:
     """Generate metadata about the references dataset."""
-    year_records = [r for r in records if r["has_year"]]
-    author_records = [r for r in records if r["has_author"]]
+    year_records = [r for r in records if r.has_year]
+    author_records = [r for r in records if r.has_author]
     
-    years = [r["year"] for r in year_records]
-    countries = set(r["country"] for r in records)
-    ref_types = set(r["type"] for r in records)
-    authors = set(r["author"] for r in author_records)
+    years = [r.year for r in year_records]
+    countries = set(r.country for r in records)
+    ref_types = set(r.type for r in records)
+    authors = set(r.author for r in author_records)
     
     # Count unique publications (not records)
-    unique_pub_ids = set(r["pub_id"] for r in records)
-    unique_pub_ids_with_year = set(r["pub_id"] for r in year_records)
-    unique_pub_ids_with_author = set(r["pub_id"] for r in author_records)
+    unique_pub_ids = set(r.pub_id for r in records)
+    unique_pub_ids_with_year = set(r.pub_id for r in year_records)
+    unique_pub_ids_with_author = set(r.pub_id for r in author_records)
     
     # Count by country
-    country_counts = Counter(r["country"] for r in records)
+    country_counts = Counter(r.country for r in records)
     
     # Get countries with enough data for individual files (e.g., > 10 records)
     countries_with_files = sorted([
@@ -1117,23 +1171,23 @@ def generate_metadata(records: List[Dict[str, Any]]) -> Dict[str, Any]:
             "total_publications": len(unique_pub_ids_with_author)
         },
         "publishers": {
-            "total_unique": len(set(p for r in records for p in r.get("publishers_list", []))),
-            "total_publications": len(set(r["pub_id"] for r in records if r.get("publishers_list")))
+            "total_unique": len(set(p for r in records for p in r.publishers_list)),
+            "total_publications": len(set(r.pub_id for r in records if r.publishers_list))
         },
         "files_generated": {
             "by_year_global": "references/by-year-global.json",
             "by_year_countries": [
-                f"references/by-year-{country.lower().replace(' ', '-')}.json"
+                f"references/by-year-{country_slug(country)}.json"
                 for country in countries_with_files
             ],
             "authors_global": "references/authors.json",
             "authors_countries": [
-                f"references/authors-{country.lower().replace(' ', '-')}.json"
+                f"references/authors-{country_slug(country)}.json"
                 for country in countries_with_files
             ],
             "publishers_global": "references/publishers.json",
             "publishers_countries": [
-                f"references/publishers-{country.lower().replace(' ', '-')}.json"
+                f"references/publishers-{country_slug(country)}.json"
                 for country in countries_with_files
             ],
             "coauthor_network": "references/coauthor-network.json",
@@ -1188,6 +1242,39 @@ def main():
         default=10,
         help="Minimum records per country to generate individual files (default: 10)"
     )
+    parser.add_argument(
+        "--layout",
+        action="store_true",
+        help="Precompute ForceAtlas2 x/y positions for the co-author network"
+    )
+    parser.add_argument(
+        "--layout-iterations",
+        type=int,
+        default=DEFAULT_LAYOUT_ITERATIONS,
+        help=f"ForceAtlas2 iteration budget (default: {DEFAULT_LAYOUT_ITERATIONS})"
+    )
+    parser.add_argument(
+        "--layout-seed",
+        type=int,
+        default=DEFAULT_LAYOUT_SEED,
+        help=f"Seed for the initial layout positions (default: {DEFAULT_LAYOUT_SEED})"
+    )
+    parser.add_argument(
+        "--binary",
+        action="store_true",
+        help="Also write a typed-array binary copy of the co-author network (coauthor-network.bin)"
+    )
+    parser.add_argument(
+        "--no-fuzzy",
+        action="store_true",
+        help="Only link author/publisher names to index entries by exact match"
+    )
+    parser.add_argument(
+        "--fuzzy-threshold",
+        type=float,
+        default=DEFAULT_FUZZY_THRESHOLD,
+        help=f"Minimum similarity for a fuzzy name match (default: {DEFAULT_FUZZY_THRESHOLD})"
+    )
     
     args = parser.parse_args()
     output_dir = Path(args.output_dir)
@@ -1207,6 +1294,10 @@ def main():
     # Load index data for name→id lookup
     index_df = load_index_data()
     name_lookup = build_name_to_id_lookup(index_df) if not index_df.empty else {}
+    if name_lookup and not args.no_fuzzy:
+        names = {r.author for r in records if r.author}
+        names.update(p for r in records for p in r.publishers_list)
+        add_fuzzy_matches(name_lookup, sorted(names), threshold=args.fuzzy_threshold)
 
     # Generate global by-year data
     logger.info("Generating global by-year data...")
@@ -1225,8 +1316,16 @@ def main():
 
     # Generate co-author network
     logger.info("Generating co-author network...")
-    coauthor_network = generate_coauthor_network(records, name_lookup=name_lookup)
+    coauthor_network = generate_coauthor_network(
+        records,
+        name_lookup=name_lookup,
+        layout=args.layout,
+        layout_iterations=args.layout_iterations,
+        layout_seed=args.layout_seed,
+    )
     save_json(coauthor_network, output_dir / "coauthor-network.json")
+    if args.binary:
+        save_graph_binary(coauthor_network, output_dir / "coauthor-network.bin")
 
     # Build coordinate lookup for provenance map
     coord_lookup = build_coord_lookup(index_df) if not index_df.empty else {}
@@ -1241,31 +1340,17 @@ def main():
     treemap_data = generate_treemap_data(records)
     save_json(treemap_data, output_dir / "treemap.json")
 
-    # Get countries with enough data
-    country_counts = Counter(r["country"] for r in records)
+    # Partition records by country once; countries with enough data get files
+    partitions = partition_by_country(records)
     countries_with_files = [
-        country for country, count in country_counts.items()
-        if country != "Unknown" and count >= min_country_records
+        country for country, country_records in partitions.items()
+        if country != "Unknown" and len(country_records) >= min_country_records
     ]
 
     logger.info(f"Generating data for {len(countries_with_files)} countries with >={min_country_records} records")
 
     # Generate per-country data
-    for country in countries_with_files:
-        # By-year data
-        by_year_country = generate_by_year_data(records, country)
-        filename = f"by-year-{country.lower().replace(' ', '-')}.json"
-        save_json(by_year_country, output_dir / filename)
-
-        # Authors data
-        authors_country = generate_authors_data(records, country, name_lookup=name_lookup)
-        filename = f"authors-{country.lower().replace(' ', '-')}.json"
-        save_json(authors_country, output_dir / filename)
-
-        # Publishers data
-        publishers_country = generate_publishers_data(records, country, name_lookup=name_lookup)
-        filename = f"publishers-{country.lower().replace(' ', '-')}.json"
-        save_json(publishers_country, output_dir / filename)
+    generate_country_files(partitions, countries_with_files, output_dir, name_lookup)
     
     # Generate metadata
     logger.info("Generating metadata...")
@@ -13,6 +13,7 @@ Output: static/data/references/subject-cooccurrence.json
 import hashlib
 import sys
 from collections import defaultdict
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -25,6 +26,7 @@ from iwac_utils import (
     parse_pipe_separated,
     save_json,
 )
+from network_builder import NetworkBuilder
 
 logger = configure_logging()
 
@@ -68,25 +70,18 @@ def generate_subject_cooccurrence(records: List[Dict[str, Any]]) -> Dict[str, An
     logger.info(f"Found {len(ref_subjects)} references with 2+ subjects")
     logger.info(f"Found {len(subject_refs)} unique subjects")
 
-    # Build co-occurrence edges
-    edge_weights: Dict[tuple, Dict] = {}
-
+    # Register subjects and reference memberships, then derive co-occurrence edges
+    builder = NetworkBuilder()
+    for subj, pub_ids in subject_refs.items():
+        builder.add_node(make_subject_id(subj), type="subject", label=subj, count=len(pub_ids))
     for pub_id, subjects in ref_subjects.items():
-        subjects_list = sorted(subjects)
-
-        for i, subj1 in enumerate(subjects_list):
-            for subj2 in subjects_list[i + 1 :]:
-                edge_key = (subj1, subj2)
-
-                if edge_key not in edge_weights:
-                    edge_weights[edge_key] = {"weight": 0, "pub_ids": set()}
+        for subj in sorted(subjects):
+            builder.add_membership(pub_id, builder.code(make_subject_id(subj)))
+    builder.add_cooccurrence_edges(edge_type="subject-subject")
 
-                edge_weights[edge_key]["weight"] += 1
-                edge_weights[edge_key]["pub_ids"].add(pub_id)
+    logger.info(f"Found {builder.edge_count} unique subject co-occurrence pairs")
 
-    logger.info(f"Found {len(edge_weights)} unique subject co-occurrence pairs")
-
-    if not edge_weights:
+    if not builder.edge_count:
         return {
             "nodes": [],
             "edges": [],
@@ -106,97 +101,32 @@ def generate_subject_cooccurrence(records: List[Dict[str, Any]]) -> Dict[str, An
             },
         }
 
-    # Compute node metrics
-    subject_degree: Dict[str, int] = defaultdict(int)
-    subject_strength: Dict[str, int] = defaultdict(int)
-
-    for (subj1, subj2), data in edge_weights.items():
-        weight = data["weight"]
-        subject_degree[subj1] += 1
-        subject_degree[subj2] += 1
-        subject_strength[subj1] += weight
-        subject_strength[subj2] += weight
-
-    all_subjects = set(subject_degree.keys())
-
-    # Sort subjects by strength for label priority
-    sorted_subjects = sorted(all_subjects, key=lambda s: subject_strength[s], reverse=True)
-    subject_priority = {subj: idx for idx, subj in enumerate(sorted_subjects)}
-
-    # Build nodes
-    subject_id_map = {}
-    nodes = []
-
-    for subj in all_subjects:
-        subj_id = make_subject_id(subj)
-        subject_id_map[subj] = subj_id
-
-        nodes.append(
-            {
-                "id": subj_id,
-                "type": "subject",
-                "label": subj,
-                "count": len(subject_refs.get(subj, set())),
-                "degree": subject_degree[subj],
-                "strength": subject_strength[subj],
-                "labelPriority": subject_priority[subj],
-            }
-        )
-
-    # Build edges
-    max_weight = max(data["weight"] for data in edge_weights.values())
-
-    edges = []
-    for (subj1, subj2), data in edge_weights.items():
-        weight = data["weight"]
-        edges.append(
-            {
-                "source": subject_id_map[subj1],
-                "target": subject_id_map[subj2],
-                "type": "subject-subject",
-                "weight": weight,
-                "weightNorm": weight / max_weight if max_weight > 0 else 0,
-                "articleIds": list(data["pub_ids"])[:100],
-            }
-        )
-
-    # Sort edges by weight descending
-    edges.sort(key=lambda e: e["weight"], reverse=True)
-
-    # Compute stats
-    degrees = list(subject_degree.values())
-    strengths = list(subject_strength.values())
-
-    from datetime import datetime
+    # Edges by weight descending; nodes ranked by strength for label priority
+    builder.sort_edges_by_weight()
+    network = builder.serialize(
+        priority=builder.priority_rank(builder.strength()),
+        order_by_priority=True,
+        article_ids=True,
+        max_article_ids=100,
+    )
+    nodes = network["nodes"]
+    weight = builder.weight
 
     meta = {
         "generatedAt": datetime.now().isoformat(),
         "totalNodes": len(nodes),
-        "totalEdges": len(edges),
+        "totalEdges": builder.edge_count,
         "supportedTypes": ["subject"],
         "weightMinConfigured": 1,
-        "weightMinActual": min(data["weight"] for data in edge_weights.values()),
-        "weightMax": max_weight,
-        "degree": {
-            "min": min(degrees),
-            "max": max(degrees),
-            "mean": round(sum(degrees) / len(degrees), 2) if degrees else 0,
-        },
-        "strength": {
-            "min": min(strengths),
-            "max": max(strengths),
-            "mean": round(sum(strengths) / len(strengths), 2) if strengths else 0,
-        },
+        "weightMinActual": int(weight.min()),
+        "weightMax": int(weight.max()),
+        **builder.metric_summary(decimals=2),
         "topLabelCount": min(50, len(nodes)),
         "typePairs": [["subject", "subject"]],
-        "labelPriorityTop": [
-            nodes[i]["label"]
-            for i in range(min(50, len(nodes)))
-            if i < len(nodes)
-        ],
+        "labelPriorityTop": [node["label"] for node in nodes[:50]],
     }
 
-    return {"nodes": nodes, "edges": edges, "meta": meta}
+    return {"nodes": nodes, "edges": network["edges"], "meta": meta}
 
 
 def main():
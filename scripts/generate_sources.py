@@ -18,7 +18,8 @@ Process:
 5. Generate sources data with coordinates for map visualization
 
 Output:
-- static/data/sources.json (main data with sources, counts, and coordinates)
+- static/data/sources.json (main data with sources, counts, and coordinates;
+  "clusters" holds the per-zoom marker clustering index from point_clusters.py)
 """
 
 import json
@@ -44,6 +45,7 @@ from iwac_utils import (
     normalize_location_name,
     find_column,
 )
+from point_clusters import DEFAULT_RADIUS, cluster_records
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -66,9 +68,12 @@ CUSTOM_COORDINATES = {
 class IWACSourcesGenerator:
     """Generate sources data from IWAC dataset with GPS coordinates"""
     
-    def __init__(self, output_dir: str = "static/data"):
+    def __init__(self, output_dir: str = "static/data", clusters: bool = True,
+                 cluster_radius: int = DEFAULT_RADIUS):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.clusters = clusters
+        self.cluster_radius = cluster_radius
         
         # Content subsets with source field
         self.content_subsets = ['articles', 'publications', 'documents', 'audiovisual']
@@ -286,6 +291,9 @@ class IWACSourcesGenerator:
             }
         }
         
+        if self.clusters:
+            result['clusters'] = cluster_records(sources_list, 'count', radius=self.cluster_radius)
+        
         logger.info(f"Generated data for {len(sources_list)} sources")
         logger.info(f"  - With coordinates: {sources_with_coords}")
         logger.info(f"  - Without coordinates: {sources_without_coords}")
@@ -322,9 +330,25 @@ def main():
         help='Output directory for JSON files (default: static/data)'
     )
     
+    parser.add_argument(
+        '--no-clusters',
+        action='store_true',
+        help='Skip the precomputed marker clustering index'
+    )
+    parser.add_argument(
+        '--cluster-radius',
+        type=int,
+        default=DEFAULT_RADIUS,
+        help=f'Marker cluster radius in pixels (default: {DEFAULT_RADIUS})'
+    )
+    
     args = parser.parse_args()
     
-    generator = IWACSourcesGenerator(output_dir=args.output_dir)
+    generator = IWACSourcesGenerator(
+        output_dir=args.output_dir,
+        clusters=not args.no_clusters,
+        cluster_radius=args.cluster_radius
+    )
     generator.process()
     logger.info("✅ Sources data generation completed successfully!")
 
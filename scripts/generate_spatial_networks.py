@@ -7,7 +7,7 @@ enabling visualization on a Leaflet map with Sigma.js overlay.
 
 INPUT: 
     - static/data/entities/locations.json (already has coordinates!)
-    - static/data/articles.json
+    - static/data/articles.json or articles.jsonl (preprocess export, newest)
 
 OUTPUT:
     - static/data/networks/spatial.json (location network with coordinates)
@@ -15,6 +15,10 @@ OUTPUT:
 The output includes:
     - nodes: locations with GPS coordinates, article counts, and network metrics
     - edges: co-occurrence relationships between locations from shared articles
+    - edges carry distanceKm, the great-circle distance between their endpoints,
+      and path, a quantized great-circle (optionally bundled) polyline
+      (see edge_paths.py)
+    - nearest: k-nearest-neighbour index over the nodes (see geo_proximity.py)
     - bounds: geographic bounds for map initialization
     - meta: generation metadata and statistics
 """
@@ -22,15 +26,26 @@ The output includes:
 from __future__ import annotations
 import json
 import argparse
+import sys
 from pathlib import Path
 from datetime import datetime
 from statistics import fmean
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
+
+from edge_paths import DEFAULT_TOLERANCE, edge_paths
+from geo_proximity import DEFAULT_NEIGHBORS, DISTANCE_DECIMALS, neighbor_index, pair_distances_km
 from iwac_utils import save_json as _utils_save_json, generate_timestamp
+from network_builder import NetworkBuilder
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'spatial'))
+from preprocess_all import articles_file, iter_articles
 
 # ------------------ Configuration ------------------
 DEFAULT_WEIGHT_MIN = 2
+# Edges at least this long count as long-range ties
+DEFAULT_LOCAL_RADIUS_KM = 100.0
 
 # ------------------ Paths ------------------
 ROOT = Path(__file__).resolve().parents[1]
@@ -48,17 +63,28 @@ def parse_args():
                        help="Minimum edge weight to keep")
     parser.add_argument("--output-dir", type=str, default=None,
                        help="Base output directory (default: static/data)")
+    parser.add_argument("--neighbors", type=int, default=DEFAULT_NEIGHBORS,
+                       help="Nearest neighbours exported per location (0 to disable)")
+    parser.add_argument("--local-radius-km", type=float, default=DEFAULT_LOCAL_RADIUS_KM,
+                       help="Distance separating local from long-range edges")
+    parser.add_argument("--no-paths", action="store_true",
+                       help="Skip precomputed edge polylines (the map draws straight lines)")
+    parser.add_argument("--bundle", action="store_true",
+                       help="Apply force-directed edge bundling to the edge polylines")
+    parser.add_argument("--path-tolerance", type=float, default=DEFAULT_TOLERANCE,
+                       help="Edge polyline simplification tolerance in degrees")
     return parser.parse_args()
 
 def load_articles() -> List[Dict]:
-    """Load articles data."""
-    articles_file = DATA_DIR / 'articles.json'
-    if not articles_file.exists():
-        print(f"❌ Articles file not found: {articles_file}")
+    """Load the exported articles (articles.json or articles.jsonl, whichever is newer)."""
+    try:
+        path = articles_file(DATA_DIR)
+    except FileNotFoundError:
+        print(f"❌ Articles file not found in {DATA_DIR} (articles.json / articles.jsonl)")
         return []
-    
-    print(f"📰 Loading articles from {articles_file}")
-    return json.loads(articles_file.read_text(encoding='utf-8'))
+
+    print(f"📰 Loading articles from {path}")
+    return list(iter_articles(DATA_DIR))
 
 def load_locations() -> List[Dict]:
     """Load locations data."""
@@ -92,7 +118,7 @@ def build_spatial_network(args):
     print(f"📊 Loaded {len(articles)} articles and {len(locations)} locations")
     
     # Build location nodes with coordinates (filter out locations without coordinates)
-    nodes = []
+    builder = NetworkBuilder()
     locations_with_coords = 0
     
     for location in locations:
@@ -115,104 +141,96 @@ def build_spatial_network(args):
         if abs(lat) > 90 or abs(lng) > 180:
             continue
         
-        node = {
-            'id': f"location:{location['id']}",
-            'type': 'location',
-            'label': location_name,
-            'count': location.get('articleCount', len(location.get('relatedArticleIds', []))),
-            'coordinates': [lat, lng],  # [lat, lng]
-            'country': location.get('country', ''),
-            'region': location.get('region', ''),
-            'prefecture': location.get('prefecture', ''),
-            'relatedArticleIds': location.get('relatedArticleIds', [])
-        }
-        
-        nodes.append(node)
+        builder.add_node(
+            f"location:{location['id']}",
+            type='location',
+            label=location_name,
+            count=location.get('articleCount', len(location.get('relatedArticleIds', []))),
+            coordinates=[lat, lng],  # [lat, lng]
+            country=location.get('country', ''),
+            region=location.get('region', ''),
+            prefecture=location.get('prefecture', ''),
+            relatedArticleIds=location.get('relatedArticleIds', [])
+        )
         locations_with_coords += 1
     
     print(f"📍 Found {locations_with_coords} locations with valid coordinates")
     
-    # Build article index for co-occurrence calculation
-    article_to_locations = {}
-    node_by_name = {node['label'].lower(): node for node in nodes}
-    
+    # Register article memberships (articles are the co-occurrence groups)
+    node_by_name = {node['label'].lower(): node for node in builder.nodes}
+
+    articles_with_multiple = 0
     for article in articles:
         article_id = str(article.get('o:id', ''))
         spatial = article.get('spatial', '')
         if not spatial:
             continue
-        
+
         # Parse locations from spatial field and match to nodes with coordinates
-        article_locations = []
+        article_locations = set()
         for loc_name in spatial.split('|'):
             loc_name = loc_name.strip()
             if not loc_name:
                 continue
-            
+
             # Find matching node by name
             node = node_by_name.get(loc_name.lower())
             if node:
-                article_locations.append(node['id'])
-        
+                article_locations.add(builder.code(node['id']))
+
         # Only articles with multiple locations create edges
         if len(article_locations) > 1:
-            article_to_locations[article_id] = article_locations
-    
-    print(f"🔗 Found {len(article_to_locations)} articles with multiple coordinate-enabled locations")
-    
-    # Build edges (co-occurrence between locations)
-    edge_weights = {}
-    
-    for article_id, location_ids in article_to_locations.items():
-        # Create edges between all pairs of locations in this article
-        for i, loc1 in enumerate(location_ids):
-            for loc2 in location_ids[i + 1:]:
-                edge_key = tuple(sorted([loc1, loc2]))
-                
-                if edge_key not in edge_weights:
-                    edge_weights[edge_key] = {
-                        'source': edge_key[0],
-                        'target': edge_key[1],
-                        'weight': 0,
-                        'articleIds': []
-                    }
-                
-                edge_weights[edge_key]['weight'] += 1
-                edge_weights[edge_key]['articleIds'].append(article_id)
-    
-    # Filter edges by minimum weight
-    edges = [
-        edge for edge in edge_weights.values() 
-        if edge['weight'] >= args.weight_min
-    ]
-    
-    print(f"🔗 Created {len(edges)} edges (min weight: {args.weight_min})")
-    
-    # Calculate network metrics
-    degree = {node['id']: 0 for node in nodes}
-    strength = {node['id']: 0 for node in nodes}
-    
-    for edge in edges:
-        degree[edge['source']] += 1
-        degree[edge['target']] += 1
-        strength[edge['source']] += edge['weight']
-        strength[edge['target']] += edge['weight']
-    
-    # Add metrics to nodes
-    for node in nodes:
-        node['degree'] = degree[node['id']]
-        node['strength'] = strength[node['id']]
-    
-    # Filter out isolated nodes (nodes with no edges)
-    connected_node_ids = set()
-    for edge in edges:
-        connected_node_ids.add(edge['source'])
-        connected_node_ids.add(edge['target'])
-    
-    nodes = [node for node in nodes if node['id'] in connected_node_ids]
-    
+            articles_with_multiple += 1
+            for code in article_locations:
+                builder.add_membership(article_id, code)
+
+    print(f"🔗 Found {articles_with_multiple} articles with multiple coordinate-enabled locations")
+
+    # Build edges (co-occurrence between locations) and filter by minimum weight
+    builder.add_cooccurrence_edges()
+    builder.prune(args.weight_min)
+    builder.sort_edges_by_weight()
+
+    print(f"🔗 Created {builder.edge_count} edges (min weight: {args.weight_min})")
+
+    # Great-circle length of every edge, in edge order
+    node_lats = [node['coordinates'][0] for node in builder.nodes]
+    node_lngs = [node['coordinates'][1] for node in builder.nodes]
+    distances = np.round(pair_distances_km(node_lats, node_lngs, builder.src, builder.dst), DISTANCE_DECIMALS)
+
+    # Precomputed edge polylines, in edge order
+    paths = None
+    if not args.no_paths:
+        src_codes, dst_codes = builder.src, builder.dst
+        paths = edge_paths(
+            np.asarray(node_lats)[src_codes], np.asarray(node_lngs)[src_codes],
+            np.asarray(node_lats)[dst_codes], np.asarray(node_lngs)[dst_codes],
+            bundle=args.bundle,
+            tolerance=args.path_tolerance,
+        )
+        print(f"🗺️ Built {len(paths['paths'])} edge paths{' (bundled)' if args.bundle else ''}")
+
+    # Degree/strength metrics, normalized edge weights; isolated nodes are dropped
+    network = builder.serialize(article_ids=True)
+    nodes, edges = network['nodes'], network['edges']
+    for edge, distance in zip(edges, distances.tolist()):
+        edge['distanceKm'] = distance
+    if paths is not None:
+        for edge, path in zip(edges, paths['paths']):
+            edge['path'] = path
+
     print(f"📊 Final network: {len(nodes)} connected nodes, {len(edges)} edges")
-    
+
+    # Nearest-neighbour index over the exported nodes
+    nearest = None
+    if args.neighbors > 0 and len(nodes) > 1:
+        nearest = neighbor_index(
+            [node['coordinates'][0] for node in nodes],
+            [node['coordinates'][1] for node in nodes],
+            args.neighbors,
+        )
+    long_range = int((distances >= args.local_radius_km).sum())
+
     # Calculate geographic bounds
     if nodes:
         lats = [node['coordinates'][0] for node in nodes]
@@ -236,17 +254,12 @@ def build_spatial_network(args):
     else:
         bounds = None
     
-    # Add normalized edge weights
-    if edges:
-        max_weight = max(edge['weight'] for edge in edges)
-        min_weight = min(edge['weight'] for edge in edges)
-        for edge in edges:
-            edge['weightNorm'] = edge['weight'] / max_weight if max_weight > 0 else 0
-    
     # Prepare output
     output = {
         'nodes': nodes,
         'edges': edges,
+        'nearest': nearest,
+        'edgePaths': paths['header'] if paths is not None else None,
         'bounds': bounds,
         'meta': {
             'generatedAt': generate_timestamp(),
@@ -257,7 +270,10 @@ def build_spatial_network(args):
             'totalLocationsInData': len(locations),
             'geocodingSuccessRate': round(locations_with_coords / len(locations) * 100, 1) if locations else 0,
             'bounds': bounds,
-            'articlesWithMultipleLocations': len(article_to_locations)
+            'articlesWithMultipleLocations': articles_with_multiple,
+            'localRadiusKm': args.local_radius_km,
+            'longRangeEdges': long_range,
+            'medianEdgeDistanceKm': round(float(np.median(distances)), DISTANCE_DECIMALS) if len(distances) else None
         }
     }
     
@@ -268,7 +284,7 @@ def build_spatial_network(args):
     print(f"✅ Spatial network saved to {output_file}")
     print(f"📊 Statistics:")
     print(f"   - Nodes: {len(nodes)}")
-    print(f"   - Edges: {len(edges)}")
+    print(f"   - Edges: {len(edges)} ({long_range} at {args.local_radius_km:g} km or more)")
     print(f"   - Locations with coordinates: {locations_with_coords}/{len(locations)} ({output['meta']['geocodingSuccessRate']}%)")
     if bounds:
         print(f"   - Geographic bounds: {bounds['south']:.2f}°S to {bounds['north']:.2f}°N, {bounds['west']:.2f}°W to {bounds['east']:.2f}°E")
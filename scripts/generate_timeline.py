@@ -8,8 +8,8 @@ Fetches data from multiple subsets of the dataset:
 Generates JSON files for timeline visualization under static/data:
 
 1) timeline-growth.json          -> monthly additions and cumulative total
-2) timeline-types.json           -> monthly growth faceted by document type
-3) timeline-countries.json       -> monthly growth faceted by country
+2) timeline-types.json           -> monthly growth faceted by document type (columnar)
+3) timeline-countries.json       -> monthly growth faceted by country (columnar)
 4) timeline-metadata.json        -> metadata about the timeline data
 
 The script processes these subsets:
@@ -26,7 +26,7 @@ from __future__ import annotations
 import argparse
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from collections import defaultdict, Counter
 from datetime import datetime
 
@@ -45,6 +45,8 @@ from iwac_utils import (
     extract_month,
     find_column,
     save_json,
+    build_columnar_series,
+    save_columnar_json,
 )
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -152,67 +154,53 @@ def generate_global_timeline(all_records: List[Dict[str, Any]]) -> Dict[str, Any
     return result
 
 
+def _facet_month_matrix(
+    facet_month_counts: Dict[str, Dict[str, int]]
+) -> Tuple[List[str], Dict[str, Any]]:
+    """Align per-facet monthly counts to one shared month axis.
+
+    Returns the sorted month axis and a columnar series block with one row
+    of monthly additions per facet (facets in sorted order). Cumulative
+    totals are not stored: they are a running sum of each row.
+    """
+    all_months = sorted(set(
+        month
+        for month_data in facet_month_counts.values()
+        for month in month_data.keys()
+    ))
+
+    series = build_columnar_series({
+        facet: [facet_month_counts[facet].get(month, 0) for month in all_months]
+        for facet in sorted(facet_month_counts.keys())
+    })
+    return all_months, series
+
+
 def generate_type_faceted_timeline(all_records: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Generate timeline data faceted by document type."""
     logger.info("Generating type-faceted timeline data...")
     
     # Group by type and month
     type_month_counts = defaultdict(lambda: defaultdict(int))
+    labels_fr: Dict[str, str] = {}
     
     for record in all_records:
         type_key = record["type_en"]
         month = record["month"]
         type_month_counts[type_key][month] += 1
+        labels_fr.setdefault(type_key, record["type_fr"])
     
-    # Get all unique months across all types
-    all_months = sorted(set(
-        month
-        for type_data in type_month_counts.values()
-        for month in type_data.keys()
-    ))
-    
-    # Build faceted data for each type
-    facets = {}
-    
-    for type_en, month_data in type_month_counts.items():
-        # Get the French label (find the first record with this type)
-        type_fr = next(
-            (r["type_fr"] for r in all_records if r["type_en"] == type_en),
-            type_en
-        )
-        
-        # Build monthly series with cumulative total
-        monthly_additions = []
-        cumulative_total = []
-        running_total = 0
-        
-        for month in all_months:
-            count = month_data.get(month, 0)
-            running_total += count
-            
-            monthly_additions.append(count)
-            cumulative_total.append(running_total)
-        
-        facets[type_en] = {
-            "label_en": type_en,
-            "label_fr": type_fr,
-            "months": all_months,
-            "monthly_additions": monthly_additions,
-            "cumulative_total": cumulative_total,
-            "total_records": sum(month_data.values()),
-            "month_range": {
-                "min": all_months[0] if all_months else None,
-                "max": all_months[-1] if all_months else None
-            }
-        }
+    all_months, series = _facet_month_matrix(type_month_counts)
     
     result = {
-        "facets": facets,
-        "types": sorted(facets.keys()),
+        "months": all_months,
+        "series": series,
+        "labels_fr": labels_fr,
+        "types": series["names"],
         "generated_at": datetime.now().isoformat()
     }
     
-    logger.info(f"Generated type-faceted timeline for {len(facets)} types")
+    logger.info(f"Generated type-faceted timeline for {len(series['names'])} types")
     return result
 
 
@@ -228,47 +216,16 @@ def generate_country_faceted_timeline(all_records: List[Dict[str, Any]]) -> Dict
         month = record["month"]
         country_month_counts[country][month] += 1
     
-    # Get all unique months across all countries
-    all_months = sorted(set(
-        month
-        for country_data in country_month_counts.values()
-        for month in country_data.keys()
-    ))
-    
-    # Build faceted data for each country
-    facets = {}
-    
-    for country, month_data in country_month_counts.items():
-        # Build monthly series with cumulative total
-        monthly_additions = []
-        cumulative_total = []
-        running_total = 0
-        
-        for month in all_months:
-            count = month_data.get(month, 0)
-            running_total += count
-            
-            monthly_additions.append(count)
-            cumulative_total.append(running_total)
-        
-        facets[country] = {
-            "months": all_months,
-            "monthly_additions": monthly_additions,
-            "cumulative_total": cumulative_total,
-            "total_records": sum(month_data.values()),
-            "month_range": {
-                "min": all_months[0] if all_months else None,
-                "max": all_months[-1] if all_months else None
-            }
-        }
+    all_months, series = _facet_month_matrix(country_month_counts)
     
     result = {
-        "facets": facets,
-        "countries": sorted(facets.keys()),
+        "months": all_months,
+        "series": series,
+        "countries": series["names"],
         "generated_at": datetime.now().isoformat()
     }
     
-    logger.info(f"Generated country-faceted timeline for {len(facets)} countries")
+    logger.info(f"Generated country-faceted timeline for {len(series['names'])} countries")
     return result
 
 
@@ -342,11 +299,11 @@ def main():
         
         # 2. Type-faceted timeline
         type_data = generate_type_faceted_timeline(all_records)
-        save_json(type_data, output_dir / "timeline-types.json")
+        save_columnar_json(type_data, output_dir / "timeline-types.json")
         
         # 3. Country-faceted timeline
         country_data = generate_country_faceted_timeline(all_records)
-        save_json(country_data, output_dir / "timeline-countries.json")
+        save_columnar_json(country_data, output_dir / "timeline-countries.json")
         
         # 4. Metadata
         metadata = generate_metadata(all_records)
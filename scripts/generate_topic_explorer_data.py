@@ -14,6 +14,7 @@ import json
 import os
 import re
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
@@ -80,6 +81,22 @@ def clean_topic_label(label: str) -> str:
     return ' - '.join(cap_words(p) for p in parts)
 
 
+def build_topic_docs(sub: pd.DataFrame, keep_cols: List[str]) -> List[Dict[str, Any]]:
+    """
+    Convert one topic's rows to JSON-ready document dicts in a single pass.
+
+    Missing values become None and underscore-joined phrases in the
+    per-document topic label are turned into spaces.
+    """
+    docs_df = sub[keep_cols].astype(object)
+    docs_df = docs_df.where(docs_df.notna(), None)
+    if "topic_label" in docs_df.columns:
+        labels = docs_df["topic_label"]
+        has_label = labels.map(bool)
+        docs_df.loc[has_label, "topic_label"] = labels[has_label].astype(str).str.replace('_', ' ', regex=False)
+    return docs_df.to_dict("records")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Export static JSON for Topic Explorer")
     # Default to static/data/topics in the project root
@@ -92,6 +109,7 @@ def main():
     parser.add_argument("--max-docs", type=int, default=0, help="Limit number of docs (0 = all)")
     parser.add_argument("--per-topic-docs", type=int, default=200, help="Max docs per topic to include")
     parser.add_argument("--topic-min-count", type=int, default=5, help="Drop topics with < count")
+    parser.add_argument("--workers", type=int, default=min(8, os.cpu_count() or 1), help="Parallel writers for per-topic files")
 
     args = parser.parse_args()
 
@@ -170,12 +188,15 @@ def main():
     unique_topics = len(topic_counts)
     total_docs = int(df_docs.shape[0])
 
+    # Partition once by topic; every per-topic lookup below reuses these groups
+    groups = {int(tid): sub for tid, sub in df_docs.groupby("topic_id", sort=False)}
+
     topics_summary: List[Dict[str, Any]] = []
     for tid, cnt in sorted(topic_counts.items(), key=lambda x: (-x[1], x[0])):
         if cnt < args.topic_min_count:
             continue
         # label: use mode of topic_label for this topic
-        labels = df_docs.loc[df_docs["topic_id"] == tid, "topic_label"].dropna().astype(str)
+        labels = groups[int(tid)]["topic_label"].dropna().astype(str)
         raw_label = labels.mode().iloc[0] if not labels.empty else f"Topic {tid}"
         # Clean the topic label for better readability
         clean_label = clean_topic_label(raw_label)
@@ -191,44 +212,42 @@ def main():
     _utils_save_json(summary, out_dir / "summary.json")
     print(f"Wrote {out_dir / 'summary.json'}")
 
-    # Per-topic files
-    for item in topics_summary:
-        tid = item["id"]
-        sub = df_docs[df_docs["topic_id"] == tid].copy()
+    # Per-topic files: build each blob from its partition, write in parallel
+    keep_cols = [c for c in doc_fields if c in df_docs.columns]
+
+    def build_topic_blob(item: Dict[str, Any]) -> Dict[str, Any]:
+        sub = groups[item["id"]]
         sub = sub.sort_values(by=["topic_prob"], ascending=False).head(args.per_topic_docs)
 
         # counts by country
-        counts_by_country = Counter([safe_str(c) for c in sub["country"].fillna("") if safe_str(c)])
+        countries = sub["country"].fillna("").astype(str)
+        counts_by_country = countries[countries != ""].value_counts(sort=False)
         # counts by month
-        counts_by_month = Counter([m for m in sub["_month"].fillna("") if m])
+        months = sub["_month"].fillna("")
+        counts_by_month = months[months != ""].value_counts(sort=False)
         # avg prob
         avg_prob = float(pd.to_numeric(sub["topic_prob"], errors="coerce").fillna(0).mean()) if "topic_prob" in sub else 0.0
 
-        # docs
-        docs = []
-        keep_cols = [c for c in doc_fields if c in sub.columns]
-        for _, row in sub.iterrows():
-            d = {c: (None if pd.isna(row[c]) else row[c]) for c in keep_cols}
-            # Clean underscore-joined phrases in per-document topic labels
-            if d.get("topic_label"):
-                d["topic_label"] = d["topic_label"].replace('_', ' ')
-            docs.append(d)
-
-        topic_blob = {
-            "id": tid,
+        return {
+            "id": item["id"],
             "label": item["label"],
             "count": item["count"],
             "avg_prob": avg_prob,
-            "counts_by_country": dict(counts_by_country),
-            "counts_by_month": dict(counts_by_month),
+            "counts_by_country": {k: int(v) for k, v in counts_by_country.items()},
+            "counts_by_month": {k: int(v) for k, v in counts_by_month.items()},
             "ai_fields": ai_fields,
-            "docs": docs,
+            "docs": build_topic_docs(sub, keep_cols),
         }
 
-        path = out_dir / f"{tid}.json"
-        _utils_save_json(topic_blob, path)
-        # print each file path briefly
-        print(f"Wrote {path}")
+    def write_topic(item: Dict[str, Any]) -> Path:
+        path = out_dir / f"{item['id']}.json"
+        _utils_save_json(build_topic_blob(item), path, log=False)
+        return path
+
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        for path in pool.map(write_topic, topics_summary):
+            # print each file path briefly
+            print(f"Wrote {path}")
 
     print(f"Done. Data written to: {out_dir}")
 
@@ -26,7 +26,11 @@ from datetime import datetime, timezone
 from typing import Dict, List, Optional
 from statistics import fmean
 
+import numpy as np
+
+from graph_layout import DEFAULT_ITERATIONS as DEFAULT_LAYOUT_ITERATIONS, DEFAULT_SEED as DEFAULT_LAYOUT_SEED
 from iwac_utils import save_json as _utils_save_json, generate_timestamp
+from network_builder import NetworkBuilder
 
 # ------------------ Configuration ------------------
 DEFAULT_ARTICLES_PER_TOPIC = 50
@@ -58,6 +62,18 @@ def parse_args():
         "--output-dir", type=str, default=None,
         help="Base output directory (default: static/data)"
     )
+    parser.add_argument(
+        "--layout", action="store_true",
+        help="Precompute ForceAtlas2 x/y positions for each node"
+    )
+    parser.add_argument(
+        "--layout-iterations", type=int, default=DEFAULT_LAYOUT_ITERATIONS,
+        help=f"ForceAtlas2 iteration budget (default: {DEFAULT_LAYOUT_ITERATIONS})"
+    )
+    parser.add_argument(
+        "--layout-seed", type=int, default=DEFAULT_LAYOUT_SEED,
+        help=f"Seed for the initial layout positions (default: {DEFAULT_LAYOUT_SEED})"
+    )
     return parser.parse_args()
 
 
@@ -114,15 +130,12 @@ def build_topic_network(args):
 
     print(f"[INFO] Found {len(topics_summary)} topics")
 
-    nodes = []
-    edges = []
-
-    # Track unique articles to avoid duplicates
-    article_ids = set()
+    builder = NetworkBuilder()
+    # Topics have high label priority, articles lower
+    label_priority = []
 
     topic_nodes_count = 0
     article_nodes_count = 0
-    total_edges = 0
     all_probs = []
 
     # Process each topic (excluding outlier topic with id=-1)
@@ -143,23 +156,17 @@ def build_topic_network(args):
             print(f"  [WARN] Could not load details for topic {topic_id}")
             continue
 
-        # Extract keywords from label
-        keywords = extract_keywords(topic_label)
-
-        # Create topic node
-        topic_node_id = f"topic:{topic_id}"
-        topic_node = {
-            'id': topic_node_id,
-            'type': 'topic',
-            'label': topic_label,
-            'count': topic_count,
-            'keywords': keywords,
-            'degree': 0,
-            'strength': 0,
-            'labelPriority': 1  # Topics have high label priority
-        }
-        nodes.append(topic_node)
+        # Create topic node (keywords extracted from label)
+        topic_code = builder.add_node(
+            f"topic:{topic_id}",
+            type='topic',
+            label=topic_label,
+            count=topic_count,
+            keywords=extract_keywords(topic_label),
+        )
+        label_priority.append(1)
         topic_nodes_count += 1
+        topic_edges = 0
 
         # Get articles for this topic
         docs = topic_details.get('docs', [])
@@ -188,58 +195,48 @@ def build_topic_network(args):
             article_id = f"article:{url.split('/')[-1]}" if '/' in url else f"article:{hash(url)}"
 
             # Only add article node once (in case of multiple topics)
-            if article_id not in article_ids:
-                article_ids.add(article_id)
-
-                article_node = {
-                    'id': article_id,
-                    'type': 'article',
-                    'label': doc.get('title', 'Untitled'),
-                    'topicProb': round(topic_prob, 4),
-                    'country': doc.get('country', ''),
-                    'newspaper': doc.get('newspaper', ''),
-                    'pubDate': doc.get('pub_date', ''),
-                    'url': url,
-                    'topicId': topic_id,
-                    'degree': 1,  # Connected to one topic
-                    'strength': round(topic_prob, 4),
-                    'labelPriority': 0  # Articles have lower label priority
-                }
-                nodes.append(article_node)
+            if builder.code(article_id) is None:
+                label_priority.append(0)
                 article_nodes_count += 1
-
-            # Create edge from article to topic
+            article_code = builder.add_node(
+                article_id,
+                type='article',
+                label=doc.get('title', 'Untitled'),
+                topicProb=round(topic_prob, 4),
+                country=doc.get('country', ''),
+                newspaper=doc.get('newspaper', ''),
+                pubDate=doc.get('pub_date', ''),
+                url=url,
+                topicId=topic_id,
+            )
+
+            # Create edge from topic to article
             all_probs.append(topic_prob)
-            edge = {
-                'source': topic_node_id,
-                'target': article_id,
-                'weight': round(topic_prob, 4),
-                'weightNorm': 0  # Will be normalized later
-            }
-            edges.append(edge)
-            total_edges += 1
-
-            # Update topic node degree and strength
-            topic_node['degree'] += 1
-            topic_node['strength'] += topic_prob
-
-        # Round topic strength
-        topic_node['strength'] = round(topic_node['strength'], 2)
-
-        print(f"  [OK] Topic {topic_id}: {topic_node['degree']} articles")
-
-    # Normalize edge weights
-    if edges:
-        max_weight = max(e['weight'] for e in edges)
-        min_weight = min(e['weight'] for e in edges)
-        for edge in edges:
-            if max_weight > min_weight:
-                edge['weightNorm'] = round(
-                    (edge['weight'] - min_weight) / (max_weight - min_weight),
-                    4
-                )
-            else:
-                edge['weightNorm'] = 1.0
+            builder.add_edge(topic_code, article_code, round(topic_prob, 4))
+            topic_edges += 1
+
+        print(f"  [OK] Topic {topic_id}: {topic_edges} articles")
+
+    if args.layout:
+        print(f"[INFO] Computing ForceAtlas2 layout ({args.layout_iterations} iterations)")
+        builder.compute_layout(drop_isolated=False, iterations=args.layout_iterations, seed=args.layout_seed)
+
+    # Degree/strength from the edge arrays, weights normalized over their range
+    network = builder.serialize(
+        priority=np.array(label_priority, dtype=np.int64),
+        drop_isolated=False,
+        weight_norm='range',
+        norm_decimals=4,
+        weight_decimals=4,
+        strength_decimals=4,
+    )
+    nodes, edges = network['nodes'], network['edges']
+    total_edges = len(edges)
+
+    # Topic strengths are sums over many articles; keep them at 2 decimals
+    for node in nodes:
+        if node['type'] == 'topic':
+            node['strength'] = round(node['strength'], 2)
 
     print(f"\nNetwork Statistics:")
     print(f"   - Topic nodes: {topic_nodes_count}")
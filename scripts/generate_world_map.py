@@ -17,12 +17,23 @@ Process:
 5. Generate country-filtered and year-filtered data for interactive filtering
 
 Output:
-- static/data/world-map.json (main data with filtering support)
+- static/data/world-map.json (main data with filtering support; "clusters" holds
+  the per-zoom marker clustering index from point_clusters.py)
+
+Filter data is columnar: filterData.locationFacets is a sparse
+(location x year x source country) count cube in CSR layout, rows aligned
+with `locations`:
+    offsets[i]..offsets[i + 1]   entries of location i
+    cell = yearIndex * len(sourceCountries) + sourceCountryIndex
+    count                        matching article references
+with years indexing locationFacets.years (0 = undated). The client filters
+by summing the counts of the cells inside the selected range/country.
 """
 
 import json
 import argparse
 import logging
+from array import array
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timezone
@@ -30,6 +41,7 @@ from collections import defaultdict
 
 try:
     from datasets import load_dataset
+    import numpy as np
     import pandas as pd
 except ImportError:
     print("Required packages not installed. Please run:")
@@ -54,6 +66,7 @@ from iwac_utils import (
     find_column,
     save_json,
 )
+from point_clusters import DEFAULT_RADIUS, cluster_records
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -63,9 +76,12 @@ logger = logging.getLogger(__name__)
 class IWACWorldMapGenerator:
     """Generate world map data from IWAC dataset using index coordinates"""
     
-    def __init__(self, output_dir: str = "static/data"):
+    def __init__(self, output_dir: str = "static/data", clusters: bool = True,
+                 cluster_radius: int = DEFAULT_RADIUS):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.clusters = clusters
+        self.cluster_radius = cluster_radius
         
         # Subsets with spatial field
         self.article_subsets = ['articles', 'documents', 'audiovisual', 'publications']
@@ -266,8 +282,8 @@ class IWACWorldMapGenerator:
                     'coordinates': coords,
                     'country': country if country else '',
                     'articleCount': 0,
-                    'articleIds': set(),
-                    'articleMeta': []  # Will store article metadata for filtering
+                    # Indices into self.articles_data, one per reference
+                    'articles': array('I')
                 }
             else:
                 locations_without_coords += 1
@@ -278,7 +294,9 @@ class IWACWorldMapGenerator:
     def count_articles_per_location(self) -> None:
         """Count how many articles reference each location via spatial field.
         
-        Also tracks article metadata (source country, year) for filtering.
+        Each location keeps the indices of its articles in self.articles_data;
+        source country and year are looked up from that table when the
+        filter data is built.
         """
         logger.info("Counting articles per location...")
         
@@ -286,7 +304,7 @@ class IWACWorldMapGenerator:
         unmatched = 0
         unmatched_names = set()
         
-        for article in self.articles_data:
+        for article_index, article in enumerate(self.articles_data):
             spatial = article.get('spatial', '')
             if not spatial or pd.isna(spatial):
                 continue
@@ -298,23 +316,12 @@ class IWACWorldMapGenerator:
             elif isinstance(spatial, (list, tuple)):
                 locations = [str(loc).strip() for loc in spatial if loc]
             
-            article_id = str(article.get('id', ''))
-            source_country = article.get('source_country', '')
-            year = article.get('year')
-            
             for loc_name in locations:
                 normalized = normalize_location_name(loc_name)
                 
                 if normalized in self.location_lookup:
                     self.location_lookup[normalized]['articleCount'] += 1
-                    self.location_lookup[normalized]['articleIds'].add(article_id)
-                    
-                    # Track article metadata for filtering
-                    self.location_lookup[normalized]['articleMeta'].append({
-                        'id': article_id,
-                        'source_country': source_country,
-                        'year': year
-                    })
+                    self.location_lookup[normalized]['articles'].append(article_index)
                     matched += 1
                 else:
                     unmatched += 1
@@ -330,92 +337,79 @@ class IWACWorldMapGenerator:
         """Generate the final world map data structure with filtering support."""
         logger.info("Generating world map data...")
         
-        # Build locations list
-        locations_list = []
+        # Article table columns: source country code (-1 = none) and year (0 = undated)
+        article_country = [a.get('source_country', '') for a in self.articles_data]
+        article_year = np.array([a.get('year') or 0 for a in self.articles_data], dtype=np.int32)
         
-        # For choropleth: count UNIQUE articles per country
-        # An article mentioning multiple locations in the same country counts as 1
-        country_article_ids: Dict[str, set] = defaultdict(set)
+        # Locations with articles, most referenced first, with their article indices
+        rows = [
+            (data, np.frombuffer(data['articles'], dtype=np.uint32))
+            for data in self.location_lookup.values()
+            if data['articleCount'] > 0  # Only include locations with articles
+        ]
+        rows.sort(key=lambda row: row[0]['articleCount'], reverse=True)
+        
+        locations_list = []
+        for data, _ in rows:
+            coords = data['coordinates']
+            locations_list.append({
+                'name': data['name'],
+                'lat': coords[0],
+                'lng': coords[1],
+                'articleCount': data['articleCount'],
+                'country': data['country'] if data['country'] else 'Unknown'
+            })
+        
+        matched = np.concatenate([idx for _, idx in rows]) if rows else np.zeros(0, dtype=np.uint32)
+        matched_unique = np.unique(matched)
         
         # Track all years and source countries for filtering
-        all_years: set = set()
-        all_source_countries: set = set()
+        sorted_source_countries = sorted({article_country[i] for i in matched_unique.tolist()} - {''})
+        sorted_years = sorted(set(article_year[matched_unique].tolist()) - {0})
+        country_code = {c: i for i, c in enumerate(sorted_source_countries)}
+        article_code = np.array([country_code.get(c, -1) for c in article_country], dtype=np.int32)
+        
+        # Sparse (location x year x source country) count cube, CSR rows per location.
+        # References without a source country are not filterable and left out.
+        has_code = article_code[matched] >= 0
+        facet_years = np.unique(article_year[matched][has_code])
+        n_codes = max(len(sorted_source_countries), 1)
+        
+        def cells_of(idx: np.ndarray) -> np.ndarray:
+            idx = idx[article_code[idx] >= 0]
+            return np.searchsorted(facet_years, article_year[idx]) * n_codes + article_code[idx]
+        
+        offsets = [0]
+        facet_cells: List[int] = []
+        facet_counts: List[int] = []
+        for _, idx in rows:
+            cells, counts = np.unique(cells_of(idx), return_counts=True)
+            facet_cells.extend(cells.tolist())
+            facet_counts.extend(counts.tolist())
+            offsets.append(len(facet_cells))
         
         # Aggregated counts by source_country and year for filtering
-        # Structure: { source_country: { year: count } }
-        counts_by_source_country_year: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
-        
-        # Location counts by source_country and year
-        # Structure: { location_name: { source_country: { year: count } } }
-        location_counts_by_filter: Dict[str, Dict[str, Dict[int, int]]] = defaultdict(
-            lambda: defaultdict(lambda: defaultdict(int))
-        )
-        
-        for normalized, data in self.location_lookup.items():
-            if data['articleCount'] > 0:  # Only include locations with articles
-                coords = data['coordinates']
-                country = data['country']
-                loc_name = data['name']
-                
-                locations_list.append({
-                    'name': loc_name,
-                    'lat': coords[0],
-                    'lng': coords[1],
-                    'articleCount': data['articleCount'],
-                    'country': country if country else 'Unknown'
-                })
-                
-                # Track unique article IDs per country for choropleth
-                if country:
-                    country_article_ids[country].update(data['articleIds'])
-                
-                # Process article metadata for filtering
-                for meta in data.get('articleMeta', []):
-                    source_country = meta.get('source_country', '')
-                    year = meta.get('year')
-                    
-                    if source_country:
-                        all_source_countries.add(source_country)
-                    if year:
-                        all_years.add(year)
-                    
-                    # Count by source country and year
-                    if source_country and year:
-                        counts_by_source_country_year[source_country][year] += 1
-                        location_counts_by_filter[loc_name][source_country][year] += 1
-                    elif source_country:
-                        # Article with source country but no year
-                        counts_by_source_country_year[source_country][0] += 1
-                        location_counts_by_filter[loc_name][source_country][0] += 1
-        
-        # Convert to counts of unique articles per country
+        # Structure: { source_country: { year: count } } (year "0" = undated)
+        filter_counts: Dict[str, Dict[str, int]] = defaultdict(dict)
+        cells, counts = np.unique(cells_of(matched), return_counts=True)
+        for cell, count in zip(cells.tolist(), counts.tolist()):
+            year = int(facet_years[cell // n_codes])
+            filter_counts[sorted_source_countries[cell % n_codes]][str(year)] = count
+        
+        # For choropleth: count UNIQUE articles per country
+        # An article mentioning multiple locations in the same country counts as 1
+        country_articles: Dict[str, List[np.ndarray]] = defaultdict(list)
+        for data, idx in rows:
+            if data['country']:
+                country_articles[data['country']].append(idx)
         country_counts = {
-            country: len(article_ids) 
-            for country, article_ids in country_article_ids.items()
+            country: int(np.unique(np.concatenate(parts)).size)
+            for country, parts in country_articles.items()
         }
         
-        # Sort by article count (descending)
-        locations_list.sort(key=lambda x: x['articleCount'], reverse=True)
-        
-        # Build filter data for frontend
-        sorted_years = sorted(y for y in all_years if y)
-        sorted_source_countries = sorted(all_source_countries)
-        
-        # Convert counts_by_source_country_year to JSON-serializable format
-        filter_counts = {}
-        for src_country, year_counts in counts_by_source_country_year.items():
-            filter_counts[src_country] = {str(y): c for y, c in year_counts.items()}
-        
-        # Convert location_counts_by_filter to JSON-serializable format
-        location_filter_data = {}
-        for loc_name, country_data in location_counts_by_filter.items():
-            location_filter_data[loc_name] = {}
-            for src_country, year_counts in country_data.items():
-                location_filter_data[loc_name][src_country] = {str(y): c for y, c in year_counts.items()}
-        
         # Build metadata
         total_locations = len(locations_list)
-        total_unique_articles = len(set().union(*[data['articleIds'] for data in self.location_lookup.values() if data['articleIds']]))
+        total_unique_articles = int(matched_unique.size)
         countries_with_data = sorted(set(
             loc['country'] for loc in locations_list if loc['country'] != 'Unknown'
         ))
@@ -430,8 +424,13 @@ class IWACWorldMapGenerator:
                     'min': min(sorted_years) if sorted_years else None,
                     'max': max(sorted_years) if sorted_years else None
                 },
-                'countsBySourceCountryYear': filter_counts,
-                'locationCountsByFilter': location_filter_data
+                'countsBySourceCountryYear': dict(filter_counts),
+                'locationFacets': {
+                    'years': facet_years.tolist(),
+                    'offsets': offsets,
+                    'cell': facet_cells,
+                    'count': facet_counts
+                }
             },
             'metadata': {
                 'totalLocations': total_locations,
@@ -447,6 +446,11 @@ class IWACWorldMapGenerator:
             }
         }
         
+        if self.clusters:
+            result['clusters'] = cluster_records(locations_list, 'articleCount', radius=self.cluster_radius)
+            logger.info(f"Clustered {total_locations} locations up to zoom {result['clusters']['maxZoom']}: "
+                        + ", ".join(f"z{l['zoom']} {len(l['start'])}" for l in result['clusters']['levels']))
+        
         logger.info(f"Generated data for {total_locations} locations, {total_unique_articles} unique articles")
         logger.info(f"Countries with data: {len(countries_with_data)}")
         logger.info(f"Source countries: {sorted_source_countries}")
@@ -483,9 +487,25 @@ def main():
         help='Output directory for JSON files (default: static/data)'
     )
     
+    parser.add_argument(
+        '--no-clusters',
+        action='store_true',
+        help='Skip the precomputed marker clustering index'
+    )
+    parser.add_argument(
+        '--cluster-radius',
+        type=int,
+        default=DEFAULT_RADIUS,
+        help=f'Marker cluster radius in pixels (default: {DEFAULT_RADIUS})'
+    )
+    
     args = parser.parse_args()
     
-    generator = IWACWorldMapGenerator(output_dir=args.output_dir)
+    generator = IWACWorldMapGenerator(
+        output_dir=args.output_dir,
+        clusters=not args.no_clusters,
+        cluster_radius=args.cluster_radius
+    )
     generator.process()
 
 
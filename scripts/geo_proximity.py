@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Great-circle distances and nearest-neighbour queries for IWAC locations.
+
+Locations are mapped to unit vectors on the sphere and indexed in a KD-tree.
+The straight-line (chord) distance between two unit vectors grows
+monotonically with their great-circle distance, so Euclidean KD-tree queries
+return exactly the haversine nearest neighbours and radius matches; chords
+are converted back to kilometres with ``2 R asin(chord / 2)``. Pairwise
+distances for known pairs (e.g. co-occurrence edges) are a single vectorized
+haversine over the endpoint arrays, with no Python loop over pairs.
+
+Exported nearest-neighbour index (columnar, aligned with the node list)::
+
+    {
+      "k": 5,
+      "neighbors": [[node index, ...], ...],   # nearest first
+      "distanceKm": [[12.3, ...], ...]
+    }
+
+Rows are shorter than ``k`` when there are fewer than ``k + 1`` points.
+
+The client reader is src/lib/utils/spatialProximity.ts.
+
+Used by:
+- generate_spatial_networks.py  (networks/spatial.json edge distanceKm and "nearest")
+- edge_paths.py                 (unit vectors for great-circle sampling)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Sequence, Tuple
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+# Mean Earth radius (IUGG)
+EARTH_RADIUS_KM = 6371.0088
+DISTANCE_DECIMALS = 1
+DEFAULT_NEIGHBORS = 5
+
+
+# ============================================================================
+# Distances
+# ============================================================================
+
+
+def unit_vectors(lats: Sequence[float], lngs: Sequence[float]) -> np.ndarray:
+    """Latitude/longitude in degrees -> (n, 3) unit vectors."""
+    lat = np.radians(np.asarray(lats, dtype=np.float64))
+    lng = np.radians(np.asarray(lngs, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack([cos_lat * np.cos(lng), cos_lat * np.sin(lng), np.sin(lat)])
+
+
+def chord_to_km(chord: np.ndarray) -> np.ndarray:
+    """Chord length between unit vectors -> great-circle distance in km."""
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(np.asarray(chord, dtype=np.float64) / 2, 0.0, 1.0))
+
+
+def km_to_chord(km: float) -> float:
+    """Great-circle distance in km -> chord length between unit vectors."""
+    return float(2 * np.sin(min(km / EARTH_RADIUS_KM, np.pi) / 2))
+
+
+def haversine_km(lat1, lng1, lat2, lng2) -> np.ndarray:
+    """Vectorized haversine distance in km; arguments broadcast like NumPy arrays."""
+    lat1, lng1, lat2, lng2 = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lng1, lat2, lng2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def pair_distances_km(
+    lats: Sequence[float], lngs: Sequence[float], src: Sequence[int], dst: Sequence[int]
+) -> np.ndarray:
+    """Distance in km of every (src[i], dst[i]) pair of point indices."""
+    lats = np.asarray(lats, dtype=np.float64)
+    lngs = np.asarray(lngs, dtype=np.float64)
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    return haversine_km(lats[src], lngs[src], lats[dst], lngs[dst])
+
+
+# ============================================================================
+# Proximity index
+# ============================================================================
+
+
+def build_tree(lats: Sequence[float], lngs: Sequence[float]) -> cKDTree:
+    """KD-tree over the unit vectors of the points."""
+    return cKDTree(unit_vectors(lats, lngs))
+
+
+def nearest_neighbors(
+    lats: Sequence[float], lngs: Sequence[float], k: int = DEFAULT_NEIGHBORS
+) -> Tuple[np.ndarray, np.ndarray]:
+    """The ``k`` nearest other points of every point.
+
+    Returns:
+        (indices, distances in km), both of shape (n, min(k, n - 1)), nearest first
+    """
+    n = len(lats)
+    k = min(k, n - 1)
+    if k <= 0:
+        return np.zeros((n, 0), dtype=np.int64), np.zeros((n, 0))
+
+    tree = build_tree(lats, lngs)
+    # One extra neighbour: each point finds itself at distance 0
+    chords, indices = tree.query(tree.data, k=k + 1)
+    rows = np.arange(n)[:, None]
+    # Drop the point itself (not always column 0 when points coincide)
+    not_self = indices != rows
+    keep = not_self & (np.cumsum(not_self, axis=1) <= k)
+    indices = indices[keep].reshape(n, k)
+    return indices, chord_to_km(chords[keep].reshape(n, k))
+
+
+def within_km(tree: cKDTree, lat: float, lng: float, radius_km: float) -> np.ndarray:
+    """Indices of the tree points within ``radius_km`` of a location, sorted."""
+    center = unit_vectors([lat], [lng])[0]
+    return np.array(sorted(tree.query_ball_point(center, km_to_chord(radius_km))), dtype=np.int64)
+
+
+def neighbor_index(
+    lats: Sequence[float], lngs: Sequence[float], k: int = DEFAULT_NEIGHBORS, decimals: int = DISTANCE_DECIMALS
+) -> Dict[str, Any]:
+    """Columnar nearest-neighbour export (see module docstring)."""
+    indices, distances = nearest_neighbors(lats, lngs, k)
+    return {
+        "k": int(indices.shape[1]),
+        "neighbors": indices.tolist(),
+        "distanceKm": np.round(distances, decimals).tolist(),
+    }
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Binary typed-array export for the IWAC graph files.
+
+The JSON graph exports repeat every key (source, target, weight, weightNorm,
+...) on every node and edge, and the client parses each record before
+building its graphology graph. This format stores the same graph as
+columns instead:
+
+- numbers become Uint32 / Int32 / Float32 arrays (Float64 only when Float32
+  would lose precision), booleans Uint8;
+- edge source/target become Uint32 node indices;
+- repetitive strings (node/edge type, countries) are dictionary-coded into
+  Uint8/Uint16 codes, digit-only ids (articleIds, o_id) into Uint32,
+  strings ending in a number after a shared prefix ("plc:269", item URLs)
+  into a prefix code plus a Uint32, and ISO dates (YYYY, YYYY-MM or
+  YYYY-MM-DD) into Uint32 YYYYMMDD (the odd non-ISO value, e.g. a date
+  range, is kept in the header);
+- list values (articleIds, coordinates) become a Uint32 offsets array plus
+  one flat value column;
+- nested objects (KG node ``properties``) are split into one column per key.
+
+Everything else (ids, labels, mixed values) stays as a JSON array in the
+header. Keys missing on some records get a Uint8 presence mask and only the
+present values are stored, so decoding restores records key for key.
+
+File layout (little-endian)::
+
+    "IWGB" | uint32 header length | JSON header (space-padded) | binary blob
+
+The blob starts on an 8-byte boundary and every array inside it is 8-byte
+aligned, so the client can wrap each one in a typed-array view without
+copying. Column specs in the header give ``dtype``, ``offset`` (bytes from
+the blob start) and ``length`` (elements). Top-level keys other than nodes
+and edges (``meta``, ...) are kept verbatim in the header under ``extra``.
+
+The client decoder is src/lib/utils/graphBinary.ts.
+
+Used by:
+- generate_knowledge_graph.py  (--binary: graph.bin, graph-{tier}.bin)
+- spatial/build_networks.py    (--binary: networks/global.bin)
+- generate_references.py       (--binary: coauthor-network.bin)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+MAGIC = b"IWGB"
+FORMAT_VERSION = 1
+ALIGN = 8
+# A string column is dictionary-coded when it has at most this many distinct
+# values and each one repeats CATEGORY_MIN_REPEAT times on average
+MAX_CATEGORIES = 65536
+CATEGORY_MIN_REPEAT = 4
+# Float columns fall back to Float64 when Float32 is off by more than this,
+# or changes a whole number (large ids/timestamps mixed with fractions)
+FLOAT32_RTOL = 1e-6
+# Share of ISO dates for a string column to be date-coded
+MIN_DATE_SHARE = 0.9
+
+_UINT32_MAX = 2**32 - 1
+_INT32_MIN, _INT32_MAX = -(2**31), 2**31 - 1
+_MISSING = object()
+# Prefix (empty or ending in a non-digit) + number without leading zeros
+_TAGGED = re.compile(r"^(.*\D|)(0|[1-9][0-9]*)$")
+_ISO_DATE = re.compile(r"^[0-9]{4}(-(0[1-9]|1[0-2])(-(0[1-9]|[12][0-9]|3[01]))?)?$")
+
+
+# ============================================================================
+# Encoding
+# ============================================================================
+
+class _Blob:
+    """Accumulates aligned little-endian arrays and returns their descriptors."""
+
+    def __init__(self) -> None:
+        self.parts: List[bytes] = []
+        self.size = 0
+
+    def add(self, array: np.ndarray) -> Dict[str, Any]:
+        pad = -self.size % ALIGN
+        if pad:
+            self.parts.append(b"\0" * pad)
+            self.size += pad
+        data = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<")).tobytes()
+        desc = {"dtype": array.dtype.name, "offset": self.size, "length": int(len(array))}
+        self.parts.append(data)
+        self.size += len(data)
+        return desc
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_scalar(value: Any) -> bool:
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+def _is_digit_id(value: str) -> bool:
+    return value.isdigit() and value.isascii() and (value == "0" or value[0] != "0") and int(value) <= _UINT32_MAX
+
+
+def _categories(values: Sequence[str]) -> Optional[List[str]]:
+    """Distinct values in first-seen order when dictionary coding pays off."""
+    categories = list(dict.fromkeys(values))
+    if len(categories) <= MAX_CATEGORIES and len(categories) * CATEGORY_MIN_REPEAT <= len(values):
+        return categories
+    return None
+
+
+def _category_codes(values: Sequence[str], categories: List[str]) -> np.ndarray:
+    code_of = {c: i for i, c in enumerate(categories)}
+    dtype = np.uint8 if len(categories) <= 256 else np.uint16
+    return np.asarray([code_of[v] for v in values], dtype=dtype)
+
+
+def _number_array(values: Sequence[Any]) -> np.ndarray:
+    """Smallest exact typed array for a list of numbers."""
+    if all(isinstance(v, int) for v in values):
+        lo, hi = min(values, default=0), max(values, default=0)
+        if lo >= 0 and hi <= _UINT32_MAX:
+            return np.asarray(values, dtype=np.uint32)
+        if lo >= _INT32_MIN and hi <= _INT32_MAX:
+            return np.asarray(values, dtype=np.int32)
+    exact = np.asarray(values, dtype=np.float64)
+    single = exact.astype(np.float32)
+    whole = np.isfinite(exact) & (exact == np.round(exact))
+    if np.allclose(single, exact, rtol=FLOAT32_RTOL, atol=0.0, equal_nan=True) and np.array_equal(
+        single[whole], exact[whole]
+    ):
+        return single
+    return exact
+
+
+def _encode_values(values: List[Any], blob: _Blob) -> Dict[str, Any]:
+    """Encode one column of present values (no _MISSING) into a spec."""
+    if not values:
+        return {"kind": "json", "values": []}
+
+    if all(isinstance(v, bool) for v in values):
+        return {"kind": "bool", **blob.add(np.asarray(values, dtype=np.uint8))}
+
+    if all(_is_number(v) for v in values):
+        return {"kind": "number", **blob.add(_number_array(values))}
+
+    if all(isinstance(v, str) for v in values):
+        if all(_is_digit_id(v) for v in values):
+            return {"kind": "digits", **blob.add(np.asarray([int(v) for v in values], dtype=np.uint32))}
+        others = {i: v for i, v in enumerate(values) if not _ISO_DATE.match(v)}
+        if len(values) - len(others) >= MIN_DATE_SHARE * len(values):
+            # Missing month/day are stored as 00, non-ISO values as 0
+            dates = np.asarray(
+                [0 if i in others else int(v.replace("-", "").ljust(8, "0")) for i, v in enumerate(values)],
+                dtype=np.uint32,
+            )
+            return {"kind": "date", "others": {str(i): v for i, v in others.items()}, **blob.add(dates)}
+        categories = _categories(values)
+        if categories is not None:
+            return {"kind": "category", "categories": categories, **blob.add(_category_codes(values, categories))}
+        matches = [_TAGGED.match(v) for v in values]
+        if all(m and int(m.group(2)) <= _UINT32_MAX for m in matches):
+            prefixes = [m.group(1) for m in matches]
+            categories = _categories(prefixes)
+            if categories is not None:
+                return {
+                    "kind": "tagged",
+                    "categories": categories,
+                    "codes": blob.add(_category_codes(prefixes, categories)),
+                    "numbers": blob.add(np.asarray([int(m.group(2)) for m in matches], dtype=np.uint32)),
+                }
+        return {"kind": "json", "values": values}
+
+    if all(isinstance(v, list) and all(_is_scalar(x) for x in v) for v in values):
+        offsets = np.zeros(len(values) + 1, dtype=np.uint32)
+        np.cumsum([len(v) for v in values], out=offsets[1:])
+        items = [x for v in values for x in v]
+        return {"kind": "list", "offsets": blob.add(offsets), "items": _encode_values(items, blob)}
+
+    return {"kind": "json", "values": values}
+
+
+def _encode_table(
+    records: Sequence[Mapping[str, Any]],
+    blob: _Blob,
+    node_index: Optional[Mapping[str, int]] = None,
+    path: Sequence[str] = (),
+) -> List[Dict[str, Any]]:
+    """Column specs for a list of records (nested objects become sub-columns)."""
+    keys = list(dict.fromkeys(k for r in records for k in r))
+    columns: List[Dict[str, Any]] = []
+    for key in keys:
+        column = [r.get(key, _MISSING) for r in records]
+        present = [v is not _MISSING for v in column]
+        values = [v for v in column if v is not _MISSING]
+        spec: Dict[str, Any] = {"path": [*path, key]}
+        if not all(present):
+            spec["present"] = blob.add(np.asarray(present, dtype=np.uint8))
+
+        if values and all(isinstance(v, dict) for v in values):
+            columns.append({**spec, "kind": "object"})
+            columns.extend(_encode_table(values, blob, path=[*path, key]))
+            continue
+
+        if node_index is not None and key in ("source", "target") and all(
+            isinstance(v, str) and v in node_index for v in values
+        ):
+            indices = np.asarray([node_index[v] for v in values], dtype=np.uint32)
+            columns.append({**spec, "kind": "node", **blob.add(indices)})
+            continue
+
+        columns.append({**spec, **_encode_values(values, blob)})
+    return columns
+
+
+def encode_graph(graph: Mapping[str, Any]) -> bytes:
+    """Encode a {nodes, edges, ...} graph dict into the binary format.
+
+    Args:
+        graph: Graph as written to JSON (node records need an ``id`` for
+            source/target to be index-coded)
+
+    Returns:
+        The encoded file contents
+    """
+    nodes = list(graph.get("nodes", []))
+    edges = list(graph.get("edges", []))
+    node_index = {n["id"]: i for i, n in enumerate(nodes) if isinstance(n.get("id"), str)}
+
+    blob = _Blob()
+    header = {
+        "format": "iwac-graph",
+        "version": FORMAT_VERSION,
+        "nodeCount": len(nodes),
+        "edgeCount": len(edges),
+        "nodes": _encode_table(nodes, blob),
+        "edges": _encode_table(edges, blob, node_index=node_index),
+        "extra": {k: v for k, v in graph.items() if k not in ("nodes", "edges")},
+    }
+
+    header_bytes = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    header_bytes += b" " * (-(len(MAGIC) + 4 + len(header_bytes)) % ALIGN)
+    return MAGIC + struct.pack("<I", len(header_bytes)) + header_bytes + b"".join(blob.parts)
+
+
+# ============================================================================
+# Decoding
+# ============================================================================
+
+def _read_array(buffer: memoryview, desc: Mapping[str, Any]) -> np.ndarray:
+    dtype = np.dtype(desc["dtype"]).newbyteorder("<")
+    return np.frombuffer(buffer, dtype=dtype, count=desc["length"], offset=desc["offset"])
+
+
+def _format_date(value: int) -> str:
+    year, month, day = value // 10000, value // 100 % 100, value % 100
+    text = f"{year:04d}"
+    if month:
+        text += f"-{month:02d}"
+        if day:
+            text += f"-{day:02d}"
+    return text
+
+
+def _decode_values(spec: Mapping[str, Any], buffer: memoryview) -> List[Any]:
+    kind = spec["kind"]
+    if kind == "json":
+        return list(spec["values"])
+    if kind == "tagged":
+        categories = spec["categories"]
+        codes = _read_array(buffer, spec["codes"]).tolist()
+        numbers = _read_array(buffer, spec["numbers"]).tolist()
+        return [f"{categories[c]}{n}" for c, n in zip(codes, numbers)]
+    if kind == "list":
+        offsets = _read_array(buffer, spec["offsets"]).tolist()
+        items = _decode_values(spec["items"], buffer)
+        return [items[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+    array = _read_array(buffer, spec)
+    if kind == "bool":
+        return [bool(v) for v in array]
+    if kind == "digits":
+        return [str(v) for v in array.tolist()]
+    if kind == "date":
+        dates = [_format_date(v) for v in array.tolist()]
+        for i, value in spec["others"].items():
+            dates[int(i)] = value
+        return dates
+    if kind == "category":
+        categories = spec["categories"]
+        return [categories[c] for c in array.tolist()]
+    return array.tolist()
+
+
+def _decode_table(
+    columns: Sequence[Mapping[str, Any]],
+    count: int,
+    buffer: memoryview,
+    nodes: Optional[List[Dict[str, Any]]] = None,
+) -> List[Dict[str, Any]]:
+    """Rebuild the records of a table from its column specs (inverse of _encode_table)."""
+    records: List[Dict[str, Any]] = [{} for _ in range(count)]
+    for spec in columns:
+        *parents, key = spec["path"]
+        if "present" in spec:
+            rows = np.flatnonzero(_read_array(buffer, spec["present"])).tolist()
+        else:
+            rows = range(count)
+
+        if spec["kind"] == "object":
+            values: List[Any] = [{} for _ in rows]
+        elif spec["kind"] == "node":
+            values = [nodes[i]["id"] for i in _read_array(buffer, spec).tolist()]
+        else:
+            values = _decode_values(spec, buffer)
+
+        for row, value in zip(rows, values):
+            target = records[row]
+            for parent in parents:
+                target = target[parent]
+            target[key] = value
+    return records
+
+
+def decode_graph(data: bytes) -> Dict[str, Any]:
+    """Decode a binary graph back into the {nodes, edges, ...} dict."""
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not an IWAC binary graph (bad magic)")
+    (header_length,) = struct.unpack_from("<I", data, len(MAGIC))
+    start = len(MAGIC) + 4
+    header = json.loads(data[start:start + header_length].decode("utf-8"))
+    if header.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported binary graph version {header.get('version')}")
+
+    buffer = memoryview(data)[start + header_length:]
+    nodes = _decode_table(header["nodes"], header["nodeCount"], buffer)
+    edges = _decode_table(header["edges"], header["edgeCount"], buffer, nodes=nodes)
+    return {"nodes": nodes, "edges": edges, **header["extra"]}
+
+
+# ============================================================================
+# I/O
+# ============================================================================
+
+def save_graph_binary(graph: Mapping[str, Any], path: Path, log: bool = True) -> None:
+    """Write ``graph`` in the binary format, creating parent directories.
+
+    Examples:
+        >>> save_graph_binary(graph, Path("static/data/networks/global.bin"))
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(encode_graph(graph))
+    if log:
+        logger.info(f"Wrote {path} ({path.stat().st_size / 1024:.1f} KB)")
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Deterministic ForceAtlas2 layout for the IWAC graph exports.
+
+Computes node positions server-side so the dashboard can render a network
+immediately instead of running ForceAtlas2 in the browser. The force model and
+the adaptive per-node speed follow graphology-layout-forceatlas2 (the library
+used by NetworkGraph.svelte). Defaults are Gephi's (linear attraction, scaling
+2 or 10 for small graphs, gravity 1): with a fixed iteration budget they settle,
+whereas the client's linLog settings keep expanding and only suit short runs.
+
+Repulsion uses a Barnes-Hut approximation over a quadtree built from Morton
+codes. Instead of walking the tree node by node, every node is paired with
+the root cell and the (node, cell) frontier is refined one level at a time:
+far-enough cells are applied as a single mass at their centre, the others are
+opened into their children, and leaves at the maximum depth are resolved
+exactly. Each level is a handful of NumPy operations.
+
+With a fixed seed and iteration budget the result is reproducible.
+
+Used by:
+- generate_knowledge_graph.py  (KnowledgeGraphBuilder.compute_layout)
+- network_builder.py           (NetworkBuilder.compute_layout)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+DEFAULT_ITERATIONS = 200
+DEFAULT_SEED = 42
+DEFAULT_THETA = 1.2
+DEFAULT_GRAVITY = 1.0
+DEFAULT_SLOW_DOWN = 1.0
+DEFAULT_EDGE_WEIGHT_INFLUENCE = 1.0
+# Initial positions are drawn in [0, INITIAL_SPAN), like the client's Math.random() * 100
+INITIAL_SPAN = 100.0
+# Quadtree depth (Morton codes use 2 bits per level)
+MAX_DEPTH = 12
+# Below this many nodes repulsion is computed exactly (client: barnesHutOptimize for > 30)
+BARNES_HUT_MIN_NODES = 30
+
+
+# ============================================================================
+# Quadtree
+# ============================================================================
+
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    """Insert a zero bit between each of the low 16 bits of ``values``."""
+    v = values.astype(np.uint64) & np.uint64(0xFFFF)
+    v = (v | (v << np.uint64(8))) & np.uint64(0x00FF00FF)
+    v = (v | (v << np.uint64(4))) & np.uint64(0x0F0F0F0F)
+    v = (v | (v << np.uint64(2))) & np.uint64(0x33333333)
+    v = (v | (v << np.uint64(1))) & np.uint64(0x55555555)
+    return v.astype(np.int64)
+
+
+def morton_codes(pos: np.ndarray, depth: int = MAX_DEPTH) -> np.ndarray:
+    """Morton (Z-order) code of each position on a 2**depth grid over its bounding square."""
+    low = pos.min(axis=0)
+    span = float((pos.max(axis=0) - low).max()) or 1.0
+    grid = 1 << depth
+    cells = np.minimum(((pos - low) / span * grid).astype(np.int64), grid - 1)
+    return _spread_bits(cells[:, 0]) | (_spread_bits(cells[:, 1]) << 1)
+
+
+class _QuadTree:
+    """Per-level cell summaries (mass, centre of mass, node ranges) of a point set."""
+
+    def __init__(self, pos: np.ndarray, mass: np.ndarray, depth: int = MAX_DEPTH) -> None:
+        self.depth = depth
+        low = pos.min(axis=0)
+        self.span = float((pos.max(axis=0) - low).max()) or 1.0
+        self.codes = morton_codes(pos, depth)
+        self.order = np.argsort(self.codes, kind="stable")
+        sorted_codes = self.codes[self.order]
+        sorted_mass = mass[self.order]
+        sorted_pos = pos[self.order]
+
+        self.keys: List[np.ndarray] = []
+        self.start: List[np.ndarray] = []
+        self.count: List[np.ndarray] = []
+        self.mass: List[np.ndarray] = []
+        self.centre: List[np.ndarray] = []
+        for level in range(depth + 1):
+            level_codes = sorted_codes >> (2 * (depth - level))
+            keys, start, count = np.unique(level_codes, return_index=True, return_counts=True)
+            cell_mass = np.add.reduceat(sorted_mass, start)
+            centre = np.add.reduceat(sorted_pos * sorted_mass[:, None], start, axis=0) / cell_mass[:, None]
+            self.keys.append(keys)
+            self.start.append(start)
+            self.count.append(count)
+            self.mass.append(cell_mass)
+            self.centre.append(centre)
+
+        # Child cell range [first, last) of every cell in the next level
+        self.child_first: List[np.ndarray] = []
+        self.child_last: List[np.ndarray] = []
+        for level in range(depth):
+            parents = self.keys[level + 1] >> 2
+            self.child_first.append(np.searchsorted(parents, self.keys[level], side="left"))
+            self.child_last.append(np.searchsorted(parents, self.keys[level], side="right"))
+
+
+def _expand_ranges(owner: np.ndarray, first: np.ndarray, last: np.ndarray):
+    """Pair each owner with every index in its [first, last) range."""
+    sizes = last - first
+    owners = np.repeat(owner, sizes)
+    offsets = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    return owners, np.repeat(first, sizes) + offsets
+
+
+def _accumulate(force: np.ndarray, nodes: np.ndarray, delta: np.ndarray, factor: np.ndarray) -> None:
+    n = len(force)
+    force[:, 0] += np.bincount(nodes, weights=delta[:, 0] * factor, minlength=n)
+    force[:, 1] += np.bincount(nodes, weights=delta[:, 1] * factor, minlength=n)
+
+
+def _repulsion_barnes_hut(pos: np.ndarray, mass: np.ndarray, coefficient: float, theta: float) -> np.ndarray:
+    """Approximate linear repulsion (k * m_i * m_j / d) with a level-by-level Barnes-Hut walk."""
+    n = len(pos)
+    tree = _QuadTree(pos, mass)
+    force = np.zeros_like(pos)
+
+    nodes = np.arange(n)
+    cells = np.zeros(n, dtype=np.int64)
+    for level in range(tree.depth + 1):
+        if not len(nodes):
+            break
+        shift = 2 * (tree.depth - level)
+        contains = (tree.codes[nodes] >> shift) == tree.keys[level][cells]
+        delta = pos[nodes] - tree.centre[level][cells]
+        dist = np.sqrt((delta ** 2).sum(axis=1))
+        size = tree.span / (1 << level)
+        single = tree.count[level][cells] == 1
+
+        # Far cells and single-node cells act as one mass at their centre
+        apply = ~contains & (single | (size < theta * dist)) & (dist > 0)
+        if apply.any():
+            factor = coefficient * mass[nodes[apply]] * tree.mass[level][cells[apply]] / dist[apply] ** 2
+            _accumulate(force, nodes[apply], delta[apply], factor)
+
+        # Open the remaining cells (a single-node cell that contains the node is the node itself)
+        open_ = ~apply & ~(single & contains)
+        nodes, cells = nodes[open_], cells[open_]
+        if level < tree.depth:
+            nodes, cells = _expand_ranges(
+                nodes, tree.child_first[level][cells], tree.child_last[level][cells]
+            )
+
+    # Crowded leaves at maximum depth: exact pairwise interactions
+    if len(nodes):
+        leaf = tree.depth
+        nodes, members = _expand_ranges(
+            nodes,
+            tree.start[leaf][cells],
+            tree.start[leaf][cells] + tree.count[leaf][cells],
+        )
+        others = tree.order[members]
+        keep = others != nodes
+        nodes, others = nodes[keep], others[keep]
+        delta = pos[nodes] - pos[others]
+        dist2 = (delta ** 2).sum(axis=1)
+        ok = dist2 > 0
+        factor = coefficient * mass[nodes[ok]] * mass[others[ok]] / dist2[ok]
+        _accumulate(force, nodes[ok], delta[ok], factor)
+    return force
+
+
+def _repulsion_exact(pos: np.ndarray, mass: np.ndarray, coefficient: float, chunk: int = 512) -> np.ndarray:
+    """Exact linear repulsion, computed in row blocks."""
+    force = np.zeros_like(pos)
+    for lo in range(0, len(pos), chunk):
+        delta = pos[lo:lo + chunk, None, :] - pos[None, :, :]
+        dist2 = (delta ** 2).sum(axis=2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            factor = np.where(dist2 > 0, coefficient * mass[lo:lo + chunk, None] * mass[None, :] / dist2, 0.0)
+        force[lo:lo + chunk] = (delta * factor[:, :, None]).sum(axis=1)
+    return force
+
+
+# ============================================================================
+# Layout
+# ============================================================================
+
+def forceatlas2_layout(
+    n_nodes: int,
+    src: Sequence[int],
+    dst: Sequence[int],
+    weight: Optional[Sequence[float]] = None,
+    iterations: int = DEFAULT_ITERATIONS,
+    seed: int = DEFAULT_SEED,
+    scaling_ratio: Optional[float] = None,
+    gravity: float = DEFAULT_GRAVITY,
+    strong_gravity: bool = False,
+    lin_log: bool = False,
+    outbound_attraction_distribution: bool = False,
+    edge_weight_influence: float = DEFAULT_EDGE_WEIGHT_INFLUENCE,
+    slow_down: float = DEFAULT_SLOW_DOWN,
+    barnes_hut: Optional[bool] = None,
+    theta: float = DEFAULT_THETA,
+    initial: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Run a fixed number of ForceAtlas2 iterations.
+
+    Args:
+        n_nodes: Number of nodes (codes 0..n_nodes-1)
+        src: Edge source codes
+        dst: Edge target codes
+        weight: Optional edge weights (default 1)
+        iterations: Fixed iteration budget
+        seed: Seed for the initial random positions
+        scaling_ratio: Repulsion strength (default 2, or 10 below 100 nodes)
+        gravity: Pull towards the origin
+        strong_gravity: Gravity proportional to distance
+        lin_log: Logarithmic attraction (tighter clusters)
+        outbound_attraction_distribution: Divide attraction by source mass (hubs spread out)
+        edge_weight_influence: Exponent applied to edge weights
+        slow_down: Divisor of the adaptive node speed
+        barnes_hut: Approximate repulsion (default: above BARNES_HUT_MIN_NODES nodes)
+        theta: Barnes-Hut opening criterion (cell width / distance)
+        initial: Optional (n_nodes, 2) starting positions
+
+    Returns:
+        (n_nodes, 2) float array of x/y positions
+
+    Examples:
+        >>> pos = forceatlas2_layout(3, [0, 1], [1, 2], iterations=10)
+        >>> pos.shape
+        (3, 2)
+    """
+    if n_nodes == 0:
+        return np.zeros((0, 2))
+
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    weight = np.ones(len(src)) if weight is None else np.asarray(weight, dtype=np.float64)
+    if scaling_ratio is None:
+        scaling_ratio = 2.0 if n_nodes >= 100 else 10.0
+    if barnes_hut is None:
+        barnes_hut = n_nodes > BARNES_HUT_MIN_NODES
+
+    if initial is None:
+        pos = np.random.default_rng(seed).random((n_nodes, 2)) * INITIAL_SPAN
+    else:
+        pos = np.array(initial, dtype=np.float64)
+
+    degree = np.bincount(src, minlength=n_nodes) + np.bincount(dst, minlength=n_nodes)
+    mass = 1.0 + degree
+    edge_coef = weight ** edge_weight_influence if edge_weight_influence != 1 else weight
+    attraction_coef = mass.mean() if outbound_attraction_distribution else 1.0
+    old_force = np.zeros_like(pos)
+
+    for _ in range(iterations):
+        # Repulsion
+        if barnes_hut:
+            force = _repulsion_barnes_hut(pos, mass, scaling_ratio, theta)
+        else:
+            force = _repulsion_exact(pos, mass, scaling_ratio)
+
+        # Gravity
+        dist = np.sqrt((pos ** 2).sum(axis=1))
+        if strong_gravity:
+            factor = scaling_ratio * mass * gravity
+        else:
+            factor = np.divide(mass * gravity, dist, out=np.zeros(n_nodes), where=dist > 0)
+        force -= pos * factor[:, None]
+
+        # Attraction
+        if len(src):
+            delta = pos[src] - pos[dst]
+            if lin_log:
+                edge_dist = np.sqrt((delta ** 2).sum(axis=1))
+                factor = np.divide(
+                    np.log1p(edge_dist), edge_dist, out=np.zeros(len(src)), where=edge_dist > 0
+                )
+            else:
+                factor = np.ones(len(src))
+            factor = -attraction_coef * edge_coef * factor
+            if outbound_attraction_distribution:
+                factor = factor / mass[src]
+            pull = delta * factor[:, None]
+            np.add.at(force, src, pull)
+            np.subtract.at(force, dst, pull)
+
+        # Adaptive per-node speed (swinging vs. traction)
+        swinging = mass * np.sqrt(((old_force - force) ** 2).sum(axis=1))
+        traction = np.sqrt(((old_force + force) ** 2).sum(axis=1)) / 2
+        speed = 0.1 * np.log1p(traction) / (1 + np.sqrt(swinging))
+        pos += force * (speed / slow_down)[:, None]
+        old_force = force
+
+    return pos
+
+
+def assign_positions(nodes: List[Dict[str, Any]], positions: np.ndarray, decimals: int = 2) -> None:
+    """Write rounded ``x``/``y`` attributes onto node dicts (aligned with ``positions``)."""
+    for node, (x, y) in zip(nodes, np.round(positions, decimals).tolist()):
+        node["x"] = x
+        node["y"] = y
@@ -15,6 +15,8 @@ Functions:
 - load_dataset_safe: Load HuggingFace dataset with error handling
 - find_column: Find first matching column in DataFrame
 - save_json: Save JSON with mkdir and optional minification
+- build_columnar_series: Encode named series sharing one axis as a matrix
+- save_columnar_json: Save a columnar time-series/facet output file
 - configure_logging: Standard logging setup
 """
 
@@ -26,7 +28,7 @@ import re
 import unicodedata
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 try:
     from datasets import load_dataset as hf_load_dataset
@@ -48,6 +50,9 @@ DATASET_ID = "fmadore/islam-west-africa-collection"
 SUBSETS = ["articles", "audiovisual", "documents", "publications", "references", "index"]
 """Available subsets in the IWAC dataset."""
 
+COLUMNAR_FORMAT = "iwac-columnar-v1"
+"""Format tag written to columnar series files (see build_columnar_series)."""
+
 
 # =============================================================================
 # Logging Configuration
@@ -551,6 +556,128 @@ def copy_to_build(
         return False
 
 
+# =============================================================================
+# Columnar Series Output
+# =============================================================================
+
+def rle_encode(values: Sequence[int]) -> List[int]:
+    """
+    Run-length encode a sequence of integers.
+
+    Runs are flattened as [value, length, value, length, ...].
+
+    Args:
+        values: Integer values to encode
+
+    Returns:
+        Flat list of (value, run length) pairs
+
+    Examples:
+        >>> rle_encode([0, 0, 0, 5, 5, 1])
+        [0, 3, 5, 2, 1, 1]
+        >>> rle_encode([])
+        []
+    """
+    runs: List[int] = []
+    for value in values:
+        value = int(value)
+        if runs and runs[-2] == value:
+            runs[-1] += 1
+        else:
+            runs.extend((value, 1))
+    return runs
+
+
+def rle_decode(runs: Sequence[int]) -> List[int]:
+    """
+    Decode a flat run-length list produced by rle_encode.
+
+    Args:
+        runs: Flat list of (value, run length) pairs
+
+    Returns:
+        Expanded list of integers
+
+    Examples:
+        >>> rle_decode([0, 3, 5, 2, 1, 1])
+        [0, 0, 0, 5, 5, 1]
+    """
+    values: List[int] = []
+    for i in range(0, len(runs) - 1, 2):
+        values.extend([int(runs[i])] * int(runs[i + 1]))
+    return values
+
+
+def build_columnar_series(
+    series: Dict[str, Sequence[int]],
+    encoding: str = "auto"
+) -> Dict[str, Any]:
+    """
+    Encode named integer series that share one axis as a columnar block.
+
+    Instead of repeating the axis (years, months, languages) for every
+    series, the block stores a name dictionary and one row of counts per
+    name, in the same order. The axis itself is written once by the caller.
+
+    Args:
+        series: Mapping of series name -> counts aligned to the shared axis
+        encoding: "dense", "rle" or "auto" (rle only if it is shorter)
+
+    Returns:
+        Dictionary with "names", "encoding" and "matrix" keys
+
+    Raises:
+        ValueError: If encoding is not one of "dense", "rle" or "auto"
+
+    Examples:
+        >>> build_columnar_series({"Islam": [0, 0, 0, 2], "Niger": [1, 0, 0, 0]}, "rle")
+        {"names": ["Islam", "Niger"], "encoding": "rle",
+         "matrix": [[0, 3, 2, 1], [1, 1, 0, 3]]}
+    """
+    if encoding not in ("dense", "rle", "auto"):
+        raise ValueError(f"Unknown columnar encoding: {encoding}")
+
+    names = list(series.keys())
+    dense = [[int(v) for v in series[name]] for name in names]
+
+    if encoding == "dense":
+        matrix = dense
+    else:
+        runs = [rle_encode(row) for row in dense]
+        if encoding == "auto" and sum(map(len, runs)) >= sum(map(len, dense)):
+            encoding, matrix = "dense", dense
+        else:
+            encoding, matrix = "rle", runs
+
+    return {
+        "names": names,
+        "encoding": encoding,
+        "matrix": matrix,
+    }
+
+
+def save_columnar_json(
+    data: Dict[str, Any],
+    path: Path,
+    log: bool = True
+) -> None:
+    """
+    Save a columnar series file.
+
+    The payload is stamped with COLUMNAR_FORMAT so the frontend loader can
+    tell it apart from the legacy per-series layout, and is always minified.
+
+    Args:
+        data: Output dictionary containing one or more build_columnar_series blocks
+        path: Output file path
+        log: If True, log the save operation
+
+    Examples:
+        >>> save_columnar_json({"axis": [2020, 2021], "series": block}, Path("out.json"))
+    """
+    save_json({"format": COLUMNAR_FORMAT, **data}, path, minify=True, log=log)
+
+
 # =============================================================================
 # Metadata Generation
 # =============================================================================
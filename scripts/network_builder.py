@@ -0,0 +1,494 @@
+#!/usr/bin/env python3
+"""
+Shared network assembly for the IWAC network generators.
+
+Nodes are interned to dense integer codes in insertion order and edges are
+held as parallel NumPy arrays (src, dst, weight, type). Co-occurrence edges
+are derived from a sparse group x node incidence matrix (articles,
+publications, references ...), so pair weights are a sparse product and the
+weight filter, degree, strength, weightNorm and labelPriority are array
+operations. `NetworkBuilder.serialize` produces the Sigma.js/graphology
+``{nodes, edges}`` shape consumed by the dashboard, with precomputed ``x``/``y``
+when `NetworkBuilder.compute_layout` has been run.
+
+Used by:
+- spatial/build_networks.py              (networks/global.json)
+- generate_spatial_networks.py           (networks/spatial.json)
+- generate_topic_network.py              (networks/topic-network.json)
+- generate_references.py                 (references/coauthor-network.json)
+- generate_references_subject_cooccurrence.py (references/subject-cooccurrence.json)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from scipy import sparse
+
+from graph_analytics import disparity_filter
+from graph_layout import assign_positions, forceatlas2_layout
+
+
+class NetworkBuilder:
+    """Integer-coded node/edge store with vectorized network metrics.
+
+    Typical use::
+
+        builder = NetworkBuilder()
+        for author in authors:
+            code = builder.add_node(make_id(author), type="author", label=author)
+            for pub_id in pubs_of[author]:
+                builder.add_membership(pub_id, code)
+        builder.add_cooccurrence_edges(edge_type="coauthor")
+        builder.sort_edges_by_weight()
+        network = builder.serialize(priority=builder.priority_rank(builder.strength()))
+    """
+
+    def __init__(self) -> None:
+        self.node_ids: List[str] = []
+        self.nodes: List[Dict[str, Any]] = []
+        self._codes: Dict[str, int] = {}
+
+        # Group (article / publication) memberships as raw incidence pairs
+        self.group_ids: List[str] = []
+        self._group_codes: Dict[str, int] = {}
+        self._rows: List[int] = []
+        self._cols: List[int] = []
+        self._incidence: Optional[sparse.csc_matrix] = None
+
+        self.edge_types: List[str] = []
+        self._chunks: List[tuple] = []
+        self._pending: List[tuple] = []
+
+        # (node_count, 2) layout positions, NaN for nodes left out of the layout
+        self.positions: Optional[np.ndarray] = None
+
+    # ------------------------------------------------------------------
+    # Nodes
+    # ------------------------------------------------------------------
+
+    def add_node(self, node_id: str, **attrs: Any) -> int:
+        """Register a node and return its code.
+
+        Re-adding an existing id returns the existing code and keeps the
+        attributes given the first time.
+        """
+        code = self._codes.get(node_id)
+        if code is None:
+            code = self._codes[node_id] = len(self.node_ids)
+            self.node_ids.append(node_id)
+            self.nodes.append({"id": node_id, **attrs})
+        return code
+
+    def code(self, node_id: str) -> Optional[int]:
+        """Return the code of ``node_id``, or None if it is unknown."""
+        return self._codes.get(node_id)
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_ids)
+
+    # ------------------------------------------------------------------
+    # Group memberships
+    # ------------------------------------------------------------------
+
+    def add_membership(self, group_id: str, code: int) -> None:
+        """Record that node ``code`` appears in group ``group_id``.
+
+        Group codes follow first-seen order, which is also the order of the
+        ``articleIds`` lists written for co-occurrence edges. Repeated
+        memberships count once.
+        """
+        group = self._group_codes.get(group_id)
+        if group is None:
+            group = self._group_codes[group_id] = len(self.group_ids)
+            self.group_ids.append(group_id)
+        self._rows.append(group)
+        self._cols.append(code)
+        self._incidence = None
+
+    @property
+    def incidence(self) -> sparse.csc_matrix:
+        """Binary group x node incidence matrix (CSC, one column per node)."""
+        if self._incidence is None:
+            mat = sparse.csc_matrix(
+                (
+                    np.ones(len(self._rows), dtype=np.int32),
+                    (np.asarray(self._rows, dtype=np.int64), np.asarray(self._cols, dtype=np.int64)),
+                ),
+                shape=(len(self.group_ids), self.node_count),
+            )
+            mat.sum_duplicates()
+            mat.data[:] = 1
+            self._incidence = mat
+        return self._incidence
+
+    def groups_of(self, code: int) -> np.ndarray:
+        """Sorted group codes node ``code`` belongs to."""
+        inc = self.incidence
+        return inc.indices[inc.indptr[code]:inc.indptr[code + 1]]
+
+    def shared_groups(self, src: int, dst: int) -> List[str]:
+        """Group ids shared by two nodes, in first-seen order."""
+        common = np.intersect1d(self.groups_of(src), self.groups_of(dst), assume_unique=True)
+        return [self.group_ids[i] for i in common]
+
+    def sliced_node_counts(self, selector: sparse.spmatrix) -> sparse.csr_matrix:
+        """Group count per node within each slice of groups.
+
+        Args:
+            selector: (slices x groups) 0/1 matrix, row s marking the groups of slice s
+
+        Returns:
+            (slices x nodes) CSR matrix
+        """
+        return (sparse.csr_matrix(selector) @ self.incidence).tocsr()
+
+    def sliced_edge_weights(self, selector: sparse.spmatrix) -> sparse.csr_matrix:
+        """Shared-group count of every current edge within each slice of groups.
+
+        One product over the incidence matrix gives every slice at once, so
+        per-year or sliding-window weights need no recount per slice.
+
+        Args:
+            selector: (slices x groups) 0/1 matrix, row s marking the groups of slice s
+
+        Returns:
+            (slices x edges) CSR matrix aligned with the current edge arrays
+        """
+        inc = self.incidence
+        both = inc[:, self.src].multiply(inc[:, self.dst])
+        return (sparse.csr_matrix(selector) @ both).tocsr()
+
+    # ------------------------------------------------------------------
+    # Edges
+    # ------------------------------------------------------------------
+
+    def _type_code(self, edge_type: Optional[str]) -> int:
+        if edge_type is None:
+            return -1
+        try:
+            return self.edge_types.index(edge_type)
+        except ValueError:
+            self.edge_types.append(edge_type)
+            return len(self.edge_types) - 1
+
+    def add_edge(self, src: int, dst: int, weight: float, edge_type: Optional[str] = None) -> None:
+        """Append a single edge between two node codes."""
+        self._pending.append((src, dst, weight, self._type_code(edge_type)))
+
+    def add_edges(
+        self,
+        src: Sequence[int],
+        dst: Sequence[int],
+        weight: Sequence[float],
+        edge_type: Optional[str] = None,
+    ) -> None:
+        """Append a batch of edges given as parallel code/weight arrays."""
+        src = np.asarray(src, dtype=np.int64)
+        self._flush()
+        self._chunks.append((
+            src,
+            np.asarray(dst, dtype=np.int64),
+            np.asarray(weight),
+            np.full(len(src), self._type_code(edge_type), dtype=np.int64),
+        ))
+
+    def add_cooccurrence_edges(
+        self,
+        left: Optional[Sequence[int]] = None,
+        right: Optional[Sequence[int]] = None,
+        edge_type: Optional[str] = None,
+    ) -> None:
+        """Add one edge per node pair sharing at least one group.
+
+        The weight is the number of shared groups. With only ``left`` (or
+        nothing, meaning every node) pairs are taken within that set; with
+        ``right`` as well, pairs are taken across the two sets. Edges are
+        oriented so that ``src < dst``.
+        """
+        inc = self.incidence
+        left = np.arange(self.node_count) if left is None else np.unique(np.asarray(left, dtype=np.int64))
+        if right is None:
+            block = sparse.triu(inc[:, left].T @ inc[:, left], k=1).tocoo()
+            a, b = left[block.row], left[block.col]
+        else:
+            right = np.unique(np.asarray(right, dtype=np.int64))
+            block = (inc[:, left].T @ inc[:, right]).tocoo()
+            a, b = left[block.row], right[block.col]
+        weight = block.data.astype(np.int64)
+        mask = (a != b) & (weight > 0)
+        a, b, weight = a[mask], b[mask], weight[mask]
+        self.add_edges(np.minimum(a, b), np.maximum(a, b), weight, edge_type)
+
+    def _flush(self) -> None:
+        if self._pending:
+            src, dst, weight, types = zip(*self._pending)
+            self._pending = []
+            self._chunks.append((
+                np.asarray(src, dtype=np.int64),
+                np.asarray(dst, dtype=np.int64),
+                np.asarray(weight),
+                np.asarray(types, dtype=np.int64),
+            ))
+
+    def _edge_arrays(self) -> tuple:
+        self._flush()
+        if not self._chunks:
+            empty = np.array([], dtype=np.int64)
+            self._chunks = [(empty, empty, empty, empty)]
+        elif len(self._chunks) > 1:
+            self._chunks = [tuple(np.concatenate(parts) for parts in zip(*self._chunks))]
+        return self._chunks[0]
+
+    def _set_edges(self, src, dst, weight, types) -> None:
+        self._pending = []
+        self._chunks = [(src, dst, weight, types)]
+
+    @property
+    def src(self) -> np.ndarray:
+        return self._edge_arrays()[0]
+
+    @property
+    def dst(self) -> np.ndarray:
+        return self._edge_arrays()[1]
+
+    @property
+    def weight(self) -> np.ndarray:
+        return self._edge_arrays()[2]
+
+    @property
+    def edge_type_codes(self) -> np.ndarray:
+        return self._edge_arrays()[3]
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.src)
+
+    def merge_parallel_edges(self) -> None:
+        """Collapse repeated (src, dst) pairs.
+
+        Weights are summed and the type of the first-added edge is kept.
+        The result is ordered by (src, dst).
+        """
+        src, dst, weight, types = self._edge_arrays()
+        if not len(src):
+            return
+        key = src * self.node_count + dst
+        order = np.argsort(key, kind="stable")
+        key, weight, types = key[order], weight[order], types[order]
+        uniq, first = np.unique(key, return_index=True)
+        self._set_edges(
+            uniq // self.node_count,
+            uniq % self.node_count,
+            np.add.reduceat(weight, first),
+            types[first],
+        )
+
+    def filter_edges(self, keep: np.ndarray) -> None:
+        """Keep only the edges selected by a boolean mask."""
+        self._set_edges(*(arr[keep] for arr in self._edge_arrays()))
+
+    def prune(self, weight_min: float) -> None:
+        """Drop edges lighter than ``weight_min``."""
+        self.filter_edges(self.weight >= weight_min)
+
+    def backbone(self, alpha: float) -> None:
+        """Keep the disparity-filter backbone at significance ``alpha``.
+
+        Significance is computed against the current edges, so call it
+        before any weight threshold that should not affect node strengths.
+        """
+        self.filter_edges(disparity_filter(self.node_count, self.src, self.dst, self.weight, alpha))
+
+    def sort_edges_by_weight(self) -> None:
+        """Order edges by weight (descending), then by (src, dst) code."""
+        src, dst, weight, types = self._edge_arrays()
+        order = np.lexsort((dst, src, -weight))
+        self._set_edges(src[order], dst[order], weight[order], types[order])
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def degree(self) -> np.ndarray:
+        """Number of incident edges per node code."""
+        n = self.node_count
+        return np.bincount(self.src, minlength=n) + np.bincount(self.dst, minlength=n)
+
+    def strength(self) -> np.ndarray:
+        """Sum of incident edge weights per node code.
+
+        Integer weights give integer strengths.
+        """
+        n = self.node_count
+        weight = self.weight
+        total = np.bincount(self.src, weights=weight, minlength=n) + np.bincount(self.dst, weights=weight, minlength=n)
+        return total.astype(np.int64) if np.issubdtype(weight.dtype, np.integer) else total
+
+    def connected(self) -> np.ndarray:
+        """Codes of nodes with at least one edge, in code order."""
+        return np.flatnonzero(self.degree() > 0)
+
+    def weight_norm(self, mode: str = "max", decimals: Optional[int] = None) -> np.ndarray:
+        """Normalized edge weights.
+
+        Args:
+            mode: "max" divides by the largest weight; "range" rescales
+                min..max to 0..1 (all 1.0 when every weight is equal)
+            decimals: Optional rounding
+
+        Returns:
+            Float array aligned with the edge arrays
+        """
+        weight = self.weight.astype(np.float64)
+        if not len(weight):
+            return weight
+        if mode == "max":
+            top = weight.max()
+            norm = weight / top if top > 0 else np.zeros(len(weight))
+        elif mode == "range":
+            low, high = weight.min(), weight.max()
+            norm = (weight - low) / (high - low) if high > low else np.ones(len(weight))
+        else:
+            raise ValueError(f"Unknown weightNorm mode: {mode!r}")
+        return np.round(norm, decimals) if decimals is not None else norm
+
+    def priority_rank(
+        self,
+        score: np.ndarray,
+        start: int = 0,
+        nodes: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Rank nodes by descending ``score`` (ties by code) for labelPriority.
+
+        Args:
+            score: Per-node score array (length ``node_count``)
+            start: Priority given to the best node
+            nodes: Codes to rank (defaults to connected nodes)
+
+        Returns:
+            Per-node priority array; unranked nodes get -1
+        """
+        nodes = self.connected() if nodes is None else np.asarray(nodes, dtype=np.int64)
+        ranked = nodes[np.lexsort((nodes, -np.asarray(score)[nodes]))]
+        priority = np.full(self.node_count, -1, dtype=np.int64)
+        priority[ranked] = np.arange(start, start + len(ranked))
+        return priority
+
+    def metric_summary(self, decimals: int = 3) -> Dict[str, Dict[str, float]]:
+        """Min/max/mean degree and strength over connected nodes (meta block)."""
+        used = self.connected()
+        summary = {}
+        for key, values in (("degree", self.degree()), ("strength", self.strength())):
+            vals = values[used] if len(used) else np.zeros(1, dtype=values.dtype)
+            cast = int if np.issubdtype(vals.dtype, np.integer) else float
+            summary[key] = {
+                "min": cast(vals.min()),
+                "max": cast(vals.max()),
+                "mean": round(float(vals.mean()), decimals),
+            }
+        return summary
+
+    def compute_layout(self, drop_isolated: bool = True, **options: Any) -> None:
+        """Compute a ForceAtlas2 layout over the current edges.
+
+        Args:
+            drop_isolated: Lay out connected nodes only (matching `serialize`)
+            **options: Passed to `graph_layout.forceatlas2_layout`
+                (iterations, seed, scaling_ratio, ...)
+        """
+        codes = self.connected() if drop_isolated else np.arange(self.node_count)
+        index = np.full(self.node_count, -1, dtype=np.int64)
+        index[codes] = np.arange(len(codes))
+        pos = forceatlas2_layout(len(codes), index[self.src], index[self.dst], self.weight, **options)
+        self.positions = np.full((self.node_count, 2), np.nan)
+        self.positions[codes] = pos
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+
+    def serialize(
+        self,
+        *,
+        priority: Optional[np.ndarray] = None,
+        order_by_priority: bool = False,
+        drop_isolated: bool = True,
+        weight_norm: str = "max",
+        norm_decimals: Optional[int] = None,
+        weight_decimals: Optional[int] = None,
+        strength_decimals: Optional[int] = None,
+        article_ids: bool = False,
+        max_article_ids: Optional[int] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Build the Sigma.js ``{nodes, edges}`` lists.
+
+        Nodes carry their registered attributes plus ``degree``, ``strength``,
+        ``labelPriority`` when ``priority`` is given and ``x``/``y`` after
+        `compute_layout`. Edges carry
+        ``source``, ``target``, ``type`` (when set), ``weight``, ``articleIds``
+        (shared group ids, when requested) and ``weightNorm``, in the current
+        edge order.
+
+        Args:
+            priority: Per-node labelPriority array (see `priority_rank`)
+            order_by_priority: Emit nodes by ascending priority instead of code order
+            drop_isolated: Leave out nodes without edges
+            weight_norm: Normalization mode passed to `weight_norm`
+            norm_decimals: Rounding for weightNorm
+            weight_decimals: Rounding for float weights
+            strength_decimals: Rounding for float strengths
+            article_ids: Include shared group ids on each edge
+            max_article_ids: Cap on articleIds per edge
+
+        Returns:
+            Dict with "nodes" and "edges" lists
+        """
+        degree = self.degree()
+        strength = self.strength()
+        int_weights = np.issubdtype(self.weight.dtype, np.integer)
+
+        codes = self.connected() if drop_isolated else np.arange(self.node_count)
+        if order_by_priority and priority is not None:
+            # Unranked nodes (-1) go last
+            rank = priority[codes]
+            codes = codes[np.lexsort((codes, rank, rank < 0))]
+
+        nodes = []
+        for code in codes.tolist():
+            node = dict(self.nodes[code])
+            node["degree"] = int(degree[code])
+            value = strength[code]
+            if int_weights:
+                node["strength"] = int(value)
+            else:
+                node["strength"] = round(float(value), strength_decimals) if strength_decimals is not None else float(value)
+            if priority is not None:
+                node["labelPriority"] = int(priority[code])
+            nodes.append(node)
+
+        if self.positions is not None:
+            laid_out = [i for i, code in enumerate(codes.tolist()) if not np.isnan(self.positions[code, 0])]
+            assign_positions([nodes[i] for i in laid_out], self.positions[codes[laid_out]])
+
+        norms = self.weight_norm(weight_norm, norm_decimals).tolist()
+        edges = []
+        for s, t, w, k, wn in zip(
+            self.src.tolist(), self.dst.tolist(), self.weight.tolist(), self.edge_type_codes.tolist(), norms
+        ):
+            edge: Dict[str, Any] = {"source": self.node_ids[s], "target": self.node_ids[t]}
+            if k >= 0:
+                edge["type"] = self.edge_types[k]
+            if int_weights:
+                edge["weight"] = int(w)
+            else:
+                edge["weight"] = round(w, weight_decimals) if weight_decimals is not None else w
+            if article_ids:
+                shared = self.shared_groups(s, t)
+                edge["articleIds"] = shared[:max_article_ids] if max_article_ids is not None else shared
+            edge["weightNorm"] = wn
+            edges.append(edge)
+
+        return {"nodes": nodes, "edges": edges}
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Precomputed zoom-level clustering for the IWAC map markers.
+
+A supercluster-style hierarchy is built once at generation time instead of
+re-clustering every marker in the browser on each pan and zoom:
+
+1. Points are projected to web-mercator ([0, 1] on both axes).
+2. From ``max_zoom`` down to ``min_zoom``, the nodes of the finer level are
+   indexed in a KD-tree and greedily merged: taking nodes heaviest first,
+   every unclaimed node within ``radius`` pixels (of an ``extent``-pixel
+   tile) joins it. A merged cluster sits at the weighted centroid of its
+   members; a node with no neighbours is carried up unchanged. Each level
+   therefore partitions the level below it, so the clusters form a tree.
+3. Leaves are numbered in depth-first order of that tree. Every cluster at
+   every zoom then covers one contiguous run of leaves, and the clusters of
+   a level (sorted by first leaf) tile the leaf array end to end.
+
+Exported index (compact, columnar)::
+
+    {
+      "radius": 40, "extent": 512, "minZoom": 0, "maxZoom": 9,
+      "leaves": [point index, ...],                # depth-first order
+      "levels": [{"zoom": 0, "lng": [...], "lat": [...], "start": [...]}, ...]
+    }
+
+Cluster ``i`` of a level covers ``leaves[start[i]:start[i + 1]]`` (the last
+one runs to the end). Its children are the clusters of the next level whose
+``start`` falls in that range; beyond ``maxZoom`` every point stands alone.
+Because membership is a leaf range, a count under any filter (years, source
+countries) is ``prefix[start[i + 1]] - prefix[start[i]]`` over the filtered
+per-point counts laid out in leaf order, and clusters whose filtered count is
+zero are hidden. Positions are the unfiltered weighted centroids.
+
+The client reader is src/lib/utils/pointClusters.ts.
+
+Used by:
+- generate_world_map.py  (world-map.json "clusters", locations weighted by articleCount)
+- generate_sources.py    (sources.json "clusters", sources weighted by count)
+- edge_paths.py          (mercator plane for edge bundling)
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+DEFAULT_RADIUS = 40
+DEFAULT_EXTENT = 512
+DEFAULT_MIN_ZOOM = 0
+DEFAULT_MAX_ZOOM = 12
+COORD_DECIMALS = 4
+# Web-mercator is cut off at the latitude where the world is square
+MAX_LATITUDE = 85.0511287798
+
+
+# ============================================================================
+# Projection
+# ============================================================================
+
+
+def mercator(lngs: np.ndarray, lats: np.ndarray) -> np.ndarray:
+    """Longitude/latitude -> web-mercator x, y in [0, 1] (y down)."""
+    lat = np.radians(np.clip(lats, -MAX_LATITUDE, MAX_LATITUDE))
+    x = lngs / 360.0 + 0.5
+    y = 0.5 - np.log(np.tan(lat) + 1.0 / np.cos(lat)) / (2 * math.pi)
+    return np.column_stack([x, y])
+
+
+def inverse_mercator(xy: np.ndarray) -> np.ndarray:
+    """Web-mercator x, y in [0, 1] -> longitude/latitude columns."""
+    lng = (xy[:, 0] - 0.5) * 360.0
+    lat = np.degrees(np.arctan(np.sinh(math.pi * (1 - 2 * xy[:, 1]))))
+    return np.column_stack([lng, lat])
+
+
+# ============================================================================
+# Clustering
+# ============================================================================
+
+
+def _merge_level(xy: np.ndarray, weights: np.ndarray, radius: float) -> List[List[int]]:
+    """Greedy radius clustering of one level; returns member indices per new node."""
+    tree = cKDTree(xy)
+    claimed = np.zeros(len(xy), dtype=bool)
+    groups = []
+    # Heaviest first so large places become cluster centres (stable on ties)
+    for i in np.argsort(-weights, kind="stable").tolist():
+        if claimed[i]:
+            continue
+        members = [i] + [j for j in tree.query_ball_point(xy[i], radius) if j != i and not claimed[j]]
+        claimed[members] = True
+        groups.append(members)
+    return groups
+
+
+def build_clusters(
+    lngs: Sequence[float],
+    lats: Sequence[float],
+    weights: Optional[Sequence[float]] = None,
+    radius: int = DEFAULT_RADIUS,
+    extent: int = DEFAULT_EXTENT,
+    min_zoom: int = DEFAULT_MIN_ZOOM,
+    max_zoom: int = DEFAULT_MAX_ZOOM,
+) -> Dict[str, Any]:
+    """Build the per-zoom cluster index for a set of points (see module docstring).
+
+    Args:
+        lngs, lats: Point coordinates in degrees
+        weights: Per-point weight (article count) for centroids and ordering
+        radius: Cluster radius in pixels
+        extent: Tile size in pixels the radius refers to
+        min_zoom, max_zoom: Zoom levels to cluster for
+    """
+    n = len(lngs)
+    w = np.ones(n) if weights is None else np.asarray(weights, dtype=np.float64)
+    xy = mercator(np.asarray(lngs, dtype=np.float64), np.asarray(lats, dtype=np.float64))
+
+    # built: (zoom, node xy, member groups) from max_zoom down; groups index the finer level
+    node_xy, node_w = xy, w
+    built = []
+    for zoom in range(max_zoom, min_zoom - 1, -1):
+        if not len(node_xy):
+            break
+        groups = _merge_level(node_xy, node_w, radius / (extent * 2 ** zoom))
+        group_w = np.array([node_w[g].sum() for g in groups])
+        safe_w = np.where(group_w > 0, group_w, 1.0)
+        group_xy = np.array([
+            (node_xy[g] * node_w[g, None]).sum(axis=0) / safe_w[k] if group_w[k] > 0 else node_xy[g].mean(axis=0)
+            for k, g in enumerate(groups)
+        ])
+        built.append((zoom, group_xy, groups))
+        node_xy, node_w = group_xy, group_w
+
+    # Depth-first leaf order from the coarsest level down
+    built.reverse()
+    leaves: List[int] = []
+    starts: List[np.ndarray] = [np.zeros(len(b[2]), dtype=np.int64) for b in built]
+
+    def visit(level: int, node: int) -> None:
+        starts[level][node] = len(leaves)
+        children = built[level][2][node]
+        if level + 1 == len(built):
+            leaves.extend(sorted(children, key=lambda c: -w[c]))
+            return
+        for child in sorted(children, key=lambda c: -w_levels[level + 1][c]):
+            visit(level + 1, child)
+
+    # Node weights per level (computed bottom-up from the leaves)
+    w_levels: List[np.ndarray] = [w] * len(built)
+    finer = w
+    for k in range(len(built) - 1, -1, -1):
+        w_levels[k] = np.array([finer[g].sum() for g in built[k][2]])
+        finer = w_levels[k]
+
+    for node in (np.argsort(-w_levels[0], kind="stable").tolist() if built else []):
+        visit(0, node)
+
+    # Highest zoom that still merges anything; deeper levels are the raw points
+    top = min_zoom - 1
+    for zoom, group_xy, groups in built:
+        if len(groups) < n:
+            top = zoom
+
+    levels = []
+    for k, (zoom, group_xy, _) in enumerate(built):
+        if zoom > top:
+            break
+        by_start = np.argsort(starts[k], kind="stable")
+        lnglat = inverse_mercator(group_xy[by_start])
+        levels.append({
+            "zoom": zoom,
+            "lng": np.round(lnglat[:, 0], COORD_DECIMALS).tolist(),
+            "lat": np.round(lnglat[:, 1], COORD_DECIMALS).tolist(),
+            "start": starts[k][by_start].tolist(),
+        })
+
+    return {
+        "radius": radius,
+        "extent": extent,
+        "minZoom": min_zoom,
+        "maxZoom": top,
+        "leaves": leaves,
+        "levels": levels,
+    }
+
+
+def cluster_counts(level: Dict[str, Any], leaves: Sequence[int], point_counts: Sequence[float]) -> np.ndarray:
+    """Count per cluster of one level for per-point counts (e.g. filtered article counts)."""
+    prefix = np.concatenate([[0], np.cumsum(np.asarray(point_counts, dtype=np.float64)[list(leaves)])])
+    bounds = np.append(level["start"], len(leaves))
+    return prefix[bounds[1:]] - prefix[bounds[:-1]]
+
+
+def cluster_records(records: Sequence[Dict[str, Any]], weight_key: str, radius: int = DEFAULT_RADIUS) -> Dict[str, Any]:
+    """Cluster index over records with ``lat``/``lng``; leaves index ``records`` itself.
+
+    Records without coordinates are left out of the hierarchy.
+    """
+    located = [i for i, r in enumerate(records) if r.get("lat") is not None and r.get("lng") is not None]
+    index = build_clusters(
+        [records[i]["lng"] for i in located],
+        [records[i]["lat"] for i in located],
+        [records[i].get(weight_key, 0) for i in located],
+        radius=radius,
+    )
+    index["leaves"] = [located[i] for i in index["leaves"]]
+    return index
@@ -1,12 +1,60 @@
 #!/usr/bin/env python3
 """
-Simplify world_countries.geojson by reducing coordinate precision
-and removing unnecessary properties.
+Simplify the map layers in static/data/maps for the dashboard.
+
+OUTPUT:
+  - static/data/maps/world_countries_simple.geojson   (legacy: coordinates rounded
+                                                      to 0.1°, name only; needs
+                                                      world_countries.geojson)
+  - static/data/maps/topo/{layer}-z{zoom}.topo.json   (TopoJSON per zoom level)
+  - static/data/maps/topo/index.json                  (layers, levels and sizes)
+
+TOPOJSON PIPELINE (world_countries by default, the layer the world map reads;
+admin region layers only when named with --layers):
+  1. Quantization: coordinates are snapped to an integer grid over the layer
+     bbox (--quantization points per axis), so borders digitised twice land
+     on the same points.
+  2. Shared arcs: a point is a junction when two rings pass through it with
+     different neighbours. Rings are cut at junctions into arcs and identical
+     arcs (either direction) are stored once, so a border between two regions
+     is a single arc referenced by both.
+  3. Simplification: Visvalingam effective areas are computed once per arc
+     (arc ends are fixed). Each zoom level keeps the points whose area is
+     above about one square pixel at that zoom, so shared borders are
+     simplified identically (no slivers or gaps) and levels are nested.
+     Rings smaller than the threshold are dropped, except the largest polygon
+     of each feature; kept rings never collapse below a triangle.
+  4. Encoding: arcs are delta-encoded integer coordinates with the standard
+     TopoJSON transform (decoded by src/lib/utils/topojson.ts).
+
+The client picks the coarsest level whose zoom is at least the map zoom.
+
+CLI OPTIONS (run `python simplify_geojson.py -h`):
+  --layers, --zooms, --quantization
 """
 
+import argparse
+import heapq
 import json
+import math
+from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
+MAPS_DIR = Path(__file__).parent.parent / 'static' / 'data' / 'maps'
+TOPO_DIR = MAPS_DIR / 'topo'
+
+DEFAULT_ZOOMS = (3, 6, 9)
+DEFAULT_QUANTIZATION = 100_000
+# Web-mercator tiles are 256 px wide and span 360° at zoom 0
+TILE_SIZE = 256
+# Layers written when --layers is not given (read by world-map/Map.svelte)
+DEFAULT_LAYERS = ('world_countries',)
+# Layer -> properties kept (None keeps all)
+LAYER_PROPERTIES = {'world_countries': ['name']}
+
+
 def simplify_coords(coords, precision=2):
     """Recursively round coordinates to given precision."""
     if isinstance(coords[0], (int, float)):
@@ -50,9 +98,313 @@ def simplify_geometry(geometry, precision=2):
         'coordinates': simplified
     }
 
-def main():
-    input_path = Path(__file__).parent.parent / 'static' / 'data' / 'maps' / 'world_countries.geojson'
-    output_path = Path(__file__).parent.parent / 'static' / 'data' / 'maps' / 'world_countries_simple.geojson'
+def feature_name(props):
+    """Display name of a world feature."""
+    return props.get('name') or props.get('NAME') or props.get('ADMIN', 'Unknown')
+
+# ---------------------------------------------------------------------------
+# Topology
+# ---------------------------------------------------------------------------
+
+def geometry_polygons(geometry):
+    """Polygons (lists of rings) of a Polygon/MultiPolygon geometry."""
+    if not geometry:
+        return []
+    if geometry.get('type') == 'Polygon':
+        return [geometry['coordinates']]
+    if geometry.get('type') == 'MultiPolygon':
+        return geometry['coordinates']
+    return []
+
+def layer_bbox(features):
+    """[min x, min y, max x, max y] over every ring of the layer."""
+    points = np.array(
+        [p[:2] for f in features for poly in geometry_polygons(f.get('geometry')) for ring in poly for p in ring],
+        dtype=np.float64,
+    ).reshape(-1, 2)
+    if not len(points):
+        return [0.0, 0.0, 0.0, 0.0]
+    return [*points.min(axis=0).tolist(), *points.max(axis=0).tolist()]
+
+def quantize_ring(ring, bbox, scale):
+    """Snap a ring to the integer grid; open (no closing point), no repeats."""
+    q = np.rint((np.asarray(ring, dtype=np.float64)[:, :2] - bbox[:2]) / scale).astype(np.int64)
+    points = [tuple(p) for p in q.tolist()]
+    result = [points[0]]
+    for p in points[1:]:
+        if p != result[-1]:
+            result.append(p)
+    while len(result) > 1 and result[-1] == result[0]:
+        result.pop()
+    return result if len(result) >= 3 else None
+
+def ring_area(points):
+    """Absolute shoelace area of an open ring."""
+    xy = np.asarray(points, dtype=np.float64)
+    x, y = xy[:, 0], xy[:, 1]
+    return abs(float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))) / 2
+
+def find_junctions(rings):
+    """Points where rings meet or diverge (visited with different neighbours)."""
+    neighbours = {}
+    junctions = set()
+    for ring in rings:
+        n = len(ring)
+        for i, p in enumerate(ring):
+            pair = (ring[i - 1], ring[(i + 1) % n])
+            seen = neighbours.get(p)
+            if seen is None:
+                neighbours[p] = pair
+            elif seen != pair and seen != pair[::-1]:
+                junctions.add(p)
+    return junctions
+
+class ArcIndex:
+    """Deduplicated arcs; a ring references them by index (~index when reversed)."""
+
+    def __init__(self):
+        self.arcs = []
+        self.keys = {}
+
+    def add(self, points):
+        key = tuple(points)
+        if key in self.keys:
+            return self.keys[key]
+        reverse = key[::-1]
+        if reverse in self.keys:
+            return ~self.keys[reverse]
+        self.keys[key] = len(self.arcs)
+        self.arcs.append(np.asarray(points, dtype=np.int64))
+        return len(self.arcs) - 1
+
+    def add_ring(self, ring, junctions):
+        """Cut an open ring at its junctions and return its arc references."""
+        cuts = [i for i, p in enumerate(ring) if p in junctions]
+        if not cuts:
+            # Closed arc: start at the smallest point so both traversals match
+            start = min(range(len(ring)), key=ring.__getitem__)
+            rotated = ring[start:] + ring[:start]
+            if rotated[1] > rotated[-1]:
+                rotated = [rotated[0]] + rotated[:0:-1]
+                return [~self.add(rotated + [rotated[0]])]
+            return [self.add(rotated + [rotated[0]])]
+        rotated = ring[cuts[0]:] + ring[:cuts[0]] + [ring[cuts[0]]]
+        cuts = [c - cuts[0] for c in cuts] + [len(ring)]
+        return [self.add(rotated[a:b + 1]) for a, b in zip(cuts, cuts[1:])]
+
+def build_topology(features, quantization, properties=None):
+    """Quantize a layer and split it into shared arcs.
+
+    Returns:
+        (arcs, shapes, bbox, scale) where shapes holds, per feature, its
+        properties and polygons as lists of (arc refs, full-resolution area)
+    """
+    bbox = layer_bbox(features)
+    scale = np.array([
+        (bbox[2] - bbox[0]) / (quantization - 1) or 1.0,
+        (bbox[3] - bbox[1]) / (quantization - 1) or 1.0,
+    ])
+    origin = np.array(bbox[:2])
+
+    quantized = []
+    for f in features:
+        polygons = []
+        for poly in geometry_polygons(f.get('geometry')):
+            rings = [quantize_ring(ring, origin, scale) for ring in poly if len(ring) >= 3]
+            if rings and rings[0] is not None:
+                polygons.append([r for r in rings if r is not None])
+        quantized.append(polygons)
+
+    junctions = find_junctions(r for polygons in quantized for poly in polygons for r in poly)
+    index = ArcIndex()
+    shapes = []
+    for f, polygons in zip(features, quantized):
+        props = f.get('properties') or {}
+        if properties is not None:
+            props = {k: feature_name(props) if k == 'name' else props.get(k) for k in properties}
+        shapes.append({
+            'properties': props,
+            'polygons': [[(index.add_ring(r, junctions), ring_area(r)) for r in poly] for poly in polygons],
+        })
+    return index.arcs, shapes, bbox, scale
+
+# ---------------------------------------------------------------------------
+# Simplification
+# ---------------------------------------------------------------------------
+
+def _triangle_area(a, b, c):
+    return abs((b[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (b[1] - a[1])) / 2
+
+def visvalingam_areas(points):
+    """Effective area of every point of an arc (ends are infinite).
+
+    Areas are made monotonic (a point never scores below one removed before
+    it), so keeping points above a threshold gives nested simplifications.
+    """
+    n = len(points)
+    areas = np.full(n, np.inf)
+    if n < 3:
+        return areas
+    pts = points.tolist()
+    prev = list(range(-1, n - 1))
+    nxt = list(range(1, n + 1))
+    current = [0.0] * n
+    heap = []
+    for i in range(1, n - 1):
+        current[i] = _triangle_area(pts[i - 1], pts[i], pts[i + 1])
+        heap.append((current[i], i))
+    heapq.heapify(heap)
+    removed = [False] * n
+    floor = 0.0
+    while heap:
+        area, i = heapq.heappop(heap)
+        if removed[i] or area != current[i]:
+            continue
+        floor = max(floor, area)
+        areas[i] = floor
+        removed[i] = True
+        p, q = prev[i], nxt[i]
+        nxt[p], prev[q] = q, p
+        for j in (p, q):
+            if 0 < j < n - 1:
+                current[j] = _triangle_area(pts[prev[j]], pts[j], pts[nxt[j]])
+                heapq.heappush(heap, (current[j], j))
+    return areas
+
+def zoom_threshold(zoom, scale):
+    """About one square pixel at ``zoom``, in quantized grid units."""
+    pixel = 360.0 / (TILE_SIZE * 2 ** zoom)
+    return pixel * pixel / float(scale[0] * scale[1])
+
+def ring_size(refs, keep):
+    """Coordinates of a ring (closing point included) under the keep masks."""
+    return sum(int(keep[r if r >= 0 else ~r].sum()) - 1 for r in refs) + 1
+
+def simplify_level(arcs, areas, shapes, threshold):
+    """Keep masks per arc and the rings kept at one threshold.
+
+    Returns:
+        (keep, kept) where kept mirrors shapes' polygons as lists of arc refs
+    """
+    keep = [a >= threshold for a in areas]
+    kept = []
+    for shape in shapes:
+        polygons = shape['polygons']
+        largest = max(range(len(polygons)), key=lambda i: polygons[i][0][1], default=None)
+        feature = []
+        for i, poly in enumerate(polygons):
+            (exterior, area), holes = poly[0], poly[1:]
+            if area < threshold and i != largest:
+                continue
+            feature.append([exterior] + [refs for refs, hole_area in holes if hole_area >= threshold])
+        kept.append(feature)
+
+    # A kept ring must stay at least a triangle: restore its best removed points
+    for feature in kept:
+        for poly in feature:
+            for refs in poly:
+                while ring_size(refs, keep) < 4:
+                    best = None
+                    for r in refs:
+                        a = r if r >= 0 else ~r
+                        candidates = np.flatnonzero(~keep[a])
+                        if len(candidates):
+                            c = candidates[np.argmax(areas[a][candidates])]
+                            if best is None or areas[a][c] > areas[best[0]][best[1]]:
+                                best = (a, c)
+                    if best is None:
+                        break
+                    keep[best[0]][best[1]] = True
+    return keep, kept
+
+def encode_topology(name, arcs, keep, shapes, kept, bbox, scale):
+    """TopoJSON with delta-encoded arcs; only arcs still referenced are written."""
+    used = sorted({r if r >= 0 else ~r for feature in kept for poly in feature for refs in poly for r in refs})
+    remap = {a: i for i, a in enumerate(used)}
+
+    def ref(r):
+        return remap[r] if r >= 0 else ~remap[~r]
+
+    encoded_arcs = []
+    for a in used:
+        points = arcs[a][keep[a]]
+        deltas = np.vstack([points[:1], np.diff(points, axis=0)])
+        encoded_arcs.append(deltas.tolist())
+
+    geometries = []
+    for shape, feature in zip(shapes, kept):
+        polygons = [[[ref(r) for r in refs] for refs in poly] for poly in feature]
+        if not polygons:
+            geometries.append({'type': None, 'properties': shape['properties']})
+        elif len(polygons) == 1:
+            geometries.append({'type': 'Polygon', 'arcs': polygons[0], 'properties': shape['properties']})
+        else:
+            geometries.append({'type': 'MultiPolygon', 'arcs': polygons, 'properties': shape['properties']})
+
+    return {
+        'type': 'Topology',
+        'bbox': bbox,
+        'transform': {'scale': scale.tolist(), 'translate': bbox[:2]},
+        'objects': {name: {'type': 'GeometryCollection', 'geometries': geometries}},
+        'arcs': encoded_arcs,
+    }
+
+def build_layer(name, source, zooms, quantization, out_dir):
+    """Write one TopoJSON per zoom level for a layer; returns its index entry."""
+    with open(source, 'r', encoding='utf-8') as f:
+        features = json.load(f)['features']
+
+    arcs, shapes, bbox, scale = build_topology(features, quantization, LAYER_PROPERTIES.get(name))
+    areas = [visvalingam_areas(arc) for arc in arcs]
+
+    levels = []
+    for zoom in sorted(zooms):
+        keep, kept = simplify_level(arcs, areas, shapes, zoom_threshold(zoom, scale))
+        topology = encode_topology(name, arcs, keep, shapes, kept, bbox, scale)
+        path = out_dir / f"{name}-z{zoom}.topo.json"
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(topology, f, ensure_ascii=False, separators=(',', ':'))
+        levels.append({
+            'zoom': zoom,
+            'file': path.name,
+            'points': sum(len(a) for a in topology['arcs']),
+            'bytes': path.stat().st_size,
+        })
+
+    print(
+        f"{name}: {len(features)} features, {sum(len(a) for a in arcs)} points in {len(arcs)} arcs -> "
+        + ", ".join(f"z{l['zoom']} {l['points']} pts {l['bytes'] / 1024:.0f} KB" for l in levels)
+    )
+    return {
+        'source': source.name,
+        'features': len(features),
+        'sourceBytes': source.stat().st_size,
+        'levels': levels,
+    }
+
+def layer_sources(maps_dir):
+    """Layer name -> source GeoJSON (full world file when present)."""
+    sources = {}
+    world = maps_dir / 'world_countries.geojson'
+    simple = maps_dir / 'world_countries_simple.geojson'
+    if world.exists() or simple.exists():
+        sources['world_countries'] = world if world.exists() else simple
+    for path in sorted(maps_dir.glob('*.geojson')):
+        if not path.stem.startswith('world_countries'):
+            sources[path.stem] = path
+    return sources
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def write_legacy_world(maps_dir):
+    """world_countries.geojson -> world_countries_simple.geojson (0.1°, name only)."""
+    input_path = maps_dir / 'world_countries.geojson'
+    output_path = maps_dir / 'world_countries_simple.geojson'
+    if not input_path.exists():
+        print(f"Skipping {output_path.name}: {input_path} not found")
+        return
 
     print(f"Reading {input_path}...")
     with open(input_path, 'r', encoding='utf-8') as f:
@@ -64,14 +416,9 @@ def main():
     simplified_features = []
     for feature in data['features']:
         props = feature.get('properties', {})
-        # Keep only essential properties
-        simple_props = {
-            'name': props.get('name') or props.get('NAME') or props.get('ADMIN', 'Unknown')
-        }
-
         simplified_features.append({
             'type': 'Feature',
-            'properties': simple_props,
+            'properties': {'name': feature_name(props)},
             'geometry': simplify_geometry(feature.get('geometry'), precision=1)
         })
 
@@ -91,5 +438,42 @@ def main():
     print(f"Simplified: {new_size:.2f} MB")
     print(f"Reduction: {(1 - new_size/orig_size) * 100:.1f}%")
 
+def parse_args():
+    p = argparse.ArgumentParser(description="Simplify IWAC map layers (legacy GeoJSON + multi-resolution TopoJSON)")
+    p.add_argument("--layers", type=str, default="", help="Comma-separated layer names, e.g. benin_regions (default: world_countries)")
+    p.add_argument("--zooms", type=str, default=",".join(map(str, DEFAULT_ZOOMS)), help="Comma-separated zoom levels to simplify for")
+    p.add_argument("--quantization", type=int, default=DEFAULT_QUANTIZATION, help="Grid points per axis for TopoJSON coordinates")
+    return p.parse_args()
+
+def main():
+    args = parse_args()
+    zooms = [int(z) for z in args.zooms.split(",") if z.strip()]
+    if not zooms or args.quantization < 2:
+        raise SystemExit("--zooms needs at least one level and --quantization must be >= 2")
+
+    write_legacy_world(MAPS_DIR)
+
+    wanted = {name.strip() for name in args.layers.split(",")} if args.layers else set(DEFAULT_LAYERS)
+    sources = {name: path for name, path in layer_sources(MAPS_DIR).items() if name in wanted}
+
+    TOPO_DIR.mkdir(parents=True, exist_ok=True)
+    layers = {name: build_layer(name, path, zooms, args.quantization, TOPO_DIR) for name, path in sources.items()}
+
+    index_path = TOPO_DIR / 'index.json'
+    if args.layers and index_path.exists():
+        with open(index_path, 'r', encoding='utf-8') as f:
+            layers = {**json.load(f).get('layers', {}), **layers}
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'generatedAt': datetime.utcnow().isoformat() + 'Z',
+            'quantization': args.quantization,
+            'layers': layers,
+        }, f, ensure_ascii=False, indent=2)
+
+    source_total = sum(layer['sourceBytes'] for layer in layers.values())
+    for zoom in zooms:
+        total = sum(l['bytes'] for layer in layers.values() for l in layer['levels'] if l['zoom'] == zoom)
+        print(f"z{zoom}: {total / 1024 / 1024:.2f} MB ({source_total / max(total, 1):.1f}x smaller than the sources)")
+
 if __name__ == '__main__':
     main()
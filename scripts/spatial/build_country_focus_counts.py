@@ -13,6 +13,10 @@ What this script does:
 - For the four focus countries, aggregate article counts per Region and per Prefecture from location entities.
 - Use the articleCount field from each location entity for accurate totals.
 - Write compact JSONs to static/data/country_focus/ matching frontend loader naming.
+- When the exported articles (articles.json / articles.jsonl) are present,
+  join each location's relatedArticleIds to the article publication year and
+  source country, and write per-country count cubes (admin x year x source
+  country) so time- and source-filtered choropleths are a slice on the client.
 
 Outputs (to omeka-map-explorer/static/data/country_focus/):
 - benin_regions_counts.json
@@ -23,18 +27,44 @@ Outputs (to omeka-map-explorer/static/data/country_focus/):
 - cote_divoire_prefectures_counts.json
 - togo_regions_counts.json
 - togo_prefectures_counts.json
+- {country}_counts_cube.json  (one per focus country, see below)
+
+Count cubes (iwac-columnar-v1, see iwac_utils.build_columnar_series)::
+
+    {
+      "format": "iwac-columnar-v1", "country": "Benin",
+      "years": [0, 1990, ...],            # 0 = undated
+      "sources": ["Benin", "Togo", ...],  # article source countries ("" = unknown)
+      "regions": {"names": [...], "encoding": "rle", "matrix": [[...], ...]},
+      "prefectures": {...},
+      "updatedAt": "..."
+    }
+
+Row i of a level is the dense (year x source) block of admin names[i],
+flattened year-major: the count of distinct articles published in years[y]
+from sources[s] is row[y * len(sources) + s]. An article mentioning several
+locations of one region counts once for it. No dashboard view reads the
+cubes yet; each level decodes with decodeSeriesRows in
+src/lib/utils/columnarSeries.ts.
 """
 from __future__ import annotations
 import json
+import sys
 from pathlib import Path
 from collections import defaultdict
 from datetime import datetime
 import unicodedata
 
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from iwac_utils import build_columnar_series, extract_year, save_columnar_json
+from preprocess_all import iter_articles
+
 ROOT = Path(__file__).resolve().parents[2]
 DATA_DIR = ROOT / 'static' / 'data'
 OUT_DIR = DATA_DIR / 'country_focus'
-OUT_DIR.mkdir(parents=True, exist_ok=True)
 
 COUNTRIES = ['Benin', 'Burkina Faso', "Côte d'Ivoire", 'Togo']
 
@@ -51,10 +81,13 @@ def load_json(path: Path):
     with path.open('r', encoding='utf-8') as f:
         return json.load(f)
 
-def main():
-    # Load location entities which have the accurate article counts
-    locations_data = load_json(DATA_DIR / 'entities' / 'locations.json')
+def aggregate_counts(locations_data):
+    """Per-country region and prefecture totals from location entities.
 
+    Returns:
+        (reg_articles, pre_articles, reg_mentions, pre_mentions), each
+        country -> {admin name: count}
+    """
     # Prepare counters:
     # - articles: count from relatedArticleIds
     # - mentions: use articleCount from entities (more accurate)
@@ -79,6 +112,98 @@ def main():
             pre_articles[country][prefecture] += article_count
             pre_mentions[country][prefecture] += article_count
 
+    return reg_articles, pre_articles, reg_mentions, pre_mentions
+
+
+def article_facets(articles):
+    """Article id -> (publication year or 0, source country or '')."""
+    facets = {}
+    for article in articles:
+        aid = str(article.get('o:id', ''))
+        if not aid:
+            continue
+        year = extract_year(article.get('pub_date', '')) or 0
+        source = str(article.get('country', '') or '').strip()
+        facets[aid] = (year, source)
+    return facets
+
+
+def _level_cube(admin_codes, article_years, article_sources, n_admins, n_years, n_sources):
+    """Distinct-article count cube (admin x year x source) from (admin, article) pairs."""
+    cube = np.zeros((n_admins, n_years, n_sources), dtype=np.int64)
+    np.add.at(cube, (admin_codes, article_years, article_sources), 1)
+    return cube
+
+
+def aggregate_cubes(locations_data, facets):
+    """Per-country (admin x year x source country) article count cubes.
+
+    Args:
+        locations_data: Location entities (entities/locations.json)
+        facets: Article id -> (year, source country), see `article_facets`;
+            articles missing from it count as undated with an unknown source
+
+    Returns:
+        country -> {"years", "sources", "regions": (names, cube), "prefectures": (names, cube)}
+    """
+    pairs = {c: {'regions': set(), 'prefectures': set()} for c in COUNTRIES}
+    for location in locations_data:
+        country = location.get('country', '')
+        if country not in COUNTRIES:
+            continue
+        for level, key in (('regions', 'region'), ('prefectures', 'prefecture')):
+            name = location.get(key, '')
+            if name:
+                pairs[country][level].update((name, str(aid)) for aid in location.get('relatedArticleIds', []))
+
+    cubes = {}
+    for country in COUNTRIES:
+        level_pairs = {level: sorted(items) for level, items in pairs[country].items()}
+        meta = [facets.get(aid, (0, '')) for items in level_pairs.values() for _, aid in items]
+        years = sorted({year for year, _ in meta} | {0})
+        sources = sorted({source for _, source in meta})
+        year_code = {year: i for i, year in enumerate(years)}
+        source_code = {source: i for i, source in enumerate(sources)}
+
+        result = {'years': years, 'sources': sources}
+        for level, items in level_pairs.items():
+            names = sorted({name for name, _ in items})
+            name_code = {name: i for i, name in enumerate(names)}
+            item_meta = [facets.get(aid, (0, '')) for _, aid in items]
+            cube = _level_cube(
+                np.array([name_code[name] for name, _ in items], dtype=np.int64),
+                np.array([year_code[year] for year, _ in item_meta], dtype=np.int64),
+                np.array([source_code[source] for _, source in item_meta], dtype=np.int64),
+                len(names), len(years), max(len(sources), 1),
+            )
+            result[level] = (names, cube)
+        cubes[country] = result
+    return cubes
+
+
+def write_cubes(cubes, now, out_dir: Path = OUT_DIR):
+    """Write one {country}_counts_cube.json per focus country to `out_dir`."""
+    for country, result in cubes.items():
+        out = {
+            'country': country,
+            'years': result['years'],
+            'sources': result['sources'],
+        }
+        for level in ('regions', 'prefectures'):
+            names, cube = result[level]
+            out[level] = build_columnar_series(
+                {name: cube[i].ravel().tolist() for i, name in enumerate(names)}
+            )
+        out['updatedAt'] = now
+        save_columnar_json(out, out_dir / f"{norm_country_for_file(country)}_counts_cube.json", log=False)
+
+
+def main():
+    # Load location entities which have the accurate article counts
+    locations_data = load_json(DATA_DIR / 'entities' / 'locations.json')
+    reg_articles, pre_articles, reg_mentions, pre_mentions = aggregate_counts(locations_data)
+
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
     now = datetime.utcnow().isoformat()
     for country in COUNTRIES:
         norm = norm_country_for_file(country)
@@ -103,6 +228,15 @@ def main():
 
     print(f"Wrote precomputed counts to {OUT_DIR}")
 
+    # Year/source count cubes need the exported articles (preprocess_all.py fetch step)
+    try:
+        facets = article_facets(iter_articles(DATA_DIR))
+    except FileNotFoundError as e:
+        print(f"Skipping count cubes: {e}")
+        return
+    write_cubes(aggregate_cubes(locations_data, facets), now)
+    print(f"Wrote year/source count cubes for {len(facets)} articles to {OUT_DIR}")
+
 
 if __name__ == '__main__':
     main()
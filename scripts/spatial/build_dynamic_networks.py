@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""build_dynamic_networks.py
+Generate a time-sliced (dynamic) co-occurrence network for IWAC.
+
+INPUT  (static JSON):
+    static/data/entities/*.json          (same entity files as build_networks.py)
+    static/data/articles.json / .jsonl   (preprocess_all.py 'fetch' step; o:id -> pub_date)
+
+OUTPUT (JSON): static/data/networks/dynamic.json
+    nodes:     [{ id, type, label, count }]                 (shared by every slice)
+    edges:     { source: int[], target: int[], type: int[], weight: int[] }
+               (node indices; weight is the all-time shared-article count)
+    edgeTypes: string[]
+    slices: [
+        { label, start, end, articles,
+          edges: int[], weights: int[],    (edge indices active in the slice + weights)
+          nodes: int[], counts: int[] }    (node indices mentioned in the slice + article counts)
+    ]
+    meta: { generatedAt, window, step, weightMinConfigured, typePairs,
+            totalNodes, totalEdges, totalSlices, datedArticles, undatedArticles }
+
+ENGINE:
+    The article x entity incidence matrix is built once (build_networks.build_cooccurrence_builder).
+    The edge set is the all-time network pruned at --weight-min. A (slices x
+    articles) selector marks the articles of each year or sliding window, so a
+    single sparse product gives every slice's edge weights and node counts;
+    nothing is recounted per slice. Slice weights count shared articles of
+    that slice only, so a scrubber can filter or size edges per slice
+    without refetching.
+
+CLI OPTIONS (run `python build_dynamic_networks.py -h`):
+    --window, --step, --weight-min, --pairs, --no-cross-only
+"""
+from __future__ import annotations
+import argparse
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+from scipy import sparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from build_networks import DEFAULT_TYPE_PAIRS, DEFAULT_WEIGHT_MIN, ENT_DIR, build_cooccurrence_builder
+from iwac_utils import extract_year
+from preprocess_all import iter_articles
+
+# ------------------ Configuration ------------------
+DEFAULT_WINDOW = 1  # years per slice (1 = one slice per year)
+DEFAULT_STEP = 1  # years between slice starts
+
+# ------------------ Paths ------------------
+ROOT = Path(__file__).resolve().parents[2]
+DATA_DIR = ROOT / 'static' / 'data'
+OUT_DIR = DATA_DIR / 'networks'
+
+
+def load_article_years(data_dir: Path = DATA_DIR) -> dict[str, int]:
+    """Map article o:id -> publication year from the exported articles file."""
+    years: dict[str, int] = {}
+    for article in iter_articles(data_dir):
+        year = extract_year(article.get('pub_date'))
+        if year is not None:
+            years[str(article.get('o:id', ''))] = year
+    return years
+
+
+def slice_selector(group_years: np.ndarray, window: int, step: int) -> tuple[sparse.csr_matrix, list[tuple[int, int]]]:
+    """Build the (slices x groups) selector for year windows.
+
+    Args:
+        group_years: Year per group, -1 when undated
+        window: Years per slice
+        step: Years between consecutive slice starts
+
+    Returns:
+        (selector, [(start, end), ...]) with inclusive year bounds
+    """
+    dated = group_years >= 0
+    if not dated.any():
+        return sparse.csr_matrix((0, len(group_years))), []
+    first, last = int(group_years[dated].min()), int(group_years[dated].max())
+    starts = list(range(first, max(first, last - window + 1) + 1, step))
+    rows, cols = [], []
+    for s, start in enumerate(starts):
+        members = np.flatnonzero((group_years >= start) & (group_years < start + window))
+        rows.append(np.full(len(members), s, dtype=np.int64))
+        cols.append(members)
+    rows, cols = np.concatenate(rows), np.concatenate(cols)
+    selector = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (rows, cols)), shape=(len(starts), len(group_years))
+    )
+    return selector, [(start, start + window - 1) for start in starts]
+
+
+def build_dynamic_network(
+    entities_dir: Path = ENT_DIR,
+    data_dir: Path = DATA_DIR,
+    type_pairs: list[tuple[str, str]] | None = None,
+    weight_min: int = DEFAULT_WEIGHT_MIN,
+    window: int = DEFAULT_WINDOW,
+    step: int = DEFAULT_STEP,
+    same_type: bool = False,
+    article_years: dict[str, int] | None = None,
+) -> dict:
+    """Build the time-sliced co-occurrence network as a compact dict."""
+    type_pairs = list(type_pairs or DEFAULT_TYPE_PAIRS)
+    builder = build_cooccurrence_builder(entities_dir, type_pairs, same_type)
+    builder.prune(weight_min)
+    builder.sort_edges_by_weight()
+
+    if article_years is None:
+        article_years = load_article_years(data_dir)
+    group_years = np.array([article_years.get(g, -1) for g in builder.group_ids], dtype=np.int64)
+    selector, bounds = slice_selector(group_years, window, step)
+    print(f"Dated {int((group_years >= 0).sum())} of {len(group_years)} articles; {len(bounds)} slices.")
+
+    edge_weights = builder.sliced_edge_weights(selector)
+    node_counts = builder.sliced_node_counts(selector)
+    articles_per_slice = np.asarray(selector.sum(axis=1)).ravel()
+
+    # Keep nodes that have at least one edge; remap codes to output indices
+    codes = builder.connected()
+    index = np.full(builder.node_count, -1, dtype=np.int64)
+    index[codes] = np.arange(len(codes))
+    nodes = [
+        {k: builder.nodes[c][k] for k in ('id', 'type', 'label', 'count')}
+        for c in codes.tolist()
+    ]
+
+    slices = []
+    for s, (start, end) in enumerate(bounds):
+        e_row = edge_weights.getrow(s)
+        n_row = node_counts.getrow(s)
+        n_keep = index[n_row.indices] >= 0
+        e_order = np.argsort(e_row.indices, kind='stable')
+        n_order = np.argsort(index[n_row.indices[n_keep]], kind='stable')
+        slices.append({
+            'label': str(start) if start == end else f"{start}-{end}",
+            'start': start,
+            'end': end,
+            'articles': int(articles_per_slice[s]),
+            'edges': e_row.indices[e_order].tolist(),
+            'weights': e_row.data[e_order].astype(np.int64).tolist(),
+            'nodes': index[n_row.indices[n_keep]][n_order].tolist(),
+            'counts': n_row.data[n_keep][n_order].astype(np.int64).tolist(),
+        })
+
+    return {
+        'nodes': nodes,
+        'edges': {
+            'source': index[builder.src].tolist(),
+            'target': index[builder.dst].tolist(),
+            'type': builder.edge_type_codes.tolist(),
+            'weight': builder.weight.astype(np.int64).tolist(),
+        },
+        'edgeTypes': builder.edge_types,
+        'slices': slices,
+        'meta': {
+            'generatedAt': datetime.utcnow().isoformat() + 'Z',
+            'window': window,
+            'step': step,
+            'weightMinConfigured': weight_min,
+            'typePairs': type_pairs,
+            'totalNodes': len(nodes),
+            'totalEdges': builder.edge_count,
+            'totalSlices': len(slices),
+            'datedArticles': int((group_years >= 0).sum()),
+            'undatedArticles': int((group_years < 0).sum()),
+        },
+    }
+
+
+# ------------------ CLI ------------------
+def parse_args():
+    p = argparse.ArgumentParser(description="Build time-sliced co-occurrence network JSON for IWAC")
+    p.add_argument("--window", type=int, default=DEFAULT_WINDOW, help="Years per slice (1 = per year)")
+    p.add_argument("--step", type=int, default=DEFAULT_STEP, help="Years between slice starts (sliding windows when < --window)")
+    p.add_argument("--weight-min", type=int, default=DEFAULT_WEIGHT_MIN, help="Minimum all-time edge weight to keep")
+    p.add_argument("--pairs", type=str, default="", help="Comma-separated type pairs 'a-b,c-d' (override defaults)")
+    p.add_argument("--no-cross-only", action="store_true", help="If set, also build same-type co-occurrence edges")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.window < 1 or args.step < 1:
+        raise SystemExit("--window and --step must be >= 1")
+
+    if args.pairs:
+        type_pairs = [tuple(x.split("-", 1)) for x in args.pairs.split(",") if "-" in x]
+    else:
+        type_pairs = DEFAULT_TYPE_PAIRS
+
+    output = build_dynamic_network(
+        ENT_DIR,
+        DATA_DIR,
+        type_pairs=type_pairs,
+        weight_min=args.weight_min,
+        window=args.window,
+        step=args.step,
+        same_type=args.no_cross_only,
+    )
+
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
+    out_path = OUT_DIR / 'dynamic.json'
+    out_path.write_text(json.dumps(output, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+    meta = output['meta']
+    print(
+        f"Wrote {out_path} (nodes={meta['totalNodes']}, edges={meta['totalEdges']}, "
+        f"slices={meta['totalSlices']}, window={meta['window']}y)"
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -26,15 +26,60 @@ WHY CHANGES (Sigma integration):
     * Provide labelPriority so the client can show top-N labels without scanning.
     * Include statistical metadata (degree/strength distributions) for UI scaling heuristics.
 
+ENGINE:
+    Uses the shared scripts/network_builder.NetworkBuilder: entity ids are
+    mapped to dense integer codes over one sparse article x entity incidence
+    matrix. Pair weights for a type pair are the sparse product A_t1^T @ A_t2
+    (shared article counts), so the weight filter, degree and strength are
+    array operations. articleIds are only resolved for the edges that survive
+    the filter.
+
+ORDERING:
+    Nodes are ranked by (-(3 * degree + count), id) and edges by
+    (-weight, source, target), so the output is the same on every run. The
+    original script broke ties in set iteration order, which changed with
+    PYTHONHASHSEED, so tied nodes and edges may be ordered differently from
+    files it wrote.
+
+API:
+    load_entity_builder(entities_dir) -> (NetworkBuilder, type_codes)
+    build_cooccurrence_builder(entities_dir, type_pairs=..., same_type=...) -> NetworkBuilder
+    build_global_network(entities_dir, type_pairs=..., weight_min=..., ...) -> dict
+    main()  (CLI entry point; nothing runs at import time)
+
+BACKBONE (optional, --backbone-alpha):
+    Keeps only the disparity-filter backbone (scripts/graph_analytics.py) of
+    the co-occurrence edges, evaluated before the weight-min threshold:
+    an edge survives when it carries a significant share of either
+    endpoint's strength, so ties between low-frequency entities are kept
+    while the many weak edges around hubs are dropped.
+
+BINARY (optional, --binary):
+    Also writes networks/global.bin, the same network as typed-array columns
+    (scripts/graph_binary.py; decoded by src/lib/utils/graphBinary.ts).
+
+LAYOUT (optional, --layout):
+    Adds precomputed x/y per node (deterministic ForceAtlas2, scripts/graph_layout.py)
+    so the client can skip its own force layout.
+
 CLI OPTIONS (run `python build_networks.py -h`):
-    --weight-min, --top-labels, --pairs, --no-cross-only
+    --weight-min, --top-labels, --pairs, --no-cross-only, --backbone-alpha,
+    --binary, --layout, --layout-iterations, --layout-seed
 """
 from __future__ import annotations
 import json
 from pathlib import Path
 from datetime import datetime
-from statistics import fmean
 import argparse
+import sys
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from graph_binary import save_graph_binary
+from graph_layout import DEFAULT_ITERATIONS as DEFAULT_LAYOUT_ITERATIONS, DEFAULT_SEED as DEFAULT_LAYOUT_SEED
+from network_builder import NetworkBuilder
 
 # ------------------ Configuration ------------------
 DEFAULT_TYPE_PAIRS = [
@@ -48,211 +93,210 @@ DEFAULT_TYPE_PAIRS = [
 DEFAULT_WEIGHT_MIN = 2  # prune weak edges (configurable)
 DEFAULT_TOP_LABELS = 60
 
+# Entity file per node type, in load order
+ENTITY_FILES = [
+    ('person', 'persons.json'),
+    ('organization', 'organizations.json'),
+    ('event', 'events.json'),
+    ('subject', 'subjects.json'),
+    ('location', 'locations.json'),
+]
+
 # ------------------ Paths ------------------
 ROOT = Path(__file__).resolve().parents[2]
 DATA_DIR = ROOT / 'static' / 'data'
 ENT_DIR = DATA_DIR / 'entities'
 OUT_DIR = DATA_DIR / 'networks'
-OUT_DIR.mkdir(parents=True, exist_ok=True)
 
 # ------------------ Helpers ------------------
-def load_entities(file: str):
-    p = ENT_DIR / file
+def load_entities(file: str, ent_dir: Path = ENT_DIR):
+    p = ent_dir / file
     if not p.exists():
         return []
     return json.loads(p.read_text(encoding='utf-8'))
 
-def build_article_index(entities: list[dict], type_key: str, 
-                        article_to_entities: dict[str, dict[str, set[str]]],
-                        node_info: dict[str, dict]):
-    """
-    Populate article_to_entities[articleId][type_key] with entity ids,
-    and node_info with label/count for each node id.
+
+def load_entity_builder(entities_dir: Path = ENT_DIR) -> tuple[NetworkBuilder, dict[str, list[int]]]:
+    """Load the entity files into a NetworkBuilder holding the article x entity incidence.
+
+    Node codes follow sorted id order, so src < dst on codes matches the
+    string ordering used for edge source/target. Article (group) codes follow
+    first-seen order, which keeps articleIds in entity file order.
+
+    Returns:
+        (builder, node codes per entity type in file order)
     """
-    for ent in entities:
-        ent_id = str(ent.get('id'))
-        node_id = f"{type_key}:{ent_id}"
-        label = ent.get('name', '')
-        count = int(ent.get('articleCount', len(ent.get('relatedArticleIds', []) or [])) or 0)
-        node_info[node_id] = {
-            'id': node_id,
-            'type': type_key,
-            'label': label,
-            'count': count,
-        }
-        for aid in ent.get('relatedArticleIds', []) or []:
-            aid = str(aid)
-            bucket = article_to_entities.setdefault(aid, {})
-            bucket.setdefault(type_key, set()).add(node_id)
-
-# ------------------ Load ------------------
+    print("Loading entity files...")
+    by_type: dict[str, list[dict]] = {}
+    loaded = {}
+    for type_key, fname in ENTITY_FILES:
+        ents = load_entities(fname, entities_dir)
+        loaded[fname] = len(ents)
+        by_type[type_key] = ents
+    print("Loaded " + ", ".join(f"{k.removesuffix('.json')}={v}" for k, v in loaded.items()))
+
+    node_info: dict[str, dict] = {}
+    for type_key, ents in by_type.items():
+        for ent in ents:
+            related = ent.get('relatedArticleIds', []) or []
+            node_info[f"{type_key}:{ent.get('id')}"] = {
+                'type': type_key,
+                'label': ent.get('name', ''),
+                'count': int(ent.get('articleCount', len(related)) or 0),
+            }
+
+    builder = NetworkBuilder()
+    for node_id in sorted(node_info):
+        builder.add_node(node_id, **node_info[node_id])
+    type_codes: dict[str, list[int]] = {}
+    for type_key, ents in by_type.items():
+        codes = type_codes.setdefault(type_key, [])
+        for ent in ents:
+            code = builder.code(f"{type_key}:{ent.get('id')}")
+            codes.append(code)
+            for aid in ent.get('relatedArticleIds', []) or []:
+                builder.add_membership(str(aid), code)
+    print(f"Indexed {len(builder.group_ids)} articles with at least one entity.")
+    return builder, type_codes
+
+
+def build_cooccurrence_builder(
+    entities_dir: Path = ENT_DIR,
+    type_pairs: list[tuple[str, str]] | None = None,
+    same_type: bool = False,
+) -> NetworkBuilder:
+    """Load the entity files into a NetworkBuilder with merged co-occurrence edges."""
+    type_pairs = list(type_pairs or DEFAULT_TYPE_PAIRS)
+    builder, type_codes = load_entity_builder(entities_dir)
+
+    # Pair weights per type pair; a node pair reached through several type
+    # pairs keeps the first label and the summed weight.
+    for t1, t2 in type_pairs:
+        if type_codes.get(t1) and type_codes.get(t2):
+            builder.add_cooccurrence_edges(type_codes[t1], None if t1 == t2 else type_codes[t2], f"{t1}-{t2}")
+    if same_type:
+        for t, codes in type_codes.items():
+            if codes:
+                builder.add_cooccurrence_edges(codes, edge_type=f"{t}-{t}")
+    builder.merge_parallel_edges()
+    return builder
+
+
+def build_global_network(
+    entities_dir: Path = ENT_DIR,
+    type_pairs: list[tuple[str, str]] | None = None,
+    weight_min: int = DEFAULT_WEIGHT_MIN,
+    top_labels: int = DEFAULT_TOP_LABELS,
+    same_type: bool = False,
+    backbone_alpha: float | None = None,
+    layout: bool = False,
+    layout_iterations: int = DEFAULT_LAYOUT_ITERATIONS,
+    layout_seed: int = DEFAULT_LAYOUT_SEED,
+) -> dict:
+    """Build the global co-occurrence network as a Sigma.js-ready dict."""
+    type_pairs = list(type_pairs or DEFAULT_TYPE_PAIRS)
+    builder = build_cooccurrence_builder(entities_dir, type_pairs, same_type)
+
+    # Statistical backbone (before the threshold, so strengths see every edge)
+    if backbone_alpha is not None:
+        before = builder.edge_count
+        builder.backbone(backbone_alpha)
+        print(f"Disparity backbone (alpha={backbone_alpha}): kept {builder.edge_count} of {before} edges.")
+
+    # Prune weak edges
+    builder.prune(weight_min)
+    builder.sort_edges_by_weight()
+
+    weight = builder.weight
+    max_w = int(weight.max()) if len(weight) else 1
+    min_w = int(weight.min()) if len(weight) else 1
+
+    # Label priority (higher = more important) used by client for top labels;
+    # ties go by code, i.e. by node id (codes follow sorted id order)
+    counts = np.array([node['count'] for node in builder.nodes], dtype=np.int64)
+    priority = builder.priority_rank(builder.degree() * 3 + counts, start=1)
+
+    if layout:
+        print(f"Computing ForceAtlas2 layout ({layout_iterations} iterations, seed {layout_seed})...")
+        builder.compute_layout(iterations=layout_iterations, seed=layout_seed)
+
+    network = builder.serialize(
+        priority=priority,
+        order_by_priority=True,
+        norm_decimals=6,
+        article_ids=True,
+    )
+    nodes = network['nodes']  # already sorted by label priority importance
+
+    # Truncate top labels list length (still store priority for all)
+    top_label_slice = nodes[:top_labels]
+
+    return {
+        'nodes': nodes,
+        'edges': network['edges'],
+        'meta': {
+            'generatedAt': datetime.utcnow().isoformat() + 'Z',
+            'totalNodes': len(nodes),
+            'totalEdges': builder.edge_count,
+            'supportedTypes': ['person', 'organization', 'event', 'subject', 'location'],
+            'weightMinConfigured': weight_min,
+            'backboneAlpha': backbone_alpha,
+            'weightMinActual': min_w,
+            'weightMax': max_w,
+            **builder.metric_summary(decimals=3),
+            'topLabelCount': top_labels,
+            'typePairs': type_pairs,
+            'labelPriorityTop': [n['id'] for n in top_label_slice],
+        },
+    }
+
+
+# ------------------ CLI ------------------
 def parse_args():
     p = argparse.ArgumentParser(description="Build co-occurrence network JSON for IWAC")
     p.add_argument("--weight-min", type=int, default=DEFAULT_WEIGHT_MIN, help="Minimum edge weight to keep")
     p.add_argument("--top-labels", type=int, default=DEFAULT_TOP_LABELS, help="How many high-priority node labels to pre-compute")
     p.add_argument("--pairs", type=str, default="", help="Comma-separated type pairs 'a-b,c-d' (override defaults)")
     p.add_argument("--no-cross-only", action="store_true", help="If set, also build same-type co-occurrence edges")
+    p.add_argument("--backbone-alpha", type=float, default=None, help="Keep only the disparity-filter backbone at this significance (e.g. 0.05)")
+    p.add_argument("--binary", action="store_true", help="Also write a typed-array binary copy (global.bin)")
+    p.add_argument("--layout", action="store_true", help="Precompute ForceAtlas2 x/y positions for each node")
+    p.add_argument("--layout-iterations", type=int, default=DEFAULT_LAYOUT_ITERATIONS, help="ForceAtlas2 iteration budget")
+    p.add_argument("--layout-seed", type=int, default=DEFAULT_LAYOUT_SEED, help="Seed for the initial layout positions")
     return p.parse_args()
 
-ARGS = parse_args()
-
-if ARGS.pairs:
-    TYPE_PAIRS = [tuple(x.split("-", 1)) for x in ARGS.pairs.split(",") if "-" in x]
-else:
-    TYPE_PAIRS = DEFAULT_TYPE_PAIRS
-
-WEIGHT_MIN = ARGS.weight_min
-TOP_LABELS = ARGS.top_labels
-
-print("Loading entity files...")
-persons = load_entities('persons.json')
-organizations = load_entities('organizations.json')
-events = load_entities('events.json')
-subjects = load_entities('subjects.json')
-locations = load_entities('locations.json')
-
-print(
-    f"Loaded persons={len(persons)}, orgs={len(organizations)}, events={len(events)}, subjects={len(subjects)}, locations={len(locations)}"
-)
-
-# ------------------ Index ------------------
-article_to_entities: dict[str, dict[str, set[str]]] = {}
-node_info: dict[str, dict] = {}
-
-build_article_index(persons, 'person', article_to_entities, node_info)
-build_article_index(organizations, 'organization', article_to_entities, node_info)
-build_article_index(events, 'event', article_to_entities, node_info)
-build_article_index(subjects, 'subject', article_to_entities, node_info)
-build_article_index(locations, 'location', article_to_entities, node_info)
-
-print(f"Indexed {len(article_to_entities)} articles with at least one entity.")
-
-def accumulate_edge(aid: str, t1: str, t2: str, a_nodes: set[str], b_nodes: set[str], acc: dict):
-    for n1 in a_nodes:
-        for n2 in b_nodes:
-            s, t = (n1, n2) if n1 < n2 else (n2, n1)
-            key = (s, t)
-            rec = acc.get(key)
-            if not rec:
-                acc[key] = {
-                    'source': s,
-                    'target': t,
-                    'type': f"{t1}-{t2}",
-                    'weight': 1,
-                    'articleIds': [aid],
-                }
-            else:
-                rec['weight'] += 1
-                if not rec['articleIds'] or rec['articleIds'][-1] != aid:
-                    rec['articleIds'].append(aid)
-
-edge_acc: dict[tuple[str, str], dict] = {}
-
-for aid, by_type in article_to_entities.items():
-    # cross-type pairs
-    for t1, t2 in TYPE_PAIRS:
-        a = by_type.get(t1)
-        b = by_type.get(t2)
-        if a and b:
-            accumulate_edge(aid, t1, t2, a, b, edge_acc)
-    # optional same-type pairs if requested
-    if ARGS.no_cross_only:
-        for t, nodeset in by_type.items():
-            if len(nodeset) < 2:
-                continue
-            # all unordered pairs inside nodeset
-            lst = sorted(nodeset)
-            for i in range(len(lst)):
-                for j in range(i + 1, len(lst)):
-                    s, t2 = lst[i], lst[j]
-                    key = (s, t2)
-                    rec = edge_acc.get(key)
-                    if not rec:
-                        edge_acc[key] = {
-                            'source': s,
-                            'target': t2,
-                            'type': f"{t}-{t}",
-                            'weight': 1,
-                            'articleIds': [aid],
-                        }
-                    else:
-                        rec['weight'] += 1
-                        if rec['articleIds'][-1] != aid:
-                            rec['articleIds'].append(aid)
-
-# Prune weak edges
-edges = [e for e in edge_acc.values() if e['weight'] >= WEIGHT_MIN]
-edges.sort(key=lambda r: r['weight'], reverse=True)
-
-# ------------------ Build nodes subset ------------------
-used_ids: set[str] = set()
-for e in edges:
-    used_ids.add(e['source'])
-    used_ids.add(e['target'])
-
-nodes = [node_info[nid] for nid in used_ids]
-
-# Degree & strength (sum of incident edge weights)
-degree = {nid: 0 for nid in used_ids}
-strength = {nid: 0 for nid in used_ids}
-for e in edges:
-    degree[e['source']] += 1
-    degree[e['target']] += 1
-    strength[e['source']] += e['weight']
-    strength[e['target']] += e['weight']
-for n in nodes:
-    nid = n['id']
-    n['degree'] = degree.get(nid, 0)
-    n['strength'] = strength.get(nid, 0)
-
-# Edge weight normalization
-if edges:
-    max_w = max(e['weight'] for e in edges)
-    min_w = min(e['weight'] for e in edges)
-else:
-    max_w = min_w = 1
-for e in edges:
-    e['weightNorm'] = round(e['weight'] / max_w, 6) if max_w else 0
-
-# Label priority (higher = more important) used by client for top labels
-nodes.sort(key=lambda x: (x['degree'] * 3 + x['count']), reverse=True)
-for idx, n in enumerate(nodes):
-    n['labelPriority'] = idx + 1
-
-# Truncate top labels list length (still store priority for all)
-top_label_slice = nodes[:TOP_LABELS]
-
-deg_vals = [n['degree'] for n in nodes] or [0]
-str_vals = [n['strength'] for n in nodes] or [0]
-
-output = {
-    'nodes': nodes,  # already sorted by label priority importance
-    'edges': edges,
-    'meta': {
-        'generatedAt': datetime.utcnow().isoformat() + 'Z',
-        'totalNodes': len(nodes),
-        'totalEdges': len(edges),
-        'supportedTypes': ['person', 'organization', 'event', 'subject', 'location'],
-        'weightMinConfigured': WEIGHT_MIN,
-        'weightMinActual': min_w,
-        'weightMax': max_w,
-        'degree': {
-            'min': min(deg_vals),
-            'max': max(deg_vals),
-            'mean': round(fmean(deg_vals), 3),
-        },
-        'strength': {
-            'min': min(str_vals),
-            'max': max(str_vals),
-            'mean': round(fmean(str_vals), 3),
-        },
-        'topLabelCount': TOP_LABELS,
-        'typePairs': TYPE_PAIRS,
-        'labelPriorityTop': [n['id'] for n in top_label_slice],
-    },
-}
-
-(OUT_DIR / 'global.json').write_text(json.dumps(output, ensure_ascii=False, indent=2), encoding='utf-8')
-print(
-    f"Wrote {OUT_DIR / 'global.json'} (nodes={len(nodes)}, edges={len(edges)}, maxW={max_w}, topLabels={TOP_LABELS})"
-)
+
+def main():
+    args = parse_args()
+
+    if args.pairs:
+        type_pairs = [tuple(x.split("-", 1)) for x in args.pairs.split(",") if "-" in x]
+    else:
+        type_pairs = DEFAULT_TYPE_PAIRS
+
+    output = build_global_network(
+        ENT_DIR,
+        type_pairs=type_pairs,
+        weight_min=args.weight_min,
+        top_labels=args.top_labels,
+        same_type=args.no_cross_only,
+        backbone_alpha=args.backbone_alpha,
+        layout=args.layout,
+        layout_iterations=args.layout_iterations,
+        layout_seed=args.layout_seed,
+    )
+
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
+    (OUT_DIR / 'global.json').write_text(json.dumps(output, ensure_ascii=False, indent=2), encoding='utf-8')
+    if args.binary:
+        save_graph_binary(output, OUT_DIR / 'global.bin', log=False)
+        print(f"Wrote {OUT_DIR / 'global.bin'}")
+    meta = output['meta']
+    print(
+        f"Wrote {OUT_DIR / 'global.json'} (nodes={meta['totalNodes']}, edges={meta['totalEdges']}, "
+        f"maxW={meta['weightMax']}, topLabels={meta['topLabelCount']})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""build_related_entities.py
+Precompute "related entities" (top-k most similar entities) for IWAC.
+
+INPUT  (static JSON): static/data/entities/*.json
+    Entity files built by preprocess_all.py from the articles' subject/spatial
+    fields matched to index ids: [{ id, name, relatedArticleIds, articleCount }]
+
+OUTPUT (JSON): static/data/related-entities.json
+    related: { "<type>:<id>": [[neighbourId, score, sharedArticles], ...] }   (best first)
+    meta:    { generatedAt, metric, k, minShared, totalEntities, withNeighbours }
+
+    Node ids use the same "<type>:<o:id>" form as networks/global.json.
+
+ENGINE:
+    Reuses the article x entity incidence matrix of build_networks.load_entity_builder.
+    Similarities (cosine or Jaccard over article sets) are computed by
+    graph_analytics.top_k_similar one block of entities at a time, with an
+    argpartition top-k per row, so memory is bounded by --block-size x entities
+    instead of entities².
+
+CLI OPTIONS (run `python build_related_entities.py -h`):
+    --k, --metric, --min-shared, --block-size
+"""
+from __future__ import annotations
+import argparse
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from build_networks import ENT_DIR, load_entity_builder
+from graph_analytics import DEFAULT_BLOCK_SIZE, DEFAULT_TOP_K, SIMILARITY_METRICS, top_k_similar
+
+# ------------------ Configuration ------------------
+DEFAULT_MIN_SHARED = 2  # ignore pairs sharing a single article
+SCORE_DECIMALS = 4
+
+# ------------------ Paths ------------------
+ROOT = Path(__file__).resolve().parents[2]
+OUT_PATH = ROOT / 'static' / 'data' / 'related-entities.json'
+
+
+def build_related_entities(
+    entities_dir: Path = ENT_DIR,
+    k: int = DEFAULT_TOP_K,
+    metric: str = 'cosine',
+    min_shared: int = DEFAULT_MIN_SHARED,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> dict:
+    """Compute the top-k related entities of every entity."""
+    builder, _ = load_entity_builder(entities_dir)
+    neighbours, scores, shared = top_k_similar(
+        builder.incidence, k=k, metric=metric, block_size=block_size, min_shared=min_shared
+    )
+
+    node_ids = builder.node_ids
+    related: dict[str, list] = {}
+    for code, row in enumerate(neighbours.tolist()):
+        entries = [
+            [node_ids[other], round(float(scores[code, j]), SCORE_DECIMALS), int(shared[code, j])]
+            for j, other in enumerate(row)
+            if other >= 0
+        ]
+        if entries:
+            related[node_ids[code]] = entries
+
+    return {
+        'related': related,
+        'meta': {
+            'generatedAt': datetime.utcnow().isoformat() + 'Z',
+            'metric': metric,
+            'k': k,
+            'minShared': min_shared,
+            'totalEntities': builder.node_count,
+            'withNeighbours': len(related),
+        },
+    }
+
+
+# ------------------ CLI ------------------
+def parse_args():
+    p = argparse.ArgumentParser(description="Build related-entities JSON for IWAC")
+    p.add_argument("--k", type=int, default=DEFAULT_TOP_K, help="Neighbours kept per entity")
+    p.add_argument("--metric", choices=SIMILARITY_METRICS, default='cosine', help="Similarity over article sets")
+    p.add_argument("--min-shared", type=int, default=DEFAULT_MIN_SHARED, help="Minimum shared articles for a pair")
+    p.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE, help="Entities per similarity block (bounds memory)")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    output = build_related_entities(
+        ENT_DIR,
+        k=args.k,
+        metric=args.metric,
+        min_shared=args.min_shared,
+        block_size=args.block_size,
+    )
+    OUT_PATH.write_text(json.dumps(output, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+    meta = output['meta']
+    print(
+        f"Wrote {OUT_PATH} (entities={meta['totalEntities']}, withNeighbours={meta['withNeighbours']}, "
+        f"k={meta['k']}, metric={meta['metric']})"
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -24,6 +24,12 @@ Usage (PowerShell):
   # Run specific steps
   # python scripts/preprocess_all.py --steps fetch add-countries entities
 
+  # Stream the export in Arrow record batches (constant memory)
+  # python scripts/preprocess_all.py --stream --batch-size 2000
+
+  # Re-run, skipping steps whose inputs are unchanged (checkpoints in .cache/)
+  # python scripts/spatial/preprocess_all.py --resume
+
   # Customize output dir and log file
   # python scripts/preprocess_all.py --out-dir "omeka-map-explorer/static/data" --log-file "scripts/logs/preprocess.log"
 """
@@ -31,8 +37,10 @@ Usage (PowerShell):
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import logging
+import pickle
 import re
 import time
 from contextlib import contextmanager
@@ -42,6 +50,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
+import numpy as np
+
 # Optional imports; some steps only need these lazily
 try:
     from datasets import Dataset, DatasetDict, load_dataset  # type: ignore
@@ -51,8 +61,8 @@ except Exception:  # pragma: no cover - optional, validated at runtime
     load_dataset = None  # type: ignore
 
 try:
-    from shapely.geometry import Point, shape  # type: ignore
-    from shapely.prepared import prep  # type: ignore
+    import shapely  # type: ignore
+    from shapely.geometry import shape  # type: ignore
     _HAS_SHAPELY = True
 except Exception:
     _HAS_SHAPELY = False
@@ -62,6 +72,10 @@ except Exception:
 # Logging & timing utilities
 # -------------------------
 
+# Durations recorded by step_timer during this run (written to the run report)
+STEP_TIMINGS: List[Dict[str, Any]] = []
+
+
 @contextmanager
 def step_timer(name: str) -> Iterator[float]:
     start = time.perf_counter()
@@ -70,6 +84,7 @@ def step_timer(name: str) -> Iterator[float]:
         yield start
     finally:
         dur = time.perf_counter() - start
+        STEP_TIMINGS.append({"name": name, "seconds": round(dur, 3)})
         logging.info(f"✅ Done: %s (%.2fs)", name, dur)
 
 
@@ -102,6 +117,212 @@ def _dump_json(path: Path, data: Any, compact: bool = False) -> None:
             json.dump(data, f, ensure_ascii=False, indent=2)
 
 
+class _RowStreamWriter:
+    """Incrementally write rows as a JSON array or as JSON Lines.
+
+    The JSON array output is byte-for-byte what _dump_json would produce for
+    the full list, so downstream readers do not need to know it was streamed.
+    Rows go to a sibling temp file that only replaces ``path`` on a clean
+    exit; if the export fails partway it is deleted, so a truncated file is
+    never taken for the full export.
+    """
+
+    def __init__(self, path: Path, compact: bool = False, jsonl: bool = False) -> None:
+        self.path = path
+        self.compact = compact
+        self.jsonl = jsonl
+        self.count = 0
+        self._fh = None
+        self._tmp_path = path.with_name(path.name + ".tmp")
+
+    def __enter__(self) -> "_RowStreamWriter":
+        self._fh = self._tmp_path.open("w", encoding="utf-8")
+        if not self.jsonl:
+            self._fh.write("[")
+        return self
+
+    def write(self, row: Dict[str, Any]) -> None:
+        assert self._fh is not None
+        if self.jsonl:
+            self._fh.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")))
+            self._fh.write("\n")
+        elif self.compact:
+            self._fh.write("," if self.count else "")
+            self._fh.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")))
+        else:
+            self._fh.write(",\n  " if self.count else "\n  ")
+            self._fh.write(json.dumps(row, ensure_ascii=False, indent=2).replace("\n", "\n  "))
+        self.count += 1
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        assert self._fh is not None
+        try:
+            if exc_type is None and not self.jsonl:
+                self._fh.write("\n]" if self.count and not self.compact else "]")
+        finally:
+            self._fh.close()
+            self._fh = None
+        if exc_type is None:
+            self._tmp_path.replace(self.path)
+        else:
+            self._tmp_path.unlink(missing_ok=True)
+
+
+# -------------------------
+# Step checkpoints
+# -------------------------
+
+def file_sha256(path: Path) -> Optional[str]:
+    """Content hash of a file, or None if it does not exist."""
+    if not path.exists():
+        return None
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class StepCache:
+    """Pickle-backed checkpoints for pipeline steps.
+
+    Each step stores a record with a fingerprint (step parameters plus the
+    hashes of its input files), the hashes of its inputs and outputs, the
+    totals it reported and optional artifacts. Artifacts are Python objects
+    tied to the hash of the file they mirror (e.g. the enriched index rows
+    for index.json), so later steps can load them instead of re-parsing JSON.
+
+    index.json is rewritten in place by add-countries, so a file counts as
+    unchanged if it still has the recorded hash or if a later step's record
+    shows it was rewritten from that hash into its current content.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._records: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    def _record_path(self, step: str) -> Path:
+        return self.cache_dir / f"{step}.pkl"
+
+    def load(self, step: str) -> Optional[Dict[str, Any]]:
+        if step in self._records:
+            return self._records[step]
+        record: Optional[Dict[str, Any]] = None
+        path = self._record_path(step)
+        if path.exists():
+            try:
+                with path.open("rb") as f:
+                    record = pickle.load(f)
+            except Exception as e:
+                logging.warning("Ignoring unreadable checkpoint %s: %s", path, e)
+        self._records[step] = record
+        return record
+
+    def input_hash(self, step: str, path: Path) -> Optional[str]:
+        """Hash of path as the step saw it, undoing the step's own in-place rewrite."""
+        current = file_sha256(path)
+        record = self.load(step)
+        if record and current is not None and record["outputs"].get(str(path)) == current:
+            return record["inputs"].get(str(path), current)
+        return current
+
+    def fingerprint(self, step: str, inputs: Iterable[Path], params: Dict[str, Any]) -> Optional[str]:
+        """Hash of step name, parameters and input file contents (None if an input is missing)."""
+        payload: Dict[str, Any] = {"step": step, "params": params, "inputs": {}}
+        for path in inputs:
+            digest = self.input_hash(step, path)
+            if digest is None:
+                return None
+            payload["inputs"][path.name] = digest
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def _file_matches(self, path: Path, digest: Optional[str]) -> bool:
+        current = file_sha256(path)
+        if digest is None or current is None:
+            return False
+        if current == digest:
+            return True
+        key = str(path)
+        return any(
+            rec["inputs"].get(key) == digest and rec["outputs"].get(key) == current
+            for rec in (self.load(p.stem) for p in self.cache_dir.glob("*.pkl"))
+            if rec
+        )
+
+    def save(
+        self,
+        step: str,
+        fingerprint: Optional[str],
+        inputs: Dict[Path, Optional[str]],
+        outputs: Iterable[Path],
+        totals: Dict[str, Any],
+        artifacts: Optional[Dict[Path, Any]] = None,
+    ) -> None:
+        record = {
+            "fingerprint": fingerprint,
+            "inputs": {str(p): digest for p, digest in inputs.items()},
+            "outputs": {str(p): file_sha256(p) for p in outputs},
+            "totals": totals,
+            "artifacts": {str(p): (file_sha256(p), obj) for p, obj in (artifacts or {}).items() if obj is not None},
+        }
+        with self._record_path(step).open("wb") as f:
+            pickle.dump(record, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self._records[step] = record
+
+    def fresh_record(self, step: str, fingerprint: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the step's record if its fingerprint matches and its outputs are untouched."""
+        if fingerprint is None:
+            return None
+        record = self.load(step)
+        if not record or record.get("fingerprint") != fingerprint:
+            return None
+        if not all(self._file_matches(Path(p), d) for p, d in record["outputs"].items()):
+            return None
+        return record
+
+    def artifact(self, step: str, path: Path) -> Any:
+        """Cached object mirroring path, if the file still has the hash it had when cached."""
+        record = self.load(step)
+        if not record:
+            return None
+        entry = record["artifacts"].get(str(path))
+        if entry is None or entry[0] != file_sha256(path):
+            return None
+        return entry[1]
+
+
+def dataset_revision(dataset_id: str, timeout: float = 10.0) -> Optional[str]:
+    """Commit hash of the dataset on the Hub, used to key the fetch checkpoint.
+
+    Returns None when offline (HF_HUB_OFFLINE) or when the Hub cannot be
+    reached; the fetch step then always runs.
+    """
+    try:
+        from huggingface_hub import HfApi, constants  # type: ignore
+
+        if constants.HF_HUB_OFFLINE:
+            return None
+        return HfApi().dataset_info(dataset_id, timeout=timeout).sha
+    except Exception as e:
+        logging.debug("Could not resolve dataset revision for %s: %s", dataset_id, e)
+        return None
+
+
+def write_run_report(path: Path, steps: List[Dict[str, Any]], totals: Dict[str, Any], started: float) -> None:
+    """Write a machine-readable summary of step status, step_timer timings and totals."""
+    report = {
+        "generatedAt": datetime.now().isoformat(timespec="seconds"),
+        "totalSeconds": round(time.perf_counter() - started, 3),
+        "steps": steps,
+        "timers": STEP_TIMINGS,
+        "totals": totals,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _dump_json(path, report)
+    logging.info("Run report -> %s", path)
+
+
 # -------------------------
 # Paths & CLI
 # -------------------------
@@ -117,6 +338,7 @@ def default_paths(script_path: Path) -> Dict[str, Path]:
     entities_dir = data_dir / "entities"
     return {
         "root": root,
+        "cache_dir": root / ".cache" / "spatial-preprocess",
         "data_dir": data_dir,
         "maps_dir": maps_dir,
         "entities_dir": entities_dir,
@@ -250,17 +472,53 @@ def transform_index_row(row: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def iter_row_batches(ds: Any, batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Yield lists of at most batch_size row dicts from a dataset.
+
+    Hugging Face datasets are read as Arrow record batches so only one batch
+    is materialised as Python objects at a time; any other iterable of rows
+    (e.g. a plain list) is chunked as-is.
+    """
+    if hasattr(ds, "with_format") and hasattr(ds, "iter"):
+        for table in ds.with_format("arrow").iter(batch_size=batch_size):
+            yield table.to_pylist()
+        return
+    batch: List[Dict[str, Any]] = []
+    for row in ds:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 @dataclass
 class FetchResult:
     articles_count: int
     index_count: int
     articles_path: Path
     index_path: Path
-
-
-def step_fetch(dataset_id: str, out_dir: Path, *, compact: bool = False) -> FetchResult:
+    # entity name -> article ids, only populated by streaming fetch
+    entity_articles: Optional[Dict[str, set[str]]] = None
+    # transformed index rows, only populated by non-streaming fetch
+    index_rows: Optional[List[Dict[str, Any]]] = None
+
+
+def step_fetch(
+    dataset_id: str,
+    out_dir: Path,
+    *,
+    compact: bool = False,
+    stream: bool = False,
+    batch_size: int = 1000,
+    jsonl: bool = False,
+) -> FetchResult:
     out_dir.mkdir(parents=True, exist_ok=True)
 
+    if stream:
+        return _step_fetch_streaming(dataset_id, out_dir, compact=compact, batch_size=batch_size, jsonl=jsonl)
+
     with step_timer("Export dataset subsets to JSON"):
         articles_ds = load_subset(dataset_id, "articles")
         index_ds = load_subset(dataset_id, "index")
@@ -282,6 +540,55 @@ def step_fetch(dataset_id: str, out_dir: Path, *, compact: bool = False) -> Fetc
             index_count=len(index_rows),
             articles_path=articles_path,
             index_path=index_path,
+            index_rows=index_rows,
+        )
+
+
+def _step_fetch_streaming(
+    dataset_id: str,
+    out_dir: Path,
+    *,
+    compact: bool,
+    batch_size: int,
+    jsonl: bool,
+) -> FetchResult:
+    """Streaming variant of step_fetch: transform and write one batch at a time.
+
+    Peak memory is bounded by batch_size rather than the collection size.
+    The entity -> article id map needed by step_entities is built on the fly
+    so that step does not have to reload the articles file.
+    """
+    with step_timer("Export dataset subsets to JSON (streaming)"):
+        articles_ds = load_subset(dataset_id, "articles")
+        index_ds = load_subset(dataset_id, "index")
+
+        articles_path = out_dir / ("articles.jsonl" if jsonl else "articles.json")
+        index_path = out_dir / "index.json"
+        entity_articles: Dict[str, set[str]] = {}
+
+        with _RowStreamWriter(articles_path, compact, jsonl=jsonl) as writer:
+            for batch in iter_row_batches(articles_ds, batch_size):
+                for raw in batch:
+                    row = transform_articles_row(raw)
+                    writer.write(row)
+                    index_article_entities(entity_articles, row)
+            articles_count = writer.count
+
+        with _RowStreamWriter(index_path, compact) as writer:
+            for batch in iter_row_batches(index_ds, batch_size):
+                for raw in batch:
+                    writer.write(transform_index_row(raw))
+            index_count = writer.count
+
+        logging.info("Wrote %d articles -> %s", articles_count, articles_path)
+        logging.info("Wrote %d index entries -> %s", index_count, index_path)
+
+        return FetchResult(
+            articles_count=articles_count,
+            index_count=index_count,
+            articles_path=articles_path,
+            index_path=index_path,
+            entity_articles=entity_articles,
         )
 
 
@@ -307,6 +614,20 @@ def parse_coordinates(coord_str: str) -> Optional[Tuple[float, float]]:
         return None
 
 
+def parse_coordinates_array(values: Iterable[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """Parse coordinate strings into (lats, lngs) arrays; NaN where a string is invalid."""
+    parsed = [parse_coordinates(str(v or "")) or (np.nan, np.nan) for v in values]
+    coords = np.array(parsed, dtype=np.float64).reshape(-1, 2)
+    return coords[:, 0], coords[:, 1]
+
+
+def _prepared_shape(geom: Dict[str, Any]) -> Any:
+    """Shapely geometry from GeoJSON, prepared in place for repeated point tests."""
+    shp = shape(geom)
+    shapely.prepare(shp)
+    return shp
+
+
 def load_world_countries(geojson_path: Path) -> List[Dict[str, Any]]:
     with geojson_path.open("r", encoding="utf-8") as f:
         world_data = json.load(f)
@@ -318,10 +639,9 @@ def load_world_countries(geojson_path: Path) -> List[Dict[str, Any]]:
         if not name or not geom:
             continue
         try:
-            shp = shape(geom)
             countries.append({
                 "name": name,
-                "geometry": prep(shp),  # prepared for fast contains
+                "geometry": _prepared_shape(geom),  # prepared for fast contains
                 "properties": props,
             })
         except Exception as e:
@@ -330,16 +650,33 @@ def load_world_countries(geojson_path: Path) -> List[Dict[str, Any]]:
     return countries
 
 
-def find_country_for_coordinates(lat: float, lng: float, countries: List[Dict[str, Any]]) -> Optional[str]:
-    pt = Point(lng, lat)
-    for c in countries:
+def find_names_for_points(
+    features: List[Dict[str, Any]],
+    lats: np.ndarray,
+    lngs: np.ndarray,
+    *,
+    boundary: bool = False,
+) -> np.ndarray:
+    """Name of the first feature (in file order) holding each point; "" when none.
+
+    Each feature is tested against all still-unmatched points at once
+    (shapely.contains_xy, or intersects_xy when ``boundary`` is set so points
+    on a border count as inside). NaN coordinates never match, and a feature
+    whose geometry cannot be evaluated is skipped.
+    """
+    names = np.full(len(lats), "", dtype=object)
+    pending = np.flatnonzero(~np.isnan(lats) & ~np.isnan(lngs))
+    test = shapely.intersects_xy if boundary else shapely.contains_xy
+    for f in features:
+        if not len(pending):
+            break
         try:
-            if c["geometry"].contains(pt):
-                return c["name"]
+            hit = test(f["geometry"], lngs[pending], lats[pending])
         except Exception:
-            # ignore and continue
             continue
-    return None
+        names[pending[hit]] = f["name"]
+        pending = pending[~hit]
+    return names
 
 
 @dataclass
@@ -348,6 +685,30 @@ class CountryResult:
     matched: int
     skipped_non_locations: int
     updated_index_path: Path
+    index_rows: Optional[List[Dict[str, Any]]] = None
+
+
+# Admin layers used to add Region/Prefecture for the focus countries:
+# country -> level -> (file in maps_dir, property keys tried in order for the name)
+ADMIN_LAYER_SOURCES: Dict[str, Dict[str, Tuple[str, List[str]]]] = {
+    "Benin": {
+        "region": ("benin_regions.geojson", ["name", "NAME", "NAME_1"]),
+        "prefecture": ("benin_prefectures.geojson", ["name", "NAME", "NAME_2"]),
+    },
+    "Burkina Faso": {
+        "region": ("burkina_faso_regions.geojson", ["name", "NAME", "NAME_1"]),
+        "prefecture": ("burkina_faso_prefectures.geojson", ["name", "NAME", "NAME_2"]),
+    },
+    "Togo": {
+        "region": ("togo_regions.geojson", ["name", "NAME", "NAME_1"]),
+        # togo prefectures store prefecture in shape2
+        "prefecture": ("togo_prefectures.geojson", ["shape2", "name", "NAME_2"]),
+    },
+    "Côte d'Ivoire": {
+        # Cote d'Ivoire regions file uses shape2 for the region label
+        "region": ("cote_divoire_regions.geojson", ["shape2", "name", "NAME", "NAME_1"]),
+    },
+}
 
 
 def _load_named_polygons(geojson_path: Path, name_keys: List[str]) -> List[Dict[str, Any]]:
@@ -369,10 +730,9 @@ def _load_named_polygons(geojson_path: Path, name_keys: List[str]) -> List[Dict[
         if not raw_name or not geom:
             continue
         try:
-            shp = shape(geom)
             items.append({
                 "name": raw_name,
-                "geometry": prep(shp),
+                "geometry": _prepared_shape(geom),
                 "properties": props,
             })
         except Exception as e:
@@ -381,19 +741,27 @@ def _load_named_polygons(geojson_path: Path, name_keys: List[str]) -> List[Dict[
     return items
 
 
-def _find_name_for_point(lat: float, lng: float, features: List[Dict[str, Any]]) -> Optional[str]:
-    pt = Point(lng, lat)
-    for f in features:
-        try:
-            # intersects includes boundary; more robust than contains for points on borders
-            if f["geometry"].intersects(pt):
-                return f["name"]
-        except Exception:
-            continue
-    return None
-
-
-def step_add_countries(index_path: Path, world_geojson: Path, maps_dir: Optional[Path] = None, *, compact: bool = False) -> CountryResult:
+def load_admin_layers(maps_dir: Path) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+    """Load the available ADMIN_LAYER_SOURCES; a missing file only drops its own layer."""
+    admin_layers: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+    for country, levels in ADMIN_LAYER_SOURCES.items():
+        for level, (filename, name_keys) in levels.items():
+            path = maps_dir / filename
+            if not path.exists():
+                logging.warning("Admin layer file is missing: %s", path)
+                continue
+            admin_layers.setdefault(country, {})[level] = _load_named_polygons(path, name_keys)
+    return admin_layers
+
+
+def step_add_countries(
+    index_path: Path,
+    world_geojson: Path,
+    maps_dir: Optional[Path] = None,
+    *,
+    compact: bool = False,
+    index_rows: Optional[List[Dict[str, Any]]] = None,
+) -> CountryResult:
     if not _HAS_SHAPELY:
         raise RuntimeError("shapely is required for add-countries step. Install with: pip install shapely")
     if not world_geojson.exists():
@@ -401,8 +769,9 @@ def step_add_countries(index_path: Path, world_geojson: Path, maps_dir: Optional
 
     with step_timer("Add Country/Region/Prefecture to locations in index.json"):
         countries = load_world_countries(world_geojson)
-        with index_path.open("r", encoding="utf-8") as f:
-            index_rows: List[Dict[str, Any]] = json.load(f)
+        if index_rows is None:
+            with index_path.open("r", encoding="utf-8") as f:
+                index_rows = json.load(f)
 
     # Note: backup creation removed to keep output directory minimal and avoid extra files
 
@@ -414,79 +783,65 @@ def step_add_countries(index_path: Path, world_geojson: Path, maps_dir: Optional
             if potential.exists():
                 maps_dir = potential
         if maps_dir is not None:
-            try:
-                admin_layers = {
-                    "Benin": {
-                        "region": _load_named_polygons(maps_dir / "benin_regions.geojson", ["name", "NAME", "NAME_1"]),
-                        "prefecture": _load_named_polygons(maps_dir / "benin_prefectures.geojson", ["name", "NAME", "NAME_2"]),
-                    },
-                    "Burkina Faso": {
-                        "region": _load_named_polygons(maps_dir / "burkina_faso_regions.geojson", ["name", "NAME", "NAME_1"]),
-                        "prefecture": _load_named_polygons(maps_dir / "burkina_faso_prefectures.geojson", ["name", "NAME", "NAME_2"]),
-                    },
-                    "Togo": {
-                        "region": _load_named_polygons(maps_dir / "togo_regions.geojson", ["name", "NAME", "NAME_1"]),
-                        # togo prefectures store prefecture in shape2
-                        "prefecture": _load_named_polygons(maps_dir / "togo_prefectures.geojson", ["shape2", "name", "NAME_2"]),
-                    },
-                    "Côte d'Ivoire": {
-                        # Cote d'Ivoire regions file uses shape2 for the region label
-                        "region": _load_named_polygons(maps_dir / "cote_divoire_regions.geojson", ["shape2", "name", "NAME", "NAME_1"]),
-                    },
-                }
-            except FileNotFoundError as e:
-                logging.warning("Some admin layer files are missing: %s", e)
-
-        processed = matched = skipped = 0
-        TARGET_COUNTRIES = {"Benin", "Burkina Faso", "Togo", "Côte d'Ivoire"}
-        for row in index_rows:
-            if row.get("Type") != "Lieux":
-                skipped += 1
+            admin_layers = load_admin_layers(maps_dir)
+
+        # Bulk lookups: every location point is tested per layer in one call
+        locations = [row for row in index_rows if row.get("Type") == "Lieux"]
+        skipped = len(index_rows) - len(locations)
+        lats, lngs = parse_coordinates_array(row.get("Coordonnées", "") for row in locations)
+        has_coords = ~np.isnan(lats)
+        country_names = find_names_for_points(countries, lats, lngs)
+
+        # Region/Prefecture only for target countries, against that country's points
+        admin_names: Dict[str, np.ndarray] = {
+            level: np.full(len(locations), "", dtype=object) for level in ("region", "prefecture")
+        }
+        has_layers = np.zeros(len(locations), dtype=bool)
+        for country, layers in admin_layers.items():
+            subset = np.flatnonzero(country_names == country)
+            if not len(subset) or not layers:
                 continue
-            coord_str = row.get("Coordonnées", "") or ""
-            coords = parse_coordinates(coord_str)
-            if coords:
-                lat, lng = coords
-                country = find_country_for_coordinates(lat, lng, countries)
-                row["Country"] = country or ""
-                if country:
-                    matched += 1
-                    # Enrich with Region/Prefecture only for target countries
-                    if country in TARGET_COUNTRIES:
-                        layers = admin_layers.get(country)
-                        if layers:
-                            try:
-                                region_val = None
-                                pref_val = None
-                                if "region" in layers:
-                                    region_val = _find_name_for_point(lat, lng, layers["region"])
-                                if "prefecture" in layers:
-                                    pref_val = _find_name_for_point(lat, lng, layers["prefecture"])
-                                if region_val:
-                                    row["Region"] = region_val
-                                else:
-                                    row.pop("Region", None)
-                                if pref_val:
-                                    row["Prefecture"] = pref_val
-                                else:
-                                    row.pop("Prefecture", None)
-                            except Exception as e:
-                                logging.debug("Admin match failed for %s at (%s,%s): %s", country, lat, lng, e)
-                    else:
-                        # Ensure we don't carry empty fields for non-target countries
-                        row.pop("Region", None)
-                        row.pop("Prefecture", None)
-            else:
-                row["Country"] = ""
+            has_layers[subset] = True
+            for level, features in layers.items():
+                admin_names[level][subset] = find_names_for_points(
+                    features, lats[subset], lngs[subset], boundary=True
+                )
+
+        # Write results back row by row
+        for i, row in enumerate(locations):
+            country = country_names[i]
+            row["Country"] = country
+            if not has_coords[i]:
                 # Remove admin fields if no coordinates
                 row.pop("Region", None)
                 row.pop("Prefecture", None)
-            processed += 1
+            elif not country:
+                continue
+            elif country in ADMIN_LAYER_SOURCES:
+                if has_layers[i]:
+                    for level, key in (("region", "Region"), ("prefecture", "Prefecture")):
+                        if admin_names[level][i]:
+                            row[key] = admin_names[level][i]
+                        else:
+                            row.pop(key, None)
+            else:
+                # Ensure we don't carry empty fields for non-target countries
+                row.pop("Region", None)
+                row.pop("Prefecture", None)
+
+        processed = len(locations)
+        matched = int(np.count_nonzero(country_names != ""))
 
         _dump_json(index_path, index_rows, compact)
 
         logging.info("Processed %d locations, matched %d countries, skipped %d non-locations", processed, matched, skipped)
-    return CountryResult(processed=processed, matched=matched, skipped_non_locations=skipped, updated_index_path=index_path)
+    return CountryResult(
+        processed=processed,
+        matched=matched,
+        skipped_non_locations=skipped,
+        updated_index_path=index_path,
+        index_rows=index_rows,
+    )
 
 
 # -------------------------
@@ -499,25 +854,57 @@ def parse_pipe_list(s: str) -> List[str]:
     return [item.strip() for item in s.split("|") if item.strip()]
 
 
-def step_entities(data_dir: Path, entities_dir: Path, *, compact: bool = False) -> Dict[str, int]:
+def index_article_entities(entity_articles: Dict[str, set[str]], article: Dict[str, Any]) -> None:
+    """Add one article's spatial and subject entities to the entity -> article IDs map."""
+    aid = str(article.get("o:id", ""))
+    # Add spatial entities (locations)
+    for spatial in parse_pipe_list(article.get("spatial", "")):
+        entity_articles.setdefault(spatial, set()).add(aid)
+    # Add subject entities (persons, organizations, events, subjects)
+    for subj in parse_pipe_list(article.get("subject", "")):
+        entity_articles.setdefault(subj, set()).add(aid)
+
+
+def articles_file(data_dir: Path) -> Path:
+    """Exported articles file: articles.json or articles.jsonl, whichever is newer."""
+    candidates = [p for p in (data_dir / "articles.json", data_dir / "articles.jsonl") if p.exists()]
+    if not candidates:
+        raise FileNotFoundError(f"articles.json not found in {data_dir}; run 'fetch' step first")
+    return max(candidates, key=lambda p: p.stat().st_mtime)
+
+
+def iter_articles(data_dir: Path) -> Iterator[Dict[str, Any]]:
+    """Iterate exported articles from articles.json or articles.jsonl (whichever is newer)."""
+    path = articles_file(data_dir)
+    with path.open("r", encoding="utf-8") as f:
+        if path.suffix == ".jsonl":
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from json.load(f)
+
+
+def step_entities(
+    data_dir: Path,
+    entities_dir: Path,
+    *,
+    compact: bool = False,
+    entity_articles: Optional[Dict[str, set[str]]] = None,
+    index_data: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, int]:
     with step_timer("Build entity files from articles/index"):
-        articles_path = data_dir / "articles.json"
-        index_path = data_dir / "index.json"
-        with articles_path.open("r", encoding="utf-8") as fa:
-            articles: List[Dict[str, Any]] = json.load(fa)
-        with index_path.open("r", encoding="utf-8") as fi:
-            index_data: List[Dict[str, Any]] = json.load(fi)
-
-        # Build entity -> article IDs map (from article spatial and subject fields)
-        entity_articles: Dict[str, set[str]] = {}
-        for a in articles:
-            aid = str(a.get("o:id", ""))
-            # Add spatial entities (locations)
-            for spatial in parse_pipe_list(a.get("spatial", "")):
-                entity_articles.setdefault(spatial, set()).add(aid)
-            # Add subject entities (persons, organizations, events, subjects)
-            for subj in parse_pipe_list(a.get("subject", "")):
-                entity_articles.setdefault(subj, set()).add(aid)
+        if index_data is None:
+            index_path = data_dir / "index.json"
+            with index_path.open("r", encoding="utf-8") as fi:
+                index_data = json.load(fi)
+
+        # Build entity -> article IDs map (from article spatial and subject fields),
+        # unless a streaming fetch already built it in this run
+        if entity_articles is None:
+            entity_articles = {}
+            for a in iter_articles(data_dir):
+                index_article_entities(entity_articles, a)
 
         # Types mapping
         type_to_file = {
@@ -600,15 +987,30 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--entities-dir", default=str(paths["entities_dir"]), help="Output directory for entities/*.json")
     p.add_argument("--maps-dir", default=str(paths["maps_dir"]), help="Directory containing administrative GeoJSON files")
     p.add_argument("--compact", action="store_true", help="Write compact (minified) JSON to reduce file size")
+    p.add_argument("--stream", action="store_true", help="Fetch: transform and write rows batch by batch (constant memory)")
+    p.add_argument("--batch-size", type=int, default=1000, help="Rows per Arrow record batch in --stream mode")
+    p.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Write articles as JSON Lines (articles.jsonl) instead of a JSON array (implies --stream)",
+    )
     p.add_argument(
         "--steps",
         nargs="*",
         choices=["fetch", "add-countries", "entities"],
         help="Limit to specific steps (default: run all in order)",
     )
+    p.add_argument("--resume", action="store_true", help="Skip steps whose inputs and parameters are unchanged since their checkpoint")
+    p.add_argument("--cache-dir", default=str(paths["cache_dir"]), help="Directory for step checkpoints (pickle)")
+    p.add_argument("--no-cache", action="store_true", help="Do not read or write step checkpoints")
+    p.add_argument("--report", default=None, help="Run report JSON path (default: <cache-dir>/run-report.json)")
     p.add_argument("--log-level", default="INFO", help="Logging level (DEBUG, INFO, WARNING, ERROR)")
     p.add_argument("--log-file", default=None, help="Optional log file path")
-    return p.parse_args()
+    args = p.parse_args()
+    # JSON Lines output is only written by the streaming fetch
+    if args.jsonl:
+        args.stream = True
+    return args
 
 
 def main() -> None:
@@ -627,29 +1029,120 @@ def main() -> None:
     paths = default_paths(script_path)
 
     totals: Dict[str, Any] = {}
+    entity_articles: Optional[Dict[str, set[str]]] = None
+    index_rows: Optional[List[Dict[str, Any]]] = None
+    index_path = data_dir / "index.json"
+
+    cache = None if args.no_cache else StepCache(Path(args.cache_dir).resolve())
+    if args.resume and cache is None:
+        logging.warning("--resume has no effect with --no-cache")
+    step_log: List[Dict[str, Any]] = []
+    started = time.perf_counter()
+
+    def resume(step: str, fingerprint: Optional[str]) -> bool:
+        record = cache.fresh_record(step, fingerprint) if (cache and args.resume) else None
+        if record is None:
+            return False
+        totals.update(record["totals"])
+        step_log.append({"step": step, "status": "skipped", "seconds": 0.0})
+        logging.info("⏭️  Skip: %s (inputs unchanged since last run)", step)
+        return True
+
+    def finish(step: str, t0: float, step_totals: Dict[str, Any], checkpoint: Dict[str, Any]) -> None:
+        totals.update(step_totals)
+        step_log.append({"step": step, "status": "ran", "seconds": round(time.perf_counter() - t0, 3)})
+        if cache:
+            cache.save(step, totals=step_totals, **checkpoint)
 
     logging.info("Preprocess pipeline starting | steps=%s", ",".join(selected_steps))
 
     if "fetch" in selected_steps:
-        res = step_fetch(args.dataset_id, data_dir, compact=args.compact)
-        totals["articles"] = res.articles_count
-        totals["index"] = res.index_count
+        # Only --resume compares the fetch fingerprint, so skip the Hub call otherwise
+        revision = dataset_revision(args.dataset_id) if (cache and args.resume) else None
+        fp = (
+            cache.fingerprint("fetch", [], {
+                "dataset": args.dataset_id,
+                "revision": revision,
+                "compact": args.compact,
+                "jsonl": args.jsonl,
+            })
+            if cache and revision
+            else None
+        )
+        if not resume("fetch", fp):
+            t0 = time.perf_counter()
+            res = step_fetch(
+                args.dataset_id,
+                data_dir,
+                compact=args.compact,
+                stream=args.stream,
+                batch_size=args.batch_size,
+                jsonl=args.jsonl,
+            )
+            entity_articles = res.entity_articles
+            index_rows = res.index_rows
+            finish("fetch", t0, {"articles": res.articles_count, "index": res.index_count}, {
+                "fingerprint": fp,
+                "inputs": {},
+                "outputs": [res.articles_path, res.index_path],
+                "artifacts": {res.articles_path: entity_articles, res.index_path: index_rows},
+            })
 
     if "add-countries" in selected_steps:
-        index_path = data_dir / "index.json"
         if not index_path.exists():
             raise FileNotFoundError(f"index.json not found at {index_path}; run 'fetch' step first or provide correct --out-dir")
-        res2 = step_add_countries(index_path, world_geojson, maps_dir, compact=args.compact)
-        totals["locationsProcessed"] = res2.processed
-        totals["countriesMatched"] = res2.matched
-        totals["nonLocationsSkipped"] = res2.skipped_non_locations
+        geo_inputs = [world_geojson] + (sorted(maps_dir.glob("*.geojson")) if maps_dir and maps_dir.exists() else [])
+        fp = cache.fingerprint("add-countries", [index_path] + geo_inputs, {"compact": args.compact}) if cache else None
+        if not resume("add-countries", fp):
+            t0 = time.perf_counter()
+            raw_hash = file_sha256(index_path) if cache else None
+            if index_rows is None and cache:
+                index_rows = cache.artifact("fetch", index_path)
+            res2 = step_add_countries(index_path, world_geojson, maps_dir, compact=args.compact, index_rows=index_rows)
+            index_rows = res2.index_rows
+            finish("add-countries", t0, {
+                "locationsProcessed": res2.processed,
+                "countriesMatched": res2.matched,
+                "nonLocationsSkipped": res2.skipped_non_locations,
+            }, {
+                "fingerprint": fp,
+                "inputs": {index_path: raw_hash},
+                "outputs": [index_path],
+                "artifacts": {index_path: index_rows},
+            })
 
     if "entities" in selected_steps:
-        counts = step_entities(data_dir, entities_dir, compact=args.compact)
-        totals.update({f"entities_{k}": v for k, v in counts.items()})
+        articles_path = articles_file(data_dir)
+        fp = cache.fingerprint("entities", [index_path, articles_path], {
+            "compact": args.compact,
+            "entities_dir": str(entities_dir),
+        }) if cache else None
+        if not resume("entities", fp):
+            t0 = time.perf_counter()
+            if cache:
+                if entity_articles is None:
+                    entity_articles = cache.artifact("fetch", articles_path)
+                if index_rows is None:
+                    index_rows = cache.artifact("add-countries", index_path) or cache.artifact("fetch", index_path)
+            counts = step_entities(
+                data_dir,
+                entities_dir,
+                compact=args.compact,
+                entity_articles=entity_articles,
+                index_data=index_rows,
+            )
+            finish("entities", t0, {f"entities_{k}": v for k, v in counts.items()}, {
+                "fingerprint": fp,
+                "inputs": {},
+                "outputs": [entities_dir / f"{name}.json" for name in counts],
+            })
 
     logging.info("All steps complete: %s", json.dumps(totals, ensure_ascii=False))
 
+    if cache or args.report:
+        report_path = Path(args.report) if args.report else cache.cache_dir / "run-report.json"  # type: ignore[union-attr]
+        write_run_report(report_path, step_log, totals, started)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Country Focus count cubes (spatial/build_country_focus_counts.py)
+
+Run with: python -m pytest test_country_focus_counts.py -v
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "spatial"))
+
+from build_country_focus_counts import aggregate_cubes, article_facets, write_cubes
+from iwac_utils import COLUMNAR_FORMAT, rle_decode
+
+
+ARTICLES = [
+    {"o:id": 1, "pub_date": "2001-05-03", "country": "Benin"},
+    {"o:id": 2, "pub_date": "", "country": "Togo"},
+    {"o:id": "", "pub_date": "1999", "country": "Benin"},
+]
+
+LOCATIONS = [
+    {
+        "country": "Benin",
+        "region": "Atlantique",
+        "prefecture": "Abomey-Calavi",
+        "relatedArticleIds": [1, 2],
+    },
+    {
+        "country": "Benin",
+        "region": "Atlantique",
+        "prefecture": "Ouidah",
+        "relatedArticleIds": ["1", 3],
+    },
+    {"country": "Niger", "region": "Niamey", "prefecture": "Niamey", "relatedArticleIds": [1]},
+]
+
+
+def make_cubes():
+    return aggregate_cubes(LOCATIONS, article_facets(ARTICLES))
+
+
+def rows(level):
+    names, cube = level
+    return {name: cube[i].ravel().tolist() for i, name in enumerate(names)}
+
+
+class TestArticleFacets:
+    """Tests for the article id -> (year, source) join"""
+
+    def test_undated_and_missing_ids(self):
+        assert article_facets(ARTICLES) == {"1": (2001, "Benin"), "2": (0, "Togo")}
+
+
+class TestAggregateCubes:
+    """Tests for the admin x year x source cubes"""
+
+    def test_axes_include_undated_and_unknown_buckets(self):
+        benin = make_cubes()["Benin"]
+        # Article 3 has no facets: undated (0) with an unknown ("") source
+        assert benin["years"] == [0, 2001]
+        assert benin["sources"] == ["", "Benin", "Togo"]
+
+    def test_article_counts_once_per_region(self):
+        benin = make_cubes()["Benin"]
+        # Article 1 is linked from both Atlantique prefectures; rows are year-major
+        assert rows(benin["regions"]) == {"Atlantique": [1, 0, 1, 0, 1, 0]}
+        assert rows(benin["prefectures"]) == {
+            "Abomey-Calavi": [0, 0, 1, 0, 1, 0],
+            "Ouidah": [1, 0, 0, 0, 1, 0],
+        }
+
+    def test_countries_without_locations(self):
+        cubes = make_cubes()
+        assert set(cubes) == {"Benin", "Burkina Faso", "Côte d'Ivoire", "Togo"}
+        assert cubes["Togo"]["years"] == [0]
+        assert cubes["Togo"]["regions"][0] == []
+
+
+class TestWriteCubes:
+    """Tests for the columnar cube files"""
+
+    def test_rows_flatten_year_major(self, tmp_path):
+        write_cubes(make_cubes(), "2026-01-01T00:00:00", out_dir=tmp_path)
+
+        data = json.loads((tmp_path / "benin_counts_cube.json").read_text(encoding="utf-8"))
+        assert data["format"] == COLUMNAR_FORMAT
+        assert data["country"] == "Benin"
+        block = data["regions"]
+        decode = rle_decode if block["encoding"] == "rle" else list
+        decoded = [decode(row) for row in block["matrix"]]
+        assert block["names"] == ["Atlantique"]
+        # row[y * len(sources) + s]: 2001 x Benin
+        assert decoded[0][1 * len(data["sources"]) + 1] == 1
+        assert decoded == [[1, 0, 1, 0, 1, 0]]
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "benin_counts_cube.json",
+            "burkina_faso_counts_cube.json",
+            "cote_divoire_counts_cube.json",
+            "togo_counts_cube.json",
+        ]
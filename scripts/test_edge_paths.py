@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the precomputed edge geometry (edge_paths.py)
+
+Run with: python -m pytest test_edge_paths.py -v
+"""
+
+import numpy as np
+import pytest
+
+from edge_paths import (
+    bundle_paths,
+    compatible_pairs,
+    edge_paths,
+    great_circle_paths,
+    quantize_path,
+    simplify_paths,
+)
+from geo_proximity import haversine_km
+
+
+def decode(path, header):
+    """Mirror of src/lib/utils/edgePaths.ts."""
+    points = np.cumsum(np.asarray(path).reshape(-1, 2), axis=0) * header["scale"]
+    return points + np.asarray(header["translate"])
+
+
+def parallel_edges():
+    """Two close parallel edges (one reversed) and a perpendicular one."""
+    return np.array([
+        np.linspace([0.0, 0.0], [1.0, 0.0], 9),
+        np.linspace([1.0, 0.1], [0.0, 0.1], 9),
+        np.linspace([1.1, -0.5], [1.1, 0.5], 9),
+    ])
+
+
+class TestGreatCircles:
+    """Tests for great_circle_paths"""
+
+    def test_equator(self):
+        path = great_circle_paths([0], [0], [0], [90], segments=4)[0]
+        assert path == pytest.approx(np.array([[0, 0], [22.5, 0], [45, 0], [67.5, 0], [90, 0]]))
+
+    def test_points_lie_on_the_great_circle(self):
+        # Abidjan -> Paris: every sample splits the total distance
+        path = great_circle_paths([5.36], [-4.01], [48.85], [2.35], segments=8)[0]
+        total = haversine_km(5.36, -4.01, 48.85, 2.35)
+        from_start = haversine_km(5.36, -4.01, path[:, 1], path[:, 0])
+        assert from_start == pytest.approx(np.linspace(0, total, 9), rel=1e-6)
+        # The great circle bulges west of the straight line in longitude/latitude
+        assert path[4, 0] < (-4.01 + 2.35) / 2
+
+    def test_antimeridian_is_continuous(self):
+        lngs = great_circle_paths([10], [170], [10], [-170], segments=4)[0, :, 0]
+        assert np.all(np.diff(lngs) > 0)
+        assert lngs[0] == pytest.approx(170)
+
+    def test_coincident_endpoints(self):
+        path = great_circle_paths([5], [5], [5], [5], segments=2)[0]
+        assert path == pytest.approx(np.full((3, 2), 5.0))
+
+
+class TestBundling:
+    """Tests for compatible_pairs / bundle_paths"""
+
+    def test_compatibility(self):
+        first, second, score = compatible_pairs(parallel_edges()[:, [0, -1]])
+        assert list(zip(first.tolist(), second.tolist())) == [(0, 1)]
+        assert score[0] > 0.8
+
+    def test_compatible_edges_attract(self):
+        paths = parallel_edges()
+        bundled = bundle_paths(paths)
+        # Endpoints fixed, middles pulled together, the incompatible edge untouched
+        assert bundled[:, [0, -1]] == pytest.approx(paths[:, [0, -1]])
+        gap = abs(bundled[0, 4, 1] - bundled[1, 4, 1])
+        assert gap < 0.02
+        assert bundled[2] == pytest.approx(paths[2])
+
+    def test_single_edge_unchanged(self):
+        paths = parallel_edges()[:1]
+        assert bundle_paths(paths) == pytest.approx(paths)
+
+
+class TestEncoding:
+    """Tests for simplify_paths / quantize_path / edge_paths"""
+
+    def test_straight_paths_simplify_to_endpoints(self):
+        simplified = simplify_paths(parallel_edges(), tolerance=0.01)
+        assert [len(p) for p in simplified] == [2, 2, 2]
+
+    def test_quantize_round_trip(self):
+        path = np.array([[-4.0123, 5.3004], [-3.5, 6.25], [-3.5004, 6.2502], [2.35, 12.37]])
+        encoded = quantize_path(path, [-5.0, 5.0], scale=0.001)
+        # The third point collapses onto the second grid cell and is dropped
+        assert len(encoded) == 6
+        assert decode(encoded, {"scale": 0.001, "translate": [-5.0, 5.0]}) == pytest.approx(
+            path[[0, 1, 3]], abs=0.0005
+        )
+
+    def test_edge_paths_keep_endpoints(self):
+        lats, lngs = [5.36, 12.37, 6.37], [-4.01, -1.52, 2.39]
+        result = edge_paths(lats[:2], lngs[:2], lats[1:], lngs[1:], tolerance=0.001)
+        assert result["header"]["bundled"] is False
+        for i, path in enumerate(result["paths"]):
+            points = decode(path, result["header"])
+            assert points[0] == pytest.approx([lngs[i], lats[i]], abs=0.001)
+            assert points[-1] == pytest.approx([lngs[i + 1], lats[i + 1]], abs=0.001)
+            assert len(points) > 2
+
+    def test_empty(self):
+        assert edge_paths([], [], [], [])["paths"] == []
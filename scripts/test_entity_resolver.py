@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the fuzzy entity resolver (entity_resolver.py)
+
+Run with: python -m pytest test_entity_resolver.py -v
+"""
+
+from entity_resolver import FuzzyResolver, match_key, name_similarity
+
+
+ENTITIES = {
+    "Amadou Hampâté Bâ": "per:1",
+    "Cheikh Anta Diop": "per:2",
+    "Forces de Défense et de Sécurité": "org:3",
+    "Union Culturelle Musulmane": "org:4",
+    "Moussa Kone": "per:5",
+    "Moussa Kane": "per:6",
+}
+
+
+def make_resolver(tmp_path=None, **kwargs):
+    return FuzzyResolver(ENTITIES, cache_dir=tmp_path, **kwargs)
+
+
+class TestMatchKey:
+    """Tests for name normalization"""
+
+    def test_strips_accents_case_and_punctuation(self):
+        assert match_key("  Amadou Hampâté-Bâ ") == "amadou hampate ba"
+
+    def test_empty(self):
+        assert match_key("") == ""
+        assert match_key(None) == ""
+
+
+class TestNameSimilarity:
+    """Tests for the pairwise score"""
+
+    def test_word_order_insensitive(self):
+        assert name_similarity("diop cheikh anta", "cheikh anta diop") == 1.0
+
+    def test_initials_expand_with_penalty(self):
+        score = name_similarity("c a diop", "cheikh anta diop")
+        assert 0.9 < score < 1.0
+
+    def test_different_names_score_low(self):
+        assert name_similarity("amadou diallo", "cheikh anta diop") < 0.6
+
+
+class TestFuzzyResolver:
+    """Tests for blocked batch resolution"""
+
+    def test_resolves_spelling_variants(self):
+        matches = make_resolver().resolve_many([
+            "Amadou Hampate Ba",
+            "Diop, Cheikh Anta",
+            "Forces de Defense et de Securite",
+            "Union Culturele Musulmane",
+        ])
+        assert matches == {
+            "Amadou Hampate Ba": "per:1",
+            "Diop, Cheikh Anta": "per:2",
+            "Forces de Defense et de Securite": "org:3",
+            "Union Culturele Musulmane": "org:4",
+        }
+
+    def test_unknown_and_empty_names_unmatched(self):
+        resolver = make_resolver()
+        assert resolver.resolve("Société Générale") is None
+        assert resolver.resolve("") is None
+
+    def test_ambiguous_names_unmatched(self):
+        # Equally close to two different entities
+        assert make_resolver().resolve("Moussa Kine") is None
+
+    def test_shared_key_is_ambiguous(self):
+        resolver = FuzzyResolver({"Diop": "per:1", "DIOP": "per:2"}, cache_dir=None)
+        assert resolver.resolve("Diop.") is None
+
+    def test_cache_round_trip(self, tmp_path):
+        resolver = make_resolver(tmp_path)
+        assert resolver.resolve("Cheikh Anta Diopp") == "per:2"
+        resolver.save_cache()
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        cached = make_resolver(tmp_path)
+        assert cached.cache == {"cheikh anta diopp": "per:2"}
+        assert cached.resolve("Cheikh Anta Diopp") == "per:2"
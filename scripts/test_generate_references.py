@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the references generator helpers (generate_references.py)
+
+Run with: python -m pytest test_generate_references.py -v
+"""
+
+import json
+
+import pandas as pd
+
+from generate_references import (
+    ReferenceRecord,
+    add_fuzzy_matches,
+    build_name_to_id_lookup,
+    country_slug,
+    find_entity_id,
+    generate_authors_data,
+    generate_by_year_data,
+    generate_country_files,
+    generate_publishers_data,
+    partition_by_country,
+)
+
+
+def make_lookup():
+    index_df = pd.DataFrame(
+        {
+            "o:id": [12, 31],
+            "Titre": ["Amadou Diallo", "Cheikh Anta Diop"],
+            "Titre alternatif": ["Diallo Amadou", None],
+            "Type": ["Personnes", "Personnes"],
+        }
+    )
+    return build_name_to_id_lookup(index_df)
+
+
+class TestAddFuzzyMatches:
+    """Tests for fuzzy author/publisher aliasing"""
+
+    def test_alternative_title_is_not_a_rival(self, tmp_path):
+        lookup = make_lookup()
+        assert lookup["diallo amadou"]["o_id"] == "12"
+
+        added = add_fuzzy_matches(lookup, ["Amadou Dialo"], cache_dir=tmp_path)
+
+        assert added == 1
+        assert lookup["amadou dialo"] is lookup["amadou diallo"]
+        assert find_entity_id("Amadou Dialo", lookup, ["Personnes"]) == "12"
+
+    def test_exact_and_unknown_names_are_left_alone(self, tmp_path):
+        lookup = make_lookup()
+        size = len(lookup)
+
+        added = add_fuzzy_matches(lookup, ["Amadou Diallo", "Ousmane Sembène"], cache_dir=tmp_path)
+
+        assert added == 0
+        assert len(lookup) == size
+
+
+def make_records():
+    rows = [
+        ("1", 2001, "Benin", "Article", "Amadou Diallo", ["La Nation"]),
+        ("1", 2001, "Togo", "Article", "Amadou Diallo", ["La Nation"]),
+        ("2", 2003, "Benin", "Livre", "Cheikh Anta Diop", ["Présence Africaine"]),
+        ("2", 2003, "Benin", "Livre", "Amadou Diallo", ["Présence Africaine"]),
+        ("3", None, "Burkina Faso", "Thèse", None, []),
+        ("4", 2010, "Unknown", "Article", "Moussa Kone", ["Sidwaya"]),
+    ]
+    return [
+        ReferenceRecord(
+            pub_id=pub_id,
+            year=year,
+            country=country,
+            type=ref_type,
+            author=author,
+            title=f"Title {pub_id}",
+            publishers_list=publishers,
+            authors_list=[author] if author else [],
+            provenance_list=[],
+        )
+        for pub_id, year, country, ref_type, author, publishers in rows
+    ]
+
+
+def without_timestamps(data):
+    if isinstance(data, dict):
+        return {k: without_timestamps(v) for k, v in data.items() if k != "generated_at"}
+    if isinstance(data, list):
+        return [without_timestamps(v) for v in data]
+    return data
+
+
+class TestGenerateCountryFiles:
+    """Tests for the partitioned per-country outputs"""
+
+    def test_partition_keeps_every_record_once(self):
+        records = make_records()
+        partitions = partition_by_country(records)
+
+        assert list(partitions) == ["Benin", "Togo", "Burkina Faso", "Unknown"]
+        assert sum(map(len, partitions.values())) == len(records)
+
+    def test_matches_filtering_the_full_records(self, tmp_path):
+        records = make_records()
+        lookup = make_lookup()
+        countries = ["Benin", "Togo", "Burkina Faso"]
+
+        generate_country_files(partition_by_country(records), countries, tmp_path, lookup)
+
+        for country in countries:
+            slug = country_slug(country)
+            expected = {
+                f"by-year-{slug}.json": generate_by_year_data(records, country),
+                f"authors-{slug}.json": generate_authors_data(records, country, name_lookup=lookup),
+                f"publishers-{slug}.json": generate_publishers_data(
+                    records, country, name_lookup=lookup
+                ),
+            }
+            for filename, data in expected.items():
+                written = json.loads((tmp_path / filename).read_text(encoding="utf-8"))
+                assert without_timestamps(written) == without_timestamps(data)
+        assert len(list(tmp_path.iterdir())) == 3 * len(countries)
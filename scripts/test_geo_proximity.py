@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the great-circle distance helpers (geo_proximity.py)
+
+Run with: python -m pytest test_geo_proximity.py -v
+"""
+
+import numpy as np
+import pytest
+
+from geo_proximity import (
+    build_tree,
+    chord_to_km,
+    haversine_km,
+    km_to_chord,
+    nearest_neighbors,
+    neighbor_index,
+    pair_distances_km,
+    unit_vectors,
+    within_km,
+)
+
+# Abidjan, Bouaké, Ouagadougou, Bobo-Dioulasso, Cotonou
+LATS = [5.36, 7.69, 12.37, 11.18, 6.37]
+LNGS = [-4.01, -5.03, -1.52, -4.30, 2.39]
+
+
+class TestDistances:
+    """Tests for haversine_km / pair_distances_km"""
+
+    def test_known_distances(self):
+        # One degree of longitude on the equator
+        assert haversine_km(0, 0, 0, 1) == pytest.approx(111.195, abs=0.01)
+        # Abidjan - Ouagadougou, about 826 km
+        assert haversine_km(LATS[0], LNGS[0], LATS[2], LNGS[2]) == pytest.approx(826, abs=5)
+
+    def test_broadcasts(self):
+        d = haversine_km(LATS[0], LNGS[0], np.array(LATS), np.array(LNGS))
+        assert d.shape == (5,)
+        assert d[0] == 0
+
+    def test_pairs_match_scalar_haversine(self):
+        src, dst = [0, 2, 4], [1, 3, 0]
+        expected = [haversine_km(LATS[s], LNGS[s], LATS[t], LNGS[t]) for s, t in zip(src, dst)]
+        assert pair_distances_km(LATS, LNGS, src, dst) == pytest.approx(expected)
+
+    def test_chord_round_trip(self):
+        chord = np.linalg.norm(unit_vectors([LATS[0]], [LNGS[0]]) - unit_vectors([LATS[4]], [LNGS[4]]))
+        km = haversine_km(LATS[0], LNGS[0], LATS[4], LNGS[4])
+        assert chord_to_km(chord) == pytest.approx(km)
+        assert km_to_chord(km) == pytest.approx(chord)
+
+
+class TestProximityIndex:
+    """Tests for nearest_neighbors / within_km / neighbor_index"""
+
+    def test_nearest_matches_brute_force(self):
+        indices, distances = nearest_neighbors(LATS, LNGS, k=2)
+        full = haversine_km(np.array(LATS)[:, None], np.array(LNGS)[:, None], np.array(LATS), np.array(LNGS))
+        np.fill_diagonal(full, np.inf)
+        assert indices.tolist() == np.argsort(full, axis=1)[:, :2].tolist()
+        assert distances == pytest.approx(np.sort(full, axis=1)[:, :2])
+
+    def test_coincident_points_exclude_self(self):
+        indices, distances = nearest_neighbors([0, 0, 0, 10], [0, 0, 0, 10], k=2)
+        for i, row in enumerate(indices.tolist()):
+            assert i not in row
+        assert distances[0] == pytest.approx([0, 0])
+
+    def test_k_capped_by_point_count(self):
+        indices, _ = nearest_neighbors(LATS[:3], LNGS[:3], k=5)
+        assert indices.shape == (3, 2)
+        assert nearest_neighbors([1.0], [1.0])[0].shape == (1, 0)
+
+    def test_within_radius(self):
+        tree = build_tree(LATS, LNGS)
+        # From Abidjan: Bouaké ~283 km, Bobo-Dioulasso ~648 km, Cotonou ~717 km
+        assert within_km(tree, LATS[0], LNGS[0], 300).tolist() == [0, 1]
+        assert within_km(tree, LATS[0], LNGS[0], 700).tolist() == [0, 1, 3]
+
+    def test_export(self):
+        index = neighbor_index(LATS, LNGS, k=1)
+        assert index["k"] == 1
+        assert index["neighbors"] == [[1], [0], [3], [2], [0]]
+        assert all(len(row) == 1 for row in index["distanceKm"])
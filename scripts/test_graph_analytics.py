@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the sparse graph analytics (graph_analytics.py)
+
+Run with: python -m pytest test_graph_analytics.py -v
+"""
+
+import numpy as np
+from scipy import sparse
+
+from graph_analytics import (
+    adjacency_matrix,
+    core_numbers,
+    disparity_filter,
+    disparity_pvalues,
+    louvain_communities,
+    modularity,
+    pagerank,
+    top_k_similar,
+)
+
+
+def two_cliques(size=6):
+    """Two cliques of ``size`` nodes joined by a single bridge edge."""
+    src, dst = [], []
+    for base in (0, size):
+        for i in range(base, base + size):
+            for j in range(i + 1, base + size):
+                src.append(i)
+                dst.append(j)
+    src.append(0)
+    dst.append(size)
+    return 2 * size, src, dst
+
+
+class TestAdjacency:
+    """Tests for the CSR builder"""
+
+    def test_symmetric_sums_parallel_and_drops_loops(self):
+        adj = adjacency_matrix(3, [0, 0, 1, 2], [1, 1, 2, 2], [1.0, 2.0, 4.0, 9.0])
+        dense = adj.toarray()
+        assert dense.tolist() == [[0, 3, 0], [3, 0, 4], [0, 4, 0]]
+
+
+class TestPageRank:
+    """Tests for weighted PageRank"""
+
+    def test_star_centre_ranks_first(self):
+        adj = adjacency_matrix(5, [0, 0, 0, 0], [1, 2, 3, 4])
+        ranks = pagerank(adj)
+        assert np.isclose(ranks.sum(), 1.0)
+        assert ranks.argmax() == 0
+        assert np.allclose(ranks[1:], ranks[1])
+
+    def test_weights_shift_rank(self):
+        adj = adjacency_matrix(3, [0, 0], [1, 2], [1.0, 10.0])
+        ranks = pagerank(adj)
+        assert ranks[2] > ranks[1]
+
+    def test_isolated_nodes_keep_teleport_mass(self):
+        ranks = pagerank(adjacency_matrix(3, [0], [1]))
+        assert np.isclose(ranks.sum(), 1.0)
+        assert ranks[2] > 0
+
+
+class TestCoreNumbers:
+    """Tests for batched k-core peeling"""
+
+    def test_clique_with_tail(self):
+        # 4-clique (core 3), a pendant path 3-4-5 (core 1) and an isolated node
+        src = [0, 0, 0, 1, 1, 2, 3, 4]
+        dst = [1, 2, 3, 2, 3, 3, 4, 5]
+        cores = core_numbers(adjacency_matrix(7, src, dst))
+        assert cores.tolist() == [3, 3, 3, 3, 1, 1, 0]
+
+
+class TestDisparityFilter:
+    """Tests for the disparity backbone"""
+
+    def test_pvalue_formula(self):
+        # Node 0: degree 3, strength 10; edge 0-1 carries 8/10
+        p = disparity_pvalues(4, [0, 0, 0], [1, 2, 3], [8.0, 1.0, 1.0])
+        assert np.isclose(p[0], (1 - 0.8) ** 2)
+        assert np.isclose(p[1], 0.9 ** 2)
+
+    def test_keeps_dominant_tie_around_hub(self):
+        # Hub 0 with one strong tie and many weak ones
+        src = [0] * 11
+        dst = list(range(1, 12))
+        weight = [50.0] + [1.0] * 10
+        keep = disparity_filter(12, src, dst, weight, alpha=0.05)
+        assert keep.tolist() == [True] + [False] * 10
+
+    def test_lone_edges_are_not_significant(self):
+        assert disparity_filter(2, [0], [1], [5.0]).tolist() == [False]
+
+
+class TestLouvain:
+    """Tests for vectorized Louvain communities"""
+
+    def test_finds_planted_cliques(self):
+        n, src, dst = two_cliques()
+        adj = adjacency_matrix(n, src, dst)
+        communities = louvain_communities(adj)
+        assert len(set(communities[:6])) == 1
+        assert len(set(communities[6:])) == 1
+        assert communities[0] != communities[6]
+        assert modularity(adj, communities) > 0.4
+
+    def test_deterministic_for_seed(self):
+        rng = np.random.default_rng(3)
+        src, dst = rng.integers(0, 200, (2, 800))
+        adj = adjacency_matrix(200, src, dst)
+        a = louvain_communities(adj, seed=5)
+        b = louvain_communities(adj, seed=5)
+        assert np.array_equal(a, b)
+        # Numbered by decreasing size
+        sizes = np.bincount(a)
+        assert (np.diff(sizes) <= 0).all()
+
+    def test_modularity_of_single_community_is_zero(self):
+        n, src, dst = two_cliques()
+        adj = adjacency_matrix(n, src, dst)
+        assert np.isclose(modularity(adj, np.zeros(n, dtype=np.int64)), 0.0)
+
+
+class TestTopKSimilar:
+    """Tests for blocked top-k similarity"""
+
+    def setup_method(self):
+        # Groups x items: item 0 and 1 share 2 groups, item 2 shares 1 with item 0
+        self.incidence = sparse.csc_matrix(np.array([
+            [1, 1, 0, 0],
+            [1, 1, 1, 0],
+            [1, 0, 0, 0],
+            [0, 0, 0, 1],
+        ]))
+
+    def test_cosine_ranking(self):
+        neighbours, scores, shared = top_k_similar(self.incidence, k=2, block_size=1)
+        assert neighbours[0].tolist() == [1, 2]
+        assert np.isclose(scores[0, 0], 2 / np.sqrt(3 * 2))
+        assert shared[0].tolist() == [2, 1]
+        # Item 3 shares nothing
+        assert neighbours[3].tolist() == [-1, -1]
+
+    def test_jaccard_and_min_shared(self):
+        neighbours, scores, _ = top_k_similar(self.incidence, k=2, metric="jaccard", min_shared=2)
+        assert neighbours[0].tolist() == [1, -1]
+        assert np.isclose(scores[0, 0], 2 / 3)
+
+    def test_blocks_match_single_block(self):
+        incidence = sparse.random(300, 80, density=0.05, random_state=2, format="csc")
+        _, small, _ = top_k_similar(incidence, k=5, block_size=7)
+        _, whole, _ = top_k_similar(incidence, k=5, block_size=1000)
+        np.testing.assert_allclose(small, whole)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the binary graph export (graph_binary.py)
+
+Run with: python -m pytest test_graph_binary.py -v
+"""
+
+import json
+import struct
+
+import pytest
+
+from graph_binary import ALIGN, MAGIC, decode_graph, encode_graph, save_graph_binary
+
+
+def header_of(data):
+    (length,) = struct.unpack_from("<I", data, len(MAGIC))
+    return json.loads(data[len(MAGIC) + 4:len(MAGIC) + 4 + length])
+
+
+def column(header, table, *path):
+    return next(c for c in header[table] if c["path"] == list(path))
+
+
+def sample_graph(n=10):
+    nodes = [
+        {
+            "id": f"per:{i}",
+            "type": "Person" if i % 3 else "Organization",
+            "label": f"Name {i}",
+            "count": i * 10,
+            "properties": {"firstOccurrence": f"20{i:02d}-03", "countries": ["Niger", "Togo"][: i % 3]},
+        }
+        for i in range(1, n + 1)
+    ]
+    nodes[0]["x"] = 1.5
+    edges = [
+        {"source": "per:1", "target": f"per:{j}", "type": "related_to", "weight": j, "articleIds": [str(1000 + j)]}
+        for j in range(2, n + 1)
+    ]
+    return {"nodes": nodes, "edges": edges, "meta": {"totalNodes": n}}
+
+
+class TestRoundTrip:
+    """Tests for encode_graph / decode_graph"""
+
+    def test_restores_records(self):
+        graph = sample_graph()
+        assert decode_graph(encode_graph(graph)) == graph
+
+    def test_missing_keys_stay_missing(self):
+        decoded = decode_graph(encode_graph(sample_graph()))
+        assert decoded["nodes"][0]["x"] == 1.5
+        assert all("x" not in node for node in decoded["nodes"][1:])
+
+    def test_float32_and_float64_columns(self):
+        graph = {
+            "nodes": [{"id": "a", "norm": 0.1, "stamp": 0.5}, {"id": "b", "norm": 0.25, "stamp": 2**24 + 1}],
+            "edges": [],
+        }
+        data = encode_graph(graph)
+        header = header_of(data)
+        assert column(header, "nodes", "norm")["dtype"] == "float32"
+        assert column(header, "nodes", "stamp")["dtype"] == "float64"
+        nodes = decode_graph(data)["nodes"]
+        assert nodes[0]["norm"] == pytest.approx(0.1, rel=1e-6)
+        assert nodes[1]["stamp"] == 2**24 + 1
+
+    def test_empty_graph(self):
+        graph = {"nodes": [], "edges": [], "meta": {}}
+        assert decode_graph(encode_graph(graph)) == graph
+
+    def test_mixed_values_fall_back_to_json(self):
+        graph = {"nodes": [{"id": "a", "v": 1}, {"id": "b", "v": "x"}, {"id": "c", "v": None}], "edges": []}
+        data = encode_graph(graph)
+        assert column(header_of(data), "nodes", "v")["kind"] == "json"
+        assert decode_graph(data) == graph
+
+
+class TestEncoding:
+    """Tests for the column encodings"""
+
+    def test_column_kinds(self):
+        header = header_of(encode_graph(sample_graph()))
+        assert column(header, "nodes", "id")["kind"] == "tagged"
+        assert column(header, "nodes", "type")["kind"] == "category"
+        assert column(header, "nodes", "count")["dtype"] == "uint32"
+        assert column(header, "nodes", "properties", "firstOccurrence")["kind"] == "date"
+        assert column(header, "edges", "source")["kind"] == "node"
+        assert column(header, "edges", "articleIds")["items"]["kind"] == "digits"
+
+    def test_non_iso_dates_kept_as_others(self):
+        dates = [f"{1990 + i}" for i in range(9)] + ["1997-09/1997-10"]
+        graph = {"nodes": [{"id": f"n{i}", "date": d} for i, d in enumerate(dates)], "edges": []}
+        data = encode_graph(graph)
+        assert column(header_of(data), "nodes", "date")["others"] == {"9": "1997-09/1997-10"}
+        assert decode_graph(data) == graph
+
+    def test_unknown_endpoints_not_index_coded(self):
+        graph = {"nodes": [{"id": "a"}], "edges": [{"source": "a", "target": "zz"}]}
+        data = encode_graph(graph)
+        assert column(header_of(data), "edges", "target")["kind"] == "json"
+        assert decode_graph(data) == graph
+
+    def test_arrays_are_aligned(self):
+        data = encode_graph(sample_graph())
+        header = header_of(data)
+        (length,) = struct.unpack_from("<I", data, len(MAGIC))
+        assert (len(MAGIC) + 4 + length) % ALIGN == 0
+        assert all(c["offset"] % ALIGN == 0 for c in header["nodes"] + header["edges"] if "offset" in c)
+
+    def test_smaller_than_json(self):
+        graph = sample_graph(200)
+        assert len(encode_graph(graph)) * 2 < len(json.dumps(graph, separators=(",", ":")))
+
+
+class TestIO:
+    """Tests for save_graph_binary and decoding errors"""
+
+    def test_save_creates_directories(self, tmp_path):
+        path = tmp_path / "nested" / "graph.bin"
+        save_graph_binary(sample_graph(), path, log=False)
+        assert decode_graph(path.read_bytes()) == sample_graph()
+
+    def test_rejects_other_files(self):
+        with pytest.raises(ValueError, match="bad magic"):
+            decode_graph(b'{"nodes": []}')
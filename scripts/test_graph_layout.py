@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the ForceAtlas2 layout (graph_layout.py)
+
+Run with: python -m pytest test_graph_layout.py -v
+"""
+
+import numpy as np
+
+from graph_layout import (
+    _repulsion_barnes_hut,
+    _repulsion_exact,
+    assign_positions,
+    forceatlas2_layout,
+    morton_codes,
+)
+
+
+class TestMortonCodes:
+    """Tests for Z-order cell codes"""
+
+    def test_quadrant_order(self):
+        pos = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+        assert morton_codes(pos, depth=1).tolist() == [0, 1, 2, 3]
+
+
+class TestRepulsion:
+    """Tests for the Barnes-Hut approximation"""
+
+    def setup_method(self):
+        rng = np.random.default_rng(0)
+        self.pos = rng.random((400, 2)) * 100
+        self.pos[1] = self.pos[0]  # coincident nodes must not blow up
+        self.mass = 1.0 + rng.integers(0, 5, 400)
+
+    def test_matches_exact_with_small_theta(self):
+        exact = _repulsion_exact(self.pos, self.mass, 2.0)
+        approx = _repulsion_barnes_hut(self.pos, self.mass, 2.0, theta=1e-6)
+        np.testing.assert_allclose(approx, exact, rtol=1e-9, atol=1e-9)
+
+    def test_close_to_exact_with_default_theta(self):
+        exact = _repulsion_exact(self.pos, self.mass, 2.0)
+        approx = _repulsion_barnes_hut(self.pos, self.mass, 2.0, theta=0.5)
+        error = np.linalg.norm(approx - exact, axis=1) / np.linalg.norm(exact, axis=1)
+        assert np.median(error) < 0.01
+        assert np.isfinite(approx).all()
+
+
+class TestForceAtlas2Layout:
+    """Tests for the full layout loop"""
+
+    def two_cliques(self):
+        src, dst = [], []
+        for base in (0, 20):
+            for i in range(base, base + 20):
+                for j in range(i + 1, base + 20):
+                    src.append(i)
+                    dst.append(j)
+        src.append(0)
+        dst.append(20)
+        return src, dst
+
+    def test_deterministic_for_seed(self):
+        src, dst = self.two_cliques()
+        a = forceatlas2_layout(40, src, dst, iterations=30, seed=7)
+        b = forceatlas2_layout(40, src, dst, iterations=30, seed=7)
+        c = forceatlas2_layout(40, src, dst, iterations=30, seed=8)
+        assert np.array_equal(a, b)
+        assert not np.array_equal(a, c)
+
+    def test_separates_communities(self):
+        src, dst = self.two_cliques()
+        pos = forceatlas2_layout(40, src, dst, iterations=200)
+        within = np.linalg.norm(pos[:20] - pos[:20].mean(axis=0), axis=1).mean()
+        between = np.linalg.norm(pos[:20].mean(axis=0) - pos[20:].mean(axis=0))
+        assert between > 2 * within
+
+    def test_barnes_hut_and_exact_agree(self):
+        src, dst = self.two_cliques()
+        exact = forceatlas2_layout(40, src, dst, iterations=20, barnes_hut=False)
+        approx = forceatlas2_layout(40, src, dst, iterations=20, barnes_hut=True, theta=1e-6)
+        np.testing.assert_allclose(approx, exact, rtol=1e-6, atol=1e-6)
+
+    def test_empty_graph(self):
+        assert forceatlas2_layout(0, [], []).shape == (0, 2)
+
+
+class TestAssignPositions:
+    """Tests for writing x/y onto node dicts"""
+
+    def test_rounds_positions(self):
+        nodes = [{"id": "a"}, {"id": "b"}]
+        assign_positions(nodes, np.array([[1.234, -5.678], [0.0, 2.0]]))
+        assert nodes == [{"id": "a", "x": 1.23, "y": -5.68}, {"id": "b", "x": 0.0, "y": 2.0}]
@@ -16,8 +16,10 @@ import pandas as pd
 import pytest
 
 from iwac_utils import (
+    COLUMNAR_FORMAT,
     DATASET_ID,
     SUBSETS,
+    build_columnar_series,
     configure_logging,
     copy_to_build,
     create_metadata_block,
@@ -31,6 +33,9 @@ from iwac_utils import (
     parse_coordinates,
     parse_multi_value,
     parse_pipe_separated,
+    rle_decode,
+    rle_encode,
+    save_columnar_json,
     save_json,
 )
 
@@ -355,6 +360,61 @@ class TestSaveJson:
             assert path.exists()
 
 
+# =============================================================================
+# Test columnar series helpers
+# =============================================================================
+
+class TestRunLengthEncoding:
+    """Tests for rle_encode and rle_decode functions."""
+
+    def test_encode_runs(self):
+        assert rle_encode([0, 0, 0, 5, 5, 1]) == [0, 3, 5, 2, 1, 1]
+
+    def test_encode_empty(self):
+        assert rle_encode([]) == []
+
+    def test_roundtrip(self):
+        values = [0, 0, 1, 0, 0, 0, 0, 7, 7]
+        assert rle_decode(rle_encode(values)) == values
+
+
+class TestBuildColumnarSeries:
+    """Tests for build_columnar_series function."""
+
+    def test_dense_block(self):
+        block = build_columnar_series({"a": [1, 2], "b": [0, 3]}, encoding="dense")
+        assert block == {"names": ["a", "b"], "encoding": "dense", "matrix": [[1, 2], [0, 3]]}
+
+    def test_preserves_name_order(self):
+        block = build_columnar_series({"z": [1], "a": [2]})
+        assert block["names"] == ["z", "a"]
+
+    def test_auto_picks_rle_for_sparse_rows(self):
+        block = build_columnar_series({"a": [0] * 20 + [4]})
+        assert block["encoding"] == "rle"
+        assert block["matrix"] == [[0, 20, 4, 1]]
+
+    def test_auto_keeps_dense_for_varied_rows(self):
+        block = build_columnar_series({"a": [1, 2, 3, 4]})
+        assert block["encoding"] == "dense"
+
+    def test_invalid_encoding(self):
+        with pytest.raises(ValueError):
+            build_columnar_series({"a": [1]}, encoding="zip")
+
+
+class TestSaveColumnarJson:
+    """Tests for save_columnar_json function."""
+
+    def test_writes_format_tag_minified(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "series.json"
+            save_columnar_json({"axis": [2020]}, path, log=False)
+
+            content = path.read_text()
+            assert content == '{"format":"%s","axis":[2020]}' % COLUMNAR_FORMAT
+
+
 # =============================================================================
 # Test copy_to_build
 # =============================================================================
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared network builder (network_builder.py)
+
+Run with: python -m pytest test_network_builder.py -v
+"""
+
+import numpy as np
+import pytest
+
+from network_builder import NetworkBuilder
+
+
+def make_builder(memberships):
+    """Builder over nodes a..d with (group, node) memberships."""
+    builder = NetworkBuilder()
+    for name in "abcd":
+        builder.add_node(f"n:{name}", type="n", label=name.upper(), count=1)
+    for group, name in memberships:
+        builder.add_membership(group, builder.code(f"n:{name}"))
+    return builder
+
+
+class TestNetworkBuilderNodes:
+    """Tests for node registration"""
+
+    def test_codes_follow_insertion_order(self):
+        builder = NetworkBuilder()
+        assert builder.add_node("x:1", label="One") == 0
+        assert builder.add_node("x:2", label="Two") == 1
+        assert builder.add_node("x:1", label="Ignored") == 0
+        assert builder.nodes[0] == {"id": "x:1", "label": "One"}
+        assert builder.code("x:3") is None
+
+
+class TestCooccurrenceEdges:
+    """Tests for co-occurrence edge accumulation"""
+
+    def test_weights_count_shared_groups(self):
+        builder = make_builder([("1", "a"), ("1", "b"), ("2", "a"), ("2", "b"), ("2", "c")])
+        builder.add_cooccurrence_edges(edge_type="n-n")
+        builder.sort_edges_by_weight()
+        assert builder.src.tolist() == [0, 0, 1]
+        assert builder.dst.tolist() == [1, 2, 2]
+        assert builder.weight.tolist() == [2, 1, 1]
+
+    def test_repeated_membership_counts_once(self):
+        builder = make_builder([("1", "a"), ("1", "a"), ("1", "b")])
+        builder.add_cooccurrence_edges()
+        assert builder.weight.tolist() == [1]
+
+    def test_cross_sets_and_merge(self):
+        builder = make_builder([("1", "a"), ("1", "c"), ("1", "d")])
+        builder.add_cooccurrence_edges([0], [2, 3], "first")
+        builder.add_cooccurrence_edges([0, 2], edge_type="second")
+        builder.merge_parallel_edges()
+        assert list(zip(builder.src.tolist(), builder.dst.tolist())) == [(0, 2), (0, 3)]
+        assert builder.weight.tolist() == [2, 1]
+        assert [builder.edge_types[k] for k in builder.edge_type_codes] == ["first", "first"]
+
+    def test_shared_groups_in_first_seen_order(self):
+        builder = make_builder([("9", "a"), ("9", "b"), ("3", "a"), ("3", "b")])
+        assert builder.shared_groups(0, 1) == ["9", "3"]
+
+
+class TestSlices:
+    """Tests for per-slice weights over group subsets"""
+
+    def test_slices_split_weights(self):
+        builder = make_builder([("1", "a"), ("1", "b"), ("2", "a"), ("2", "b"), ("2", "c")])
+        builder.add_cooccurrence_edges()
+        builder.sort_edges_by_weight()
+        selector = np.array([[1, 0], [0, 1], [1, 1]])
+        weights = builder.sliced_edge_weights(selector).toarray()
+        assert weights.tolist() == [[1, 0, 0], [1, 1, 1], [2, 1, 1]]
+        counts = builder.sliced_node_counts(selector).toarray()
+        assert counts.tolist() == [[1, 1, 0, 0], [1, 1, 1, 0], [2, 2, 1, 0]]
+
+
+class TestMetrics:
+    """Tests for vectorized degree/strength/priority"""
+
+    @pytest.fixture
+    def builder(self):
+        builder = make_builder([])
+        builder.add_edges([0, 0, 1], [1, 2, 2], [3, 1, 2])
+        return builder
+
+    def test_degree_and_strength(self, builder):
+        assert builder.degree().tolist() == [2, 2, 2, 0]
+        assert builder.strength().tolist() == [4, 5, 3, 0]
+
+    def test_prune(self, builder):
+        builder.prune(2)
+        assert builder.edge_count == 2
+        assert builder.connected().tolist() == [0, 1, 2]
+
+    def test_backbone_keeps_significant_edges(self):
+        builder = NetworkBuilder()
+        for i in range(12):
+            builder.add_node(f"n:{i}")
+        builder.add_edges([0] * 11, list(range(1, 12)), [50] + [1] * 10)
+        builder.backbone(0.05)
+        assert list(zip(builder.src.tolist(), builder.dst.tolist())) == [(0, 1)]
+
+    def test_weight_norm_modes(self, builder):
+        assert builder.weight_norm("max", 4).tolist() == [1.0, 0.3333, 0.6667]
+        assert builder.weight_norm("range").tolist() == [1.0, 0.0, 0.5]
+        with pytest.raises(ValueError):
+            builder.weight_norm("log")
+
+    def test_priority_rank_ties_by_code(self, builder):
+        priority = builder.priority_rank(np.array([5, 9, 5, 100]), start=1)
+        assert priority.tolist() == [2, 1, 3, -1]
+
+    def test_metric_summary(self, builder):
+        summary = builder.metric_summary(decimals=2)
+        assert summary["degree"] == {"min": 2, "max": 2, "mean": 2.0}
+        assert summary["strength"] == {"min": 3, "max": 5, "mean": 4.0}
+
+
+class TestSerialize:
+    """Tests for the Sigma.js serializer"""
+
+    def test_shape_and_isolated_nodes(self):
+        builder = make_builder([("1", "a"), ("1", "b")])
+        builder.add_cooccurrence_edges(edge_type="n-n")
+        network = builder.serialize(priority=builder.priority_rank(builder.strength()), article_ids=True)
+        assert [n["id"] for n in network["nodes"]] == ["n:a", "n:b"]
+        assert network["nodes"][0] == {
+            "id": "n:a", "type": "n", "label": "A", "count": 1,
+            "degree": 1, "strength": 1, "labelPriority": 0,
+        }
+        assert network["edges"] == [{
+            "source": "n:a", "target": "n:b", "type": "n-n",
+            "weight": 1, "articleIds": ["1"], "weightNorm": 1.0,
+        }]
+
+    def test_float_weights_and_priority_order(self):
+        builder = make_builder([])
+        builder.add_edge(0, 1, 0.25)
+        builder.add_edge(0, 2, 0.75)
+        network = builder.serialize(
+            priority=builder.priority_rank(builder.strength()),
+            order_by_priority=True,
+            drop_isolated=False,
+            strength_decimals=2,
+        )
+        assert [n["id"] for n in network["nodes"]] == ["n:a", "n:c", "n:b", "n:d"]
+        assert network["nodes"][0]["strength"] == 1.0
+        assert "type" not in network["edges"][0]
+        assert network["edges"][0]["weight"] == 0.25
+
+    def test_empty_network(self):
+        network = make_builder([]).serialize()
+        assert network == {"nodes": [], "edges": []}
+
+    def test_layout_positions(self):
+        builder = make_builder([("1", "a"), ("1", "b"), ("2", "b"), ("2", "c")])
+        builder.add_cooccurrence_edges()
+        builder.compute_layout(iterations=5, seed=1)
+        network = builder.serialize()
+        assert [n["id"] for n in network["nodes"]] == ["n:a", "n:b", "n:c"]
+        assert all(isinstance(n["x"], float) and isinstance(n["y"], float) for n in network["nodes"])
+        assert np.isnan(builder.positions[3]).all()
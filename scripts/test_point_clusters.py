@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the precomputed marker clustering (point_clusters.py)
+
+Run with: python -m pytest test_point_clusters.py -v
+"""
+
+import numpy as np
+import pytest
+
+from point_clusters import build_clusters, cluster_counts, cluster_records, inverse_mercator, mercator
+
+
+def two_towns():
+    """Two groups of three points (Abidjan, Ouagadougou areas) and one far point."""
+    lngs = [-4.0, -4.01, -3.99, -1.5, -1.51, -1.49, 100.0]
+    lats = [5.3, 5.31, 5.29, 12.4, 12.41, 12.39, 10.0]
+    weights = [50, 5, 1, 20, 2, 2, 7]
+    return lngs, lats, weights
+
+
+def ranges(level, n):
+    bounds = level["start"] + [n]
+    return [(a, b) for a, b in zip(bounds, bounds[1:])]
+
+
+class TestProjection:
+    """Tests for mercator / inverse_mercator"""
+
+    def test_round_trip(self):
+        lnglat = np.array([[-4.0, 5.3], [100.0, -33.9], [0.0, 0.0]])
+        xy = mercator(lnglat[:, 0], lnglat[:, 1])
+        assert xy[2] == pytest.approx([0.5, 0.5])
+        assert inverse_mercator(xy) == pytest.approx(lnglat)
+
+
+class TestBuildClusters:
+    """Tests for build_clusters"""
+
+    def test_leaves_are_a_permutation(self):
+        lngs, lats, weights = two_towns()
+        index = build_clusters(lngs, lats, weights)
+        assert sorted(index["leaves"]) == list(range(len(lngs)))
+
+    def test_levels_tile_the_leaves_and_nest(self):
+        lngs, lats, weights = two_towns()
+        index = build_clusters(lngs, lats, weights)
+        n = len(lngs)
+        previous = None
+        for level in index["levels"]:
+            assert level["start"][0] == 0
+            assert level["start"] == sorted(set(level["start"]))
+            if previous is not None:
+                # Every coarser boundary is also a boundary one zoom in
+                assert set(previous["start"]) <= set(level["start"])
+            previous = level
+        assert len(ranges(index["levels"][-1], n)) < n
+
+    def test_towns_merge_at_low_zoom_and_split_later(self):
+        lngs, lats, weights = two_towns()
+        index = build_clusters(lngs, lats, weights, max_zoom=16)
+        by_zoom = {level["zoom"]: level for level in index["levels"]}
+        assert len(by_zoom[0]["start"]) <= 2
+        assert len(by_zoom[6]["start"]) == 3
+        assert index["maxZoom"] < 16
+
+    def test_cluster_at_weighted_centroid(self):
+        index = build_clusters([0.0, 1.0], [0.0, 0.0], [3, 1], max_zoom=0)
+        level = index["levels"][0]
+        assert level["lng"] == [pytest.approx(0.25, abs=1e-4)]
+        assert index["leaves"] == [0, 1]
+
+    def test_no_merges_means_no_levels(self):
+        index = build_clusters([-170.0, 170.0], [0.0, 0.0], max_zoom=3)
+        assert index["levels"] == []
+        assert index["maxZoom"] == -1
+
+    def test_empty(self):
+        assert build_clusters([], [])["leaves"] == []
+
+
+class TestCounts:
+    """Tests for cluster_counts / cluster_records"""
+
+    def test_filtered_counts_by_prefix_sums(self):
+        lngs, lats, weights = two_towns()
+        index = build_clusters(lngs, lats, weights)
+        level = next(l for l in index["levels"] if len(l["start"]) == 3)
+        counts = cluster_counts(level, index["leaves"], weights)
+        assert sorted(counts.tolist()) == [7, 24, 56]
+
+        filtered = [0, 0, 0, 1, 1, 0, 2]
+        assert sorted(cluster_counts(level, index["leaves"], filtered).tolist()) == [0, 2, 2]
+
+    def test_records_without_coordinates_skipped(self):
+        records = [{"name": "a", "count": 3}, {"name": "b", "count": 2, "lat": 5.0, "lng": -4.0},
+                   {"name": "c", "count": 1, "lat": 5.001, "lng": -4.001}]
+        index = cluster_records(records, "count")
+        assert sorted(index["leaves"]) == [1, 2]
+        assert index["levels"][0]["start"] == [0]
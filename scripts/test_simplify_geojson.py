@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the TopoJSON map simplification (simplify_geojson.py)
+
+Run with: python -m pytest test_simplify_geojson.py -v
+"""
+
+import numpy as np
+
+from simplify_geojson import (
+    build_topology,
+    encode_topology,
+    find_junctions,
+    ring_size,
+    simplify_level,
+    visvalingam_areas,
+)
+
+
+def square(x0, y0, size=1.0, steps=1):
+    """Closed square ring with ``steps`` points per side."""
+    side = [i * size / steps for i in range(steps)]
+    ring = (
+        [[x0 + s, y0] for s in side]
+        + [[x0 + size, y0 + s] for s in side]
+        + [[x0 + size - s, y0 + size] for s in side]
+        + [[x0, y0 + size - s] for s in side]
+    )
+    return ring + [ring[0]]
+
+
+def feature(name, *rings):
+    return {"type": "Feature", "properties": {"name": name}, "geometry": {"type": "Polygon", "coordinates": list(rings)}}
+
+
+def decode(topology, name):
+    """Rings of each geometry as lists of absolute grid points."""
+    arcs = [np.cumsum(np.array(a), axis=0) for a in topology["arcs"]]
+
+    def ring(refs):
+        points = []
+        for r in refs:
+            arc = arcs[r] if r >= 0 else arcs[~r][::-1]
+            points.extend(arc[1:].tolist() if points else arc.tolist())
+        return points
+
+    result = []
+    for g in topology["objects"][name]["geometries"]:
+        polygons = [g["arcs"]] if g["type"] == "Polygon" else g.get("arcs") or []
+        result.append([[ring(r) for r in poly] for poly in polygons])
+    return result
+
+
+class TestTopology:
+    """Tests for junctions and shared arcs"""
+
+    def test_junctions_where_rings_diverge(self):
+        west = [(0, 0), (1, 0), (1, 1), (0, 1)]
+        east = [(1, 0), (2, 0), (2, 1), (1, 1)]
+        assert find_junctions([west, east]) == {(1, 0), (1, 1)}
+
+    def test_shared_border_is_one_arc(self):
+        features = [feature("West", square(0, 0, steps=4)), feature("East", square(1, 0, steps=4))]
+        arcs, shapes, _, _ = build_topology(features, quantization=9)
+        west, east = (s["polygons"][0][0][0] for s in shapes)
+        shared = set(west) & {~r for r in east}
+        assert len(arcs) == 3
+        assert len(shared) == 1
+
+    def test_isolated_ring_is_one_closed_arc(self):
+        arcs, shapes, _, _ = build_topology([feature("Island", square(0, 0, steps=3))], quantization=10)
+        assert len(arcs) == 1
+        assert (arcs[0][0] == arcs[0][-1]).all()
+
+    def test_properties_filtered(self):
+        f = feature("A", square(0, 0))
+        f["properties"]["extra"] = 1
+        _, shapes, _, _ = build_topology([f], quantization=10, properties=["name"])
+        assert shapes[0]["properties"] == {"name": "A"}
+
+
+class TestSimplification:
+    """Tests for Visvalingam levels"""
+
+    def test_areas_fix_ends(self):
+        areas = visvalingam_areas(np.array([[0, 0], [1, 0], [2, 0], [3, 2], [4, 0]]))
+        assert areas.tolist() == [np.inf, 0.0, 2.0, 4.0, np.inf]
+
+    def test_areas_are_monotonic(self):
+        # (2, 0) ends up collinear (area 0) but is removed after (1, 2), area 2
+        areas = visvalingam_areas(np.array([[0, 0], [1, 2], [2, 0], [3, 0], [10, 0]]))
+        assert areas.tolist() == [np.inf, 2.0, 2.0, 0.0, np.inf]
+
+    def test_levels_are_nested_and_shared_borders_identical(self):
+        features = [feature("West", square(0, 0, steps=20)), feature("East", square(1, 0, steps=20))]
+        arcs, shapes, bbox, scale = build_topology(features, quantization=1000)
+        areas = [visvalingam_areas(a) for a in arcs]
+        coarse, _ = simplify_level(arcs, areas, shapes, threshold=50.0)
+        fine, kept = simplify_level(arcs, areas, shapes, threshold=1.0)
+        for c, f in zip(coarse, fine):
+            assert not (c & ~f).any()
+
+        topology = encode_topology("t", arcs, fine, shapes, kept, bbox, scale)
+        west_refs, east_refs = (g["arcs"][0] for g in topology["objects"]["t"]["geometries"])
+        shared = set(west_refs) & {~r for r in east_refs}
+        assert len(shared) == 1
+        west, east = decode(topology, "t")
+        common = {tuple(p) for p in west[0][0]} & {tuple(p) for p in east[0][0]}
+        border = np.cumsum(np.array(topology["arcs"][shared.pop()]), axis=0)
+        assert common == {tuple(p) for p in border.tolist()}
+
+    def test_kept_rings_stay_triangles(self):
+        features = [feature("Tiny", square(0, 0, steps=5))]
+        arcs, shapes, _, _ = build_topology(features, quantization=100)
+        areas = [visvalingam_areas(a) for a in arcs]
+        keep, kept = simplify_level(arcs, areas, shapes, threshold=1e12)
+        assert ring_size(kept[0][0][0], keep) >= 4
+
+    def test_small_parts_dropped_but_largest_kept(self):
+        mainland = square(0, 0, size=10, steps=4)
+        islet = square(20, 0, size=0.1)
+        f = {
+            "type": "Feature",
+            "properties": {"name": "A"},
+            "geometry": {"type": "MultiPolygon", "coordinates": [[mainland], [islet]]},
+        }
+        arcs, shapes, bbox, scale = build_topology([f], quantization=1000)
+        areas = [visvalingam_areas(a) for a in arcs]
+        keep, kept = simplify_level(arcs, areas, shapes, threshold=100.0)
+        topology = encode_topology("t", arcs, keep, shapes, kept, bbox, scale)
+        geometry = topology["objects"]["t"]["geometries"][0]
+        assert geometry["type"] == "Polygon"
+        assert len(topology["arcs"]) == 1
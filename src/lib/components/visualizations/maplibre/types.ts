@@ -23,6 +23,8 @@ export interface NetworkEdge {
 	target: [number, number]; // [lng, lat]
 	weight: number;
 	id?: string;
+	/** Full [lng, lat] polyline from source to target; a straight segment when absent */
+	path?: [number, number][];
 }
 
 /**
@@ -7,6 +7,8 @@ import type {
 	WorldMapData,
 	WorldMapFilterData
 } from '$lib/types/worldmap.js';
+import type { ClusterIndex } from '$lib/utils/pointClusters.js';
+import { facetLocationCounts } from '$lib/utils/locationFacets.js';
 
 class MapDataStore {
 	viewMode = $state<ViewMode>('bubbles');
@@ -19,6 +21,7 @@ class MapDataStore {
 	countryCounts = $state<Record<string, number>>({});
 	metadata = $state<WorldMapData['metadata'] | null>(null);
 	filterData = $state<WorldMapFilterData | null>(null);
+	clusters = $state<ClusterIndex | null>(null);
 
 	// Filter state
 	selectedSourceCountry = $state<string | null>(null); // null means "All countries"
@@ -34,43 +37,64 @@ class MapDataStore {
 			return this.locations;
 		}
 
+		const counts = this.filteredLocationCounts;
+		return this.locations
+			.map((loc, i) => ({ ...loc, articleCount: counts[i] }))
+			.filter((loc) => loc.articleCount > 0);
+	}
+
+	/** Filtered article count of each location, indexed like `locations` (cluster input) */
+	get filteredLocationCounts(): ArrayLike<number> {
+		if (!this.selectedSourceCountry && !this.selectedYearRange) {
+			return this.locations.map((loc) => loc.articleCount);
+		}
+
+		const facets = this.filterData?.locationFacets;
+		if (facets) {
+			return facetLocationCounts(
+				facets,
+				this.filterData?.sourceCountries ?? [],
+				this.selectedSourceCountry,
+				this.selectedYearRange
+			);
+		}
+
 		if (!this.filterData?.locationCountsByFilter) {
-			return this.locations;
+			return this.locations.map((loc) => loc.articleCount);
 		}
+		return this.locations.map((loc) => this.legacyFilteredCount(loc));
+	}
 
-		return this.locations
-			.map((loc) => {
-				const locFilterData = this.filterData?.locationCountsByFilter[loc.name];
-				if (!locFilterData) {
-					return { ...loc, articleCount: 0 };
-				}
+	// Older exports: nested { location: { sourceCountry: { year: count } } } objects
+	private legacyFilteredCount(loc: LocationData): number {
+		const locFilterData = this.filterData?.locationCountsByFilter?.[loc.name];
+		if (!locFilterData) {
+			return 0;
+		}
 
-				let count = 0;
-				const sourceCountries = this.selectedSourceCountry
-					? [this.selectedSourceCountry]
-					: Object.keys(locFilterData);
-
-				for (const srcCountry of sourceCountries) {
-					const yearData = locFilterData[srcCountry];
-					if (!yearData) continue;
-
-					if (this.selectedYearRange) {
-						const [minYear, maxYear] = this.selectedYearRange;
-						for (const [yearStr, yearCount] of Object.entries(yearData)) {
-							const year = parseInt(yearStr, 10);
-							if (year >= minYear && year <= maxYear) {
-								count += yearCount;
-							}
-						}
-					} else {
-						// Sum all years
-						count += Object.values(yearData).reduce((sum, c) => sum + c, 0);
+		let count = 0;
+		const sourceCountries = this.selectedSourceCountry
+			? [this.selectedSourceCountry]
+			: Object.keys(locFilterData);
+
+		for (const srcCountry of sourceCountries) {
+			const yearData = locFilterData[srcCountry];
+			if (!yearData) continue;
+
+			if (this.selectedYearRange) {
+				const [minYear, maxYear] = this.selectedYearRange;
+				for (const [yearStr, yearCount] of Object.entries(yearData)) {
+					const year = parseInt(yearStr, 10);
+					if (year >= minYear && year <= maxYear) {
+						count += yearCount;
 					}
 				}
-
-				return { ...loc, articleCount: count };
-			})
-			.filter((loc) => loc.articleCount > 0);
+			} else {
+				// Sum all years
+				count += Object.values(yearData).reduce((sum, c) => sum + c, 0);
+			}
+		}
+		return count;
 	}
 
 	get filteredCountryCounts(): Record<string, number> {
@@ -121,6 +145,7 @@ class MapDataStore {
 		this.countryCounts = data.countryCounts;
 		this.metadata = data.metadata;
 		this.filterData = data.filterData ?? null;
+		this.clusters = data.clusters ?? null;
 		this.isLoading = false;
 		this.error = null;
 
@@ -154,6 +179,7 @@ class MapDataStore {
 		this.countryCounts = {};
 		this.metadata = null;
 		this.filterData = null;
+		this.clusters = null;
 		this.selectedSourceCountry = null;
 		this.selectedYearRange = null;
 		this.isLoading = true;
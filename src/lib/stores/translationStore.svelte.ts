@@ -369,6 +369,12 @@ export const translations = {
 		'network.size_by_degree': 'By Connections',
 		'network.size_by_strength': 'By Connection Strength',
 		'network.min_edge_weight': 'Min Co-occurrences',
+		'network.edge_range': 'Distance',
+		'network.range_all': 'All ties',
+		'network.range_local': 'Local (< {0})',
+		'network.range_long': 'Long-range (≥ {0})',
+		'network.period': 'Period',
+		'network.all_years': 'All years',
 		'network.zoom_in': 'Zoom In',
 		'network.zoom_out': 'Zoom Out',
 		'network.reset_view': 'Reset View',
@@ -379,6 +385,7 @@ export const translations = {
 		'network.strength': 'Strength',
 		'network.connected_locations': 'Connected Locations',
 		'network.no_connections': 'No connections',
+		'network.nearby_locations': 'Nearest Locations',
 		'network.legend': 'Legend',
 		'network.legend_size_count': 'Node size = article count',
 		'network.legend_size_degree': 'Node size = connections',
@@ -1093,6 +1100,12 @@ export const translations = {
 		'network.size_by_degree': 'Par connexions',
 		'network.size_by_strength': 'Par force de connexion',
 		'network.min_edge_weight': 'Co-occurrences min.',
+		'network.edge_range': 'Distance',
+		'network.range_all': 'Tous les liens',
+		'network.range_local': 'Locaux (< {0})',
+		'network.range_long': 'Longue distance (≥ {0})',
+		'network.period': 'Période',
+		'network.all_years': 'Toutes les années',
 		'network.zoom_in': 'Zoom avant',
 		'network.zoom_out': 'Zoom arrière',
 		'network.reset_view': 'Réinitialiser la vue',
@@ -1103,6 +1116,7 @@ export const translations = {
 		'network.strength': 'Force',
 		'network.connected_locations': 'Lieux connectés',
 		'network.no_connections': 'Aucune connexion',
+		'network.nearby_locations': 'Lieux les plus proches',
 		'network.legend': 'Légende',
 		'network.legend_size_count': "Taille = nombre d'articles",
 		'network.legend_size_degree': 'Taille = connexions',
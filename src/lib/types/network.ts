@@ -3,6 +3,9 @@
  * Generated by generate_spatial_networks.py
  */
 
+import type { EdgePathEncoding } from '$lib/utils/edgePaths.js';
+import type { NearestNeighborIndex } from '$lib/utils/spatialProximity.js';
+
 /** A node in the spatial network representing a location */
 export interface NetworkNode {
 	/** Unique identifier (format: "location:{id}") */
@@ -41,6 +44,10 @@ export interface NetworkEdge {
 	weightNorm: number;
 	/** Array of article IDs where co-occurrence happens */
 	articleIds: string[];
+	/** Great-circle distance between the two locations, in km */
+	distanceKm?: number;
+	/** Precomputed polyline, delta-encoded on the edgePaths grid */
+	path?: number[];
 }
 
 /** Geographic bounds for the network */
@@ -75,6 +82,12 @@ export interface NetworkMeta {
 	bounds: NetworkBounds | null;
 	/** Number of articles with multiple locations */
 	articlesWithMultipleLocations: number;
+	/** Distance separating local from long-range edges, in km */
+	localRadiusKm?: number;
+	/** Number of edges at least localRadiusKm long */
+	longRangeEdges?: number;
+	/** Median edge length, in km */
+	medianEdgeDistanceKm?: number | null;
 }
 
 /** Complete spatial network data structure */
@@ -83,6 +96,10 @@ export interface SpatialNetworkData {
 	nodes: NetworkNode[];
 	/** Array of co-occurrence edges */
 	edges: NetworkEdge[];
+	/** Nearest locations of every node (indexed like nodes) */
+	nearest?: NearestNeighborIndex | null;
+	/** Grid of the precomputed edge polylines */
+	edgePaths?: EdgePathEncoding | null;
 	/** Geographic bounds for map initialization */
 	bounds: NetworkBounds | null;
 	/** Generation metadata and statistics */
@@ -112,6 +129,9 @@ export interface GlobalNetworkNode {
 	labelPriority: number;
 	/** Optional Omeka o:id for linking to islam.zmo.de */
 	o_id?: string;
+	/** Optional precomputed ForceAtlas2 position (generated with --layout) */
+	x?: number;
+	y?: number;
 }
 
 /** Edge structure for global network */
@@ -147,6 +167,38 @@ export interface GlobalNetworkData {
 	meta: GlobalNetworkMeta;
 }
 
+/** One time slice of a dynamic network (indices refer to DynamicNetworkData.nodes / edges) */
+export interface DynamicNetworkSlice {
+	label: string;
+	start: number;
+	end: number;
+	articles: number;
+	edges: number[];
+	weights: number[];
+	nodes: number[];
+	counts: number[];
+}
+
+/** Time-sliced co-occurrence network (networks/dynamic.json, build_dynamic_networks.py) */
+export interface DynamicNetworkData {
+	nodes: { id: string; type: EntityType; label: string; count: number }[];
+	edges: { source: number[]; target: number[]; type: number[]; weight: number[] };
+	edgeTypes: string[];
+	slices: DynamicNetworkSlice[];
+	meta: {
+		generatedAt: string;
+		window: number;
+		step: number;
+		weightMinConfigured: number;
+		typePairs: [string, string][];
+		totalNodes: number;
+		totalEdges: number;
+		totalSlices: number;
+		datedArticles: number;
+		undatedArticles: number;
+	};
+}
+
 /** View mode for network visualization */
 export type NetworkViewMode = 'graph' | 'map';
 
@@ -2,6 +2,9 @@
  * World Map visualization types for the IWAC Dashboard
  */
 
+import type { ClusterIndex } from '$lib/utils/pointClusters.js';
+import type { LocationFacets } from '$lib/utils/locationFacets.js';
+
 export type ViewMode = 'bubbles' | 'choropleth';
 
 export interface GeoJsonFeature {
@@ -51,16 +54,24 @@ export interface WorldMapFilterData {
 	 */
 	countsBySourceCountryYear: Record<string, Record<string, number>>;
 	/**
-	 * Location counts by source country and year for filtering
+	 * Sparse (location × year × source country) count cube, rows aligned
+	 * with `locations` (see $lib/utils/locationFacets.ts)
+	 */
+	locationFacets?: LocationFacets;
+	/**
+	 * Location counts by source country and year, written by older exports
+	 * instead of `locationFacets`
 	 * Structure: { locationName: { sourceCountry: { year: count } } }
 	 */
-	locationCountsByFilter: Record<string, Record<string, Record<string, number>>>;
+	locationCountsByFilter?: Record<string, Record<string, Record<string, number>>>;
 }
 
 export interface WorldMapData {
 	locations: LocationData[];
 	countryCounts: Record<string, number>;
 	filterData: WorldMapFilterData;
+	/** Per-zoom marker clusters over `locations` (absent in older exports) */
+	clusters?: ClusterIndex;
 	metadata: {
 		totalLocations: number;
 		totalArticles: number;
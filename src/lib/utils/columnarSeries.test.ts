@@ -0,0 +1,69 @@
+import { describe, it, expect } from 'vitest';
+import {
+	COLUMNAR_FORMAT,
+	isColumnar,
+	decodeRle,
+	decodeSeriesRows,
+	decodeColumnarSeries,
+	cumulativeSum
+} from './columnarSeries.js';
+
+describe('isColumnar', () => {
+	it('detects the columnar format tag', () => {
+		expect(isColumnar({ format: COLUMNAR_FORMAT })).toBe(true);
+	});
+
+	it('rejects legacy payloads and non-objects', () => {
+		expect(isColumnar({ facets: {} })).toBe(false);
+		expect(isColumnar(null)).toBe(false);
+		expect(isColumnar('iwac-columnar-v1')).toBe(false);
+	});
+});
+
+describe('decodeRle', () => {
+	it('expands value/length pairs', () => {
+		expect(decodeRle([0, 3, 5, 2, 1, 1])).toEqual([0, 0, 0, 5, 5, 1]);
+	});
+
+	it('returns an empty array for empty input', () => {
+		expect(decodeRle([])).toEqual([]);
+	});
+});
+
+describe('decodeSeriesRows', () => {
+	it('returns dense rows unchanged', () => {
+		const matrix = [
+			[1, 2],
+			[3, 4]
+		];
+		expect(decodeSeriesRows({ names: ['a', 'b'], encoding: 'dense', matrix })).toBe(matrix);
+	});
+
+	it('decodes run-length rows', () => {
+		expect(decodeSeriesRows({ names: ['a'], encoding: 'rle', matrix: [[0, 2, 7, 1]] })).toEqual([
+			[0, 0, 7]
+		]);
+	});
+});
+
+describe('decodeColumnarSeries', () => {
+	it('maps names to rows in order', () => {
+		const series = decodeColumnarSeries({
+			names: ['Islam', 'Niger'],
+			encoding: 'rle',
+			matrix: [
+				[0, 3, 2, 1],
+				[1, 1, 0, 3]
+			]
+		});
+		expect(Object.keys(series)).toEqual(['Islam', 'Niger']);
+		expect(series.Islam).toEqual([0, 0, 0, 2]);
+		expect(series.Niger).toEqual([1, 0, 0, 0]);
+	});
+});
+
+describe('cumulativeSum', () => {
+	it('computes a running total', () => {
+		expect(cumulativeSum([1, 0, 2, 3])).toEqual([1, 1, 3, 6]);
+	});
+});
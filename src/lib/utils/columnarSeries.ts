@@ -0,0 +1,71 @@
+/**
+ * Decoding helpers for the columnar series layout written by
+ * `iwac_utils.save_columnar_json` (keywords, timeline and language facet files).
+ *
+ * A columnar file stores its axis (years, months, languages) once and every
+ * series block as a name dictionary plus one row of counts per name, either
+ * dense or run-length encoded as [value, length, value, length, ...].
+ */
+
+/** Format tag stamped on columnar files (mirrors iwac_utils.COLUMNAR_FORMAT) */
+export const COLUMNAR_FORMAT = 'iwac-columnar-v1';
+
+export interface ColumnarSeriesBlock {
+	names: string[];
+	encoding: 'dense' | 'rle';
+	matrix: number[][];
+}
+
+/**
+ * Check whether a fetched payload uses the columnar layout.
+ * Files generated before the columnar format have no `format` tag.
+ */
+export function isColumnar(data: unknown): boolean {
+	return (
+		typeof data === 'object' &&
+		data !== null &&
+		(data as { format?: unknown }).format === COLUMNAR_FORMAT
+	);
+}
+
+/**
+ * Expand a flat run-length list into its values.
+ */
+export function decodeRle(runs: number[]): number[] {
+	const values: number[] = [];
+	for (let i = 0; i + 1 < runs.length; i += 2) {
+		const value = runs[i];
+		const length = runs[i + 1];
+		for (let j = 0; j < length; j++) values.push(value);
+	}
+	return values;
+}
+
+/**
+ * Decode every row of a series block into a plain array of counts,
+ * in the order of `block.names`.
+ */
+export function decodeSeriesRows(block: ColumnarSeriesBlock): number[][] {
+	return block.encoding === 'rle' ? block.matrix.map(decodeRle) : block.matrix;
+}
+
+/**
+ * Decode a series block into a name → counts record.
+ * Key insertion order follows `block.names` (e.g. descending keyword frequency).
+ */
+export function decodeColumnarSeries(block: ColumnarSeriesBlock): Record<string, number[]> {
+	const rows = decodeSeriesRows(block);
+	const series: Record<string, number[]> = {};
+	block.names.forEach((name, i) => {
+		series[name] = rows[i] ?? [];
+	});
+	return series;
+}
+
+/**
+ * Running sum of a counts row (e.g. cumulative collection growth).
+ */
+export function cumulativeSum(values: number[]): number[] {
+	let total = 0;
+	return values.map((value) => (total += value));
+}
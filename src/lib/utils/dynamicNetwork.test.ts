@@ -0,0 +1,88 @@
+import { describe, it, expect } from 'vitest';
+import { decodeSlice, sliceIndexForYear } from './dynamicNetwork.js';
+import type { DynamicNetworkData } from '$lib/types/network.js';
+
+const data: DynamicNetworkData = {
+	nodes: [
+		{ id: 'person:1', type: 'person', label: 'A', count: 10 },
+		{ id: 'organization:2', type: 'organization', label: 'B', count: 8 },
+		{ id: 'event:3', type: 'event', label: 'C', count: 4 }
+	],
+	edges: { source: [0, 0], target: [1, 2], type: [0, 1], weight: [6, 3] },
+	edgeTypes: ['person-organization', 'person-event'],
+	slices: [
+		{
+			label: '2000',
+			start: 2000,
+			end: 2000,
+			articles: 5,
+			edges: [0],
+			weights: [4],
+			nodes: [0, 1, 2],
+			counts: [4, 4, 1]
+		},
+		{
+			label: '2001',
+			start: 2001,
+			end: 2001,
+			articles: 3,
+			edges: [0, 1],
+			weights: [2, 3],
+			nodes: [0, 1, 2],
+			counts: [3, 2, 3]
+		}
+	],
+	meta: {
+		generatedAt: '',
+		window: 1,
+		step: 1,
+		weightMinConfigured: 2,
+		typePairs: [],
+		totalNodes: 3,
+		totalEdges: 2,
+		totalSlices: 2,
+		datedArticles: 8,
+		undatedArticles: 0
+	}
+};
+
+describe('sliceIndexForYear', () => {
+	it('finds the slice covering a year', () => {
+		expect(sliceIndexForYear(data, 2001)).toBe(1);
+		expect(sliceIndexForYear(data, 1999)).toBe(-1);
+	});
+});
+
+describe('decodeSlice', () => {
+	it('keeps only nodes with an edge in the slice', () => {
+		const { nodes, edges } = decodeSlice(data, 0);
+		expect(nodes.map((n) => n.id)).toEqual(['person:1', 'organization:2']);
+		expect(edges).toEqual([
+			{
+				source: 'person:1',
+				target: 'organization:2',
+				type: 'person-organization',
+				weight: 4,
+				weightNorm: 1,
+				articleIds: []
+			}
+		]);
+	});
+
+	it('computes slice metrics and priority', () => {
+		const { nodes, edges } = decodeSlice(data, 1);
+		expect(nodes[0]).toMatchObject({
+			id: 'person:1',
+			count: 3,
+			degree: 2,
+			strength: 5,
+			labelPriority: 0
+		});
+		expect(nodes[1]).toMatchObject({ id: 'event:3', strength: 3, labelPriority: 1 });
+		expect(edges[0].weightNorm).toBeCloseTo(2 / 3);
+	});
+
+	it('returns an empty network for unknown slices', () => {
+		expect(decodeSlice(data, 5)).toEqual({ nodes: [], edges: [] });
+	});
+});
@@ -0,0 +1,76 @@
+/**
+ * Decoding helpers for the time-sliced network written by
+ * `spatial/build_dynamic_networks.py` (`networks/dynamic.json`).
+ *
+ * Nodes and the all-time edge list are stored once; each slice only lists
+ * the indices of its active edges and nodes with their per-slice weights and
+ * counts, so scrubbing through time is a cheap re-decode of one slice.
+ */
+
+import type {
+	DynamicNetworkData,
+	GlobalNetworkEdge,
+	GlobalNetworkNode
+} from '$lib/types/network.js';
+
+/**
+ * Index of the slice covering `year` (the last one starting at or before it),
+ * or -1 when the year precedes every slice.
+ */
+export function sliceIndexForYear(data: DynamicNetworkData, year: number): number {
+	let found = -1;
+	data.slices.forEach((slice, i) => {
+		if (slice.start <= year && year <= slice.end) found = i;
+	});
+	return found;
+}
+
+/**
+ * Expand one slice into the global network node/edge shapes.
+ *
+ * Node `count` is the number of slice articles mentioning the entity; degree,
+ * strength, labelPriority and weightNorm are computed within the slice.
+ * Nodes without an edge in the slice are left out.
+ */
+export function decodeSlice(
+	data: DynamicNetworkData,
+	sliceIndex: number
+): { nodes: GlobalNetworkNode[]; edges: GlobalNetworkEdge[] } {
+	const slice = data.slices[sliceIndex];
+	if (!slice) return { nodes: [], edges: [] };
+
+	const maxWeight = slice.weights.reduce((max, w) => Math.max(max, w), 0) || 1;
+	const degree = new Map<number, number>();
+	const strength = new Map<number, number>();
+	const edges: GlobalNetworkEdge[] = slice.edges.map((e, i) => {
+		const source = data.edges.source[e];
+		const target = data.edges.target[e];
+		const weight = slice.weights[i];
+		for (const end of [source, target]) {
+			degree.set(end, (degree.get(end) ?? 0) + 1);
+			strength.set(end, (strength.get(end) ?? 0) + weight);
+		}
+		return {
+			source: data.nodes[source].id,
+			target: data.nodes[target].id,
+			type: data.edgeTypes[data.edges.type[e]] ?? 'unknown',
+			weight,
+			weightNorm: weight / maxWeight,
+			articleIds: []
+		};
+	});
+
+	const counts = new Map(slice.nodes.map((n, i) => [n, slice.counts[i]]));
+	const active = [...degree.keys()].sort(
+		(a, b) => (strength.get(b) ?? 0) - (strength.get(a) ?? 0) || a - b
+	);
+	const nodes: GlobalNetworkNode[] = active.map((n, rank) => ({
+		...data.nodes[n],
+		count: counts.get(n) ?? 0,
+		degree: degree.get(n) ?? 0,
+		strength: strength.get(n) ?? 0,
+		labelPriority: rank
+	}));
+
+	return { nodes, edges };
+}
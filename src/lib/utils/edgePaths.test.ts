@@ -0,0 +1,21 @@
+import { describe, it, expect } from 'vitest';
+import { decodeEdgePath, type EdgePathEncoding } from './edgePaths.js';
+
+const encoding: EdgePathEncoding = { scale: 0.001, translate: [-5, 5], bundled: false };
+
+describe('decodeEdgePath', () => {
+	it('accumulates deltas on the grid', () => {
+		const points = decodeEdgePath(encoding, [988, 300, 500, 950, 5850, 6120]);
+		expect(points).toHaveLength(3);
+		expect(points?.[0][0]).toBeCloseTo(-4.012);
+		expect(points?.[0][1]).toBeCloseTo(5.3);
+		expect(points?.[2][0]).toBeCloseTo(2.338);
+		expect(points?.[2][1]).toBeCloseTo(12.37);
+	});
+
+	it('returns null without a header or a full segment', () => {
+		expect(decodeEdgePath(null, [1, 2, 3, 4])).toBeNull();
+		expect(decodeEdgePath(encoding, undefined)).toBeNull();
+		expect(decodeEdgePath(encoding, [1, 2])).toBeNull();
+	});
+});
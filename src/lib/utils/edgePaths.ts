@@ -0,0 +1,36 @@
+/**
+ * Decoder for the precomputed edge polylines of `networks/spatial.json`
+ * (written by `scripts/edge_paths.py`).
+ *
+ * Each edge's `path` is a flat list of delta-encoded integer coordinates
+ * `[x0, y0, dx1, dy1, ...]` on a grid described by the shared `edgePaths`
+ * header; great-circle curvature and any bundling are already baked in, so
+ * the map only draws the decoded points.
+ */
+
+export interface EdgePathEncoding {
+	/** Grid step in degrees */
+	scale: number;
+	/** Grid origin as [west, south] */
+	translate: [number, number];
+	/** Whether force-directed edge bundling was applied */
+	bundled: boolean;
+}
+
+/** Decode one edge path to `[lng, lat]` points; null when there is none. */
+export function decodeEdgePath(
+	encoding: EdgePathEncoding | null | undefined,
+	path: number[] | undefined
+): [number, number][] | null {
+	if (!encoding || !path || path.length < 4) return null;
+	const { scale, translate } = encoding;
+	const points: [number, number][] = [];
+	let x = 0;
+	let y = 0;
+	for (let i = 0; i + 1 < path.length; i += 2) {
+		x += path[i];
+		y += path[i + 1];
+		points.push([x * scale + translate[0], y * scale + translate[1]]);
+	}
+	return points;
+}
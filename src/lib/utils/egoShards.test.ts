@@ -0,0 +1,69 @@
+import { describe, it, expect } from 'vitest';
+import { isEgoIndex, egoBucket, egoShardFile, egoFromShard, type EgoShard } from './egoShards.js';
+
+interface Node {
+	id: string;
+}
+
+interface Edge {
+	source: string;
+	target: string;
+	weight: number;
+}
+
+const shard: EgoShard<Node, Edge> = {
+	bucket: 7,
+	egos: {
+		a: [
+			{ source: 'b', target: 'a', weight: 5 },
+			{ source: 'a', target: 'c', weight: 2 }
+		],
+		d: []
+	},
+	nodes: { a: { id: 'a' }, b: { id: 'b' }, c: { id: 'c' }, d: { id: 'd' } }
+};
+
+describe('isEgoIndex', () => {
+	it('accepts bucket metadata with a known hash', () => {
+		expect(isEgoIndex({ buckets: 512, hash: 'fnv1a32' })).toBe(true);
+	});
+
+	it('rejects malformed payloads', () => {
+		expect(isEgoIndex({ buckets: 512 })).toBe(false);
+		expect(isEgoIndex({ buckets: 512, hash: 'md5' })).toBe(false);
+		expect(isEgoIndex({ buckets: 0, hash: 'fnv1a32' })).toBe(false);
+		expect(isEgoIndex(null)).toBe(false);
+	});
+});
+
+describe('egoBucket', () => {
+	it('matches the buckets written by generate_knowledge_graph.py', () => {
+		expect(egoBucket('a', 512)).toBe(300);
+		expect(egoBucket('b', 512)).toBe(485);
+		expect(egoBucket('', 512)).toBe(453);
+		expect(egoBucket('person:Amadou Diallo', 512)).toBe(464);
+		expect(egoBucket('subject:été', 512)).toBe(261);
+		expect(egoBucket('subject:été', 7)).toBe(4);
+	});
+});
+
+describe('egoShardFile', () => {
+	it('maps ids to bucket files', () => {
+		const index = { buckets: 512, hash: 'fnv1a32' };
+		expect(egoShardFile(index, 'a')).toBe('ego/300.json');
+		expect(egoShardFile(index, 'b')).toBe('ego/485.json');
+	});
+});
+
+describe('egoFromShard', () => {
+	it('returns the ego first and neighbours in edge order', () => {
+		const ego = egoFromShard(shard, 'a');
+		expect(ego.nodes.map((n) => n.id)).toEqual(['a', 'b', 'c']);
+		expect(ego.edges).toHaveLength(2);
+	});
+
+	it('handles nodes without edges or missing from the shard', () => {
+		expect(egoFromShard(shard, 'd')).toEqual({ nodes: [{ id: 'd' }], edges: [] });
+		expect(egoFromShard(shard, 'z')).toEqual({ nodes: [], edges: [] });
+	});
+});
@@ -0,0 +1,76 @@
+/**
+ * Ego-network shard helpers for the knowledge graph (`ego/index.json` +
+ * `ego/{bucket}.json`, written by `generate_knowledge_graph.py`).
+ *
+ * Node ids are hashed into buckets; a bucket file maps each of its ego nodes
+ * to its incident edges and carries the records of those nodes and all their
+ * neighbours, so one small fetch yields a complete 1-hop neighbourhood. The
+ * index only names the bucket count and hash, which is recomputed here.
+ */
+
+export interface EgoIndex {
+	generatedAt?: string;
+	buckets: number;
+	hash: string;
+}
+
+/** Bucket hash implemented by `egoBucket` (must match `ego_bucket` in Python). */
+export const EGO_HASH = 'fnv1a32';
+
+export interface EgoShard<N, E> {
+	bucket: number;
+	egos: Record<string, E[]>;
+	nodes: Record<string, N>;
+}
+
+/**
+ * Check whether a fetched payload is a usable shard index.
+ */
+export function isEgoIndex(data: unknown): data is EgoIndex {
+	if (typeof data !== 'object' || data === null) return false;
+	const { buckets, hash } = data as EgoIndex;
+	return Number.isInteger(buckets) && buckets > 0 && hash === EGO_HASH;
+}
+
+/**
+ * Shard bucket of a node id: 32-bit FNV-1a over its UTF-8 bytes, modulo
+ * `buckets`.
+ */
+export function egoBucket(id: string, buckets: number): number {
+	let h = 0x811c9dc5;
+	for (const byte of new TextEncoder().encode(id)) {
+		h = Math.imul(h ^ byte, 0x01000193) >>> 0;
+	}
+	return h % buckets;
+}
+
+/**
+ * Shard file (relative to the knowledge-graph data directory) that would hold
+ * `id`. The shard may not contain the node; check `egos` after fetching.
+ */
+export function egoShardFile(index: EgoIndex, id: string): string {
+	return `ego/${egoBucket(id, index.buckets)}.json`;
+}
+
+/**
+ * Extract the 1-hop neighbourhood of `id` from its shard: the ego node first,
+ * then its neighbours in edge order (strongest first).
+ */
+export function egoFromShard<N, E extends { source: string; target: string }>(
+	shard: EgoShard<N, E>,
+	id: string
+): { nodes: N[]; edges: E[] } {
+	const edges = shard.egos[id] ?? [];
+	const ids = [id];
+	const seen = new Set(ids);
+	for (const edge of edges) {
+		for (const end of [edge.source, edge.target]) {
+			if (!seen.has(end)) {
+				seen.add(end);
+				ids.push(end);
+			}
+		}
+	}
+	const nodes = ids.map((nodeId) => shard.nodes[nodeId]).filter((n): n is N => n !== undefined);
+	return { nodes, edges };
+}
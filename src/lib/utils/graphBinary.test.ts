@@ -0,0 +1,88 @@
+import { describe, it, expect } from 'vitest';
+import { decodeGraphBinary, readGraphBinaryHeader } from './graphBinary.js';
+
+// Written by scripts/graph_binary.py (encode_graph) from the graph in `expected`
+const FIXTURE = [
+	'SVdHQhgFAAB7ImZvcm1hdCI6Iml3YWMtZ3JhcGgiLCJ2ZXJzaW9uIjoxLCJub2RlQ291bnQiOjEwLCJlZGdlQ291',
+	'bnQiOjQsIm5vZGVzIjpbeyJwYXRoIjpbImlkIl0sImtpbmQiOiJ0YWdnZWQiLCJjYXRlZ29yaWVzIjpbInBlcjoi',
+	'XSwiY29kZXMiOnsiZHR5cGUiOiJ1aW50OCIsIm9mZnNldCI6MCwibGVuZ3RoIjoxMH0sIm51bWJlcnMiOnsiZHR5',
+	'cGUiOiJ1aW50MzIiLCJvZmZzZXQiOjE2LCJsZW5ndGgiOjEwfX0seyJwYXRoIjpbInR5cGUiXSwia2luZCI6ImNh',
+	'dGVnb3J5IiwiY2F0ZWdvcmllcyI6WyJQZXJzb24iLCJPcmdhbml6YXRpb24iXSwiZHR5cGUiOiJ1aW50OCIsIm9m',
+	'ZnNldCI6NTYsImxlbmd0aCI6MTB9LHsicGF0aCI6WyJsYWJlbCJdLCJraW5kIjoidGFnZ2VkIiwiY2F0ZWdvcmll',
+	'cyI6WyJOIl0sImNvZGVzIjp7ImR0eXBlIjoidWludDgiLCJvZmZzZXQiOjcyLCJsZW5ndGgiOjEwfSwibnVtYmVy',
+	'cyI6eyJkdHlwZSI6InVpbnQzMiIsIm9mZnNldCI6ODgsImxlbmd0aCI6MTB9fSx7InBhdGgiOlsiZGVncmVlIl0s',
+	'ImtpbmQiOiJudW1iZXIiLCJkdHlwZSI6InVpbnQzMiIsIm9mZnNldCI6MTI4LCJsZW5ndGgiOjEwfSx7InBhdGgi',
+	'OlsicHJvcGVydGllcyJdLCJraW5kIjoib2JqZWN0In0seyJwYXRoIjpbInByb3BlcnRpZXMiLCJmaXJzdE9jY3Vy',
+	'cmVuY2UiXSwia2luZCI6ImRhdGUiLCJvdGhlcnMiOnsiOCI6IjIwMDEvMjAwMiJ9LCJkdHlwZSI6InVpbnQzMiIs',
+	'Im9mZnNldCI6MTY4LCJsZW5ndGgiOjEwfSx7InBhdGgiOlsiaGlkZGVuIl0sInByZXNlbnQiOnsiZHR5cGUiOiJ1',
+	'aW50OCIsIm9mZnNldCI6MjA4LCJsZW5ndGgiOjEwfSwia2luZCI6ImJvb2wiLCJkdHlwZSI6InVpbnQ4Iiwib2Zm',
+	'c2V0IjoyMjQsImxlbmd0aCI6MX1dLCJlZGdlcyI6W3sicGF0aCI6WyJzb3VyY2UiXSwia2luZCI6Im5vZGUiLCJk',
+	'dHlwZSI6InVpbnQzMiIsIm9mZnNldCI6MjMyLCJsZW5ndGgiOjR9LHsicGF0aCI6WyJ0YXJnZXQiXSwia2luZCI6',
+	'Im5vZGUiLCJkdHlwZSI6InVpbnQzMiIsIm9mZnNldCI6MjQ4LCJsZW5ndGgiOjR9LHsicGF0aCI6WyJ3ZWlnaHQi',
+	'XSwia2luZCI6Im51bWJlciIsImR0eXBlIjoiZmxvYXQzMiIsIm9mZnNldCI6MjY0LCJsZW5ndGgiOjR9LHsicGF0',
+	'aCI6WyJhcnRpY2xlSWRzIl0sImtpbmQiOiJsaXN0Iiwib2Zmc2V0cyI6eyJkdHlwZSI6InVpbnQzMiIsIm9mZnNl',
+	'dCI6MjgwLCJsZW5ndGgiOjV9LCJpdGVtcyI6eyJraW5kIjoiZGlnaXRzIiwiZHR5cGUiOiJ1aW50MzIiLCJvZmZz',
+	'ZXQiOjMwNCwibGVuZ3RoIjoyfX1dLCJleHRyYSI6eyJtZXRhIjp7InRvdGFsTm9kZXMiOjEwfX19IAAAAAAAAAAA',
+	'AAAAAAAAAAABAAAAAgAAAAMAAAAEAAAABQAAAAYAAAAHAAAACAAAAAkAAAAKAAAAAAABAAABAAABAAAAAAAAAAAA',
+	'AAAAAAAAAAAAAAAAAAABAAAAAgAAAAMAAAAEAAAABQAAAAYAAAAHAAAACAAAAAkAAAAKAAAAAQAAAAIAAAADAAAA',
+	'BAAAAAUAAAAGAAAABwAAAAgAAAAJAAAACgAAAHRUMQHoezEBXKMxAdDKMQFE8jEBuBkyASxBMgGgaDIBAAAAAKCz',
+	'MgEAAAAAAAAAAAABAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAIAAAADAAAABAAAAAAAgD8AAMA/',
+	'AAAAQAAAIEAAAAAAAAAAAAEAAAABAAAAAgAAAAAAAABnAAAAaQAAAA=='
+].join('');
+
+function fixtureBuffer(): ArrayBuffer {
+	return Uint8Array.from(atob(FIXTURE), (c) => c.charCodeAt(0)).buffer;
+}
+
+const dates = [
+	'2001-01',
+	'2002-02',
+	'2003-03',
+	'2004-04',
+	'2005-05',
+	'2006-06',
+	'2007-07',
+	'2008-08',
+	'2001/2002',
+	'2010'
+];
+
+const expected = {
+	nodes: dates.map((firstOccurrence, i) => ({
+		id: `per:${i + 1}`,
+		type: (i + 1) % 3 ? 'Person' : 'Organization',
+		label: `N${i + 1}`,
+		degree: i + 1,
+		properties: { firstOccurrence },
+		...(i === 9 ? { hidden: true } : {})
+	})),
+	edges: [2, 3, 4, 5].map((j) => ({
+		source: 'per:1',
+		target: `per:${j}`,
+		weight: j / 2,
+		articleIds: j % 2 ? [String(100 + j)] : []
+	})),
+	meta: { totalNodes: 10 }
+};
+
+describe('readGraphBinaryHeader', () => {
+	it('reads counts and columns', () => {
+		const { header, blobOffset } = readGraphBinaryHeader(fixtureBuffer());
+		expect(header.nodeCount).toBe(10);
+		expect(header.edgeCount).toBe(4);
+		expect(blobOffset % 8).toBe(0);
+		expect(header.edges.find((c) => c.path[0] === 'source')?.kind).toBe('node');
+	});
+
+	it('rejects other files', () => {
+		expect(() => readGraphBinaryHeader(new TextEncoder().encode('{"nodes":[]}').buffer)).toThrow(
+			/bad magic/
+		);
+	});
+});
+
+describe('decodeGraphBinary', () => {
+	it('restores the JSON records', () => {
+		expect(decodeGraphBinary(fixtureBuffer())).toEqual(expected);
+	});
+});
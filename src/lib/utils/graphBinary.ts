@@ -0,0 +1,167 @@
+/**
+ * Decoder for the typed-array graph files written by `scripts/graph_binary.py`
+ * (`graph.bin`, `graph-{tier}.bin`, `networks/global.bin`, `coauthor-network.bin`).
+ *
+ * Layout: `"IWGB"` | uint32 header length | JSON header | binary blob. The
+ * header describes node and edge columns; numeric columns are little-endian
+ * typed arrays in the blob (8-byte aligned, read as views without copying),
+ * strings that do not code well stay as JSON arrays in the header. Decoding
+ * rebuilds the same `{ nodes, edges, ...extra }` records as the JSON export,
+ * without parsing a JSON object per edge.
+ */
+
+type Dtype = 'uint8' | 'uint16' | 'uint32' | 'int32' | 'float32' | 'float64';
+
+interface ArrayDesc {
+	dtype: Dtype;
+	offset: number;
+	length: number;
+}
+
+type ValueSpec =
+	| { kind: 'json'; values: unknown[] }
+	| ({ kind: 'number' | 'bool' | 'digits' } & ArrayDesc)
+	| ({ kind: 'date'; others: Record<string, string> } & ArrayDesc)
+	| ({ kind: 'category'; categories: string[] } & ArrayDesc)
+	| { kind: 'tagged'; categories: string[]; codes: ArrayDesc; numbers: ArrayDesc }
+	| { kind: 'list'; offsets: ArrayDesc; items: ValueSpec };
+
+type ColumnSpec = { path: string[]; present?: ArrayDesc } & (
+	| ValueSpec
+	| { kind: 'object' }
+	| ({ kind: 'node' } & ArrayDesc)
+);
+
+export interface GraphBinaryHeader {
+	format: 'iwac-graph';
+	version: number;
+	nodeCount: number;
+	edgeCount: number;
+	nodes: ColumnSpec[];
+	edges: ColumnSpec[];
+	extra: Record<string, unknown>;
+}
+
+export const GRAPH_BINARY_VERSION = 1;
+
+const MAGIC = 'IWGB';
+
+const ARRAY_TYPES = {
+	uint8: Uint8Array,
+	uint16: Uint16Array,
+	uint32: Uint32Array,
+	int32: Int32Array,
+	float32: Float32Array,
+	float64: Float64Array
+} as const;
+
+type Row = Record<string, unknown>;
+
+function formatDate(value: number): string {
+	const year = Math.floor(value / 10000);
+	const month = Math.floor(value / 100) % 100;
+	const day = value % 100;
+	let text = String(year).padStart(4, '0');
+	if (month) {
+		text += `-${String(month).padStart(2, '0')}`;
+		if (day) text += `-${String(day).padStart(2, '0')}`;
+	}
+	return text;
+}
+
+/**
+ * Parse the file header and return it with the byte offset of the binary blob.
+ */
+export function readGraphBinaryHeader(buffer: ArrayBuffer): {
+	header: GraphBinaryHeader;
+	blobOffset: number;
+} {
+	const bytes = new Uint8Array(buffer);
+	if (String.fromCharCode(...bytes.subarray(0, 4)) !== MAGIC) {
+		throw new Error('Not an IWAC binary graph (bad magic)');
+	}
+	const headerLength = new DataView(buffer).getUint32(4, true);
+	const header = JSON.parse(
+		new TextDecoder().decode(bytes.subarray(8, 8 + headerLength))
+	) as GraphBinaryHeader;
+	if (header.version !== GRAPH_BINARY_VERSION) {
+		throw new Error(`Unsupported binary graph version ${header.version}`);
+	}
+	return { header, blobOffset: 8 + headerLength };
+}
+
+/**
+ * Decode a binary graph into the records of its JSON counterpart.
+ */
+export function decodeGraphBinary<T = Row>(buffer: ArrayBuffer): T {
+	const { header, blobOffset } = readGraphBinaryHeader(buffer);
+	const read = (desc: ArrayDesc) =>
+		new ARRAY_TYPES[desc.dtype](buffer, blobOffset + desc.offset, desc.length);
+
+	function decodeValues(spec: ValueSpec): unknown[] {
+		switch (spec.kind) {
+			case 'json':
+				return spec.values;
+			case 'list': {
+				const offsets = read(spec.offsets);
+				const items = decodeValues(spec.items);
+				return Array.from({ length: offsets.length - 1 }, (_, i) =>
+					items.slice(offsets[i], offsets[i + 1])
+				);
+			}
+			case 'tagged': {
+				const codes = read(spec.codes);
+				const numbers = read(spec.numbers);
+				return Array.from(codes, (c, i) => `${spec.categories[c]}${numbers[i]}`);
+			}
+			case 'category':
+				return Array.from(read(spec), (c) => spec.categories[c]);
+			case 'bool':
+				return Array.from(read(spec), (v) => v !== 0);
+			case 'digits':
+				return Array.from(read(spec), (v) => String(v));
+			case 'date': {
+				const dates: unknown[] = Array.from(read(spec), formatDate);
+				for (const [i, value] of Object.entries(spec.others)) dates[Number(i)] = value;
+				return dates;
+			}
+			case 'number':
+				return Array.from(read(spec));
+		}
+	}
+
+	function decodeTable(columns: ColumnSpec[], count: number, nodes?: Row[]): Row[] {
+		const rows: Row[] = Array.from({ length: count }, () => ({}));
+		for (const spec of columns) {
+			const parents = spec.path.slice(0, -1);
+			const key = spec.path[spec.path.length - 1];
+			let present: number[] | null = null;
+			if (spec.present) {
+				present = [];
+				read(spec.present).forEach((flag, row) => {
+					if (flag) present!.push(row);
+				});
+			}
+
+			let values: unknown[];
+			if (spec.kind === 'object') {
+				values = Array.from({ length: present?.length ?? count }, () => ({}));
+			} else if (spec.kind === 'node') {
+				values = Array.from(read(spec), (i) => nodes?.[i]?.id);
+			} else {
+				values = decodeValues(spec);
+			}
+
+			values.forEach((value, i) => {
+				let target = rows[present ? present[i] : i];
+				for (const parent of parents) target = target[parent] as Row;
+				target[key] = value;
+			});
+		}
+		return rows;
+	}
+
+	const nodes = decodeTable(header.nodes, header.nodeCount);
+	const edges = decodeTable(header.edges, header.edgeCount, nodes);
+	return { nodes, edges, ...header.extra } as T;
+}
@@ -0,0 +1,72 @@
+import { describe, it, expect } from 'vitest';
+import {
+	isLodManifest,
+	tierForNodeCount,
+	isFullTier,
+	fetchTier,
+	type LodManifest
+} from './graphLod.js';
+
+const manifest: LodManifest = {
+	tiers: [
+		{ name: 'core', file: 'graph-core.json', nodes: 500, edges: 4000 },
+		{ name: 'mid', file: 'graph-mid.json', nodes: 2000, edges: 17000 },
+		{ name: 'full', file: 'graph.json', nodes: 4521, edges: 26241 }
+	]
+};
+
+describe('isLodManifest', () => {
+	it('accepts a manifest with tiers', () => {
+		expect(isLodManifest(manifest)).toBe(true);
+	});
+
+	it('rejects empty or malformed payloads', () => {
+		expect(isLodManifest({ tiers: [] })).toBe(false);
+		expect(isLodManifest({ nodes: [] })).toBe(false);
+		expect(isLodManifest(null)).toBe(false);
+	});
+});
+
+describe('tierForNodeCount', () => {
+	it('picks the smallest tier large enough', () => {
+		expect(tierForNodeCount(manifest, 200)).toBe(0);
+		expect(tierForNodeCount(manifest, 500)).toBe(0);
+		expect(tierForNodeCount(manifest, 501)).toBe(1);
+	});
+
+	it('falls back to the full tier', () => {
+		expect(tierForNodeCount(manifest, 10000)).toBe(2);
+	});
+});
+
+describe('isFullTier', () => {
+	it('is true only for the last tier', () => {
+		expect(isFullTier(manifest, 1)).toBe(false);
+		expect(isFullTier(manifest, 2)).toBe(true);
+	});
+});
+
+describe('fetchTier', () => {
+	it('fetches the binary copy when listed', async () => {
+		const urls: string[] = [];
+		const fakeFetch = (async (url: string) => {
+			urls.push(url);
+			return new Response(JSON.stringify({ nodes: [], edges: [] }));
+		}) as typeof fetch;
+
+		await expect(fetchTier(fakeFetch, '/data', manifest.tiers[0])).resolves.toEqual({
+			nodes: [],
+			edges: []
+		});
+		// Not a valid binary graph, so decoding fails after fetching the .bin file
+		await expect(
+			fetchTier(fakeFetch, '/data', { file: 'graph.json', binary: 'graph.bin' })
+		).rejects.toThrow(/bad magic/);
+		expect(urls).toEqual(['/data/graph-core.json', '/data/graph.bin']);
+	});
+
+	it('throws on HTTP errors', async () => {
+		const fakeFetch = (async () => new Response('', { status: 404 })) as typeof fetch;
+		await expect(fetchTier(fakeFetch, '/data', manifest.tiers[2])).rejects.toThrow(/404/);
+	});
+});
@@ -0,0 +1,68 @@
+/**
+ * Level-of-detail helpers for the knowledge graph tiers written by
+ * `generate_knowledge_graph.py` (`lod.json` + `graph-{tier}.json`).
+ *
+ * Tiers are listed smallest first and end with the full `graph.json`. Each
+ * tier is self-contained and nested by node (core ⊂ mid ⊂ full), so a larger
+ * tier simply replaces the loaded one. When the generator ran with
+ * `--binary`, each tier also lists a typed-array copy (`graph_binary.py`).
+ */
+
+import { decodeGraphBinary } from './graphBinary.js';
+
+export interface LodTier {
+	name: string;
+	file: string;
+	/** Typed-array copy of `file`, preferred when present */
+	binary?: string;
+	nodes: number;
+	edges: number;
+}
+
+export interface LodManifest {
+	generatedAt?: string;
+	tiers: LodTier[];
+}
+
+/**
+ * Check whether a fetched payload is a usable tier manifest.
+ */
+export function isLodManifest(data: unknown): data is LodManifest {
+	return (
+		typeof data === 'object' &&
+		data !== null &&
+		Array.isArray((data as LodManifest).tiers) &&
+		(data as LodManifest).tiers.length > 0
+	);
+}
+
+/**
+ * Index of the smallest tier holding at least `neededNodes` nodes
+ * (the last, full tier when none is large enough).
+ */
+export function tierForNodeCount(manifest: LodManifest, neededNodes: number): number {
+	const index = manifest.tiers.findIndex((tier) => tier.nodes >= neededNodes);
+	return index === -1 ? manifest.tiers.length - 1 : index;
+}
+
+/**
+ * Whether the tier at `index` is the last (full) tier.
+ */
+export function isFullTier(manifest: LodManifest, index: number): boolean {
+	return index >= manifest.tiers.length - 1;
+}
+
+/**
+ * Fetch one tier from `dir`, decoding its binary copy when the manifest lists one.
+ */
+export async function fetchTier<T = any>(
+	fetchFn: typeof fetch,
+	dir: string,
+	tier: Pick<LodTier, 'file' | 'binary'>
+): Promise<T> {
+	const res = await fetchFn(`${dir}/${tier.binary ?? tier.file}`);
+	if (!res.ok) {
+		throw new Error(`Failed to load graph data: ${res.status}`);
+	}
+	return tier.binary ? decodeGraphBinary<T>(await res.arrayBuffer()) : ((await res.json()) as T);
+}
@@ -0,0 +1,32 @@
+import { describe, it, expect } from 'vitest';
+import { facetLocationCounts, type LocationFacets } from './locationFacets.js';
+
+const sourceCountries = ['Benin', 'Togo'];
+
+// Location 0: Benin 1990 ×2, Togo 2005 ×1; location 1: Benin undated ×4
+const facets: LocationFacets = {
+	years: [0, 1990, 2005],
+	offsets: [0, 2, 3],
+	cell: [2, 5, 0],
+	count: [2, 1, 4]
+};
+
+describe('facetLocationCounts', () => {
+	it('sums every cell without filters', () => {
+		expect(Array.from(facetLocationCounts(facets, sourceCountries, null, null))).toEqual([3, 4]);
+	});
+
+	it('filters by source country', () => {
+		expect(Array.from(facetLocationCounts(facets, sourceCountries, 'Togo', null))).toEqual([1, 0]);
+		expect(Array.from(facetLocationCounts(facets, sourceCountries, 'Niger', null))).toEqual([0, 0]);
+	});
+
+	it('filters by year range, leaving undated articles out', () => {
+		expect(Array.from(facetLocationCounts(facets, sourceCountries, null, [1980, 2000]))).toEqual([
+			2, 0
+		]);
+		expect(Array.from(facetLocationCounts(facets, sourceCountries, 'Togo', [2000, 2010]))).toEqual([
+			1, 0
+		]);
+	});
+});
@@ -0,0 +1,54 @@
+/**
+ * Filtering over the columnar location facets of `world-map.json`
+ * (`filterData.locationFacets`, written by `scripts/generate_world_map.py`).
+ *
+ * The facets are a sparse (location × year × source country) count cube in
+ * CSR layout: row `i` (aligned with `locations`) holds entries
+ * `offsets[i]..offsets[i + 1]`, each a `cell = yearIndex * countries + countryIndex`
+ * with its article count. A filter becomes a mask over cells and each
+ * location's count a masked sum over its row.
+ */
+
+export interface LocationFacets {
+	/** Year axis of the cube (0 = undated) */
+	years: number[];
+	offsets: number[];
+	cell: number[];
+	count: number[];
+}
+
+/**
+ * Article count of every location (indexed like `locations`) for a source
+ * country (null = all) and an inclusive year range (null = every year,
+ * undated included).
+ */
+export function facetLocationCounts(
+	facets: LocationFacets,
+	sourceCountries: string[],
+	sourceCountry: string | null,
+	yearRange: [number, number] | null
+): Float64Array {
+	const countries = Math.max(sourceCountries.length, 1);
+	const country = sourceCountry === null ? -1 : sourceCountries.indexOf(sourceCountry);
+
+	const mask = new Uint8Array(facets.years.length * countries);
+	if (sourceCountry === null || country >= 0) {
+		facets.years.forEach((year, y) => {
+			if (yearRange && (year < yearRange[0] || year > yearRange[1])) return;
+			for (let c = 0; c < countries; c++) {
+				if (country < 0 || c === country) mask[y * countries + c] = 1;
+			}
+		});
+	}
+
+	const rows = facets.offsets.length - 1;
+	const counts = new Float64Array(Math.max(rows, 0));
+	for (let i = 0; i < rows; i++) {
+		let total = 0;
+		for (let j = facets.offsets[i]; j < facets.offsets[i + 1]; j++) {
+			if (mask[facets.cell[j]]) total += facets.count[j];
+		}
+		counts[i] = total;
+	}
+	return counts;
+}
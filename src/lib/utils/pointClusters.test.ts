@@ -0,0 +1,52 @@
+import { describe, it, expect } from 'vitest';
+import { clusterLevel, visibleClusters, type ClusterIndex } from './pointClusters.js';
+
+// Points 0-2 near Abidjan, 3-4 near Ouagadougou, as written by point_clusters.py
+const coords: [number, number][] = [
+	[-4, 5.3],
+	[-4.01, 5.31],
+	[-3.99, 5.29],
+	[-1.5, 12.4],
+	[-1.51, 12.41]
+];
+const index: ClusterIndex = {
+	radius: 40,
+	extent: 512,
+	minZoom: 0,
+	maxZoom: 6,
+	leaves: [0, 1, 2, 3, 4],
+	levels: [
+		{ zoom: 0, lng: [-3], lat: [8.5], start: [0] },
+		{ zoom: 6, lng: [-4, -1.5], lat: [5.3, 12.4], start: [0, 3] }
+	]
+};
+const pointCoords = (point: number) => coords[point];
+
+describe('clusterLevel', () => {
+	it('picks the level of the integer zoom', () => {
+		expect(clusterLevel(index, 0.7)?.zoom).toBe(0);
+		expect(clusterLevel(index, 6.2)?.zoom).toBe(6);
+		expect(clusterLevel(index, 7)).toBeNull();
+	});
+});
+
+describe('visibleClusters', () => {
+	it('sums counts over leaf ranges', () => {
+		const clusters = visibleClusters(index, 6, [5, 1, 1, 4, 2], pointCoords);
+		expect(clusters.map((c) => [c.count, c.points, c.point])).toEqual([
+			[7, 3, 0],
+			[6, 2, 3]
+		]);
+	});
+
+	it('hides empty clusters and places lone points on their own coordinates', () => {
+		const clusters = visibleClusters(index, 6, [0, 0, 0, 0, 2], pointCoords);
+		expect(clusters).toEqual([{ lng: -1.51, lat: 12.41, count: 2, points: 1, point: 4 }]);
+	});
+
+	it('returns single points past maxZoom', () => {
+		expect(visibleClusters(index, 9, [1, 0, 0, 3, 0], pointCoords).map((c) => c.point)).toEqual([
+			0, 3
+		]);
+	});
+});
@@ -0,0 +1,99 @@
+/**
+ * Reader for the per-zoom marker clustering index written by
+ * `scripts/point_clusters.py` (the `clusters` key of `world-map.json` and
+ * `sources.json`).
+ *
+ * Leaves are the point indices in depth-first order of the cluster tree, so
+ * cluster `i` of a level covers `leaves[start[i]..start[i + 1])`. Counts under
+ * any filter are differences of a prefix sum over the filtered per-point
+ * counts; nothing is re-clustered in the browser.
+ */
+
+export interface ClusterLevel {
+	zoom: number;
+	lng: number[];
+	lat: number[];
+	start: number[];
+}
+
+export interface ClusterIndex {
+	radius: number;
+	extent: number;
+	minZoom: number;
+	maxZoom: number;
+	leaves: number[];
+	levels: ClusterLevel[];
+}
+
+export interface VisibleCluster {
+	lng: number;
+	lat: number;
+	/** Summed point counts */
+	count: number;
+	/** Points with a non-zero count */
+	points: number;
+	/** Heaviest point of the cluster (index into the clustered records) */
+	point: number;
+}
+
+/**
+ * The level drawn at `zoom` (levels are per integer zoom); null past
+ * `maxZoom`, where every point stands alone.
+ */
+export function clusterLevel(index: ClusterIndex, zoom: number): ClusterLevel | null {
+	const z = Math.max(Math.floor(zoom), index.minZoom);
+	if (z > index.maxZoom) return null;
+	return index.levels.find((level) => level.zoom === z) ?? null;
+}
+
+/**
+ * Clusters of a level with non-zero counts. `pointCounts` is indexed like the
+ * clustered records (e.g. filtered article counts per location); without a
+ * level, each counted point is returned on its own using `pointCoords`.
+ */
+export function visibleClusters(
+	index: ClusterIndex,
+	zoom: number,
+	pointCounts: ArrayLike<number>,
+	pointCoords: (point: number) => [number, number]
+): VisibleCluster[] {
+	const { leaves } = index;
+	const level = clusterLevel(index, zoom);
+	const result: VisibleCluster[] = [];
+
+	if (!level) {
+		for (const point of leaves) {
+			const count = pointCounts[point] ?? 0;
+			if (count > 0) {
+				const [lng, lat] = pointCoords(point);
+				result.push({ lng, lat, count, points: 1, point });
+			}
+		}
+		return result;
+	}
+
+	const prefix = new Float64Array(leaves.length + 1);
+	const nonZero = new Uint32Array(leaves.length + 1);
+	for (let i = 0; i < leaves.length; i++) {
+		const count = pointCounts[leaves[i]] ?? 0;
+		prefix[i + 1] = prefix[i] + count;
+		nonZero[i + 1] = nonZero[i] + (count > 0 ? 1 : 0);
+	}
+
+	for (let i = 0; i < level.start.length; i++) {
+		const start = level.start[i];
+		const end = i + 1 < level.start.length ? level.start[i + 1] : leaves.length;
+		const count = prefix[end] - prefix[start];
+		if (count <= 0) continue;
+
+		let point = leaves[start];
+		for (let j = start + 1; j < end; j++) {
+			if ((pointCounts[leaves[j]] ?? 0) > (pointCounts[point] ?? 0)) point = leaves[j];
+		}
+		const points = nonZero[end] - nonZero[start];
+		// A lone point is drawn where it is, not at the unfiltered centroid
+		const [lng, lat] = points === 1 ? pointCoords(point) : [level.lng[i], level.lat[i]];
+		result.push({ lng, lat, count, points, point });
+	}
+	return result;
+}
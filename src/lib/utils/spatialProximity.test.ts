@@ -0,0 +1,61 @@
+import { describe, it, expect } from 'vitest';
+import {
+	filterEdgesByRange,
+	formatDistanceKm,
+	nearestNodes,
+	type NearestNeighborIndex
+} from './spatialProximity.js';
+
+const edges = [
+	{ id: 'a', distanceKm: 12 },
+	{ id: 'b', distanceKm: 250 },
+	{ id: 'c', distanceKm: 100 },
+	{ id: 'd' }
+];
+
+describe('filterEdgesByRange', () => {
+	it('returns every edge for "all"', () => {
+		expect(filterEdgesByRange(edges, 'all', 100)).toBe(edges);
+	});
+
+	it('splits local and long-range edges at the radius', () => {
+		expect(filterEdgesByRange(edges, 'local', 100).map((e) => e.id)).toEqual(['a', 'd']);
+		expect(filterEdgesByRange(edges, 'long', 100).map((e) => e.id)).toEqual(['b', 'c', 'd']);
+	});
+});
+
+describe('nearestNodes', () => {
+	const nodes = ['Abidjan', 'Bouaké', 'Cotonou'];
+	const index: NearestNeighborIndex = {
+		k: 2,
+		neighbors: [
+			[1, 2],
+			[0, 2],
+			[1, 0]
+		],
+		distanceKm: [
+			[282.5, 716.8],
+			[282.5, 780.1],
+			[716.8, 780.1]
+		]
+	};
+
+	it('pairs neighbours with their distances', () => {
+		expect(nearestNodes(index, nodes, 0)).toEqual([
+			{ node: 'Bouaké', distanceKm: 282.5 },
+			{ node: 'Cotonou', distanceKm: 716.8 }
+		]);
+	});
+
+	it('is empty without an index or node', () => {
+		expect(nearestNodes(null, nodes, 0)).toEqual([]);
+		expect(nearestNodes(index, nodes, 5)).toEqual([]);
+	});
+});
+
+describe('formatDistanceKm', () => {
+	it('keeps one decimal for short distances', () => {
+		expect(formatDistanceKm(3.25)).toBe('3.3 km');
+		expect(formatDistanceKm(282.5)).toBe(`${(283).toLocaleString()} km`);
+	});
+});
@@ -0,0 +1,56 @@
+/**
+ * Distance helpers for `networks/spatial.json` (written by
+ * `scripts/generate_spatial_networks.py`).
+ *
+ * Edges carry their great-circle length (`distanceKm`) and the file holds a
+ * precomputed k-nearest-neighbour index over the nodes (`nearest`, see
+ * `scripts/geo_proximity.py`), so no pairwise distances are computed here.
+ */
+
+export type EdgeRange = 'all' | 'local' | 'long';
+
+export interface NearestNeighborIndex {
+	k: number;
+	/** Per node (indexed like `nodes`), the indices of its nearest nodes, nearest first */
+	neighbors: number[][];
+	distanceKm: number[][];
+}
+
+export interface NearbyNode<T> {
+	node: T;
+	distanceKm: number;
+}
+
+/**
+ * Keep edges shorter than `radiusKm` ('local') or at least that long
+ * ('long'). Edges without a distance (older files) are kept either way.
+ */
+export function filterEdgesByRange<E extends { distanceKm?: number }>(
+	edges: E[],
+	range: EdgeRange,
+	radiusKm: number
+): E[] {
+	if (range === 'all') return edges;
+	return edges.filter((edge) => {
+		if (edge.distanceKm === undefined) return true;
+		return range === 'local' ? edge.distanceKm < radiusKm : edge.distanceKm >= radiusKm;
+	});
+}
+
+/** Nearest nodes of the node at `nodeIndex`, nearest first. */
+export function nearestNodes<T>(
+	index: NearestNeighborIndex | null | undefined,
+	nodes: T[],
+	nodeIndex: number
+): NearbyNode<T>[] {
+	const neighbors = index?.neighbors[nodeIndex];
+	if (!index || !neighbors) return [];
+	return neighbors
+		.map((j, i) => ({ node: nodes[j], distanceKm: index.distanceKm[nodeIndex][i] }))
+		.filter((nearby) => nearby.node !== undefined);
+}
+
+/** Distance label, whole kilometres past 10 km. */
+export function formatDistanceKm(km: number): string {
+	return km < 10 ? `${km.toFixed(1)} km` : `${Math.round(km).toLocaleString()} km`;
+}
@@ -0,0 +1,92 @@
+import { describe, it, expect } from 'vitest';
+import { levelForZoom, topologyToGeoJson, type Topology } from './topojson.js';
+
+// Two unit squares sharing the edge x = 1 (arc 0), as written by simplify_geojson.py
+const topology: Topology = {
+	type: 'Topology',
+	transform: { scale: [0.5, 0.5], translate: [10, 20] },
+	objects: {
+		regions: {
+			type: 'GeometryCollection',
+			geometries: [
+				{ type: 'Polygon', arcs: [[0, 1]], properties: { name: 'West' } },
+				{ type: 'MultiPolygon', arcs: [[[2, -1]]], properties: { name: 'East' } },
+				{ type: null, properties: { name: 'Dropped' } }
+			]
+		}
+	},
+	arcs: [
+		[
+			[2, 0],
+			[0, 2]
+		],
+		[
+			[2, 2],
+			[-2, 0],
+			[0, -2],
+			[2, 0]
+		],
+		[
+			[2, 0],
+			[2, 0],
+			[0, 2],
+			[-2, 0]
+		]
+	]
+};
+
+describe('topologyToGeoJson', () => {
+	it('stitches rings from shared arcs', () => {
+		const { features } = topologyToGeoJson(topology, 'regions');
+		expect(features.map((f) => f.properties.name)).toEqual(['West', 'East']);
+		expect(features[0].geometry).toEqual({
+			type: 'Polygon',
+			coordinates: [
+				[
+					[11, 20],
+					[11, 21],
+					[10, 21],
+					[10, 20],
+					[11, 20]
+				]
+			]
+		});
+		expect(features[1].geometry).toEqual({
+			type: 'MultiPolygon',
+			coordinates: [
+				[
+					[
+						[11, 20],
+						[12, 20],
+						[12, 21],
+						[11, 21],
+						[11, 20]
+					]
+				]
+			]
+		});
+	});
+
+	it('returns an empty collection for unknown objects', () => {
+		expect(topologyToGeoJson(topology, 'missing').features).toEqual([]);
+	});
+});
+
+describe('levelForZoom', () => {
+	const levels = [
+		{ zoom: 9, file: 'z9', points: 3, bytes: 3 },
+		{ zoom: 3, file: 'z3', points: 1, bytes: 1 },
+		{ zoom: 6, file: 'z6', points: 2, bytes: 2 }
+	];
+
+	it('picks the coarsest level detailed enough', () => {
+		expect(levelForZoom(levels, 2)?.file).toBe('z3');
+		expect(levelForZoom(levels, 4)?.file).toBe('z6');
+		expect(levelForZoom(levels, 6)?.file).toBe('z6');
+	});
+
+	it('falls back to the finest level', () => {
+		expect(levelForZoom(levels, 12)?.file).toBe('z9');
+		expect(levelForZoom([], 4)).toBeNull();
+	});
+});
@@ -0,0 +1,103 @@
+/**
+ * Minimal TopoJSON decoding for the map layers written by
+ * `scripts/simplify_geojson.py` (`maps/topo/{layer}-z{zoom}.topo.json`).
+ *
+ * Arcs are delta-encoded integer coordinates with a scale/translate
+ * transform; polygons reference arcs by index (`~index` = reversed). Each
+ * layer is written at several zoom levels, listed in `maps/topo/index.json`.
+ */
+
+import type { GeoJsonData, GeoJsonFeature } from '$lib/types/worldmap.js';
+
+export interface TopoLevel {
+	zoom: number;
+	file: string;
+	points: number;
+	bytes: number;
+}
+
+export interface TopoManifest {
+	generatedAt?: string;
+	quantization: number;
+	layers: Record<
+		string,
+		{ source: string; features: number; sourceBytes: number; levels: TopoLevel[] }
+	>;
+}
+
+type ArcRefs = number[];
+
+interface TopoGeometry {
+	type: 'Polygon' | 'MultiPolygon' | null;
+	arcs?: ArcRefs[] | ArcRefs[][];
+	properties?: GeoJsonFeature['properties'];
+}
+
+export interface Topology {
+	type: 'Topology';
+	bbox?: number[];
+	transform: { scale: [number, number]; translate: [number, number] };
+	objects: Record<string, { type: 'GeometryCollection'; geometries: TopoGeometry[] }>;
+	arcs: number[][][];
+}
+
+/**
+ * The coarsest level drawn for at least `zoom` (the finest one when the map
+ * is zoomed in further than every level).
+ */
+export function levelForZoom(levels: TopoLevel[], zoom: number): TopoLevel | null {
+	const sorted = [...levels].sort((a, b) => a.zoom - b.zoom);
+	return sorted.find((level) => level.zoom >= zoom) ?? sorted[sorted.length - 1] ?? null;
+}
+
+/**
+ * Decode one object of a topology into a GeoJSON FeatureCollection.
+ * Features without geometry at this level are left out.
+ */
+export function topologyToGeoJson(topology: Topology, objectName: string): GeoJsonData {
+	const [sx, sy] = topology.transform.scale;
+	const [tx, ty] = topology.transform.translate;
+
+	const arcs = topology.arcs.map((arc) => {
+		let x = 0;
+		let y = 0;
+		return arc.map(([dx, dy]) => {
+			x += dx;
+			y += dy;
+			return [x * sx + tx, y * sy + ty];
+		});
+	});
+
+	const ring = (refs: ArcRefs): number[][] => {
+		const points: number[][] = [];
+		for (const ref of refs) {
+			const arc = ref >= 0 ? arcs[ref] : [...arcs[~ref]].reverse();
+			points.push(...(points.length ? arc.slice(1) : arc));
+		}
+		return points;
+	};
+
+	const geometries = topology.objects[objectName]?.geometries ?? [];
+	const features: GeoJsonFeature[] = [];
+	for (const geometry of geometries) {
+		if (!geometry.type || !geometry.arcs) continue;
+		const properties = geometry.properties ?? { name: '' };
+		if (geometry.type === 'Polygon') {
+			features.push({
+				type: 'Feature',
+				properties,
+				geometry: { type: 'Polygon', coordinates: (geometry.arcs as ArcRefs[]).map(ring) }
+			});
+		} else {
+			features.push({
+				type: 'Feature',
+				properties,
+				geometry: {
+					type: 'MultiPolygon',
+					coordinates: (geometry.arcs as ArcRefs[][]).map((polygon) => polygon.map(ring))
+				}
+			});
+		}
+	}
+	return { type: 'FeatureCollection', features };
+}
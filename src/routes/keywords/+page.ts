@@ -1,5 +1,70 @@
 import type { PageLoad } from './$types.js';
 import { base } from '$app/paths';
+import {
+	isColumnar,
+	decodeColumnarSeries,
+	type ColumnarSeriesBlock
+} from '$lib/utils/columnarSeries.js';
+
+interface ColumnarFacet {
+	series: ColumnarSeriesBlock;
+	total_keywords: number;
+}
+
+interface ColumnarKeywordData {
+	years: number[];
+	global_series: ColumnarSeriesBlock & { totals: number[]; articles: number[] };
+	by_country: Record<string, ColumnarFacet>;
+	by_newspaper: Record<string, ColumnarFacet>;
+	[key: string]: unknown;
+}
+
+/**
+ * Expand a columnar facet into the per-keyword `{ years, counts }` records
+ * used by the page. All series share the same `years` array.
+ */
+function expandFacet(facet: ColumnarFacet, years: number[]) {
+	const rows = decodeColumnarSeries(facet.series);
+	return {
+		top_keywords: facet.series.names,
+		series: Object.fromEntries(
+			Object.entries(rows).map(([kw, counts]) => [kw, { years, counts }])
+		),
+		total_keywords: facet.total_keywords
+	};
+}
+
+/**
+ * Convert a columnar keywords file to the per-series shape.
+ * Legacy (pre-columnar) files are returned unchanged.
+ */
+function expandKeywordData(raw: unknown) {
+	if (!isColumnar(raw)) return raw;
+	const data = raw as ColumnarKeywordData;
+	const { years, global_series } = data;
+	const globalRows = decodeColumnarSeries(global_series);
+	const expandAll = (facets: Record<string, ColumnarFacet>) =>
+		Object.fromEntries(
+			Object.entries(facets).map(([name, facet]) => [name, expandFacet(facet, years)])
+		);
+
+	return {
+		...data,
+		global_series: Object.fromEntries(
+			global_series.names.map((kw, i) => [
+				kw,
+				{
+					years,
+					counts: globalRows[kw],
+					total: global_series.totals[i],
+					articles: global_series.articles[i]
+				}
+			])
+		),
+		by_country: expandAll(data.by_country),
+		by_newspaper: expandAll(data.by_newspaper)
+	};
+}
 
 export const prerender = true;
 
@@ -27,8 +92,8 @@ export const load: PageLoad = async ({ fetch }) => {
 	]);
 
 	return {
-		subjects,
-		spatial,
+		subjects: expandKeywordData(subjects),
+		spatial: expandKeywordData(spatial),
 		metadata
 	};
 };
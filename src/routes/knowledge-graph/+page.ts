@@ -1,28 +1,33 @@
 import { base } from '$app/paths';
 import type { PageLoad } from './$types.js';
+import { fetchTier, isLodManifest, type LodManifest } from '$lib/utils/graphLod.js';
 
 export const prerender = true;
 
 export const load: PageLoad = async ({ fetch }) => {
 	try {
-		const [graphRes, ontologyRes, statsRes] = await Promise.all([
-			fetch(`${base}/data/knowledge-graph/graph.json`),
+		const [lodRes, ontologyRes, statsRes] = await Promise.all([
+			fetch(`${base}/data/knowledge-graph/lod.json`).catch(() => null),
 			fetch(`${base}/data/knowledge-graph/ontology.json`).catch(() => null),
 			fetch(`${base}/data/knowledge-graph/stats.json`).catch(() => null)
 		]);
 
-		if (!graphRes.ok) {
-			throw new Error(`Failed to load graph data: ${graphRes.status}`);
-		}
-
-		const graph = await graphRes.json();
+		// Load the smallest level-of-detail tier first; larger tiers are streamed in by the page
+		const lodData: unknown = lodRes?.ok ? await lodRes.json().catch(() => null) : null;
+		const lod: LodManifest | null = isLodManifest(lodData) ? lodData : null;
+		const graph = await fetchTier(
+			fetch,
+			`${base}/data/knowledge-graph`,
+			lod ? lod.tiers[0] : { file: 'graph.json' }
+		);
 		const ontology = ontologyRes?.ok ? await ontologyRes.json() : null;
 		const stats = statsRes?.ok ? await statsRes.json() : null;
 
-		return { graph, ontology, stats, error: null };
+		return { graph, lod, ontology, stats, error: null };
 	} catch (e) {
 		return {
 			graph: null,
+			lod: null,
 			ontology: null,
 			stats: null,
 			error: e instanceof Error ? e.message : 'Failed to load data'
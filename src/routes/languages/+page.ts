@@ -1,5 +1,10 @@
 import type { PageLoad } from './$types.js';
 import { base } from '$app/paths';
+import {
+	isColumnar,
+	decodeSeriesRows,
+	type ColumnarSeriesBlock
+} from '$lib/utils/columnarSeries.js';
 
 interface PieItem {
 	label: string;
@@ -26,6 +31,47 @@ interface FacetsData {
 	generated_at: string;
 }
 
+interface ColumnarFacetsData {
+	languages: string[];
+	series: ColumnarSeriesBlock;
+	countries?: string[];
+	types?: string[];
+	generated_at: string;
+}
+
+/**
+ * Build pie data (sorted by count, zero slices dropped) from one row of a
+ * columnar language matrix.
+ */
+function toFacetEntry(languages: string[], counts: number[]): FacetEntry {
+	const total = counts.reduce((sum, value) => sum + value, 0);
+	const data = languages
+		.map((label, i) => ({
+			label,
+			value: counts[i] ?? 0,
+			percentage: total > 0 ? Math.round(((counts[i] ?? 0) / total) * 1000) / 10 : 0
+		}))
+		.filter((item) => item.value > 0)
+		.sort((a, b) => b.value - a.value);
+	return { data, total, languages: data.length };
+}
+
+/**
+ * Convert a columnar facets file to the per-facet pie shape.
+ * Legacy (pre-columnar) files are returned unchanged.
+ */
+function expandFacets(raw: unknown): FacetsData {
+	if (!isColumnar(raw)) return raw as FacetsData;
+	const { languages, series, ...rest } = raw as ColumnarFacetsData;
+	const rows = decodeSeriesRows(series);
+	return {
+		...rest,
+		facets: Object.fromEntries(
+			series.names.map((name, i) => [name, toFacetEntry(languages, rows[i])])
+		)
+	};
+}
+
 export const load: PageLoad = async ({ fetch }) => {
 	const [globalRes, countriesRes, typesRes] = await Promise.all([
 		fetch(`${base}/data/language-global.json`),
@@ -38,8 +84,10 @@ export const load: PageLoad = async ({ fetch }) => {
 	}
 
 	const global: GlobalLanguageData = await globalRes.json();
-	const countries: FacetsData | null = countriesRes.ok ? await countriesRes.json() : null;
-	const types: FacetsData | null = typesRes.ok ? await typesRes.json() : null;
+	const countries: FacetsData | null = countriesRes.ok
+		? expandFacets(await countriesRes.json())
+		: null;
+	const types: FacetsData | null = typesRes.ok ? expandFacets(await typesRes.json()) : null;
 
 	return { global, countries, types };
 };